@@ -0,0 +1,16 @@
+-- Deploy career_trainium:add_scrape_run_deferred_status to pg
+-- requires: queue-scheduler-tables
+
+BEGIN;
+
+-- Allow the scheduler to record runs it held back because the scraping or
+-- review queues were saturated. The deferral reason is stored in message.
+ALTER TABLE public.scrape_runs DROP CONSTRAINT IF EXISTS scrape_runs_status_check;
+
+ALTER TABLE public.scrape_runs
+ADD CONSTRAINT scrape_runs_status_check
+CHECK (status IN ('queued', 'running', 'succeeded', 'partial', 'failed', 'deferred'));
+
+COMMENT ON COLUMN public.scrape_runs.message IS 'Run outcome details; for deferred runs, the backpressure reason';
+
+COMMIT;
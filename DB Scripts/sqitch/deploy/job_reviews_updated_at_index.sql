@@ -0,0 +1,11 @@
+-- Deploy career_trainium:job_reviews_updated_at_index to pg
+-- requires: job_reviews_table
+
+BEGIN;
+
+-- max(updated_at) is part of the /jobs/reviews ETag stamp and must not scan the table
+CREATE INDEX idx_job_reviews_updated_at ON public.job_reviews (updated_at DESC);
+
+COMMENT ON INDEX idx_job_reviews_updated_at IS 'Backs the reviewed-jobs version stamp (max updated_at) used for ETags';
+
+COMMIT;
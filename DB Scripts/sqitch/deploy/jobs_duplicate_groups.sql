@@ -0,0 +1,235 @@
+-- Deploy career_trainium:jobs_duplicate_groups to pg
+-- requires: jobs_deduplicated_view
+-- requires: add_duplicate_status_field
+
+BEGIN;
+
+-- One row per duplicate group (COALESCE(canonical_key, id::text)) holding the
+-- representative job and the group aggregates that jobs_deduplicated used to
+-- compute with DISTINCT ON + window functions over the whole jobs table.
+CREATE TABLE public.job_duplicate_groups (
+    group_key text PRIMARY KEY,
+    representative_id uuid NOT NULL,
+    found_on_sites text[] NOT NULL,
+    duplicate_count bigint NOT NULL,
+    all_urls text[] NOT NULL,
+    refreshed_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE UNIQUE INDEX idx_job_duplicate_groups_representative
+    ON public.job_duplicate_groups (representative_id);
+
+COMMENT ON TABLE public.job_duplicate_groups IS 'Trigger-maintained duplicate groups backing the jobs_deduplicated view. Checked by check_job_duplicate_groups().';
+
+-- Recompute a single group from its member rows (indexed on canonical_key / id)
+CREATE OR REPLACE FUNCTION public.refresh_job_duplicate_group(p_group_key text)
+RETURNS void
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_job_id uuid;
+    v_representative uuid;
+BEGIN
+    -- Serialize recomputes of the same group so concurrent writers see each other's rows
+    PERFORM pg_advisory_xact_lock(hashtext('job_duplicate_groups'), hashtext(p_group_key));
+
+    -- Groups without a canonical_key are keyed by the job id
+    IF p_group_key ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' THEN
+        v_job_id := p_group_key::uuid;
+    END IF;
+
+    SELECT j.id INTO v_representative
+    FROM public.jobs j
+    WHERE j.canonical_key = p_group_key
+       OR (j.canonical_key IS NULL AND j.id = v_job_id)
+    ORDER BY
+        -- Same prioritization as the original jobs_deduplicated view
+        CASE WHEN j.duplicate_status = 'original' THEN 0 ELSE 1 END,
+        CASE WHEN j.min_amount IS NOT NULL THEN 0 ELSE 1 END,
+        j.date_posted DESC NULLS LAST,
+        j.ingested_at ASC,
+        j.id
+    LIMIT 1;
+
+    IF v_representative IS NULL THEN
+        DELETE FROM public.job_duplicate_groups WHERE group_key = p_group_key;
+        RETURN;
+    END IF;
+
+    INSERT INTO public.job_duplicate_groups (
+        group_key, representative_id, found_on_sites, duplicate_count, all_urls, refreshed_at
+    )
+    SELECT p_group_key, v_representative, ARRAY_AGG(j.site), COUNT(*), ARRAY_AGG(j.job_url), now()
+    FROM public.jobs j
+    WHERE j.canonical_key = p_group_key
+       OR (j.canonical_key IS NULL AND j.id = v_job_id)
+    ON CONFLICT (group_key) DO UPDATE SET
+        representative_id = EXCLUDED.representative_id,
+        found_on_sites = EXCLUDED.found_on_sites,
+        duplicate_count = EXCLUDED.duplicate_count,
+        all_urls = EXCLUDED.all_urls,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$function$;
+
+-- Statement-level trigger: refresh each touched group once per statement, in key
+-- order so concurrent statements take the advisory locks in the same order.
+CREATE OR REPLACE FUNCTION public.jobs_refresh_duplicate_groups()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_key text;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR v_key IN
+            SELECT DISTINCT COALESCE(canonical_key, id::text) FROM new_rows ORDER BY 1
+        LOOP
+            PERFORM public.refresh_job_duplicate_group(v_key);
+        END LOOP;
+    ELSIF TG_OP = 'DELETE' THEN
+        FOR v_key IN
+            SELECT DISTINCT COALESCE(canonical_key, id::text) FROM old_rows ORDER BY 1
+        LOOP
+            PERFORM public.refresh_job_duplicate_group(v_key);
+        END LOOP;
+    ELSE
+        -- Only rows whose grouping or ranking inputs changed (status updates are skipped)
+        FOR v_key IN
+            SELECT key FROM (
+                SELECT COALESCE(o.canonical_key, o.id::text) AS key
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE (o.canonical_key, o.duplicate_status, o.min_amount, o.date_posted, o.ingested_at, o.site, o.job_url)
+                      IS DISTINCT FROM
+                      (n.canonical_key, n.duplicate_status, n.min_amount, n.date_posted, n.ingested_at, n.site, n.job_url)
+                UNION
+                SELECT COALESCE(n.canonical_key, n.id::text)
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE (o.canonical_key, o.duplicate_status, o.min_amount, o.date_posted, o.ingested_at, o.site, o.job_url)
+                      IS DISTINCT FROM
+                      (n.canonical_key, n.duplicate_status, n.min_amount, n.date_posted, n.ingested_at, n.site, n.job_url)
+            ) changed
+            ORDER BY key
+        LOOP
+            PERFORM public.refresh_job_duplicate_group(v_key);
+        END LOOP;
+    END IF;
+
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER trg_jobs_duplicate_groups_insert
+    AFTER INSERT ON public.jobs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.jobs_refresh_duplicate_groups();
+
+CREATE TRIGGER trg_jobs_duplicate_groups_update
+    AFTER UPDATE ON public.jobs
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.jobs_refresh_duplicate_groups();
+
+CREATE TRIGGER trg_jobs_duplicate_groups_delete
+    AFTER DELETE ON public.jobs
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.jobs_refresh_duplicate_groups();
+
+-- Compare the maintained groups with a from-scratch computation over jobs
+CREATE OR REPLACE FUNCTION public.check_job_duplicate_groups()
+RETURNS TABLE (group_key text, issue text)
+LANGUAGE sql
+STABLE
+AS $function$
+    WITH expected AS (
+        SELECT DISTINCT ON (COALESCE(j.canonical_key, j.id::text))
+            COALESCE(j.canonical_key, j.id::text) AS group_key,
+            j.id AS representative_id,
+            COUNT(*) OVER w AS duplicate_count,
+            ARRAY_AGG(j.site) OVER w AS found_on_sites,
+            ARRAY_AGG(j.job_url) OVER w AS all_urls
+        FROM public.jobs j
+        WINDOW w AS (PARTITION BY COALESCE(j.canonical_key, j.id::text))
+        ORDER BY
+            COALESCE(j.canonical_key, j.id::text),
+            CASE WHEN j.duplicate_status = 'original' THEN 0 ELSE 1 END,
+            CASE WHEN j.min_amount IS NOT NULL THEN 0 ELSE 1 END,
+            j.date_posted DESC NULLS LAST,
+            j.ingested_at ASC,
+            j.id
+    )
+    SELECT
+        COALESCE(e.group_key, g.group_key),
+        CASE
+            WHEN g.group_key IS NULL THEN 'missing'
+            WHEN e.group_key IS NULL THEN 'stale'
+            WHEN e.representative_id <> g.representative_id THEN 'representative'
+            WHEN e.duplicate_count <> g.duplicate_count THEN 'duplicate_count'
+            WHEN ARRAY(SELECT unnest(e.found_on_sites) ORDER BY 1) <> ARRAY(SELECT unnest(g.found_on_sites) ORDER BY 1)
+                THEN 'found_on_sites'
+            ELSE 'all_urls'
+        END
+    FROM expected e
+    FULL OUTER JOIN public.job_duplicate_groups g ON g.group_key = e.group_key
+    WHERE g.group_key IS NULL
+       OR e.group_key IS NULL
+       OR e.representative_id <> g.representative_id
+       OR e.duplicate_count <> g.duplicate_count
+       OR ARRAY(SELECT unnest(e.found_on_sites) ORDER BY 1) <> ARRAY(SELECT unnest(g.found_on_sites) ORDER BY 1)
+       OR ARRAY(SELECT unnest(e.all_urls) ORDER BY 1) <> ARRAY(SELECT unnest(g.all_urls) ORDER BY 1);
+$function$;
+
+COMMENT ON FUNCTION public.check_job_duplicate_groups() IS 'Lists duplicate groups whose maintained row differs from a full recomputation; repair with refresh_job_duplicate_group(group_key).';
+
+-- Initial population
+INSERT INTO public.job_duplicate_groups (group_key, representative_id, found_on_sites, duplicate_count, all_urls)
+SELECT DISTINCT ON (COALESCE(j.canonical_key, j.id::text))
+    COALESCE(j.canonical_key, j.id::text),
+    j.id,
+    ARRAY_AGG(j.site) OVER w,
+    COUNT(*) OVER w,
+    ARRAY_AGG(j.job_url) OVER w
+FROM public.jobs j
+WINDOW w AS (PARTITION BY COALESCE(j.canonical_key, j.id::text))
+ORDER BY
+    COALESCE(j.canonical_key, j.id::text),
+    CASE WHEN j.duplicate_status = 'original' THEN 0 ELSE 1 END,
+    CASE WHEN j.min_amount IS NOT NULL THEN 0 ELSE 1 END,
+    j.date_posted DESC NULLS LAST,
+    j.ingested_at ASC,
+    j.id;
+
+-- Same columns as before; reads become a primary-key join instead of a full-table window scan
+CREATE OR REPLACE VIEW public.jobs_deduplicated AS
+SELECT
+    j.id,
+    j.site,
+    j.job_url,
+    j.title,
+    j.company,
+    j.location_country,
+    j.location_state,
+    j.location_city,
+    j.is_remote,
+    j.job_type,
+    j.compensation,
+    j.interval,
+    j.min_amount,
+    j.max_amount,
+    j.currency,
+    j.salary_source,
+    j.description,
+    j.date_posted,
+    j.ingested_at,
+    j.canonical_key,
+    j.fingerprint,
+    j.duplicate_group_id,
+    j.duplicate_status,
+    g.found_on_sites,
+    g.duplicate_count,
+    g.all_urls
+FROM public.job_duplicate_groups g
+INNER JOIN public.jobs j ON j.id = g.representative_id;
+
+COMMENT ON VIEW public.jobs_deduplicated IS 'Deduplicated view of jobs showing only the best version of each duplicate group, backed by the trigger-maintained job_duplicate_groups table.';
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- Deploy career_trainium:jobs_search_vector to pg
+-- requires: jobs_table_init
+
+BEGIN;
+
+-- Weighted full-text document for ranked job search: title (A), company (B),
+-- location (C), description (D). Every part is an immutable expression so the
+-- column can be STORED and indexed; concat_ws() is only STABLE and can't be used.
+ALTER TABLE public.jobs ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(company, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig,
+            COALESCE(location_city, '') || ' ' || COALESCE(location_state, '') || ' ' || COALESCE(location_country, '')), 'C') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(description, '')), 'D')
+    ) STORED;
+
+CREATE INDEX idx_jobs_search_vector ON public.jobs USING gin (search_vector);
+
+COMMENT ON COLUMN public.jobs.search_vector IS 'Generated weighted tsvector (title A, company B, location C, description D) for ranked search';
+COMMENT ON INDEX idx_jobs_search_vector IS 'GIN index backing DatabaseService.search_jobs full-text queries';
+
+COMMIT;
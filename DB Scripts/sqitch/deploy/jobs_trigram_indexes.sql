@@ -0,0 +1,18 @@
+-- Deploy career_trainium:jobs_trigram_indexes to pg
+-- requires: jobs_table_init
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Trigram GIN indexes make substring/prefix ILIKE filters on company and title
+-- indexable (the reviewed-jobs company filter and the /jobs/typeahead endpoint).
+-- They index the columns those queries filter on; normalized_company/normalized_title
+-- are only filled for manually added jobs, not for scraped ones.
+CREATE INDEX idx_jobs_company_trgm ON public.jobs USING gin (company gin_trgm_ops);
+CREATE INDEX idx_jobs_title_trgm ON public.jobs USING gin (title gin_trgm_ops);
+
+COMMENT ON INDEX idx_jobs_company_trgm IS 'Trigram index for ILIKE company filters and company typeahead';
+COMMENT ON INDEX idx_jobs_title_trgm IS 'Trigram index for ILIKE title filters and title typeahead';
+
+COMMIT;
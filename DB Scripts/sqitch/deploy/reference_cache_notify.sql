@@ -0,0 +1,32 @@
+-- Deploy career_trainium:reference_cache_notify to pg
+-- requires: v1
+-- requires: queue-scheduler-tables
+
+BEGIN;
+
+-- Publish the changed table's name so API processes drop their cached copy of it.
+-- NOTIFY is delivered on commit and collapses duplicates within a transaction,
+-- so a bulk statement costs one message per table.
+CREATE OR REPLACE FUNCTION public.notify_reference_cache()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $function$
+BEGIN
+    PERFORM pg_notify('reference_cache_invalidate', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER trg_companies_reference_cache
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.companies
+    FOR EACH STATEMENT EXECUTE FUNCTION public.notify_reference_cache();
+
+CREATE TRIGGER trg_site_schedules_reference_cache
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.site_schedules
+    FOR EACH STATEMENT EXECUTE FUNCTION public.notify_reference_cache();
+
+CREATE TRIGGER trg_statuses_reference_cache
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.statuses
+    FOR EACH STATEMENT EXECUTE FUNCTION public.notify_reference_cache();
+
+COMMIT;
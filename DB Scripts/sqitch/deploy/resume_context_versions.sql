@@ -0,0 +1,69 @@
+-- Deploy career_trainium:resume_context_versions to pg
+-- requires: v1
+
+BEGIN;
+
+-- Per-user stamp for DatabaseService.get_user_resume_context's cache. Any change to
+-- a user's resumes, narratives or standard job roles bumps it, which retires every
+-- cached copy keyed by the previous value. Users without a row are at version 0.
+CREATE TABLE public.resume_context_versions (
+    user_id uuid PRIMARY KEY,
+    version bigint NOT NULL DEFAULT 1,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE public.resume_context_versions IS 'Resume context cache stamps, bumped by triggers on resumes, strategic_narratives and standard_job_roles';
+
+CREATE OR REPLACE FUNCTION public.bump_resume_context_version()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_rows jsonb[] := '{}';
+    v_row jsonb;
+    v_users uuid[] := '{}';
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        v_rows := array_append(v_rows, to_jsonb(NEW));
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        v_rows := array_append(v_rows, to_jsonb(OLD));
+    END IF;
+
+    -- Rows carry their owner directly, or (standard_job_roles) through their narrative
+    FOREACH v_row IN ARRAY v_rows LOOP
+        IF v_row ? 'user_id' THEN
+            v_users := array_append(v_users, (v_row->>'user_id')::uuid);
+        ELSIF v_row ? 'narrative_id' THEN
+            v_users := array_cat(v_users, ARRAY(
+                SELECT sn.user_id
+                FROM public.strategic_narratives sn
+                WHERE sn.narrative_id = (v_row->>'narrative_id')::uuid
+            ));
+        END IF;
+    END LOOP;
+
+    INSERT INTO public.resume_context_versions AS v (user_id)
+    SELECT DISTINCT u FROM unnest(v_users) AS u WHERE u IS NOT NULL
+    ORDER BY 1
+    ON CONFLICT (user_id) DO UPDATE SET
+        version = v.version + 1,
+        updated_at = now();
+
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER trg_resumes_resume_context_version
+    AFTER INSERT OR UPDATE OR DELETE ON public.resumes
+    FOR EACH ROW EXECUTE FUNCTION public.bump_resume_context_version();
+
+CREATE TRIGGER trg_strategic_narratives_resume_context_version
+    AFTER INSERT OR UPDATE OR DELETE ON public.strategic_narratives
+    FOR EACH ROW EXECUTE FUNCTION public.bump_resume_context_version();
+
+CREATE TRIGGER trg_standard_job_roles_resume_context_version
+    AFTER INSERT OR UPDATE OR DELETE ON public.standard_job_roles
+    FOR EACH ROW EXECUTE FUNCTION public.bump_resume_context_version();
+
+COMMIT;
@@ -0,0 +1,263 @@
+-- Deploy career_trainium:stat_counters to pg
+-- requires: add_job_status_field
+-- requires: job_reviews_table
+
+BEGIN;
+
+-- Job counts per (status, site, ingest day), kept current by statement-level triggers
+-- so dashboards read a few hundred counter rows instead of scanning jobs.
+CREATE TABLE public.job_stat_counters (
+    status text NOT NULL,
+    site text NOT NULL,                    -- lower(jobs.site)
+    day date NOT NULL,                     -- UTC date of jobs.ingested_at
+    job_count bigint NOT NULL DEFAULT 0,
+    described_count bigint NOT NULL DEFAULT 0,  -- rows with a non-empty description
+    CONSTRAINT job_stat_counters_pkey PRIMARY KEY (status, site, day)
+);
+
+-- Review aggregates per UTC day of job_reviews.created_at
+CREATE TABLE public.job_review_stat_counters (
+    day date PRIMARY KEY,
+    review_count bigint NOT NULL DEFAULT 0,
+    recommended_count bigint NOT NULL DEFAULT 0,
+    not_recommended_count bigint NOT NULL DEFAULT 0,
+    error_count bigint NOT NULL DEFAULT 0,
+    processing_time_total double precision NOT NULL DEFAULT 0,
+    processing_time_count bigint NOT NULL DEFAULT 0,
+    retry_total bigint NOT NULL DEFAULT 0
+);
+
+COMMENT ON TABLE public.job_stat_counters IS 'Trigger-maintained job counts by status/site/day. Corrected by reconcile_stat_counters().';
+COMMENT ON TABLE public.job_review_stat_counters IS 'Trigger-maintained job review aggregates by day. Corrected by reconcile_stat_counters().';
+
+CREATE OR REPLACE FUNCTION public.jobs_maintain_stat_counters()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_rows text;
+BEGIN
+    -- Only the transition table of the firing event exists, hence the dynamic source
+    v_rows := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT 1 AS sign, * FROM new_rows'
+        ELSE 'SELECT -1 AS sign, * FROM old_rows'
+    END;
+
+    -- Deltas are aggregated per statement and applied in key order to keep lock order stable
+    EXECUTE format($sql$
+        INSERT INTO public.job_stat_counters AS c (status, site, day, job_count, described_count)
+        SELECT r.status, lower(r.site), (r.ingested_at AT TIME ZONE 'UTC')::date,
+               SUM(r.sign), SUM(r.sign * (COALESCE(r.description, '') <> '')::int)
+        FROM (%s) r
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (status, site, day) DO UPDATE SET
+            job_count = c.job_count + EXCLUDED.job_count,
+            described_count = c.described_count + EXCLUDED.described_count
+    $sql$, v_rows);
+
+    RETURN NULL;
+END;
+$function$;
+
+CREATE OR REPLACE FUNCTION public.jobs_maintain_stat_counters_update()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $function$
+BEGIN
+    INSERT INTO public.job_stat_counters AS c (status, site, day, job_count, described_count)
+    SELECT status, site, day, SUM(delta), SUM(described_delta)
+    FROM (
+        SELECT o.status, lower(o.site) AS site, (o.ingested_at AT TIME ZONE 'UTC')::date AS day,
+               -1 AS delta, -(COALESCE(o.description, '') <> '')::int AS described_delta
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        WHERE (o.status, lower(o.site), o.ingested_at, COALESCE(o.description, '') <> '')
+              IS DISTINCT FROM (n.status, lower(n.site), n.ingested_at, COALESCE(n.description, '') <> '')
+        UNION ALL
+        SELECT n.status, lower(n.site), (n.ingested_at AT TIME ZONE 'UTC')::date,
+               1, (COALESCE(n.description, '') <> '')::int
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        WHERE (o.status, lower(o.site), o.ingested_at, COALESCE(o.description, '') <> '')
+              IS DISTINCT FROM (n.status, lower(n.site), n.ingested_at, COALESCE(n.description, '') <> '')
+    ) d
+    GROUP BY status, site, day
+    HAVING SUM(delta) <> 0 OR SUM(described_delta) <> 0
+    ORDER BY status, site, day
+    ON CONFLICT (status, site, day) DO UPDATE SET
+        job_count = c.job_count + EXCLUDED.job_count,
+        described_count = c.described_count + EXCLUDED.described_count;
+
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER trg_jobs_stat_counters_insert
+    AFTER INSERT ON public.jobs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.jobs_maintain_stat_counters();
+
+CREATE TRIGGER trg_jobs_stat_counters_delete
+    AFTER DELETE ON public.jobs
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.jobs_maintain_stat_counters();
+
+CREATE TRIGGER trg_jobs_stat_counters_update
+    AFTER UPDATE ON public.jobs
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.jobs_maintain_stat_counters_update();
+
+CREATE OR REPLACE FUNCTION public.job_reviews_maintain_stat_counters()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_rows text;
+BEGIN
+    -- New rows count positively, old rows negatively; an UPDATE contributes both
+    v_rows := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT 1 AS sign, * FROM new_rows'
+        WHEN 'DELETE' THEN 'SELECT -1 AS sign, * FROM old_rows'
+        ELSE 'SELECT 1 AS sign, * FROM new_rows UNION ALL SELECT -1 AS sign, * FROM old_rows'
+    END;
+
+    EXECUTE format($sql$
+        INSERT INTO public.job_review_stat_counters AS c (
+            day, review_count, recommended_count, not_recommended_count, error_count,
+            processing_time_total, processing_time_count, retry_total
+        )
+        SELECT (r.created_at AT TIME ZONE 'UTC')::date,
+               SUM(r.sign),
+               SUM(r.sign * (r.recommend IS TRUE)::int),
+               SUM(r.sign * (r.recommend IS FALSE)::int),
+               SUM(r.sign * (r.error_message IS NOT NULL)::int),
+               SUM(r.sign * COALESCE(r.processing_time_seconds, 0)),
+               SUM(r.sign * (r.processing_time_seconds IS NOT NULL)::int),
+               SUM(r.sign * COALESCE(r.retry_count, 0))
+        FROM (%s) r
+        GROUP BY 1
+        ORDER BY 1
+        ON CONFLICT (day) DO UPDATE SET
+            review_count = c.review_count + EXCLUDED.review_count,
+            recommended_count = c.recommended_count + EXCLUDED.recommended_count,
+            not_recommended_count = c.not_recommended_count + EXCLUDED.not_recommended_count,
+            error_count = c.error_count + EXCLUDED.error_count,
+            processing_time_total = c.processing_time_total + EXCLUDED.processing_time_total,
+            processing_time_count = c.processing_time_count + EXCLUDED.processing_time_count,
+            retry_total = c.retry_total + EXCLUDED.retry_total
+    $sql$, v_rows);
+
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER trg_job_reviews_stat_counters_insert
+    AFTER INSERT ON public.job_reviews
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.job_reviews_maintain_stat_counters();
+
+CREATE TRIGGER trg_job_reviews_stat_counters_update
+    AFTER UPDATE ON public.job_reviews
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.job_reviews_maintain_stat_counters();
+
+CREATE TRIGGER trg_job_reviews_stat_counters_delete
+    AFTER DELETE ON public.job_reviews
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.job_reviews_maintain_stat_counters();
+
+-- Recompute both counter tables from the base tables and fix any drifted rows.
+-- Writers to jobs/job_reviews wait on the counter locks for the duration, so the
+-- recount and the triggers never double-apply a change.
+CREATE OR REPLACE FUNCTION public.reconcile_stat_counters()
+RETURNS TABLE (counter text, corrected_rows integer)
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_jobs integer;
+    v_reviews integer;
+BEGIN
+    LOCK TABLE public.job_stat_counters, public.job_review_stat_counters IN SHARE ROW EXCLUSIVE MODE;
+
+    WITH actual AS (
+        SELECT status, lower(site) AS site, (ingested_at AT TIME ZONE 'UTC')::date AS day,
+               COUNT(*) AS job_count,
+               COUNT(*) FILTER (WHERE COALESCE(description, '') <> '') AS described_count
+        FROM public.jobs
+        GROUP BY 1, 2, 3
+    ),
+    drift AS (
+        SELECT COALESCE(a.status, c.status) AS status,
+               COALESCE(a.site, c.site) AS site,
+               COALESCE(a.day, c.day) AS day,
+               COALESCE(a.job_count, 0) AS job_count,
+               COALESCE(a.described_count, 0) AS described_count
+        FROM actual a
+        FULL OUTER JOIN public.job_stat_counters c
+            ON c.status = a.status AND c.site = a.site AND c.day = a.day
+        WHERE (a.job_count, a.described_count) IS DISTINCT FROM (c.job_count, c.described_count)
+    )
+    INSERT INTO public.job_stat_counters AS c (status, site, day, job_count, described_count)
+    SELECT status, site, day, job_count, described_count FROM drift
+    ON CONFLICT (status, site, day) DO UPDATE SET
+        job_count = EXCLUDED.job_count,
+        described_count = EXCLUDED.described_count;
+    GET DIAGNOSTICS v_jobs = ROW_COUNT;
+
+    WITH actual AS (
+        SELECT (created_at AT TIME ZONE 'UTC')::date AS day,
+               COUNT(*) AS review_count,
+               COUNT(*) FILTER (WHERE recommend IS TRUE) AS recommended_count,
+               COUNT(*) FILTER (WHERE recommend IS FALSE) AS not_recommended_count,
+               COUNT(*) FILTER (WHERE error_message IS NOT NULL) AS error_count,
+               COALESCE(SUM(processing_time_seconds), 0) AS processing_time_total,
+               COUNT(processing_time_seconds) AS processing_time_count,
+               COALESCE(SUM(retry_count), 0) AS retry_total
+        FROM public.job_reviews
+        GROUP BY 1
+    ),
+    drift AS (
+        SELECT COALESCE(a.day, c.day) AS day,
+               COALESCE(a.review_count, 0) AS review_count,
+               COALESCE(a.recommended_count, 0) AS recommended_count,
+               COALESCE(a.not_recommended_count, 0) AS not_recommended_count,
+               COALESCE(a.error_count, 0) AS error_count,
+               COALESCE(a.processing_time_total, 0) AS processing_time_total,
+               COALESCE(a.processing_time_count, 0) AS processing_time_count,
+               COALESCE(a.retry_total, 0) AS retry_total
+        FROM actual a
+        FULL OUTER JOIN public.job_review_stat_counters c ON c.day = a.day
+        WHERE (a.review_count, a.recommended_count, a.not_recommended_count, a.error_count,
+               a.processing_time_count, a.retry_total)
+              IS DISTINCT FROM
+              (c.review_count, c.recommended_count, c.not_recommended_count, c.error_count,
+               c.processing_time_count, c.retry_total)
+           OR abs(COALESCE(a.processing_time_total, 0) - COALESCE(c.processing_time_total, 0)) > 0.001
+    )
+    INSERT INTO public.job_review_stat_counters AS c (
+        day, review_count, recommended_count, not_recommended_count, error_count,
+        processing_time_total, processing_time_count, retry_total
+    )
+    SELECT * FROM drift
+    ON CONFLICT (day) DO UPDATE SET
+        review_count = EXCLUDED.review_count,
+        recommended_count = EXCLUDED.recommended_count,
+        not_recommended_count = EXCLUDED.not_recommended_count,
+        error_count = EXCLUDED.error_count,
+        processing_time_total = EXCLUDED.processing_time_total,
+        processing_time_count = EXCLUDED.processing_time_count,
+        retry_total = EXCLUDED.retry_total;
+    GET DIAGNOSTICS v_reviews = ROW_COUNT;
+
+    DELETE FROM public.job_stat_counters WHERE job_count = 0 AND described_count = 0;
+    DELETE FROM public.job_review_stat_counters WHERE review_count = 0;
+
+    RETURN QUERY VALUES ('jobs'::text, v_jobs), ('job_reviews'::text, v_reviews);
+END;
+$function$;
+
+-- Initial population
+SELECT * FROM public.reconcile_stat_counters();
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Revert career_trainium:add_scrape_run_deferred_status from pg
+
+BEGIN;
+
+-- Deferred runs never started; drop them so the original constraint holds
+DELETE FROM public.scrape_runs WHERE status = 'deferred';
+
+ALTER TABLE public.scrape_runs DROP CONSTRAINT IF EXISTS scrape_runs_status_check;
+
+ALTER TABLE public.scrape_runs
+ADD CONSTRAINT scrape_runs_status_check
+CHECK (status IN ('queued', 'running', 'succeeded', 'partial', 'failed'));
+
+COMMENT ON COLUMN public.scrape_runs.message IS NULL;
+
+COMMIT;
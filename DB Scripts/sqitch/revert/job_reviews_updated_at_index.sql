@@ -0,0 +1,7 @@
+-- Revert career_trainium:job_reviews_updated_at_index from pg
+
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_job_reviews_updated_at;
+
+COMMIT;
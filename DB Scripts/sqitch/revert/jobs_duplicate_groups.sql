@@ -0,0 +1,59 @@
+-- Revert career_trainium:jobs_duplicate_groups from pg
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_jobs_duplicate_groups_insert ON public.jobs;
+DROP TRIGGER IF EXISTS trg_jobs_duplicate_groups_update ON public.jobs;
+DROP TRIGGER IF EXISTS trg_jobs_duplicate_groups_delete ON public.jobs;
+
+-- Restore the window-function view before dropping the table it now reads from
+CREATE OR REPLACE VIEW public.jobs_deduplicated AS
+SELECT DISTINCT ON (COALESCE(canonical_key, id::text))
+    j.id,
+    j.site,
+    j.job_url,
+    j.title,
+    j.company,
+    j.location_country,
+    j.location_state,
+    j.location_city,
+    j.is_remote,
+    j.job_type,
+    j.compensation,
+    j.interval,
+    j.min_amount,
+    j.max_amount,
+    j.currency,
+    j.salary_source,
+    j.description,
+    j.date_posted,
+    j.ingested_at,
+    j.canonical_key,
+    j.fingerprint,
+    j.duplicate_group_id,
+    j.duplicate_status,
+    ARRAY_AGG(j.site) OVER (
+        PARTITION BY COALESCE(canonical_key, id::text)
+    ) as found_on_sites,
+    COUNT(*) OVER (
+        PARTITION BY COALESCE(canonical_key, id::text)
+    ) as duplicate_count,
+    ARRAY_AGG(j.job_url) OVER (
+        PARTITION BY COALESCE(canonical_key, id::text)
+    ) as all_urls
+FROM public.jobs j
+ORDER BY
+    COALESCE(canonical_key, id::text),
+    CASE WHEN j.duplicate_status = 'original' THEN 0 ELSE 1 END,
+    CASE WHEN j.min_amount IS NOT NULL THEN 0 ELSE 1 END,
+    j.date_posted DESC NULLS LAST,
+    j.ingested_at ASC;
+
+COMMENT ON VIEW public.jobs_deduplicated IS 'Deduplicated view of jobs showing only the best version of each duplicate group. Used by job review UI to prevent showing the same job multiple times.';
+
+DROP FUNCTION IF EXISTS public.check_job_duplicate_groups();
+DROP FUNCTION IF EXISTS public.jobs_refresh_duplicate_groups();
+DROP FUNCTION IF EXISTS public.refresh_job_duplicate_group(text);
+DROP TABLE IF EXISTS public.job_duplicate_groups;
+
+COMMIT;
@@ -0,0 +1,8 @@
+-- Revert career_trainium:jobs_search_vector from pg
+
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_jobs_search_vector;
+ALTER TABLE public.jobs DROP COLUMN IF EXISTS search_vector;
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- Revert career_trainium:jobs_trigram_indexes from pg
+
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_jobs_company_trgm;
+DROP INDEX IF EXISTS public.idx_jobs_title_trgm;
+
+-- pg_trgm is left installed; other objects may depend on it
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Revert career_trainium:reference_cache_notify from pg
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_companies_reference_cache ON public.companies;
+DROP TRIGGER IF EXISTS trg_site_schedules_reference_cache ON public.site_schedules;
+DROP TRIGGER IF EXISTS trg_statuses_reference_cache ON public.statuses;
+
+DROP FUNCTION IF EXISTS public.notify_reference_cache();
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Revert career_trainium:resume_context_versions from pg
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_resumes_resume_context_version ON public.resumes;
+DROP TRIGGER IF EXISTS trg_strategic_narratives_resume_context_version ON public.strategic_narratives;
+DROP TRIGGER IF EXISTS trg_standard_job_roles_resume_context_version ON public.standard_job_roles;
+
+DROP FUNCTION IF EXISTS public.bump_resume_context_version();
+
+DROP TABLE IF EXISTS public.resume_context_versions;
+
+COMMIT;
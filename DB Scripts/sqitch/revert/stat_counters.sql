@@ -0,0 +1,20 @@
+-- Revert career_trainium:stat_counters from pg
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_jobs_stat_counters_insert ON public.jobs;
+DROP TRIGGER IF EXISTS trg_jobs_stat_counters_delete ON public.jobs;
+DROP TRIGGER IF EXISTS trg_jobs_stat_counters_update ON public.jobs;
+DROP TRIGGER IF EXISTS trg_job_reviews_stat_counters_insert ON public.job_reviews;
+DROP TRIGGER IF EXISTS trg_job_reviews_stat_counters_update ON public.job_reviews;
+DROP TRIGGER IF EXISTS trg_job_reviews_stat_counters_delete ON public.job_reviews;
+
+DROP FUNCTION IF EXISTS public.reconcile_stat_counters();
+DROP FUNCTION IF EXISTS public.job_reviews_maintain_stat_counters();
+DROP FUNCTION IF EXISTS public.jobs_maintain_stat_counters_update();
+DROP FUNCTION IF EXISTS public.jobs_maintain_stat_counters();
+
+DROP TABLE IF EXISTS public.job_review_stat_counters;
+DROP TABLE IF EXISTS public.job_stat_counters;
+
+COMMIT;
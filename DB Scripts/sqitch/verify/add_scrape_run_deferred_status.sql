@@ -0,0 +1,10 @@
+-- Verify career_trainium:add_scrape_run_deferred_status on pg
+
+BEGIN;
+
+-- Verify the status constraint accepts 'deferred'
+SELECT 1/COUNT(*) FROM pg_constraint
+WHERE conname = 'scrape_runs_status_check'
+AND pg_get_constraintdef(oid) LIKE '%deferred%';
+
+ROLLBACK;
@@ -0,0 +1,8 @@
+-- Verify career_trainium:job_reviews_updated_at_index on pg
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE schemaname = 'public' AND indexname = 'idx_job_reviews_updated_at';
+
+ROLLBACK;
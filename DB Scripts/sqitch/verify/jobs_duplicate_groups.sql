@@ -0,0 +1,30 @@
+-- Verify career_trainium:jobs_duplicate_groups on pg
+
+BEGIN;
+
+SELECT group_key, representative_id, found_on_sites, duplicate_count, all_urls, refreshed_at
+FROM public.job_duplicate_groups
+WHERE FALSE;
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_jobs_duplicate_groups_insert';
+
+SELECT has_function_privilege('public.refresh_job_duplicate_group(text)', 'execute');
+SELECT has_function_privilege('public.check_job_duplicate_groups()', 'execute');
+
+-- View keeps its original columns
+SELECT
+    id,
+    site,
+    job_url,
+    title,
+    company,
+    canonical_key,
+    fingerprint,
+    found_on_sites,
+    duplicate_count,
+    all_urls
+FROM public.jobs_deduplicated
+WHERE FALSE;
+
+ROLLBACK;
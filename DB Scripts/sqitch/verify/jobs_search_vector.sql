@@ -0,0 +1,12 @@
+-- Verify career_trainium:jobs_search_vector on pg
+
+BEGIN;
+
+SELECT search_vector
+FROM public.jobs
+WHERE FALSE;
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE schemaname = 'public' AND indexname = 'idx_jobs_search_vector';
+
+ROLLBACK;
@@ -0,0 +1,14 @@
+-- Verify career_trainium:jobs_trigram_indexes on pg
+
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_extension
+WHERE extname = 'pg_trgm';
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE schemaname = 'public' AND indexname = 'idx_jobs_company_trgm';
+
+SELECT 1/COUNT(*) FROM pg_indexes
+WHERE schemaname = 'public' AND indexname = 'idx_jobs_title_trgm';
+
+ROLLBACK;
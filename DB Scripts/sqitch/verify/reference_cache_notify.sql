@@ -0,0 +1,16 @@
+-- Verify career_trainium:reference_cache_notify on pg
+
+BEGIN;
+
+SELECT has_function_privilege('public.notify_reference_cache()', 'execute');
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_companies_reference_cache';
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_site_schedules_reference_cache';
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_statuses_reference_cache';
+
+ROLLBACK;
@@ -0,0 +1,14 @@
+-- Verify career_trainium:resume_context_versions on pg
+
+BEGIN;
+
+SELECT user_id, version, updated_at
+FROM public.resume_context_versions
+WHERE FALSE;
+
+SELECT has_function_privilege('public.bump_resume_context_version()', 'execute');
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_resumes_resume_context_version';
+
+ROLLBACK;
@@ -0,0 +1,22 @@
+-- Verify career_trainium:stat_counters on pg
+
+BEGIN;
+
+SELECT status, site, day, job_count, described_count
+FROM public.job_stat_counters
+WHERE FALSE;
+
+SELECT day, review_count, recommended_count, not_recommended_count, error_count,
+       processing_time_total, processing_time_count, retry_total
+FROM public.job_review_stat_counters
+WHERE FALSE;
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_jobs_stat_counters_insert';
+
+SELECT 1/COUNT(*) FROM pg_trigger
+WHERE tgname = 'trg_job_reviews_stat_counters_insert';
+
+SELECT has_function_privilege('public.reconcile_stat_counters()', 'execute');
+
+ROLLBACK;
@@ -0,0 +1,172 @@
+"""
+Admission control for LLM-backed endpoints.
+
+Each endpoint class ("generation", "analysis", "research") gets a
+concurrency limit and a bounded wait queue. Requests over the limit wait for
+a slot; when the queue is already full they are shed at once with 429, and
+requests that wait longer than ``ADMISSION_QUEUE_TIMEOUT_SECONDS`` get 503.
+Both carry a ``Retry-After`` estimated from recent service times, so a burst
+is turned away cheaply instead of piling onto the provider's rate limits.
+
+Endpoints opt in with ``dependencies=[Depends(admission("analysis"))]``.
+The "generation" class is reserved for application content generation; no
+route calls a provider for it yet, so nothing uses it today.
+Queue depth and shed counts are reported by ``admission_controller.snapshot()``.
+"""
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+from fastapi import HTTPException, Request
+from loguru import logger
+
+from ..core.config import get_settings
+
+
+ENDPOINT_CLASSES = ("generation", "analysis", "research")
+
+# Weight of the newest sample in the moving average of slot hold times
+_SERVICE_TIME_ALPHA = 0.2
+
+
+class ConcurrencyLimiter:
+    """At most ``limit`` holders at a time, at most ``queue_size`` waiting behind them."""
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float,
+                 default_retry_after: float, max_retry_after: float):
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_size = max(0, queue_size)
+        self.queue_timeout = queue_timeout
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        self._semaphore = asyncio.Semaphore(self.limit)
+        self.active = 0
+        self.waiting = 0
+        self.avg_service_seconds = 0.0
+        self.stats = {"admitted": 0, "queued": 0, "shed_queue_full": 0, "shed_timeout": 0, "max_queue_depth": 0}
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: the queue ahead drained at the observed service rate."""
+        if not self.avg_service_seconds:
+            estimate = self.default_retry_after
+        else:
+            estimate = self.avg_service_seconds * (self.waiting + 1) / self.limit
+        return int(min(self.max_retry_after, max(1, math.ceil(estimate))))
+
+    def _reject(self, status_code: int, reason: str) -> HTTPException:
+        retry_after = self.retry_after()
+        logger.warning(
+            f"Shedding {self.name} request ({reason}): active={self.active}, "
+            f"waiting={self.waiting}, retry_after={retry_after}s"
+        )
+        return HTTPException(
+            status_code=status_code,
+            detail=f"Too many concurrent {self.name} requests; retry in {retry_after}s",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    async def acquire(self) -> None:
+        if not self._semaphore.locked():
+            # A free slot is taken without suspending
+            await self._semaphore.acquire()
+        else:
+            if self.waiting >= self.queue_size:
+                self.stats["shed_queue_full"] += 1
+                raise self._reject(429, "queue full")
+
+            self.stats["queued"] += 1
+            self.waiting += 1
+            self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.waiting)
+            timed_out = False
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+            finally:
+                self.waiting -= 1
+            if timed_out:
+                self.stats["shed_timeout"] += 1
+                raise self._reject(503, "queue wait timed out")
+
+        self.active += 1
+        self.stats["admitted"] += 1
+
+    def release(self, held_seconds: float) -> None:
+        self.active -= 1
+        if self.avg_service_seconds:
+            self.avg_service_seconds += _SERVICE_TIME_ALPHA * (held_seconds - self.avg_service_seconds)
+        else:
+            self.avg_service_seconds = held_seconds
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "avg_service_seconds": round(self.avg_service_seconds, 3),
+            **self.stats,
+        }
+
+
+class AdmissionController:
+    """One limiter per endpoint class, built from settings on first use."""
+
+    def __init__(self):
+        self._limiters: Dict[str, ConcurrencyLimiter] = {}
+
+    def limiter(self, endpoint_class: str) -> ConcurrencyLimiter:
+        limiter = self._limiters.get(endpoint_class)
+        if limiter is None:
+            if endpoint_class not in ENDPOINT_CLASSES:
+                raise ValueError(f"Unknown endpoint class: {endpoint_class}")
+            settings = get_settings()
+            limiter = ConcurrencyLimiter(
+                endpoint_class,
+                limit=getattr(settings, f"admission_{endpoint_class}_concurrency"),
+                queue_size=getattr(settings, f"admission_{endpoint_class}_queue_size"),
+                queue_timeout=settings.admission_queue_timeout_seconds,
+                default_retry_after=settings.admission_retry_after_seconds,
+                max_retry_after=settings.admission_max_retry_after_seconds,
+            )
+            self._limiters[endpoint_class] = limiter
+        return limiter
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: limiter.snapshot() for name, limiter in self._limiters.items()}
+
+    def reset(self) -> None:
+        self._limiters.clear()
+
+
+admission_controller = AdmissionController()
+
+
+def admission(endpoint_class: str):
+    """
+    Dependency holding a slot of ``endpoint_class`` for the duration of the request.
+
+    Submit-and-poll requests (``mode=async``) only enqueue work, so they are
+    admitted without taking a slot.
+    """
+    async def dependency(request: Request):
+        if request.query_params.get("mode") == "async" or not get_settings().admission_enabled:
+            yield
+            return
+        async with admission_controller.limiter(endpoint_class).slot():
+            yield
+
+    return dependency
@@ -0,0 +1,219 @@
+"""
+Conditional GET and short-lived response caching for polled read endpoints.
+
+``response_cache.respond()`` wraps an endpoint's response builder:
+
+* With a ``version`` (a cheap stamp such as max(updated_at) plus a row count)
+  the ETag is derived from the stamp, so a matching ``If-None-Match`` is
+  answered with 304 before the builder runs, and a cached body is served for
+  as long as the stamp is unchanged.
+* Without one, the body is cached for ``ttl`` seconds and the ETag is a hash
+  of the body; revalidations inside the TTL are still answered without
+  running the builder.
+
+Bodies are held in process memory by default, or in Redis when
+``RESPONSE_CACHE_BACKEND=redis`` so several API replicas share them.
+"""
+import hashlib
+import time
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+import redis
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from ..core.config import get_settings
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    # Weak comparison: a proxy may have stripped the W/ prefix
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+class MemoryBackend:
+    """Per-process store of (etag, body) with expiry; oldest entries evicted first."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: Dict[str, Tuple[str, bytes, float]] = {}
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            etag, body, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return etag, body
+
+    def set(self, key: str, etag: str, body: bytes, ttl: float) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (etag, body, time.monotonic() + ttl)
+
+    def invalidate(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Shared store in Redis; errors degrade to cache misses."""
+
+    PREFIX = "response_cache:"
+
+    def __init__(self):
+        settings = get_settings()
+        self.conn = redis.Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            socket_timeout=1,
+            socket_connect_timeout=1,
+        )
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        try:
+            raw = self.conn.get(self.PREFIX + key)
+        except redis.RedisError as e:
+            logger.debug(f"Response cache get failed: {str(e)}")
+            return None
+        if not raw:
+            return None
+        etag, _, body = raw.partition(b"\n")
+        return etag.decode("utf-8"), body
+
+    def set(self, key: str, etag: str, body: bytes, ttl: float) -> None:
+        try:
+            self.conn.set(self.PREFIX + key, etag.encode("utf-8") + b"\n" + body, px=int(ttl * 1000))
+        except redis.RedisError as e:
+            logger.debug(f"Response cache set failed: {str(e)}")
+
+    def invalidate(self, prefix: str) -> None:
+        try:
+            keys = list(self.conn.scan_iter(match=f"{self.PREFIX}{prefix}*", count=500))
+            if keys:
+                self.conn.delete(*keys)
+        except redis.RedisError as e:
+            logger.debug(f"Response cache invalidation failed: {str(e)}")
+
+    def clear(self) -> None:
+        self.invalidate("")
+
+
+class ResponseCache:
+    """ETag/304 handling plus a TTL body cache, with per-endpoint counters."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._lock = Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, name: str, outcome: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, {"not_modified": 0, "hits": 0, "misses": 0})
+            stats[outcome] += 1
+
+    @staticmethod
+    def _response(body: bytes, etag: str, status_code: int, outcome: str) -> Response:
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Cache": outcome}
+        if status_code == 304:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    async def respond(
+        self,
+        request: Request,
+        name: str,
+        build: Callable[[], Awaitable[Any]],
+        ttl: float,
+        version: Optional[Any] = None,
+    ) -> Response:
+        """
+        Serve ``build()``'s result for endpoint ``name``, revalidating by ETag.
+
+        The cache key is ``name`` plus the sorted query string. ``build`` may raise
+        (e.g. HTTPException); nothing is cached in that case.
+        """
+        key = f"{name}?{'&'.join(sorted(f'{k}={v}' for k, v in request.query_params.multi_items()))}"
+
+        if version is not None:
+            etag = make_etag(key, version)
+            if etag_matches(request, etag):
+                self._count(name, "not_modified")
+                return self._response(b"", etag, 304, "REVALIDATED")
+            cached = self.backend.get(key)
+            if cached is not None and cached[0] == etag:
+                self._count(name, "hits")
+                return self._response(cached[1], etag, 200, "HIT")
+        else:
+            cached = self.backend.get(key)
+            if cached is not None:
+                etag, body = cached
+                if etag_matches(request, etag):
+                    self._count(name, "not_modified")
+                    return self._response(b"", etag, 304, "REVALIDATED")
+                self._count(name, "hits")
+                return self._response(body, etag, 200, "HIT")
+
+        self._count(name, "misses")
+        body = orjson.dumps(jsonable_encoder(await build()))
+        if version is None:
+            etag = make_etag(key, hashlib.blake2b(body, digest_size=12).hexdigest())
+        self.backend.set(key, etag, body, ttl)
+
+        if etag_matches(request, etag):
+            return self._response(b"", etag, 304, "REVALIDATED")
+        return self._response(body, etag, 200, "MISS")
+
+    def invalidate(self, name: str) -> None:
+        """Drop every cached variant of endpoint ``name``."""
+        self.backend.invalidate(f"{name}?")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {}
+            for name, stats in self._stats.items():
+                requests = sum(stats.values())
+                served = stats["not_modified"] + stats["hits"]
+                endpoints[name] = {
+                    **stats,
+                    "requests": requests,
+                    "served_from_cache_rate": round(served / requests, 4) if requests else 0.0,
+                }
+            return {"backend": type(self.backend).__name__, "endpoints": endpoints}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+        self.backend.clear()
+
+
+def _create_response_cache() -> ResponseCache:
+    settings = get_settings()
+    if settings.response_cache_backend == "redis":
+        return ResponseCache(RedisBackend())
+    return ResponseCache(MemoryBackend(settings.response_cache_max_entries))
+
+
+response_cache = _create_response_cache()
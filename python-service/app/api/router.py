@@ -19,6 +19,8 @@ from .v1.endpoints.linkedin_jobs import router as linkedin_jobs_router
 from .v1.endpoints.applications import router as applications_router
 from .v1.endpoints.glassdoor_enrichment import router as glassdoor_enrichment_router
 from .v1.endpoints.resume_documents import router as resume_documents_router
+from .v1.endpoints.events import router as events_router
+from .v1.endpoints.analysis_jobs import router as analysis_jobs_router
 
 from ..routes.jobs_fit_review import router as jobs_fit_review_router
 
@@ -47,6 +49,12 @@ api_router.include_router(applications_router, tags=["Applications"])
 api_router.include_router(glassdoor_enrichment_router, tags=["Glassdoor Enrichment"])
 api_router.include_router(resume_documents_router, tags=["Resumes"])
 
+# Progress streams (SSE)
+api_router.include_router(events_router, tags=["Events"])
+
+# Submit-and-poll analysis tasks
+api_router.include_router(analysis_jobs_router, tags=["Analysis Jobs"])
+
 # Health check
 api_router.include_router(health_router, tags=["Health"])
 api_router.include_router(jobs_fit_review_router, tags=["job-posting-fit-review"])
@@ -0,0 +1,111 @@
+"""
+Status and result endpoints for submit-and-poll analysis tasks.
+
+``/jobs/parse?mode=async`` and ``/job-posting-review/analyze?mode=async``
+return a task handle from ``submit_analysis``; clients poll the endpoints
+below or pass ``webhook_url`` to be called back.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from ....dependencies import get_queue_service
+from ....services.infrastructure.analysis_jobs import (
+    analysis_task_id,
+    execute_analysis,
+    get_cached_result,
+    is_cacheable,
+    store_result,
+    validate_webhook_url,
+)
+from ....services.infrastructure.queue import QueueService
+
+
+router = APIRouter(prefix="/analysis-jobs", tags=["analysis-jobs"])
+
+PENDING_STATUSES = {"queued", "started", "deferred", "scheduled"}
+
+
+def _task_links(task_id: str) -> Dict[str, str]:
+    return {
+        "status_url": f"/api/analysis-jobs/{task_id}",
+        "result_url": f"/api/analysis-jobs/{task_id}/result",
+    }
+
+
+async def _ready_queue(queue_service: QueueService) -> QueueService:
+    if not queue_service.initialized:
+        await queue_service.initialize()
+    if not queue_service.initialized:
+        raise HTTPException(status_code=503, detail="Analysis queue unavailable")
+    return queue_service
+
+
+async def submit_analysis(queue_service: QueueService, kind: str, payload: Dict[str, Any],
+                          webhook_url: Optional[str] = None) -> JSONResponse:
+    """Enqueue an analysis and answer 202 with its handle (200 with the result when cached)."""
+    if webhook_url:
+        try:
+            validate_webhook_url(webhook_url)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    queue_service = await _ready_queue(queue_service)
+    submitted = queue_service.enqueue_analysis(kind, payload, webhook_url)
+    if submitted is None:
+        raise HTTPException(status_code=503, detail=f"Failed to enqueue {kind} analysis")
+
+    return JSONResponse(
+        status_code=200 if submitted["cached"] else 202,
+        content={**submitted, **_task_links(submitted["task_id"])},
+    )
+
+
+async def run_cached_analysis(queue_service: QueueService, kind: str, payload: Dict[str, Any]) -> Any:
+    """Synchronous mode: serve an identical earlier result from cache, else run in a thread and cache it."""
+    redis_conn = queue_service.redis_conn if queue_service.initialized else None
+    task_id = analysis_task_id(kind, payload)
+    if redis_conn is not None:
+        cached = get_cached_result(redis_conn, task_id)
+        if cached is not None:
+            return cached
+
+    result = await asyncio.get_running_loop().run_in_executor(None, execute_analysis, kind, payload)
+    if redis_conn is not None and is_cacheable(kind, result):
+        store_result(redis_conn, task_id, result)
+    return result
+
+
+@router.get("/{task_id}")
+async def get_analysis_status(task_id: str, queue_service: QueueService = Depends(get_queue_service)):
+    """Status of an analysis task (queued, started, finished, failed), with its result once finished."""
+    queue_service = await _ready_queue(queue_service)
+    status = queue_service.get_analysis_status(task_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Analysis task {task_id} not found")
+    return {**status, **_task_links(task_id)}
+
+
+@router.get("/{task_id}/result")
+async def get_analysis_result(task_id: str, queue_service: QueueService = Depends(get_queue_service)):
+    """
+    Result of a finished analysis task.
+
+    Returns 202 with the current status while the task is pending and 500
+    with the error if it failed.
+    """
+    queue_service = await _ready_queue(queue_service)
+    status = queue_service.get_analysis_status(task_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Analysis task {task_id} not found")
+
+    if status["status"] == "finished":
+        return status["result"]
+    if status["status"] in PENDING_STATUSES:
+        return JSONResponse(status_code=202, content={**status, **_task_links(task_id)})
+
+    logger.warning(f"Analysis task {task_id} ended with status {status['status']}")
+    raise HTTPException(status_code=500, detail=status.get("error") or f"Analysis {status['status']}")
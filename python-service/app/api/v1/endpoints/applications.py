@@ -6,7 +6,6 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from loguru import logger
-import json
 import re
 
 from ....services.infrastructure.database import get_database_service, DatabaseService
@@ -201,21 +200,9 @@ async def generate_application_from_job(job_id: str, narrative_id: str = None):
                 raise HTTPException(400, "No narrative found. Please create a narrative first.")
 
             # Get default status - use 'Not Started' for manual AI triggering
-            status = await conn.fetchrow("""
-                SELECT status_id
-                FROM statuses
-                WHERE status_name = 'Not Started'
-                LIMIT 1
-            """)
-
-            if not status:
-                status_id = await conn.fetchval("""
-                    INSERT INTO statuses (status_name, created_at)
-                    VALUES ('Not Started', NOW())
-                    RETURNING status_id
-                """)
-            else:
-                status_id = status['status_id']
+            status_id = await db_service.get_or_create_status_id('Not Started')
+            if status_id is None:
+                raise HTTPException(500, "Could not resolve application status 'Not Started'")
 
             # Create application record with properly formatted data
             app_id = await conn.fetchval("""
@@ -352,9 +339,9 @@ async def _generate_ai_content(
                     updated_at = NOW()
                 WHERE job_application_id = $4
             """,
-                json.dumps(tailoring_data),
+                tailoring_data,
                 application_message,
-                json.dumps(application_answers),
+                application_answers,
                 UUID(app_id)
             )
 
@@ -427,21 +414,9 @@ async def create_application_from_job(job_id: str, mode: str = "fast_track", nar
                 raise HTTPException(400, "No narrative found. Please create a narrative first.")
 
             # Get default status - use 'Draft' for fast track
-            status = await conn.fetchrow("""
-                SELECT status_id
-                FROM statuses
-                WHERE status_name = 'Draft'
-                LIMIT 1
-            """)
-
-            if not status:
-                status_id = await conn.fetchval("""
-                    INSERT INTO statuses (status_name, created_at)
-                    VALUES ('Draft', NOW())
-                    RETURNING status_id
-                """)
-            else:
-                status_id = status['status_id']
+            status_id = await db_service.get_or_create_status_id('Draft')
+            if status_id is None:
+                raise HTTPException(500, "Could not resolve application status 'Draft'")
 
             # Create application record with properly formatted data
             app_id = await conn.fetchval("""
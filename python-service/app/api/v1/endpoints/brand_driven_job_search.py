@@ -13,11 +13,12 @@ from ....schemas.brand_driven_job_search import (
 )
 from ....services.crewai.brand_driven_job_search.crew import get_brand_driven_job_search_crew
 from ....services.crewai.brand_driven_job_search.brand_search import brand_search_helper
+from ...admission import admission
 
 router = APIRouter(prefix="/brand-driven-job-search", tags=["Brand-Driven Job Search"])
 
 
-@router.post("/search", response_model=StandardResponse)
+@router.post("/search", response_model=StandardResponse, dependencies=[Depends(admission("research"))])
 async def execute_brand_driven_search(request: BrandDrivenJobSearchRequest):
     """
     Execute autonomous brand-driven LinkedIn job search.
@@ -1,6 +1,6 @@
 """ChromaDB management endpoints."""
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Body
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Body, Request
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict
 from loguru import logger
@@ -18,10 +18,15 @@ from ....schemas.chroma import (
 from ....services.chroma_service import ChromaService
 from ....services.chroma_manager import get_chroma_manager
 from ....schemas.responses import create_success_response, create_error_response
+from ....core.config import get_settings
+from ...response_cache import response_cache
 
 
 router = APIRouter()
 
+# Response cache entry for the collection listing; uploads and deletes drop it
+COLLECTIONS_CACHE_NAME = "chroma:collections"
+
 
 def get_chroma_service() -> ChromaService:
     """Dependency to get ChromaService instance."""
@@ -218,6 +223,7 @@ async def upload_full_career_brand_document(
 
                 # Upload to ChromaDB
                 result = await chroma_service.upload_document(request)
+                response_cache.invalidate(COLLECTIONS_CACHE_NAME)
 
                 if result.success:
                     uploaded_sections.append({
@@ -323,6 +329,7 @@ async def upload_to_chroma(
 
         # Upload to ChromaDB
         result = await chroma_service.upload_document(request)
+        response_cache.invalidate(COLLECTIONS_CACHE_NAME)
 
         if result.success:
             logger.info(
@@ -366,6 +373,7 @@ async def upload_text_to_chroma(
 
         # Upload to ChromaDB
         result = await chroma_service.upload_document(request)
+        response_cache.invalidate(COLLECTIONS_CACHE_NAME)
 
         if result.success:
             logger.info(
@@ -389,20 +397,30 @@ async def upload_text_to_chroma(
 
 @router.get("/chroma/collections", response_model=ChromaCollectionListResponse)
 async def list_chroma_collections(
+    request: Request,
     chroma_service: ChromaService = Depends(get_chroma_service)
 ):
-    """List all ChromaDB collections with their metadata."""
-    try:
-        # Initialize service if needed
-        await chroma_service.initialize()
+    """List all ChromaDB collections with their metadata.
 
-        collections = await chroma_service.list_collections()
+    Counting documents costs a call per collection, so the listing is cached
+    briefly and supports If-None-Match revalidation.
+    """
+    async def build():
+        try:
+            # Initialize service if needed
+            await chroma_service.initialize()
 
-        return ChromaCollectionListResponse(collections=collections)
+            collections = await chroma_service.list_collections()
 
-    except Exception as e:
-        logger.error(f"Failed to list ChromaDB collections: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to list collections: {str(e)}")
+            return ChromaCollectionListResponse(collections=collections)
+
+        except Exception as e:
+            logger.error(f"Failed to list ChromaDB collections: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to list collections: {str(e)}")
+
+    return await response_cache.respond(
+        request, COLLECTIONS_CACHE_NAME, build, ttl=get_settings().response_cache_ttl_seconds
+    )
 
 
 @router.delete("/chroma/collections/{collection_name}")
@@ -416,6 +434,7 @@ async def delete_chroma_collection(
         await chroma_service.initialize()
 
         success = await chroma_service.delete_collection(collection_name)
+        response_cache.invalidate(COLLECTIONS_CACHE_NAME)
 
         if success:
             return create_success_response(
@@ -827,6 +846,7 @@ async def delete_document_by_id(
                         if doc_id == document_id:
                             # Delete this document using the service method
                             success = await chroma_service.delete_document(collection_name, document_id)
+                            response_cache.invalidate(COLLECTIONS_CACHE_NAME)
                             if success:
                                 deleted = True
                                 logger.info(f"Successfully deleted document {document_id} from collection {collection_name}")
@@ -869,6 +889,7 @@ async def delete_collection_document(
         await chroma_service.initialize()
 
         success = await chroma_service.delete_document(collection_name, document_id)
+        response_cache.invalidate(COLLECTIONS_CACHE_NAME)
 
         if success:
             return create_success_response(
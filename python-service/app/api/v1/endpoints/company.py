@@ -1,10 +1,11 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from ....schemas.company import CompanyRequest, CompanyReportResponse
 from ....services.company_service import generate_company_report
+from ...admission import admission
 
 router = APIRouter(prefix="/company", tags=["Company Research"])
 
-@router.post("/report", response_model=CompanyReportResponse)
+@router.post("/report", response_model=CompanyReportResponse, dependencies=[Depends(admission("research"))])
 async def company_report(request: CompanyRequest):
     try:
         report = generate_company_report(request.company_name)
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends
 from ....services.crewai import PersonalBrandCrew, get_personal_brand_crew
+from ...admission import admission
 
 
 router = APIRouter(tags=["Personal Branding"])
 
 
-@router.post("/personal-brand")
+@router.post("/personal-brand", dependencies=[Depends(admission("research"))])
 async def personal_branding(
     personal_brand_crew: PersonalBrandCrew = Depends(get_personal_brand_crew),
 ):
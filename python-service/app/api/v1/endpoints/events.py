@@ -0,0 +1,113 @@
+"""
+Server-sent event streams for scrape run and job review progress.
+"""
+import asyncio
+from typing import AsyncIterator, Optional, Set
+
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+from ....core.config import get_settings
+from ....services.infrastructure.progress_events import (
+    JOB_REVIEW_EVENT,
+    OVERFLOW,
+    SCRAPE_RUN_EVENT,
+    Event,
+    event_matches,
+    progress_event_hub,
+    stream_id_key,
+)
+
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+EVENT_TYPES = {SCRAPE_RUN_EVENT, JOB_REVIEW_EVENT}
+
+
+def format_sse(event: Event) -> str:
+    event_id, event_type, data = event
+    return f"id: {event_id}\nevent: {event_type}\ndata: {orjson.dumps(data).decode('utf-8')}\n\n"
+
+
+async def progress_stream(
+    request: Request,
+    last_event_id: Optional[str],
+    types: Optional[Set[str]],
+    run_id: Optional[str],
+    job_id: Optional[str],
+) -> AsyncIterator[str]:
+    """Replay events after ``last_event_id``, then relay live events with periodic heartbeats."""
+    settings = get_settings()
+    # Subscribe before replaying so nothing published in between is lost
+    queue = await progress_event_hub.subscribe()
+    try:
+        yield f"retry: {int(settings.progress_events_retry_seconds * 1000)}\n\n"
+
+        last_sent = None
+        if last_event_id:
+            try:
+                missed = await progress_event_hub.replay(last_event_id)
+            except Exception as e:
+                logger.warning(f"Progress event replay from {last_event_id} failed: {str(e)}")
+                missed = []
+            for event in missed:
+                last_sent = stream_id_key(event[0])
+                if event_matches(event, types, run_id, job_id):
+                    yield format_sse(event)
+
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=settings.progress_events_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle connection
+                yield ": heartbeat\n\n"
+                continue
+
+            if event is OVERFLOW:
+                # Client fell too far behind; it reconnects and resumes from its last ID
+                break
+            if last_sent is not None and stream_id_key(event[0]) <= last_sent:
+                continue
+            if event_matches(event, types, run_id, job_id):
+                yield format_sse(event)
+    finally:
+        progress_event_hub.unsubscribe(queue)
+
+
+@router.get("/progress")
+async def stream_progress_events(
+    request: Request,
+    types: Optional[str] = Query(None, description="Comma-separated event types: scrape_run, job_review"),
+    run_id: Optional[str] = Query(None, description="Only events for this scrape run"),
+    job_id: Optional[str] = Query(None, description="Only events for this job"),
+    last_event_id: Optional[str] = Query(None, description="Resume after this event ID (alternative to the header)"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream scrape run state changes and job review completions as server-sent events.
+
+    Each event's ``id`` can be sent back as ``Last-Event-ID`` (EventSource does
+    this automatically on reconnect) to replay what was missed. A comment
+    heartbeat is sent when the stream is idle.
+    """
+    type_filter = None
+    if types:
+        type_filter = {event_type.strip() for event_type in types.split(",") if event_type.strip()}
+        unknown = type_filter - EVENT_TYPES
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown event types: {', '.join(sorted(unknown))}")
+
+    resume_from = last_event_id_header or last_event_id
+    if resume_from:
+        try:
+            stream_id_key(resume_from)
+        except ValueError:
+            resume_from = None
+
+    return StreamingResponse(
+        progress_stream(request, resume_from, type_filter, run_id, job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
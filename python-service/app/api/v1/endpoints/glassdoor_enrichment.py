@@ -244,21 +244,11 @@ async def get_enrichment_status():
     await db_service.initialize()
 
     try:
-        async with db_service.pool.acquire() as conn:
-            total = await conn.fetchval("""
-                SELECT COUNT(*)
-                FROM jobs
-                WHERE LOWER(site) = 'glassdoor'
-            """)
-
-            enriched = await conn.fetchval("""
-                SELECT COUNT(*)
-                FROM jobs
-                WHERE LOWER(site) = 'glassdoor'
-                  AND (description IS NOT NULL AND description != '')
-            """)
-
-            pending = total - enriched
+        # Served from job_stat_counters, kept current by triggers on jobs
+        counts = await db_service.get_site_job_counts("glassdoor")
+        total = counts["total"]
+        enriched = counts["described"]
+        pending = total - enriched
 
         return {
             "total_glassdoor_jobs": total,
@@ -2,11 +2,19 @@
 Health check and system monitoring endpoints.
 """
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from loguru import logger
 
 from ....schemas.responses import StandardResponse, HealthStatus, create_success_response
 from ....core.config import get_settings
+from ....services.infrastructure.database import DatabaseService
+from ....services.infrastructure.pool_telemetry import pool_telemetry
+from ....services.infrastructure.query_builder import statement_stats
+from ....services.infrastructure.reference_cache import reference_cache
+from ....services.infrastructure.cpu_pool import cpu_pool
+from ....services.infrastructure.progress_events import progress_event_hub
+from ...admission import admission_controller
+from ...response_cache import response_cache
 
 
 def _get_llm_provider_status():
@@ -80,14 +88,24 @@ async def health_check():
 
 
 @router.get("/health/detailed", response_model=StandardResponse)
-async def detailed_health_check():
+async def detailed_health_check(request: Request):
     """
     Detailed health check that includes more comprehensive system information.
+
+    The report is cached for RESPONSE_CACHE_TTL_SECONDS so frequent polling
+    does not re-probe LLM providers on every call.
     
     Returns:
         StandardResponse: Contains detailed service health information
     """
     settings = get_settings()
+    return await response_cache.respond(
+        request, "health:detailed", _build_detailed_health, ttl=settings.response_cache_ttl_seconds
+    )
+
+
+async def _build_detailed_health():
+    settings = get_settings()
     
     try:
         # Future: Add actual dependency checks here
@@ -105,6 +123,16 @@ async def detailed_health_check():
                 "host": settings.host,
                 "port": settings.port
             },
+            "database": {
+                **pool_telemetry.snapshot(),
+                "replica": DatabaseService.replica_status(),
+                "statement_cache": statement_stats.snapshot(),
+                "reference_cache": reference_cache.snapshot()
+            },
+            "response_cache": response_cache.snapshot(),
+            "progress_events": progress_event_hub.snapshot(),
+            "admission": admission_controller.snapshot(),
+            "cpu_pool": cpu_pool.snapshot(),
             "dependencies": {
                 "postgrest": {
                     "url": settings.postgrest_url,
@@ -2,12 +2,16 @@
 API endpoints for job posting review CrewAI functionality.
 """
 from typing import Dict, Any, Optional, Union
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from loguru import logger
 from pydantic import BaseModel, Field
 
 from ....schemas.responses import StandardResponse, create_success_response, create_error_response
 from ....services.crewai.job_posting_review.crew import get_job_posting_review_crew, run_crew
+from ....services.infrastructure.queue import QueueService
+from ....dependencies import get_queue_service
+from .analysis_jobs import submit_analysis, run_cached_analysis
+from ...admission import admission
 
 router = APIRouter(prefix="/job-posting-review", tags=["Job Posting Review"])
 
@@ -41,8 +45,13 @@ class JobPostingInput(BaseModel):
         }
 
 
-@router.post("/analyze", response_model=StandardResponse)
-async def analyze_job_posting(job_input: JobPostingInput):
+@router.post("/analyze", response_model=StandardResponse, dependencies=[Depends(admission("analysis"))])
+async def analyze_job_posting(
+    job_input: JobPostingInput,
+    mode: str = Query("sync", pattern="^(sync|async)$", description="async: enqueue and return a task handle"),
+    webhook_url: Optional[str] = Query(None, description="Async mode: local URL to POST the outcome to"),
+    queue_service: QueueService = Depends(get_queue_service)
+):
     """
     Analyze a job posting using the CrewAI job posting review system.
     
@@ -56,25 +65,29 @@ async def analyze_job_posting(job_input: JobPostingInput):
     The crew uses a hierarchical process where the managing agent controls the workflow
     and only proceeds to deeper analysis if the job passes initial filters.
     
+    Identical postings are answered from the analysis result cache. With
+    ``mode=async`` the crew runs on a worker and the 202 response carries a
+    task handle to poll under ``/analysis-jobs`` (or a ``webhook_url`` to call).
+    
     Args:
         job_input: JobPostingInput containing job posting data and optional configuration
     
     Returns:
         Structured analysis results with recommendation, reasoning, and scores
     """
+    # Convert job posting to dictionary format for processing
+    if isinstance(job_input.job_posting, str):
+        job_data = {"raw_text": job_input.job_posting}
+    else:
+        job_data = job_input.job_posting
+    payload = {"job_posting": job_data, "options": job_input.options or {}}
+
+    if mode == "async":
+        return await submit_analysis(queue_service, "analyze", payload, webhook_url)
+
     try:
-        # Convert job posting to dictionary format for processing
-        if isinstance(job_input.job_posting, str):
-            job_data = {"raw_text": job_input.job_posting}
-        else:
-            job_data = job_input.job_posting
-            
-        # Run the crew using the existing run_crew function for compatibility
-        result = run_crew(
-            job_posting_data=job_data,
-            options=job_input.options or {},
-            correlation_id=None  # Could generate UUID here if needed
-        )
+        # Runs the crew through run_crew in a worker thread, reusing a cached result when present
+        result = await run_cached_analysis(queue_service, "analyze", payload)
         
         return create_success_response(
             data=result,
@@ -89,7 +102,8 @@ async def analyze_job_posting(job_input: JobPostingInput):
         )
 
 
-@router.post("/analyze/simple", response_model=StandardResponse)
+@router.post("/analyze/simple", response_model=StandardResponse,
+             dependencies=[Depends(admission("analysis"))])
 async def analyze_job_posting_simple(job_posting: Union[str, Dict[str, Any]]):
     """
     Simplified endpoint for job posting analysis with just the job posting data.
@@ -3,12 +3,14 @@ Job Review API endpoints.
 
 Provides REST API for managing job reviews.
 """
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
+from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from pydantic import BaseModel, Field
 from loguru import logger
 
+from ....core.config import get_settings
 from ....services.infrastructure.job_review_service import get_job_review_service
+from ...response_cache import response_cache
 
 
 router = APIRouter(prefix="/job-review", tags=["job-review"])
@@ -28,6 +30,22 @@ class QueueJobsResponse(BaseModel):
     message: str
 
 
+class QueueBatchesRequest(BaseModel):
+    """Request model for queuing batch review tasks."""
+    batches: int = Field(1, ge=1, le=50)
+    batch_size: Optional[int] = Field(None, ge=1, le=200)
+    max_retries: int = 3
+
+
+class QueueBatchesResponse(BaseModel):
+    """Response model for batch queue operation."""
+    status: str
+    queued_batches: int
+    batch_size: int
+    task_ids: List[str]
+    message: str
+
+
 class JobReviewStatusResponse(BaseModel):
     """Response model for job review status."""
     job_id: str
@@ -67,6 +85,20 @@ async def queue_pending_jobs(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/queue/batch", response_model=QueueBatchesResponse)
+async def queue_review_batches(
+    request: QueueBatchesRequest,
+    service = Depends(get_service)
+):
+    """Queue batch review tasks that each claim and review several pending jobs."""
+    try:
+        result = await service.queue_review_batches(request.batches, request.batch_size, request.max_retries)
+        return QueueBatchesResponse(**result)
+    except Exception as e:
+        logger.error(f"Failed to queue review batches: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/status/{job_id}", response_model=JobReviewStatusResponse)
 async def get_job_review_status(
     job_id: str,
@@ -86,14 +118,19 @@ async def get_job_review_status(
 
 
 @router.get("/stats", response_model=ReviewStatsResponse)
-async def get_review_statistics(service = Depends(get_service)):
-    """Get overall review statistics."""
-    try:
-        result = await service.get_review_stats()
-        return ReviewStatsResponse(**result)
-    except Exception as e:
-        logger.error(f"Failed to get review stats: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_review_statistics(request: Request, service = Depends(get_service)):
+    """Get overall review statistics (briefly cached, revalidate with If-None-Match)."""
+    async def build():
+        try:
+            result = await service.get_review_stats()
+            return ReviewStatsResponse(**result)
+        except Exception as e:
+            logger.error(f"Failed to get review stats: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return await response_cache.respond(
+        request, "job_review:stats", build, ttl=get_settings().response_cache_ttl_seconds
+    )
 
 
 @router.post("/requeue")
@@ -117,10 +154,7 @@ async def test_job_review(
 ):
     """Queue a specific job for review (for testing)."""
     try:
-        # Use the queue service directly for single job testing
-        queue_service = service.queue_service
-        
-        task_id = queue_service.enqueue_job_review(job_id)
+        task_id = await service.queue_single_job(job_id)
         if not task_id:
             raise HTTPException(status_code=500, detail="Failed to queue job")
         
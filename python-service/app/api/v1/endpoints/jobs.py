@@ -3,20 +3,37 @@ Jobs API endpoints.
 
 Provides REST API for accessing jobs and job reviews.
 """
-import asyncio
 import base64
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import AsyncIterator, Optional, List
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 from loguru import logger
+from starlette.requests import ClientDisconnect
 from datetime import datetime
 
 from ....schemas.job_reviews import ReviewedJobsResponse, ReviewedJob, JobDetails, JobReviewData
+from ....schemas.job_search import JobSearchResponse, JobFacetsResponse, TypeaheadResponse
 from ....schemas.job_parsing import JobParseRequest, JobParseResponse
 from ....schemas.jobspy import ScrapedJob
-from ....services.infrastructure.database import get_database_service, DatabaseService
+from ....services.infrastructure.database import get_database_service, DatabaseService, REVIEW_SUMMARY_FIELDS
 from ....services.infrastructure.job_persistence import persist_jobs
-from ....services.ai.job_parser import JobParser
+from ....services.infrastructure.ndjson_stream import iter_ndjson_lines
+from ....services.infrastructure.tabular_export import (
+    MEDIA_TYPES as EXPORT_MEDIA_TYPES,
+    csv_chunks,
+    export_columns,
+    first_batch_primed,
+    parquet_available,
+    parquet_chunks,
+)
+from ....services.infrastructure.queue import QueueService
+from ....dependencies import get_queue_service
+from .analysis_jobs import submit_analysis, run_cached_analysis
+from ....core.config import get_settings
+from ...response_cache import response_cache
+from ...admission import admission
 
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -68,6 +85,37 @@ class OverrideResponse(BaseModel):
         }
 
 
+class BulkOverrideItem(BaseModel):
+    """One override in a bulk request."""
+    job_id: str
+    override_recommend: bool
+    override_comment: str
+
+
+class BulkOverrideRequest(BaseModel):
+    """Request model for overriding many AI recommendations at once."""
+    overrides: List[BulkOverrideItem] = Field(..., min_items=1, max_items=1000)
+
+
+class BulkOverrideResult(BaseModel):
+    """Outcome of one override in a bulk request."""
+    job_id: str
+    status: str = Field(..., description="updated, not_found or invalid")
+    override_recommend: Optional[bool] = None
+    override_comment: Optional[str] = None
+    override_by: Optional[str] = None
+    override_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class BulkOverrideResponse(BaseModel):
+    """Response model for bulk override operation."""
+    updated: int
+    not_found: int
+    invalid: int
+    results: List[BulkOverrideResult]
+
+
 class JobIngestRecord(ScrapedJob):
     """Extended job payload allowing encoded descriptions."""
     description_encoded: Optional[str] = Field(
@@ -79,6 +127,29 @@ class JobIngestRecord(ScrapedJob):
         extra = "ignore"
 
 
+def _require_ingest_fields(job: JobIngestRecord) -> JobIngestRecord:
+    if not job.job_url:
+        raise ValueError("job_url is required for each job")
+    if not job.title:
+        raise ValueError("title is required for each job")
+    return job
+
+
+def _normalize_ingest_record(job: JobIngestRecord, site_name: str) -> dict:
+    """Record as handed to persist_jobs: encoded description decoded, site defaulted."""
+    job_data = job.model_dump()
+    encoded_description = job_data.pop("description_encoded", None)
+    if encoded_description:
+        try:
+            job_data["description"] = base64.b64decode(encoded_description).decode("utf-8")
+        except Exception as decode_error:
+            raise ValueError(
+                f"Invalid base64 description for job '{job.job_url}': {decode_error}"
+            ) from decode_error
+    job_data.setdefault("site", site_name)
+    return job_data
+
+
 class JobIngestRequest(BaseModel):
     """Request payload for ingesting external job records."""
     site_name: str = Field(..., min_length=1, description="Source identifier or job board name")
@@ -86,11 +157,7 @@ class JobIngestRequest(BaseModel):
 
     @validator("jobs", each_item=True)
     def _validate_job(cls, job: JobIngestRecord):
-        if not job.job_url:
-            raise ValueError("job_url is required for each job")
-        if not job.title:
-            raise ValueError("title is required for each job")
-        return job
+        return _require_ingest_fields(job)
 
 
 class JobIngestSummary(BaseModel):
@@ -105,9 +172,15 @@ class JobIngestResponse(BaseModel):
     summary: JobIngestSummary
 
 
-async def get_database():
-    """Dependency to get initialized database service."""
-    db_service = get_database_service()
+MAX_STREAM_SUMMARY_ERRORS = 100
+
+
+async def get_database(request: Request):
+    """Dependency to get the application's initialized database service."""
+    db_service = getattr(request.app.state, "database_service", None)
+    if db_service is None:
+        # Outside the app lifespan (e.g. a bare router in tests); one service per process
+        db_service = request.app.state.database_service = get_database_service()
     if not db_service.initialized:
         await db_service.initialize()
     return db_service
@@ -115,6 +188,7 @@ async def get_database():
 
 @router.get("/reviews", response_model=ReviewedJobsResponse)
 async def get_job_reviews(
+    request: Request,
     limit: int = Query(50, ge=1, le=100, description="Number of items per page"),
     offset: int = Query(0, ge=0, description="Number of items to skip"),
     sort_by: str = Query("date_posted", description="Sort field: date_posted, company, title, review_date, recommendation"),
@@ -127,14 +201,63 @@ async def get_job_reviews(
     is_remote: Optional[bool] = Query(None, description="Filter by remote work availability"),
     date_posted_after: Optional[datetime] = Query(None, description="Filter jobs posted after this date"),
     date_posted_before: Optional[datetime] = Query(None, description="Filter jobs posted before this date"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides offset"),
+    fields: Optional[str] = Query(None, description="Comma-separated job/review fields to return, e.g. title,company,tldr_summary"),
+    view: str = Query("full", pattern="^(full|summary)$", description="summary: list-row fields only, without description or crew output"),
     db: DatabaseService = Depends(get_database)
 ):
     """
     Get reviewed job postings with combined job and review data.
     
     Returns paginated results with support for filtering and sorting.
-    Combines data from jobs and job_reviews tables.
+    Combines data from jobs and job_reviews tables. Follow ``next_cursor``
+    for keyset pagination; ``offset`` is kept for jumping to a page.
+
+    ``fields`` or ``view=summary`` trims each row to the named fields (plus
+    ``job_id``); only the columns they need are read from the database.
+    Responses carry an ETag derived from the reviews change stamp; send it
+    back as ``If-None-Match`` to get 304 while nothing has changed.
     """
+    version = await db.get_reviews_version()
+    return await response_cache.respond(
+        request,
+        "jobs:reviews",
+        lambda: _build_job_reviews(
+            db, limit, offset, sort_by, sort_order, recommendation, min_score, max_score,
+            company, source, is_remote, date_posted_after, date_posted_before, cursor,
+            _review_fields(fields, view),
+        ),
+        ttl=get_settings().response_cache_versioned_ttl_seconds,
+        version=version,
+    )
+
+
+def _review_fields(fields: Optional[str], view: str) -> Optional[List[str]]:
+    """Field projection for /jobs/reviews; None means every field."""
+    if fields:
+        return [field.strip() for field in fields.split(",") if field.strip()]
+    if view == "summary":
+        return list(REVIEW_SUMMARY_FIELDS)
+    return None
+
+
+async def _build_job_reviews(
+    db: DatabaseService,
+    limit: int,
+    offset: int,
+    sort_by: str,
+    sort_order: str,
+    recommendation: Optional[bool],
+    min_score: Optional[float],
+    max_score: Optional[float],
+    company: Optional[str],
+    source: Optional[str],
+    is_remote: Optional[bool],
+    date_posted_after: Optional[datetime],
+    date_posted_before: Optional[datetime],
+    cursor: Optional[str],
+    fields: Optional[List[str]] = None,
+) -> ReviewedJobsResponse:
     try:
         # Validate sort parameters
         valid_sort_fields = [
@@ -170,13 +293,26 @@ async def get_job_reviews(
             source=source,
             is_remote=is_remote,
             date_posted_after=date_posted_after,
-            date_posted_before=date_posted_before
+            date_posted_before=date_posted_before,
+            cursor=cursor,
+            fields=fields
         )
 
         # Calculate pagination info
-        page = (offset // limit) + 1
+        page = result.get("page", (offset // limit) + 1)
         total_count = result["total_count"]
-        has_more = offset + limit < total_count
+        has_more = result.get("has_more", offset + limit < total_count)
+
+        if fields is not None:
+            # Partial rows do not satisfy the full models; they are plain JSON already
+            return {
+                "jobs": result["jobs"],
+                "total_count": total_count,
+                "page": page,
+                "page_size": limit,
+                "has_more": has_more,
+                "next_cursor": result.get("next_cursor"),
+            }
 
         # Transform to response models
         reviewed_jobs = []
@@ -191,11 +327,14 @@ async def get_job_reviews(
             total_count=total_count,
             page=page,
             page_size=limit,
-            has_more=has_more
+            has_more=has_more,
+            next_cursor=result.get("next_cursor")
         )
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get job reviews: {e}")
         import traceback
@@ -203,6 +342,184 @@ async def get_job_reviews(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reviews/export")
+async def export_job_reviews(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|parquet)$", description="Export format: csv or parquet"),
+    sort_by: str = Query(
+        "date_posted",
+        pattern="^(date_posted|company|title|review_date|recommendation|overall_alignment_score)$",
+        description="Sort field: date_posted, company, title, review_date, recommendation"
+    ),
+    sort_order: str = Query("DESC", pattern="^(ASC|DESC|asc|desc)$", description="Sort order: ASC or DESC"),
+    recommendation: Optional[bool] = Query(None, description="Filter by recommendation status"),
+    min_score: Optional[float] = Query(None, ge=0.0, le=1.0, description="Minimum alignment score"),
+    max_score: Optional[float] = Query(None, ge=0.0, le=1.0, description="Maximum alignment score"),
+    company: Optional[str] = Query(None, description="Filter by company name (partial match)"),
+    source: Optional[str] = Query(None, description="Filter by job source"),
+    is_remote: Optional[bool] = Query(None, description="Filter by remote work availability"),
+    date_posted_after: Optional[datetime] = Query(None, description="Filter jobs posted after this date"),
+    date_posted_before: Optional[datetime] = Query(None, description="Filter jobs posted before this date"),
+    include_overridden: bool = Query(False, description="Also export jobs that have a human override"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to export (default: all)"),
+    db: DatabaseService = Depends(get_database)
+):
+    """
+    Export every reviewed job matching the /jobs/reviews filters as CSV or Parquet.
+
+    The rows are read through one server-side cursor and written to the
+    response batch by batch, so the export is a single request whatever its
+    size and memory stays bounded. Columns are the /jobs/reviews job and
+    review fields, flattened; JSON fields (crew_output, personas, ...) are
+    exported as JSON text.
+    """
+    if export_format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires the pyarrow package")
+
+    projection = _review_fields(fields, "full")
+    try:
+        batches = await first_batch_primed(db.iter_reviewed_jobs(
+            sort_by=sort_by,
+            sort_order=sort_order,
+            recommendation=recommendation,
+            min_score=min_score,
+            max_score=max_score,
+            company=company,
+            source=source,
+            is_remote=is_remote,
+            date_posted_after=date_posted_after,
+            date_posted_before=date_posted_before,
+            include_overridden=include_overridden,
+            fields=projection,
+            batch_size=get_settings().export_batch_size,
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to export job reviews: {e}")
+
+    columns = export_columns(projection)
+    chunks = csv_chunks(batches, columns) if export_format == "csv" else parquet_chunks(batches, columns)
+    filename = f"reviewed-jobs-{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.{export_format}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/search", response_model=JobSearchResponse)
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200, description='Search text; supports "phrases", or, and -exclusions'),
+    limit: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    offset: int = Query(0, ge=0, le=1000, description="Number of matches to skip"),
+    source: Optional[str] = Query(None, description="Filter by job source"),
+    include_duplicates: bool = Query(False, description="Include postings hidden as cross-site duplicates"),
+    snippets: bool = Query(True, description="Return highlighted title and description snippets"),
+    db: DatabaseService = Depends(get_database)
+):
+    """
+    Ranked full-text search over job title, company, location and description.
+
+    Backed by the GIN-indexed ``jobs.search_vector`` column, so latency depends
+    on the number of matches rather than the table size.
+    """
+    result = await db.search_jobs(
+        q,
+        limit=limit,
+        offset=offset,
+        site=source,
+        include_duplicates=include_duplicates,
+        snippets=snippets
+    )
+    return JobSearchResponse(
+        query=result["query"],
+        results=result["results"],
+        page_size=limit,
+        offset=offset,
+        has_more=result["has_more"]
+    )
+
+
+@router.get("/facets", response_model=JobFacetsResponse)
+async def get_job_facets(
+    top_n: int = Query(10, ge=1, le=50, description="Values returned per facet"),
+    q: Optional[str] = Query(None, max_length=200, description="Full-text search filter"),
+    company: Optional[str] = Query(None, description="Filter by company name (partial match)"),
+    source: Optional[str] = Query(None, description="Filter by job source"),
+    status: Optional[str] = Query(None, description="Filter by review workflow status"),
+    is_remote: Optional[bool] = Query(None, description="Filter by remote work availability"),
+    date_posted_after: Optional[datetime] = Query(None, description="Filter jobs posted after this date"),
+    date_posted_before: Optional[datetime] = Query(None, description="Filter jobs posted before this date"),
+    include_duplicates: bool = Query(False, description="Count postings hidden as cross-site duplicates"),
+    db: DatabaseService = Depends(get_database)
+):
+    """
+    Top companies, sites and statuses with counts for the given filters.
+    """
+    return await db.get_job_facets(
+        top_n=top_n,
+        query=q,
+        company=company,
+        source=source,
+        status=status,
+        is_remote=is_remote,
+        date_posted_after=date_posted_after,
+        date_posted_before=date_posted_before,
+        include_duplicates=include_duplicates
+    )
+
+
+@router.get("/typeahead", response_model=TypeaheadResponse)
+async def typeahead(
+    field: str = Query("company", description="Field to complete: company or title"),
+    q: str = Query(..., min_length=1, max_length=100, description="Prefix typed so far"),
+    limit: int = Query(10, ge=1, le=25, description="Maximum suggestions"),
+    db: DatabaseService = Depends(get_database)
+):
+    """
+    Prefix completions for company or title, served by the trigram indexes.
+    """
+    try:
+        suggestions = await db.typeahead(field, q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TypeaheadResponse(field=field, prefix=q, suggestions=suggestions)
+
+
+@router.post("/reviews/overrides", response_model=BulkOverrideResponse)
+async def bulk_override_job_reviews(
+    request: BulkOverrideRequest,
+    db: DatabaseService = Depends(get_database)
+):
+    """
+    Override AI recommendations for many jobs in a single transaction.
+
+    All overrides are written by one set-based UPDATE. Results are returned
+    per item, in request order; items whose job_id is malformed or has no
+    review are reported individually and do not fail the rest.
+    """
+    try:
+        results = await db.bulk_update_job_review_overrides(
+            [item.model_dump() for item in request.overrides],
+            override_by="system_admin"  # Placeholder until user auth exists
+        )
+    except Exception as e:
+        logger.error(f"Failed to apply bulk job review overrides: {e}")
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+    counts = {"updated": 0, "not_found": 0, "invalid": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
+    return BulkOverrideResponse(
+        **counts,
+        results=[
+            BulkOverrideResult(**{key: value for key, value in result.items() if key in BulkOverrideResult.model_fields})
+            for result in results
+        ]
+    )
+
+
 @router.post("/reviews/{job_id}/override", response_model=OverrideResponse)
 async def override_job_review(
     job_id: str,
@@ -295,6 +612,24 @@ async def override_job_review(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/deduplication/consistency-check")
+async def check_duplicate_groups(
+    repair: bool = Query(False, description="Recompute any inconsistent duplicate groups"),
+    db: DatabaseService = Depends(get_database)
+):
+    """
+    Check the trigger-maintained duplicate groups behind ``jobs_deduplicated``.
+
+    Compares ``job_duplicate_groups`` against a full recomputation over ``jobs``
+    and lists groups that are missing, stale or carry a wrong representative or
+    aggregates. Pass ``repair=true`` to recompute them in place.
+    """
+    result = await db.check_duplicate_groups(repair=repair)
+    if result.get("error"):
+        raise HTTPException(status_code=500, detail=result["error"])
+    return result
+
+
 @router.post("/ingest", response_model=JobIngestResponse)
 async def ingest_jobs(request: JobIngestRequest):
     """
@@ -306,21 +641,8 @@ async def ingest_jobs(request: JobIngestRequest):
     performs canonical-key deduplication and fingerprint checks.
     """
     try:
-        normalized_jobs: List[dict] = []
-        for job in request.jobs:
-            job_data = job.model_dump()
-            encoded_description = job_data.pop("description_encoded", None)
-            if encoded_description:
-                try:
-                    decoded_bytes = base64.b64decode(encoded_description)
-                    job_data["description"] = decoded_bytes.decode("utf-8")
-                except Exception as decode_error:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid base64 description for job '{job.job_url}': {decode_error}"
-                    ) from decode_error
-            job_data.setdefault("site", request.site_name)
-            normalized_jobs.append(job_data)
+        # A bad base64 description raises ValueError, answered with 400 below
+        normalized_jobs = [_normalize_ingest_record(job, request.site_name) for job in request.jobs]
 
         summary_dict = await persist_jobs(records=normalized_jobs, site_name=request.site_name)
         summary = JobIngestSummary(**summary_dict)
@@ -337,17 +659,145 @@ async def ingest_jobs(request: JobIngestRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/parse", response_model=JobParseResponse)
-async def parse_job_description(request: JobParseRequest):
+class _UploadStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body generator is still reading the request body.
+
+    StreamingResponse normally consumes ``receive()`` to watch for a client
+    disconnect, which would swallow the upload's body messages; here the
+    upload reader raises ClientDisconnect instead.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+
+async def _persist_ingest_chunk(number: int, first_line: int, last_line: int, records: List[dict],
+                                invalid: List[str], site_name: str) -> dict:
+    summary: dict = {}
+    if records:
+        try:
+            summary = await persist_jobs(records=records, site_name=site_name)
+        except Exception as e:
+            logger.error(f"Failed to persist ingest chunk {number} (lines {first_line}-{last_line}): {e}")
+            summary = {"errors": [f"chunk failed: {e}"]}
+    return {
+        "chunk": number,
+        "first_line": first_line,
+        "last_line": last_line,
+        "received": len(records) + len(invalid),
+        "inserted": summary.get("inserted", 0),
+        "skipped_duplicates": summary.get("skipped_duplicates", 0),
+        "blocked_duplicates": summary.get("blocked_duplicates", 0),
+        "errors": invalid + list(summary.get("errors", [])),
+    }
+
+
+async def _stream_ingest(body: AsyncIterator[bytes], site_name: str, gzipped: bool,
+                         chunk_size: int) -> AsyncIterator[bytes]:
+    """Validate and persist NDJSON records ``chunk_size`` at a time, yielding one result line per chunk."""
+    max_line_bytes = get_settings().ingest_stream_max_line_bytes
+    totals = JobIngestSummary()
+    error_count = 0
+    chunks = 0
+    lines = 0
+    failure: Optional[str] = None
+    records: List[dict] = []
+    invalid: List[str] = []
+    first_line = 0
+
+    def tally(result: dict) -> bytes:
+        nonlocal error_count
+        totals.inserted += result["inserted"]
+        totals.skipped_duplicates += result["skipped_duplicates"]
+        totals.blocked_duplicates += result["blocked_duplicates"]
+        error_count += len(result["errors"])
+        # The summary keeps the first errors only, so a bad upload cannot grow it without bound
+        totals.errors.extend(result["errors"][:MAX_STREAM_SUMMARY_ERRORS - len(totals.errors)])
+        return orjson.dumps(result) + b"\n"
+
+    try:
+        async for line_number, line in iter_ndjson_lines(body, gzipped, max_line_bytes):
+            first_line = first_line or line_number
+            lines = line_number
+            try:
+                record = _require_ingest_fields(JobIngestRecord.model_validate(orjson.loads(line)))
+                records.append(_normalize_ingest_record(record, site_name))
+            except ValueError as e:
+                invalid.append(f"line {line_number}: {e}")
+
+            if len(records) + len(invalid) >= chunk_size:
+                chunks += 1
+                yield tally(await _persist_ingest_chunk(chunks, first_line, line_number, records, invalid, site_name))
+                records, invalid, first_line = [], [], 0
+    except ClientDisconnect:
+        logger.warning(f"Client disconnected during streaming ingest for {site_name} after {lines} lines")
+        return
+    except ValueError as e:
+        # Unreadable body (corrupt gzip, oversized line): keep what was read, then stop
+        failure = str(e)
+        logger.warning(f"Streaming ingest for {site_name} stopped at line {lines}: {failure}")
+
+    if records or invalid:
+        chunks += 1
+        yield tally(await _persist_ingest_chunk(chunks, first_line, lines, records, invalid, site_name))
+
+    yield orjson.dumps({
+        "done": True,
+        "success": failure is None and totals.inserted > 0 and error_count == 0,
+        "chunks": chunks,
+        "lines": lines,
+        "error_count": error_count,
+        "error": failure,
+        "summary": totals.model_dump(),
+    }) + b"\n"
+
+
+@router.post("/ingest/stream")
+async def ingest_jobs_stream(
+    request: Request,
+    site_name: str = Query(..., min_length=1, description="Source identifier or job board name"),
+    chunk_size: Optional[int] = Query(None, ge=1, le=5000, description="Records persisted per chunk"),
+):
+    """
+    Ingest job records from a newline-delimited JSON upload.
+
+    Each line is one job object, validated like the records of ``/jobs/ingest``.
+    The body may be gzip compressed (``Content-Encoding: gzip``). Records are
+    persisted ``chunk_size`` at a time while the upload is still arriving, and
+    the response streams one NDJSON result line per chunk, followed by a
+    ``{"done": true, ...}`` line with the totals. Invalid lines are reported in
+    their chunk's ``errors`` and do not stop the upload.
+    """
+    gzipped = request.headers.get("content-encoding", "").lower() == "gzip"
+    return _UploadStreamingResponse(
+        _stream_ingest(request.stream(), site_name, gzipped, chunk_size or get_settings().ingest_stream_chunk_size),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/parse", response_model=JobParseResponse, dependencies=[Depends(admission("analysis"))])
+async def parse_job_description(
+    request: JobParseRequest,
+    mode: str = Query("sync", pattern="^(sync|async)$", description="async: enqueue and return a task handle"),
+    webhook_url: Optional[str] = Query(None, description="Async mode: local URL to POST the outcome to"),
+    queue_service: QueueService = Depends(get_queue_service)
+):
     """
     Parse a raw job description using AI to extract structured data.
+
+    Identical descriptions are answered from the analysis result cache. With
+    ``mode=async`` the parse runs on a worker; the 202 response carries the
+    task handle and its status/result URLs.
     """
+    payload = {"description": request.description}
+    if mode == "async":
+        return await submit_analysis(queue_service, "parse", payload, webhook_url)
+
     try:
-        parser = JobParser()
-        # Run blocking parser in a separate thread to avoid blocking the event loop
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, parser.parse_job_text, request.description)
-        return result
+        # Parsing runs in a separate thread to avoid blocking the event loop
+        result = await run_cached_analysis(queue_service, "parse", payload)
+        return JobParseResponse(**result)
     except Exception as e:
         logger.error(f"Error in parse_job_description: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -355,6 +355,7 @@ async def get_queue_status(
 async def clear_orphaned_locks(
     pattern: str = Query("scrape_lock:*", description="Redis key pattern for locks to clear"),
     max_age_hours: int = Query(24, description="Maximum age in hours for locks to consider orphaned"),
+    scan_legacy: bool = Query(False, description="Also SCAN for locks created before the lock registry"),
     queue_service: QueueService = Depends(get_queue_service),
 ):
     """
@@ -363,6 +364,7 @@ async def clear_orphaned_locks(
     Args:
         pattern: Redis key pattern to match (default: scrape locks)
         max_age_hours: Maximum age for locks before considering them orphaned
+        scan_legacy: Include unregistered locks found with a cursor-based SCAN
 
     Returns:
         StandardResponse containing cleanup results
@@ -375,7 +377,8 @@ async def clear_orphaned_locks(
 
         cleanup_result = queue_service.clear_orphaned_locks(
             pattern=pattern,
-            max_age_hours=max_age_hours
+            max_age_hours=max_age_hours,
+            scan_legacy=scan_legacy
         )
 
         if "error" in cleanup_result:
@@ -396,6 +399,7 @@ async def clear_orphaned_locks(
 @router.get("/queue/locks", response_model=StandardResponse)
 async def get_active_locks(
     pattern: str = Query("scrape_lock:*", description="Redis key pattern for locks to check"),
+    scan_legacy: bool = Query(False, description="Also SCAN for locks created before the lock registry"),
     queue_service: QueueService = Depends(get_queue_service),
 ):
     """
@@ -403,6 +407,7 @@ async def get_active_locks(
 
     Args:
         pattern: Redis key pattern to check
+        scan_legacy: Include unregistered locks found with a cursor-based SCAN
 
     Returns:
         StandardResponse containing lock information
@@ -413,19 +418,7 @@ async def get_active_locks(
         if not queue_service.initialized:
             await queue_service.initialize()
 
-        locks = []
-        lock_keys = queue_service.redis_conn.keys(pattern)
-
-        for lock_key_bytes in lock_keys:
-            lock_key = lock_key_bytes.decode('utf-8')
-            lock_value = queue_service.check_redis_lock(lock_key)
-
-            if lock_value:
-                lock_value_str = lock_value.decode('utf-8')
-                locks.append({
-                    "key": lock_key,
-                    "value": lock_value_str
-                })
+        locks = queue_service.list_locks(pattern, scan_legacy=scan_legacy)
 
         return create_success_response(
             data={"locks": locks, "count": len(locks)},
@@ -435,3 +428,75 @@ async def get_active_locks(
     except Exception as e:
         logger.error(f"Error getting active locks: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get active locks: {str(e)}")
+
+
+@router.get("/queue/dead-letter", response_model=StandardResponse)
+async def get_dead_letter_queue(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum entries to return"),
+    queue_service: QueueService = Depends(get_queue_service),
+):
+    """
+    List job reviews that exhausted their retries or crashed the worker.
+
+    Args:
+        limit: Maximum number of entries to return
+
+    Returns:
+        StandardResponse containing dead-letter entries with their last error
+    """
+    try:
+        if not queue_service.initialized:
+            await queue_service.initialize()
+
+        entries = queue_service.get_dead_letters(limit)
+        return create_success_response(
+            data={"entries": entries, "count": len(entries)},
+            message=f"Found {len(entries)} dead-lettered reviews"
+        )
+
+    except Exception as e:
+        logger.error(f"Error reading dead-letter queue: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to read dead-letter queue: {str(e)}")
+
+
+@router.post("/queue/dead-letter/{job_id}/replay", response_model=StandardResponse)
+async def replay_dead_letter(
+    job_id: str,
+    max_retries: Optional[int] = Query(None, ge=1, description="Override the retry budget for the replay"),
+    queue_service: QueueService = Depends(get_queue_service),
+    db_service: DatabaseService = Depends(get_database_service),
+):
+    """
+    Reset a dead-lettered job's retry count and queue it for review again.
+
+    Args:
+        job_id: UUID of the dead-lettered job
+        max_retries: Optional retry budget for the replayed review
+
+    Returns:
+        StandardResponse containing the new task_id
+    """
+    try:
+        if not queue_service.initialized:
+            await queue_service.initialize()
+
+        if not queue_service.get_dead_letter(job_id):
+            raise HTTPException(status_code=404, detail=f"Job {job_id} is not in the dead-letter queue")
+
+        if not await db_service.reset_job_review_retries(job_id):
+            raise HTTPException(status_code=500, detail=f"Failed to reset review state for job {job_id}")
+
+        task_id = queue_service.replay_dead_letter(job_id, max_retries)
+        if not task_id:
+            raise HTTPException(status_code=500, detail=f"Failed to replay job {job_id}")
+
+        return create_success_response(
+            data={"job_id": job_id, "task_id": task_id},
+            message=f"Replayed job {job_id} for review"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error replaying dead-lettered job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to replay job: {str(e)}")
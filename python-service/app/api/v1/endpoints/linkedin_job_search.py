@@ -7,6 +7,7 @@ from loguru import logger
 
 from ....schemas.responses import StandardResponse, create_success_response, create_error_response
 from ....schemas.linkedin_job_search import LinkedInJobSearchRequest, LinkedInJobSearchResponse
+from ...admission import admission
 from ....services.crewai.linkedin_job_search.crew import (
     get_linkedin_job_search_crew,
     normalize_linkedin_job_search_output,
@@ -42,7 +43,7 @@ def _format_search_criteria(request: LinkedInJobSearchRequest) -> str:
     return "; ".join(parts)
 
 
-@router.post("/search", response_model=StandardResponse)
+@router.post("/search", response_model=StandardResponse, dependencies=[Depends(admission("research"))])
 async def search_linkedin_jobs(request: LinkedInJobSearchRequest):
     """
     Execute parameterized LinkedIn job search with both search and recommendations.
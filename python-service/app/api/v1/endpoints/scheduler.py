@@ -1,7 +1,8 @@
 """
 Scheduler API endpoints for managing job scraping schedules.
 """
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
 from loguru import logger
 
 from ....schemas.responses import StandardResponse, create_success_response
@@ -64,4 +65,39 @@ async def get_scheduler_status(
         
     except Exception as e:
         logger.error(f"Error getting scheduler status: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get scheduler status: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get scheduler status: {str(e)}")
+
+@router.post("/schedules/changed", response_model=StandardResponse)
+async def notify_schedules_changed(
+    schedule_id: Optional[str] = Query(None, description="ID of the changed schedule, if known"),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
+):
+    """
+    Notify the scheduler leader that site schedules changed.
+
+    The leader reloads its next-run heap immediately instead of waiting for
+    the periodic refresh, so new or edited schedules fire on time.
+
+    Returns:
+        StandardResponse indicating whether the notification was published
+    """
+    try:
+        logger.info(f"Schedule change notification requested: {schedule_id or 'all'}")
+
+        if not scheduler_service.initialized:
+            await scheduler_service.initialize()
+
+        published = scheduler_service.notify_schedules_changed(schedule_id)
+        if not published:
+            raise HTTPException(status_code=503, detail="Failed to publish schedule change")
+
+        return create_success_response(
+            data={"published": True, "schedule_id": schedule_id},
+            message="Schedule change published"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error publishing schedule change: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to publish schedule change: {str(e)}")
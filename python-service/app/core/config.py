@@ -66,6 +66,65 @@ class Settings:
             logger.warning(
                 "DATABASE_URL may be misconfigured for Docker: %s", self.database_url
             )
+        # Prepared statements asyncpg keeps per pooled connection
+        self.database_statement_cache_size: int = int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", "100"))
+        # Pool sizing: the pool grows on demand up to max size (capped at a share of the
+        # server's max_connections) and idle connections are closed after the inactive timeout
+        self.database_pool_min_size: int = int(os.getenv("DATABASE_POOL_MIN_SIZE", "1"))
+        self.database_pool_max_size: int = int(os.getenv("DATABASE_POOL_MAX_SIZE", "5"))
+        self.database_pool_max_share: float = float(os.getenv("DATABASE_POOL_MAX_SHARE", "0.25"))
+        self.database_pool_max_inactive_seconds: float = float(os.getenv("DATABASE_POOL_MAX_INACTIVE_SECONDS", "300"))
+        # Small pool reserved for latency-sensitive API reads (0 disables it)
+        self.database_read_pool_size: int = int(os.getenv("DATABASE_READ_POOL_SIZE", "2"))
+        # Optional read replica for reads that tolerate lag; falls back to the primary when
+        # unreachable or more than DATABASE_REPLICA_MAX_LAG_SECONDS behind
+        self.database_replica_url: str = os.getenv("DATABASE_REPLICA_URL", "")
+        self.database_replica_pool_size: int = int(os.getenv("DATABASE_REPLICA_POOL_SIZE", "5"))
+        self.database_replica_max_lag_seconds: float = float(os.getenv("DATABASE_REPLICA_MAX_LAG_SECONDS", "10"))
+        self.database_replica_check_seconds: float = float(os.getenv("DATABASE_REPLICA_CHECK_SECONDS", "5"))
+
+        # Reference data cache (companies, site schedules, statuses); other processes'
+        # writes arrive via NOTIFY when the API's listener is connected, otherwise after the TTL
+        self.reference_cache_ttl_seconds: float = float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300"))
+        self.reference_cache_max_entries: int = int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", "1000"))
+        self.reference_cache_reconnect_seconds: float = float(os.getenv("REFERENCE_CACHE_RECONNECT_SECONDS", "5"))
+        # Resume context entries are keyed by a trigger-bumped version, so the TTL only reclaims memory
+        self.resume_context_cache_ttl_seconds: int = int(os.getenv("RESUME_CONTEXT_CACHE_TTL_SECONDS", "86400"))
+
+        # Polled read endpoints: ETag/304 plus a short body cache ("memory" or "redis")
+        self.response_cache_backend: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()
+        self.response_cache_ttl_seconds: float = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "5"))
+        self.response_cache_versioned_ttl_seconds: float = float(os.getenv("RESPONSE_CACHE_VERSIONED_TTL_SECONDS", "300"))
+        self.response_cache_max_entries: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "500"))
+
+        # Responses smaller than this go out uncompressed
+        self.response_compression_minimum_bytes: int = int(os.getenv("RESPONSE_COMPRESSION_MINIMUM_BYTES", "1024"))
+        self.response_compression_gzip_level: int = int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL", "6"))
+        self.response_compression_brotli_quality: int = int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", "5"))
+
+        # Progress event stream (scrape runs, job reviews) served over SSE
+        self.progress_events_max_length: int = int(os.getenv("PROGRESS_EVENTS_MAX_LENGTH", "10000"))
+        self.progress_events_block_ms: int = int(os.getenv("PROGRESS_EVENTS_BLOCK_MS", "5000"))
+        self.progress_events_retry_seconds: float = float(os.getenv("PROGRESS_EVENTS_RETRY_SECONDS", "2"))
+        self.progress_events_subscriber_buffer: int = int(os.getenv("PROGRESS_EVENTS_SUBSCRIBER_BUFFER", "1000"))
+        self.progress_events_heartbeat_seconds: float = float(os.getenv("PROGRESS_EVENTS_HEARTBEAT_SECONDS", "15"))
+
+        # Admission control for LLM-backed endpoints: concurrent slots and wait queue per endpoint class
+        self.admission_enabled: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+        self.admission_generation_concurrency: int = int(os.getenv("ADMISSION_GENERATION_CONCURRENCY", "2"))
+        self.admission_generation_queue_size: int = int(os.getenv("ADMISSION_GENERATION_QUEUE_SIZE", "4"))
+        self.admission_analysis_concurrency: int = int(os.getenv("ADMISSION_ANALYSIS_CONCURRENCY", "4"))
+        self.admission_analysis_queue_size: int = int(os.getenv("ADMISSION_ANALYSIS_QUEUE_SIZE", "8"))
+        self.admission_research_concurrency: int = int(os.getenv("ADMISSION_RESEARCH_CONCURRENCY", "1"))
+        self.admission_research_queue_size: int = int(os.getenv("ADMISSION_RESEARCH_QUEUE_SIZE", "2"))
+        self.admission_queue_timeout_seconds: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "30"))
+        self.admission_retry_after_seconds: float = float(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "10"))
+        self.admission_max_retry_after_seconds: float = float(os.getenv("ADMISSION_MAX_RETRY_AFTER_SECONDS", "300"))
+
+        # Process pool for CPU-bound text helpers (0 workers runs them inline on the event loop);
+        # inputs shorter than the threshold run inline since the round trip would cost more
+        self.cpu_pool_workers: int = int(os.getenv("CPU_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.cpu_pool_offload_min_chars: int = int(os.getenv("CPU_POOL_OFFLOAD_MIN_CHARS", "20000"))
 
         # Redis Configuration for queue system
         self.redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -81,9 +140,41 @@ class Settings:
         # Job Review Queue Configuration
         self.job_review_queue_name: str = os.getenv("JOB_REVIEW_QUEUE_NAME", "job_review")
         self.job_review_batch_size: int = int(os.getenv("JOB_REVIEW_BATCH_SIZE", "20"))
+        self.job_review_batch_concurrency: int = int(os.getenv("JOB_REVIEW_BATCH_CONCURRENCY", "5"))
         self.job_review_max_retries: int = int(os.getenv("JOB_REVIEW_MAX_RETRIES", "3"))
         self.job_review_retry_delay: int = int(os.getenv("JOB_REVIEW_RETRY_DELAY", "300"))  # 5 minutes
+        self.reviewed_jobs_count_ttl_seconds: int = int(os.getenv("REVIEWED_JOBS_COUNT_TTL_SECONDS", "300"))
+
+        # Streaming NDJSON ingest (/jobs/ingest/stream): records persisted per chunk, longest accepted line
+        self.ingest_stream_chunk_size: int = int(os.getenv("INGEST_STREAM_CHUNK_SIZE", "200"))
+        self.ingest_stream_max_line_bytes: int = int(os.getenv("INGEST_STREAM_MAX_LINE_BYTES", str(1024 * 1024)))
+        # Rows fetched per server-side cursor round trip (and per Parquet row group) in /jobs/reviews/export
+        self.export_batch_size: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+        # Async analysis (submit-and-poll for /jobs/parse and job posting analysis)
+        self.analysis_queue_name: str = os.getenv("ANALYSIS_QUEUE_NAME", "analysis")
+        self.analysis_result_ttl_seconds: int = int(os.getenv("ANALYSIS_RESULT_TTL_SECONDS", "86400"))
+        self.analysis_webhook_timeout_seconds: float = float(os.getenv("ANALYSIS_WEBHOOK_TIMEOUT_SECONDS", "10"))
+        self.analysis_webhook_allowed_hosts: set = {
+            host.strip().lower()
+            for host in os.getenv("ANALYSIS_WEBHOOK_ALLOWED_HOSTS", "localhost,127.0.0.1,host.docker.internal").split(",")
+            if host.strip()
+        }
         
+        # Scheduler Configuration
+        self.scheduler_leader_ttl_seconds: int = int(os.getenv("SCHEDULER_LEADER_TTL_SECONDS", "30"))
+        self.scheduler_refresh_seconds: int = int(os.getenv("SCHEDULER_REFRESH_SECONDS", "300"))  # Full heap reload
+        self.scheduler_retry_seconds: int = int(os.getenv("SCHEDULER_RETRY_SECONDS", "60"))  # Busy-site retry delay
+        self.scheduler_channel: str = os.getenv("SCHEDULER_CHANNEL", "scheduler:schedule_changes")
+        self.scheduler_counter_reconcile_seconds: int = int(os.getenv("SCHEDULER_COUNTER_RECONCILE_SECONDS", "3600"))  # Stat counter recount
+
+        # Scheduler backpressure: defer or thin scheduled scrapes when queues are saturated
+        self.scheduler_max_scrape_queue_depth: int = int(os.getenv("SCHEDULER_MAX_SCRAPE_QUEUE_DEPTH", "3"))
+        self.scheduler_max_review_backlog: int = int(os.getenv("SCHEDULER_MAX_REVIEW_BACKLOG", "200"))
+        self.scheduler_max_review_drain_minutes: int = int(os.getenv("SCHEDULER_MAX_REVIEW_DRAIN_MINUTES", "120"))
+        self.scheduler_backpressure_defer_minutes: int = int(os.getenv("SCHEDULER_BACKPRESSURE_DEFER_MINUTES", "30"))
+        self.site_lock_lease_seconds: int = int(os.getenv("SITE_LOCK_LEASE_SECONDS", "300"))
+
         # Poller Configuration
         self.poll_interval_minutes: int = int(os.getenv("POLL_INTERVAL_MINUTES", "5"))  # Default 5 min
 
@@ -7,17 +7,18 @@ CrewAI pipeline, delegating execution entirely through run_crew.
 import time
 import uuid
 from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from loguru import logger
 
 from ..models.job_posting import JobPosting
 from ..models.fit_review import FitReviewResult
 from ..services.crewai.job_posting_review.crew import run_crew
+from ..api.admission import admission
 
 router = APIRouter(prefix="/jobs/posting", tags=["Job Posting Fit Review"])
 
 
-@router.post("/fit_review", response_model=FitReviewResult)
+@router.post("/fit_review", response_model=FitReviewResult, dependencies=[Depends(admission("analysis"))])
 async def evaluate_job_posting_fit(
     job_posting: JobPosting,
     options: Optional[Dict[str, Any]] = None
@@ -55,6 +55,7 @@ class ReviewedJobsResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
     has_more: bool = Field(..., description="Whether there are more pages available")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page (pass as ?cursor=)")
 
 
 class ReviewedJobsFilters(BaseModel):
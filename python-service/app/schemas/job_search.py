@@ -0,0 +1,47 @@
+"""Schema for the ranked job search endpoint."""
+from typing import Optional, List, Dict
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class JobSearchResult(BaseModel):
+    """Single ranked full-text search hit."""
+    job_id: str = Field(..., description="Unique job identifier")
+    title: Optional[str] = Field(None, description="Job title")
+    company: Optional[str] = Field(None, description="Company name")
+    location: Optional[str] = Field(None, description="Job location")
+    url: Optional[str] = Field(None, description="Job posting URL")
+    source: Optional[str] = Field(None, description="Job board source (indeed, linkedin, etc.)")
+    is_remote: Optional[bool] = Field(None, description="Remote work flag")
+    date_posted: Optional[datetime] = Field(None, description="When job was originally posted")
+    rank: float = Field(..., description="ts_rank_cd relevance; title matches weigh most")
+    title_highlight: Optional[str] = Field(None, description="HTML-escaped title with matched terms wrapped in <mark>")
+    snippet: Optional[str] = Field(None, description="HTML-escaped description fragments with matched terms wrapped in <mark>")
+
+
+class JobSearchResponse(BaseModel):
+    """Response model for ranked job search."""
+    query: str = Field(..., description="Search text as received")
+    results: List[JobSearchResult] = Field(..., description="Matches ordered by relevance")
+    page_size: int = Field(..., description="Number of items per page")
+    offset: int = Field(..., description="Number of matches skipped")
+    has_more: bool = Field(..., description="Whether more matches follow this page")
+
+
+class FacetValue(BaseModel):
+    """One facet bucket."""
+    value: str = Field(..., description="Facet value")
+    count: int = Field(..., description="Matching jobs with this value")
+
+
+class JobFacetsResponse(BaseModel):
+    """Top facet values for a filter context."""
+    total: int = Field(..., description="Jobs matching the filters")
+    facets: Dict[str, List[FacetValue]] = Field(..., description="companies, sites and statuses, most frequent first")
+
+
+class TypeaheadResponse(BaseModel):
+    """Prefix completions for a job field."""
+    field: str = Field(..., description="Completed field (company or title)")
+    prefix: str = Field(..., description="Prefix as received")
+    suggestions: List[FacetValue] = Field(..., description="Distinct values starting with the prefix, most frequent first")
@@ -9,11 +9,28 @@ from loguru import logger
 from enum import Enum
 
 from .infrastructure import get_chroma_client
+from .infrastructure.cpu_pool import cpu_pool
 from .embeddings import get_embedding_function
 from ..core.config import get_settings
 from ..schemas.chroma import ChromaUploadRequest, ChromaUploadResponse, ChromaCollectionInfo
 
 
+def chunk_text(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """Split text into word chunks of ``chunk_size`` words, consecutive chunks sharing ``chunk_overlap``."""
+    words = text.split()
+    chunks = []
+    start = 0
+
+    while start < len(words):
+        end = min(start + chunk_size, len(words))
+        chunks.append(" ".join(words[start:end]))
+        if end == len(words):
+            break
+        start = max(0, end - chunk_overlap)
+
+    return chunks
+
+
 class CollectionType(Enum):
     """Enumeration of supported collection types for extensibility."""
     JOB_POSTINGS = "job_postings"
@@ -253,18 +270,7 @@ class ChromaManager:
     
     def _chunk_text(self, text: str, config: ChromaCollectionConfig) -> List[str]:
         """Split text into chunks based on collection configuration."""
-        words = text.split()
-        chunks = []
-        start = 0
-        
-        while start < len(words):
-            end = min(start + config.chunk_size, len(words))
-            chunks.append(" ".join(words[start:end]))
-            if end == len(words):
-                break
-            start = max(0, end - config.chunk_overlap)
-        
-        return chunks
+        return chunk_text(text, config.chunk_size, config.chunk_overlap)
     
     def _sha1_hash(self, text: str) -> str:
         """Generate SHA1 hash of text."""
@@ -457,16 +463,16 @@ class ChromaManager:
             # Generate document ID
             doc_id = str(uuid.uuid4())
             
-            # Create chunks based on collection configuration
-            if config:
-                chunks = self._chunk_text(document_text, config)
-            else:
-                # Fallback to default chunking
-                chunks = self._chunk_text(document_text, ChromaCollectionConfig(
-                    name=collection_name,
-                    collection_type=CollectionType.GENERIC_DOCUMENTS,
-                    description="Generic collection"
-                ))
+            # Create chunks based on collection configuration, falling back to default chunking
+            chunk_config = config or ChromaCollectionConfig(
+                name=collection_name,
+                collection_type=CollectionType.GENERIC_DOCUMENTS,
+                description="Generic collection"
+            )
+            chunks = await cpu_pool.run(
+                chunk_text, document_text, chunk_config.chunk_size, chunk_config.chunk_overlap,
+                size=len(document_text)
+            )
             
             logger.info(f"Document '{title}' chunked into {len(chunks)} parts for collection '{collection_name}'")
             
@@ -0,0 +1,119 @@
+"""
+Submit-and-poll support for LLM analysis requests.
+
+Analysis requests (``parse``: job description parsing, ``analyze``: the job
+posting review crew) are identified by a hash of their kind and input. The
+hash names both the RQ job (so identical submissions in flight share one
+job) and the Redis key holding the finished result (so identical
+resubmissions are answered from cache without running the LLM again).
+"""
+import hashlib
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+import orjson
+import redis
+from loguru import logger
+
+from ...core.config import get_settings
+
+
+ANALYSIS_KINDS = ("parse", "analyze")
+
+RESULT_KEY_PREFIX = "analysis_result:"
+WEBHOOKS_KEY_PREFIX = "analysis_webhooks:"
+
+
+def analysis_task_id(kind: str, payload: Dict[str, Any]) -> str:
+    """Deterministic task handle for an analysis input."""
+    if kind not in ANALYSIS_KINDS:
+        raise ValueError(f"Unknown analysis kind: {kind}")
+    body = orjson.dumps({"kind": kind, "payload": payload}, option=orjson.OPT_SORT_KEYS, default=str)
+    return f"analysis-{kind}-{hashlib.sha256(body).hexdigest()[:40]}"
+
+
+def get_cached_result(conn: redis.Redis, task_id: str) -> Optional[Any]:
+    try:
+        raw = conn.get(RESULT_KEY_PREFIX + task_id)
+    except redis.RedisError as e:
+        logger.warning(f"Analysis result cache read failed: {str(e)}")
+        return None
+    return orjson.loads(raw) if raw else None
+
+
+def store_result(conn: redis.Redis, task_id: str, result: Any) -> None:
+    try:
+        conn.set(
+            RESULT_KEY_PREFIX + task_id,
+            orjson.dumps(result, default=str),
+            ex=get_settings().analysis_result_ttl_seconds,
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Analysis result cache write failed: {str(e)}")
+
+
+def validate_webhook_url(url: str) -> str:
+    """Accept only http(s) callbacks to hosts listed in ANALYSIS_WEBHOOK_ALLOWED_HOSTS."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("webhook_url must be an absolute http(s) URL")
+    allowed = get_settings().analysis_webhook_allowed_hosts
+    if parsed.hostname.lower() not in allowed:
+        raise ValueError(f"webhook_url host must be one of: {', '.join(sorted(allowed))}")
+    return url
+
+
+def register_webhook(conn: redis.Redis, task_id: str, url: str) -> None:
+    """Remember a callback for a task; every submitter of a shared task is notified."""
+    key = WEBHOOKS_KEY_PREFIX + task_id
+    conn.sadd(key, url)
+    conn.expire(key, get_settings().rq_job_timeout + get_settings().rq_result_ttl)
+
+
+def pop_webhooks(conn: redis.Redis, task_id: str) -> List[str]:
+    key = WEBHOOKS_KEY_PREFIX + task_id
+    try:
+        urls = conn.smembers(key)
+        conn.delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to read analysis webhooks for {task_id}: {str(e)}")
+        return []
+    return sorted(url.decode("utf-8") if isinstance(url, bytes) else url for url in urls)
+
+
+def deliver_webhooks(urls: List[str], body: Dict[str, Any]) -> None:
+    """POST the outcome to each callback; failures are logged, never raised."""
+    content = orjson.dumps(body, default=str)
+    timeout = get_settings().analysis_webhook_timeout_seconds
+    for url in urls:
+        try:
+            response = httpx.post(url, content=content, headers={"Content-Type": "application/json"},
+                                  timeout=timeout)
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Analysis webhook to {url} failed: {str(e)}")
+
+
+def execute_analysis(kind: str, payload: Dict[str, Any]) -> Any:
+    """Run an analysis inline (imports are lazy - the LLM stacks are heavy to load)."""
+    if kind == "parse":
+        from ..ai.job_parser import JobParser
+        return JobParser().parse_job_text(payload["description"]).model_dump()
+    if kind == "analyze":
+        from ..crewai.job_posting_review.crew import run_crew
+        return run_crew(
+            job_posting_data=payload["job_posting"],
+            options=payload.get("options") or {},
+            correlation_id=None,
+        )
+    raise ValueError(f"Unknown analysis kind: {kind}")
+
+
+def is_cacheable(kind: str, result: Any) -> bool:
+    """Failures come back as results (crew ``error``, parser description-only fallback); never cache them."""
+    if not isinstance(result, dict):
+        return False
+    if kind == "parse":
+        return bool(result.get("title") or result.get("company_name"))
+    return not result.get("error")
@@ -0,0 +1,154 @@
+"""
+Shared process pool for CPU-bound text helpers.
+
+HTML cleanup, markdown formatting, dedup fingerprints and document chunking
+are pure-Python CPU work; on a large input they hold the event loop and
+stall every concurrent request. ``cpu_pool.run()`` sends such calls to a
+process pool once the input is at least ``CPU_POOL_OFFLOAD_MIN_CHARS`` long
+and runs smaller ones inline, where the round trip would cost more than the
+work.
+
+The API starts the pool in its lifespan (before other threads exist, since
+workers are forked). Anywhere it is not started - RQ workers, scripts,
+tests - every call runs inline, as does everything after a worker dies, since
+the pool cannot safely be re-forked from a threaded process. Offloaded functions must be module-level so
+they pickle by reference.
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from ...core.config import get_settings
+
+
+def _timed_call(func: Callable[..., Any], args: Tuple[Any, ...], submitted_at: float) -> Tuple[Any, float, float]:
+    """Runs in the worker: result, seconds spent queued, seconds spent executing."""
+    started_at = time.time()
+    started = time.perf_counter()
+    result = func(*args)
+    return result, max(0.0, started_at - submitted_at), time.perf_counter() - started
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def _mp_context():
+    # Forked workers inherit the already-imported app modules; spawn is the portable fallback
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+class CPUPool:
+    """Process pool plus per-function queue/execution timings."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self.broken = False
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        workers = self.settings.cpu_pool_workers
+        if self._executor is not None or workers <= 0:
+            return
+        self.broken = False
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context())
+        # Forking happens on first submit; do it now, at startup, rather than mid-request
+        self._executor.submit(_warm_up).result()
+        logger.info(f"CPU pool started with {workers} worker processes")
+
+    def _disable_broken(self, executor: ProcessPoolExecutor) -> None:
+        # Forking a replacement now would copy a process that runs threads (and their held
+        # locks) into the children, so the rest of this process's life runs inline instead
+        if self._executor is not executor:
+            return
+        self._executor = None
+        self.broken = True
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def stop(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            logger.info("CPU pool stopped")
+
+    def _record(self, name: str, offloaded: bool, queue_seconds: float, exec_seconds: float) -> None:
+        stats = self._stats.setdefault(name, {
+            "offloaded": 0, "inline": 0,
+            "queue_seconds_total": 0.0, "queue_seconds_max": 0.0,
+            "exec_seconds_total": 0.0, "exec_seconds_max": 0.0,
+        })
+        stats["offloaded" if offloaded else "inline"] += 1
+        stats["queue_seconds_total"] += queue_seconds
+        stats["queue_seconds_max"] = max(stats["queue_seconds_max"], queue_seconds)
+        stats["exec_seconds_total"] += exec_seconds
+        stats["exec_seconds_max"] = max(stats["exec_seconds_max"], exec_seconds)
+
+    def _run_inline(self, name: str, func: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._record(name, False, 0.0, time.perf_counter() - started)
+
+    async def run(self, func: Callable[..., Any], *args: Any, size: int = 0) -> Any:
+        """
+        ``func(*args)``, in a worker process when the pool is running and
+        ``size`` (the input length) reaches the offload threshold.
+        """
+        name = f"{func.__module__}.{func.__qualname__}"
+        executor = self._executor
+        if executor is None or size < self.settings.cpu_pool_offload_min_chars:
+            return self._run_inline(name, func, args)
+
+        try:
+            result, queue_seconds, exec_seconds = await asyncio.get_running_loop().run_in_executor(
+                executor, _timed_call, func, args, time.time()
+            )
+        except BrokenProcessPool as e:
+            # A worker died (OOM kill, segfault); serve this and every later call inline
+            logger.error(f"CPU pool broken while running {name}: {str(e)}; running text helpers inline")
+            self._disable_broken(executor)
+            return self._run_inline(name, func, args)
+
+        self._record(name, True, queue_seconds, exec_seconds)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        functions = {}
+        for name, stats in self._stats.items():
+            calls = stats["offloaded"] + stats["inline"]
+            functions[name] = {
+                "offloaded": int(stats["offloaded"]),
+                "inline": int(stats["inline"]),
+                "avg_queue_ms": round(stats["queue_seconds_total"] / stats["offloaded"] * 1000, 3)
+                if stats["offloaded"] else 0.0,
+                "max_queue_ms": round(stats["queue_seconds_max"] * 1000, 3),
+                "avg_exec_ms": round(stats["exec_seconds_total"] / calls * 1000, 3) if calls else 0.0,
+                "max_exec_ms": round(stats["exec_seconds_max"] * 1000, 3),
+            }
+        return {
+            "started": self.started,
+            "broken": self.broken,
+            "workers": self.settings.cpu_pool_workers if self.started else 0,
+            "offload_min_chars": self.settings.cpu_pool_offload_min_chars,
+            "functions": functions,
+        }
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+cpu_pool = CPUPool()
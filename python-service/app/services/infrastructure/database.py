@@ -2,14 +2,398 @@
 Database service for direct PostgreSQL access.
 Handles connections and queries for queue system tables.
 """
+import asyncio
 import asyncpg
-from typing import Optional, List, Dict, Any, Tuple
+import os
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, List, Dict, Any, Sequence, Tuple
 from loguru import logger
 from datetime import datetime, timezone
+import base64
+import hashlib
 import json
+import time
+import orjson
+import redis
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 
 from ...core.config import get_settings
+from .pool_telemetry import InstrumentedPool, call_site
+from .query_builder import QueryBuilder, statement_stats
+from .reference_cache import MISSING, reference_cache
+
+
+JOB_REVIEW_UPSERT_QUERY = """
+    INSERT INTO public.job_reviews (
+        job_id, recommend, confidence, rationale, personas, tradeoffs,
+        actions, sources, overall_alignment_score, crew_output, processing_time_seconds,
+        crew_version, model_used, error_message, retry_count
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+    ON CONFLICT (job_id) DO UPDATE SET
+        recommend = EXCLUDED.recommend,
+        confidence = EXCLUDED.confidence,
+        rationale = EXCLUDED.rationale,
+        personas = EXCLUDED.personas,
+        tradeoffs = EXCLUDED.tradeoffs,
+        actions = EXCLUDED.actions,
+        sources = EXCLUDED.sources,
+        overall_alignment_score = EXCLUDED.overall_alignment_score,
+        crew_output = EXCLUDED.crew_output,
+        processing_time_seconds = EXCLUDED.processing_time_seconds,
+        crew_version = EXCLUDED.crew_version,
+        model_used = EXCLUDED.model_used,
+        error_message = EXCLUDED.error_message,
+        retry_count = EXCLUDED.retry_count,
+        updated_at = NOW()
+    """
+
+
+# crew_output keys the review list UI reads; the rest of the blob stays in the database
+REVIEW_LIST_CREW_OUTPUT_KEYS = (
+    "final", "job_intake", "sources", "constraints", "readable_constraint_issues",
+    "north_star", "trajectory_mastery", "values_compass", "lifestyle_alignment",
+    "compensation_philosophy", "functional_match",
+)
+_REVIEW_LIST_CREW_OUTPUT_SQL = ", ".join(f"'{key}'" for key in REVIEW_LIST_CREW_OUTPUT_KEYS)
+
+
+def _encode_json(value: Any) -> str:
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Pool connection setup: json/jsonb values round-trip as Python objects via orjson."""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=_encode_json,
+            decoder=orjson.loads,
+            schema="pg_catalog",
+            format="text",
+        )
+
+
+# Server max_connections per DSN, probed once per process to cap pool sizes
+_server_max_connections: Dict[str, int] = {}
+
+
+async def _probe_server_max_connections(database_url: str) -> Optional[int]:
+    if database_url not in _server_max_connections:
+        conn = await asyncpg.connect(database_url, timeout=10)
+        try:
+            _server_max_connections[database_url] = int(await conn.fetchval("SHOW max_connections"))
+        finally:
+            await conn.close()
+    return _server_max_connections[database_url]
+
+
+# Read and replica pools, shared by every DatabaseService in the process so that
+# short-lived instances neither open their own nor leave them open. asyncpg pools
+# only work on the loop that created them; other loops fall back to the main pool.
+_shared_pools: Dict[str, InstrumentedPool] = {}
+_shared_pools_loop: Optional[asyncio.AbstractEventLoop] = None
+_read_pool_unavailable = False
+
+
+def _on_shared_pools_loop() -> bool:
+    global _shared_pools_loop
+    loop = asyncio.get_running_loop()
+    if not _shared_pools:
+        _shared_pools_loop = loop
+    return loop is _shared_pools_loop
+
+
+async def close_shared_pools() -> None:
+    """Close the process-wide read and replica pools (application shutdown)."""
+    global _read_pool_unavailable, _shared_pools_loop
+    while _shared_pools:
+        _, pool = _shared_pools.popitem()
+        await pool.close()
+    _read_pool_unavailable = False
+    _shared_pools_loop = None
+
+
+# Seconds the replica is behind the primary; 0 when it has replayed everything it received
+# (an idle primary would otherwise look like growing lag) or is not in recovery at all
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+# Shared by every DatabaseService in the process so a down replica is skipped everywhere
+_replica_status: Dict[str, Any] = {
+    "available": True,
+    "lag_seconds": None,
+    "checked_at": 0.0,
+    "error": None,
+    "replica_reads": 0,
+    "primary_reads": 0,
+    "lagging_reads": 0,
+}
+
+
+def _replica_check_due(settings) -> bool:
+    return time.monotonic() - _replica_status["checked_at"] >= settings.database_replica_check_seconds
+
+
+def _mark_replica_unavailable(error: Exception) -> None:
+    if _replica_status["available"]:
+        logger.warning(f"Read replica unavailable, routing reads to the primary: {str(error)}")
+    _replica_status.update(available=False, checked_at=time.monotonic(), error=str(error))
+
+
+# Current resume context stamp; users never bumped by the triggers are at 0
+RESUME_CONTEXT_VERSION_QUERY = """
+    SELECT COALESCE((SELECT version FROM resume_context_versions WHERE user_id = $1), 0)
+"""
+
+# The whole resume context in one round trip, with the stamp it was read at. Roles belong
+# to a user through their narrative, the same link the resume_context_versions trigger uses
+RESUME_CONTEXT_QUERY = """
+    SELECT
+        COALESCE((SELECT rcv.version FROM resume_context_versions rcv WHERE rcv.user_id = $1), 0) AS version,
+        (
+            SELECT json_build_object('resume_id', r.resume_id, 'resume_name', r.resume_name)
+            FROM strategic_narratives sn
+            JOIN resumes r ON sn.default_resume_id = r.resume_id
+            WHERE sn.user_id = $1
+            LIMIT 1
+        ) AS default_resume,
+        COALESCE(
+            (
+                SELECT json_agg(sjr.role_title)
+                FROM standard_job_roles sjr
+                JOIN strategic_narratives sn ON sn.narrative_id = sjr.narrative_id
+                WHERE sn.user_id = $1
+            ), '[]'::json
+        ) AS standard_job_roles,
+        COALESCE(
+            (
+                SELECT json_agg(sn.positioning_statement)
+                FROM strategic_narratives sn
+                WHERE sn.user_id = $1 AND sn.positioning_statement IS NOT NULL
+            ), '[]'::json
+        ) AS strategic_narratives
+"""
+
+# Redis holds resume contexts for RQ workers, which fork per job and so never
+# hit an in-process cache; created lazily, None when Redis is unreachable
+_resume_cache_redis: Optional[redis.Redis] = None
+
+
+def _get_resume_cache_redis() -> Optional[redis.Redis]:
+    global _resume_cache_redis
+    if _resume_cache_redis is None:
+        settings = get_settings()
+        _resume_cache_redis = redis.Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            socket_timeout=1,
+            socket_connect_timeout=1,
+        )
+    return _resume_cache_redis
+
+
+def _resume_context_key(user_id: str, version: int) -> str:
+    return f"resume_context:{user_id}:{version}"
+
+
+# Parameter types for keyset comparisons on each /jobs/reviews sort key
+_REVIEW_SORT_TYPES = {
+    "date_posted": "timestamptz",
+    "company": "text",
+    "title": "text",
+    "review_date": "timestamptz",
+    "recommendation": "boolean",
+    "overall_alignment_score": "float8",
+}
+
+# Sort keys accepted by /jobs/reviews and the export -> ORDER BY column
+_REVIEW_SORT_COLUMNS = {
+    "date_posted": "jd.date_posted",
+    "company": "jd.company",
+    "title": "jd.title",
+    "review_date": "jr.created_at",
+    "recommendation": "jr.recommend",
+    "overall_alignment_score": "jr.overall_alignment_score",
+}
+
+# Select-list entries for the reviewed-jobs page, by result column
+_REVIEW_LIST_COLUMNS = {
+    "job_id": "jd.id as job_id",
+    "title": "jd.title",
+    "company": "jd.company",
+    "location": "jd.location_city || COALESCE(', ' || jd.location_state, '') || COALESCE(', ' || jd.location_country, '') as location",
+    "url": "jd.job_url as url",
+    "date_posted": "jd.date_posted",
+    "source": "jd.site as source",
+    "description": "jd.description",
+    "salary_min": "jd.min_amount as salary_min",
+    "salary_max": "jd.max_amount as salary_max",
+    "salary_currency": "jd.currency as salary_currency",
+    "is_remote": "jd.is_remote",
+    "recommend": "jr.recommend",
+    "confidence": "jr.confidence",
+    "rationale": "jr.rationale",
+    "overall_alignment_score": "jr.overall_alignment_score",
+    "crew_output": f"""CASE WHEN jsonb_typeof(jr.crew_output) = 'object' THEN (
+                SELECT jsonb_object_agg(co.key, co.value)
+                FROM jsonb_each(jr.crew_output) co
+                WHERE co.key IN ({_REVIEW_LIST_CREW_OUTPUT_SQL})
+            ) END as crew_output""",
+    "tldr_summary": "jr.crew_output->>'tldr_summary' as tldr_summary",
+    "personas": "jr.personas",
+    "tradeoffs": "jr.tradeoffs",
+    "actions": "jr.actions",
+    "sources": "jr.sources",
+    "reviewer": "jr.crew_version as reviewer",
+    "review_date": "jr.created_at as review_date",
+    "override_recommend": "jr.override_recommend",
+    "override_comment": "jr.override_comment",
+    "override_by": "jr.override_by",
+    "override_at": "jr.override_at",
+}
+
+# Response fields accepted by ``fields=`` -> (section, result columns they are built from)
+REVIEW_LIST_FIELDS = {
+    "job_id": ("job", ("job_id",)),
+    "title": ("job", ("title",)),
+    "company": ("job", ("company",)),
+    "location": ("job", ("location",)),
+    "url": ("job", ("url",)),
+    "date_posted": ("job", ("date_posted",)),
+    "source": ("job", ("source",)),
+    "description": ("job", ("description",)),
+    "salary_min": ("job", ("salary_min",)),
+    "salary_max": ("job", ("salary_max",)),
+    "salary_currency": ("job", ("salary_currency",)),
+    "salary_range": ("job", ("salary_min", "salary_max", "salary_currency")),
+    "is_remote": ("job", ("is_remote",)),
+    "overall_alignment_score": ("review", ("overall_alignment_score", "confidence")),
+    "recommendation": ("review", ("recommend",)),
+    "confidence": ("review", ("confidence",)),
+    "reviewer": ("review", ("reviewer",)),
+    "review_date": ("review", ("review_date",)),
+    "rationale": ("review", ("rationale",)),
+    "tldr_summary": ("review", ("tldr_summary",)),
+    "crew_output": ("review", ("crew_output",)),
+    "personas": ("review", ("personas",)),
+    "tradeoffs": ("review", ("tradeoffs",)),
+    "actions": ("review", ("actions",)),
+    "sources": ("review", ("sources",)),
+    "override_recommend": ("review", ("override_recommend",)),
+    "override_comment": ("review", ("override_comment",)),
+    "override_by": ("review", ("override_by",)),
+    "override_at": ("review", ("override_at",)),
+}
+
+# ``view=summary``: what a list row renders, without descriptions or crew output
+REVIEW_SUMMARY_FIELDS = (
+    "job_id", "title", "company", "location", "url", "date_posted", "source",
+    "salary_range", "is_remote", "overall_alignment_score", "recommendation",
+    "confidence", "review_date", "tldr_summary", "override_recommend",
+)
+
+
+def _review_list_select(fields: Optional[Sequence[str]]) -> str:
+    """Select list for the requested response fields (all columns when ``fields`` is None)."""
+    if fields is None:
+        columns = list(_REVIEW_LIST_COLUMNS)
+    else:
+        unknown = sorted(set(fields) - set(REVIEW_LIST_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        # job_id is always needed for the keyset cursor
+        needed = {"job_id"}
+        for field in fields:
+            needed.update(REVIEW_LIST_FIELDS[field][1])
+        columns = [column for column in _REVIEW_LIST_COLUMNS if column in needed]
+    return ",\n            ".join(_REVIEW_LIST_COLUMNS[column] for column in columns)
+
+# Change stamp for the reviewed-jobs listing. Index-only max(updated_at) catches edits and
+# overrides; the trigger-maintained counter sums catch inserts and deletes, whichever
+# process (API or RQ worker) made them
+REVIEWS_VERSION_QUERY = """
+    SELECT (SELECT MAX(updated_at) FROM job_reviews) AS reviews_updated_at,
+           (SELECT MAX(updated_at) FROM jobs) AS jobs_updated_at,
+           (SELECT COALESCE(SUM(review_count), 0) FROM job_review_stat_counters) AS review_count,
+           (SELECT COALESCE(SUM(job_count), 0) FROM job_stat_counters) AS job_count
+"""
+
+
+def _reviews_version(row: Any) -> Tuple[Any, ...]:
+    return (
+        row["reviews_updated_at"],
+        row["jobs_updated_at"],
+        int(row["review_count"]),
+        int(row["job_count"]),
+    )
+
+
+# Cached COUNT(*) per filter signature: signature -> (total, reviews version, expires_at).
+# An entry is only reused while the reviews version it was counted at is current.
+_reviewed_jobs_count_cache: Dict[str, Tuple[int, Tuple[Any, ...], float]] = {}
+
+
+def invalidate_reviewed_jobs_count_cache() -> None:
+    _reviewed_jobs_count_cache.clear()
+
+
+def _like_escape(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (default ``\\`` escape)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# HTML escapes applied in SQL, "&" first so the others are not double-escaped
+_HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"))
+
+
+def _html_escape_sql(expression: str) -> str:
+    """SQL expression HTML-escaping ``expression`` (same output as Python's ``html.escape``)."""
+    for char, entity in _HTML_ESCAPES:
+        expression = f"replace({expression}, '{char.replace(chr(39), chr(39) * 2)}', '{entity}')"
+    return expression
+
+
+# Columns /jobs/typeahead may complete; both carry a trigram GIN index
+TYPEAHEAD_COLUMNS = {"company": "j.company", "title": "j.title"}
+# Rows read per typeahead request; bounds very common prefixes like "s"
+TYPEAHEAD_SCAN_LIMIT = 2000
+
+
+def _encode_review_cursor(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_review_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(payload, dict) or "id" not in payload:
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def _review_cursor_value(value: Any, sort_type: str) -> Any:
+    """Convert a cursor's JSON sort value back into a bindable parameter."""
+    if value is None:
+        return None
+    if sort_type == "timestamptz":
+        return datetime.fromisoformat(value)
+    if sort_type == "float8":
+        return float(value)
+    if sort_type == "boolean":
+        return bool(value)
+    return str(value)
 
 
 class DatabaseService:
@@ -17,44 +401,108 @@ class DatabaseService:
 
     def __init__(self):
         self.settings = get_settings()
-        self.pool: Optional[asyncpg.Pool] = None
-        self.initialized = False
+        self.pool: Optional[InstrumentedPool] = None
+        self.read_pool: Optional[InstrumentedPool] = None
+        self.replica_pool: Optional[InstrumentedPool] = None
+        self._initialized = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._column_cache: Dict[Tuple[str, str], bool] = {}
         self._default_user_id: Optional[str] = None
 
-    @staticmethod
-    def _deserialize_json_field(value: Any) -> Optional[Any]:
-        """Convert JSON stored as text to native Python structures for API responses."""
-        if value is None or isinstance(value, (list, dict)):
-            return value
-
-        if isinstance(value, str):
-            trimmed_value = value.strip()
-            if not trimmed_value:
-                return None
+    @property
+    def initialized(self) -> bool:
+        """Whether the main pool is ready for use on the current event loop."""
+        if not self._initialized:
+            return False
+        if self._loop is None:
+            return True
+        # A pool created on another (possibly closed) loop cannot serve this one
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return not self._loop.is_closed()
 
-            try:
-                return json.loads(trimmed_value)
-            except json.JSONDecodeError:
-                logger.warning("Failed to deserialize JSON field", value=value)
-                return None
+    @initialized.setter
+    def initialized(self, value: bool) -> None:
+        self._initialized = value
 
-        return None
+    async def _pool_budget(self) -> Tuple[int, int]:
+        """
+        (main pool max size, read pool size) for this process.
+
+        Together they stay within DATABASE_POOL_MAX_SHARE of the server's
+        max_connections; the main pool gives way first, then the read pool.
+        """
+        max_size = max(self.settings.database_pool_min_size, self.settings.database_pool_max_size)
+        read_size = max(0, self.settings.database_read_pool_size)
+        try:
+            server_max = await _probe_server_max_connections(self.settings.database_url)
+        except Exception as e:
+            logger.warning(f"Could not read server max_connections, using configured pool sizes: {str(e)}")
+            return max_size, read_size
+
+        cap = max(self.settings.database_pool_min_size, int(server_max * self.settings.database_pool_max_share))
+        capped_max = min(max_size, max(self.settings.database_pool_min_size, cap - read_size))
+        capped_read = min(read_size, max(0, cap - capped_max))
+        if (capped_max, capped_read) != (max_size, read_size):
+            logger.info(
+                f"Capping database pools at {capped_max} + {capped_read} read connections "
+                f"(server max_connections={server_max})"
+            )
+        return capped_max, capped_read
+
+    async def _pool_max_size(self) -> int:
+        """Configured max size, capped at a share of the server's max_connections."""
+        return (await self._pool_budget())[0]
+
+    async def _replica_pool_size(self) -> int:
+        """Configured replica pool size, capped at the same share of the replica's max_connections."""
+        size = max(1, self.settings.database_replica_pool_size)
+        try:
+            server_max = await _probe_server_max_connections(self.settings.database_replica_url)
+        except Exception as e:
+            logger.warning(f"Could not read replica max_connections, using configured pool size: {str(e)}")
+            return size
+        return min(size, max(1, int(server_max * self.settings.database_pool_max_share)))
+
+    async def _open_shared_pool(self, name: str, size: int, dsn: Optional[str] = None) -> InstrumentedPool:
+        """The process-wide ``name`` pool, created with ``size`` connections on first use."""
+        pool = _shared_pools.get(name)
+        if pool is None:
+            created = await self._create_pool(name, 1, size, dsn=dsn)
+            # Another coroutine may have created it while this one was connecting
+            pool = _shared_pools.setdefault(name, created)
+            if pool is not created:
+                await created.close()
+        return pool
+
+    async def _create_pool(self, name: str, min_size: int, max_size: int,
+                           dsn: Optional[str] = None) -> InstrumentedPool:
+        pool = await asyncpg.create_pool(
+            dsn or self.settings.database_url,
+            min_size=min_size,
+            max_size=max_size,
+            command_timeout=15,  # Reduced timeout
+            statement_cache_size=self.settings.database_statement_cache_size,
+            max_inactive_connection_lifetime=self.settings.database_pool_max_inactive_seconds,
+            init=_init_connection
+        )
+        return InstrumentedPool(pool, name, max_size)
 
     async def initialize(self) -> bool:
         """Initialize database connection pool with retry logic."""
-        import asyncio
-
+        max_size = await self._pool_max_size()
         for attempt in range(5):  # Retry up to 5 times
             try:
-                self.pool = await asyncpg.create_pool(
-                    self.settings.database_url,
-                    min_size=1,
-                    max_size=5,
-                    command_timeout=15  # Reduced timeout
+                self.pool = await self._create_pool(
+                    "primary", min(self.settings.database_pool_min_size, max_size), max_size
                 )
+                self.read_pool = None
+                self.replica_pool = None
+                self._loop = asyncio.get_running_loop()
+                statement_stats.cache_size = self.settings.database_statement_cache_size
                 self.initialized = True
-                logger.info("Database connection pool initialized")
+                logger.info(f"Database connection pool initialized (max_size={max_size})")
                 return True
             except Exception as e:
                 error_msg = str(e)
@@ -70,12 +518,131 @@ class DatabaseService:
         logger.error("Failed to initialize database pool after 5 attempts")
         return False
 
+    async def _get_primary_read_pool(self):
+        """Pool for latency-sensitive API reads, created on first use; falls back to the main pool."""
+        global _read_pool_unavailable
+        if self.read_pool is not None:
+            return self.read_pool
+        if _read_pool_unavailable or not _on_shared_pools_loop():
+            return self.pool
+        if "read" not in _shared_pools:
+            size = (await self._pool_budget())[1]
+            if size <= 0:
+                return self.pool
+            try:
+                await self._open_shared_pool("read", size)
+            except Exception as e:
+                _read_pool_unavailable = True
+                logger.warning(f"Read pool unavailable, using the main pool: {str(e)}")
+                return self.pool
+        self.read_pool = _shared_pools["read"]
+        return self.read_pool
+
+    async def _get_replica_pool(self):
+        """Replica pool if DATABASE_REPLICA_URL is set and the replica is usable, else None."""
+        if not self.settings.database_replica_url:
+            return None
+        if not _replica_status["available"] and not _replica_check_due(self.settings):
+            return None
+        if self.replica_pool is None and not _on_shared_pools_loop():
+            return None
+        if self.replica_pool is None:
+            try:
+                self.replica_pool = await self._open_shared_pool(
+                    "replica", await self._replica_pool_size(), dsn=self.settings.database_replica_url
+                )
+            except Exception as e:
+                _mark_replica_unavailable(e)
+                return None
+        if not await self._replica_within_lag():
+            return None
+        return self.replica_pool
+
+    async def _replica_within_lag(self) -> bool:
+        """Re-check replication lag at most every DATABASE_REPLICA_CHECK_SECONDS."""
+        if _replica_check_due(self.settings):
+            try:
+                async with self.replica_pool.acquire(site="database.replica_lag_check") as conn:
+                    lag = await conn.fetchval(REPLICA_LAG_QUERY)
+                _replica_status.update(
+                    available=True, lag_seconds=float(lag or 0.0),
+                    checked_at=time.monotonic(), error=None
+                )
+            except Exception as e:
+                _mark_replica_unavailable(e)
+                return False
+
+        lag = _replica_status["lag_seconds"]
+        if lag is not None and lag > self.settings.database_replica_max_lag_seconds:
+            _replica_status["lagging_reads"] += 1
+            return False
+        return _replica_status["available"]
+
+    async def _get_read_pool(self, stale_ok: bool):
+        if stale_ok:
+            replica = await self._get_replica_pool()
+            if replica is not None:
+                return replica
+        return await self._get_primary_read_pool()
+
+    def read_connection(self, stale_ok: bool = False):
+        """
+        ``async with db.read_connection(stale_ok=...) as conn`` for read-only queries.
+
+        ``stale_ok`` marks reads that tolerate replication lag up to
+        DATABASE_REPLICA_MAX_LAG_SECONDS; those go to the replica when one is
+        configured, reachable and caught up. Everything else, and every fallback,
+        uses the primary's read pool.
+        """
+        return self._read_connection_for(call_site(1), stale_ok)
+
+    @asynccontextmanager
+    async def _read_connection_for(self, site: str, stale_ok: bool):
+        pool = await self._get_read_pool(stale_ok)
+        acquire = pool.acquire(site=site)
+        try:
+            conn = await acquire.__aenter__()
+        except Exception as e:
+            if self.replica_pool is None or pool is not self.replica_pool:
+                raise
+            _mark_replica_unavailable(e)
+            acquire = (await self._get_primary_read_pool()).acquire(site=site)
+            conn = await acquire.__aenter__()
+
+        if self.replica_pool is not None and pool is self.replica_pool:
+            _replica_status["replica_reads"] += 1
+        else:
+            _replica_status["primary_reads"] += 1
+
+        failed = True
+        try:
+            yield conn
+            failed = False
+        finally:
+            if failed:
+                await acquire.__aexit__(Exception, None, None)
+            else:
+                await acquire.__aexit__(None, None, None)
+
+    @staticmethod
+    def replica_status() -> Dict[str, Any]:
+        """Replica availability, last measured lag and read routing counts."""
+        status = dict(_replica_status)
+        status.pop("checked_at", None)
+        return status
+
     async def _column_exists(self, table_name: str, column_name: str) -> bool:
         """Check if a given column exists on a table. Uses a simple cache to avoid repeated lookups."""
         cache_key = (table_name, column_name)
         if cache_key in self._column_cache:
             return self._column_cache[cache_key]
 
+        # Instances are short-lived, so also consult the process-wide cache
+        cached = reference_cache.get("columns", cache_key)
+        if cached is not MISSING:
+            self._column_cache[cache_key] = cached
+            return cached
+
         if not self.initialized:
             await self.initialize()
 
@@ -98,6 +665,7 @@ class DatabaseService:
 
         exists_bool = bool(exists)
         self._column_cache[cache_key] = exists_bool
+        reference_cache.set("columns", cache_key, exists_bool)
         return exists_bool
 
     async def get_default_user_id(self) -> Optional[str]:
@@ -188,64 +756,85 @@ class DatabaseService:
         return formatted_min or formatted_max
 
     async def close(self):
-        """Close database connection pool."""
+        """Close the main connection pool; the shared read pools stay open (see ``close_shared_pools``)."""
+        self.replica_pool = None
+        self.read_pool = None
         if self.pool:
             await self.pool.close()
             self.initialized = False
             logger.info("Database connection pool closed")
 
-    async def get_enabled_site_schedules(self) -> List[Dict[str, Any]]:
-        """Get all enabled site schedules that are due for execution."""
-        if not self.initialized:
-            await self.initialize()
-        
-        query = """
-        SELECT id, site_name, interval_minutes, payload, min_pause_seconds, 
-               max_pause_seconds, max_retries, last_run_at, next_run_at
-        FROM site_schedules 
-        WHERE enabled = true 
-        AND (next_run_at IS NULL OR next_run_at <= NOW())
-        ORDER BY next_run_at NULLS FIRST
+    async def get_enabled_site_schedules(self, due_only: bool = True) -> List[Dict[str, Any]]:
+        """Get enabled site schedules, by default only those due for execution.
+
+        The enabled set is served from the reference cache; due filtering is
+        applied to the cached rows so both variants share one entry.
         """
-        
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query)
-            return [dict(row) for row in rows]
+        schedules = reference_cache.get("site_schedules", "enabled")
+        if schedules is MISSING:
+            if not self.initialized:
+                await self.initialize()
+
+            query = """
+            SELECT id, site_name, interval_minutes, payload, min_pause_seconds, 
+                   max_pause_seconds, max_retries, last_run_at, next_run_at
+            FROM site_schedules 
+            WHERE enabled = true 
+            ORDER BY next_run_at NULLS FIRST
+            """
+
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query)
+            schedules = [dict(row) for row in rows]
+            reference_cache.set("site_schedules", "enabled", schedules)
+
+        now = datetime.now(timezone.utc)
+        return [
+            dict(schedule) for schedule in schedules
+            if not due_only or schedule["next_run_at"] is None or schedule["next_run_at"] <= now
+        ]
+
+    async def update_site_schedule_next_run(self, schedule_id: str, next_run_at: datetime,
+                                            record_run: bool = True) -> bool:
+        """Update the next_run_at for a site schedule.
 
-    async def update_site_schedule_next_run(self, schedule_id: str, next_run_at: datetime) -> bool:
-        """Update the next_run_at for a site schedule."""
+        When ``record_run`` is False (e.g. a deferred run) last_run_at is left untouched.
+        """
         if not self.initialized:
             await self.initialize()
         
-        query = """
+        last_run_clause = "last_run_at = NOW(), " if record_run else ""
+        query = f"""
         UPDATE site_schedules 
-        SET next_run_at = $2, last_run_at = NOW(), updated_at = NOW()
+        SET next_run_at = $2, {last_run_clause}updated_at = NOW()
         WHERE id = $1
         """
         
         try:
             async with self.pool.acquire() as conn:
                 await conn.execute(query, schedule_id, next_run_at)
+            reference_cache.invalidate("site_schedules")
             return True
         except Exception as e:
             logger.error(f"Failed to update site schedule next_run_at: {str(e)}")
             return False
 
     async def create_scrape_run(self, run_id: str, site_schedule_id: Optional[str], 
-                              task_id: str, trigger: str) -> Optional[str]:
+                              task_id: str, trigger: str, status: str = "queued",
+                              message: Optional[str] = None) -> Optional[str]:
         """Create a new scrape run record."""
         if not self.initialized:
             await self.initialize()
         
         query = """
-        INSERT INTO scrape_runs (run_id, site_schedule_id, task_id, trigger)
-        VALUES ($1, $2, $3, $4)
+        INSERT INTO scrape_runs (run_id, site_schedule_id, task_id, trigger, status, message)
+        VALUES ($1, $2, $3, $4, $5, $6)
         RETURNING id
         """
         
         try:
             async with self.pool.acquire() as conn:
-                result = await conn.fetchval(query, run_id, site_schedule_id, task_id, trigger)
+                result = await conn.fetchval(query, run_id, site_schedule_id, task_id, trigger, status, message)
             return str(result)
         except Exception as e:
             logger.error(f"Failed to create scrape run: {str(e)}")
@@ -263,55 +852,26 @@ class DatabaseService:
         if not self.initialized:
             await self.initialize()
 
-        # Build dynamic update query
-        updates = ["status = $2", "updated_at = NOW()"]
-        params = [run_id, status]
-        param_count = 3
-        
-        if started_at is not None:
-            updates.append(f"started_at = ${param_count}")
-            params.append(started_at)
-            param_count += 1
-            
-        if finished_at is not None:
-            updates.append(f"finished_at = ${param_count}")
-            params.append(finished_at)
-            param_count += 1
-            
-        if requested_pages is not None:
-            updates.append(f"requested_pages = ${param_count}")
-            params.append(requested_pages)
-            param_count += 1
-            
-        if completed_pages is not None:
-            updates.append(f"completed_pages = ${param_count}")
-            params.append(completed_pages)
-            param_count += 1
-            
-        if errors_count is not None:
-            updates.append(f"errors_count = ${param_count}")
-            params.append(errors_count)
-            param_count += 1
-            
-        if task_id is not None:
-            updates.append(f"task_id = ${param_count}")
-            params.append(task_id)
-            param_count += 1
-
-        if message is not None:
-            updates.append(f"message = ${param_count}")
-            params.append(message)
-            param_count += 1
-        
+        # One statement shape for every call: unset metrics keep their current value
+        update = QueryBuilder([run_id, status])
         query = f"""
-        UPDATE scrape_runs 
-        SET {', '.join(updates)}
+        UPDATE scrape_runs
+        SET status = $2,
+            updated_at = NOW(),
+            {update.assign_if_set("started_at", started_at, "timestamptz")},
+            {update.assign_if_set("finished_at", finished_at, "timestamptz")},
+            {update.assign_if_set("requested_pages", requested_pages, "integer")},
+            {update.assign_if_set("completed_pages", completed_pages, "integer")},
+            {update.assign_if_set("errors_count", errors_count, "integer")},
+            {update.assign_if_set("task_id", task_id, "text")},
+            {update.assign_if_set("message", message, "text")}
         WHERE run_id = $1
         """
-        
+
         try:
             async with self.pool.acquire() as conn:
-                await conn.execute(query, *params)
+                statement_stats.record(conn, "scrape_runs.update_status", query)
+                await conn.execute(query, *update.params)
             return True
         except Exception as e:
             logger.error(f"Failed to update scrape run status: {str(e)}")
@@ -414,32 +974,40 @@ class DatabaseService:
             return False
 
     async def get_user_resume_context(self, user_id: str) -> Dict[str, Any]:
-        """Fetch default resume, standard job roles, and strategic narratives for a user."""
+        """Fetch default resume, standard job roles, and strategic narratives for a user.
+
+        Cached per (user, resume_context_versions.version) in-process and in
+        Redis, so the API, review workers and application generation share
+        entries. A hit costs one primary-key lookup for the current version.
+        """
         if not self.initialized:
             await self.initialize()
 
-        resume_q = (
-            """
-            SELECT r.resume_id, r.resume_name
-            FROM strategic_narratives sn
-            JOIN resumes r ON sn.default_resume_id = r.resume_id
-            WHERE sn.user_id = $1
-            LIMIT 1
-            """
-        )
-        roles_q = "SELECT role_name FROM standard_job_roles WHERE user_id = $1"
-        narratives_q = "SELECT narrative_summary FROM strategic_narratives WHERE user_id = $1"
-
         try:
-            async with self.pool.acquire() as conn:
-                resume_row = await conn.fetchrow(resume_q, user_id)
-                roles_rows = await conn.fetch(roles_q, user_id)
-                narratives_rows = await conn.fetch(narratives_q, user_id)
-            return {
-                "default_resume": dict(resume_row) if resume_row else None,
-                "standard_job_roles": [r["role_name"] for r in roles_rows],
-                "strategic_narratives": [n["narrative_summary"] for n in narratives_rows],
-            }
+            async with self.read_connection(stale_ok=False) as conn:
+                version = await conn.fetchval(RESUME_CONTEXT_VERSION_QUERY, user_id)
+                cache_key = _resume_context_key(str(user_id), version)
+
+                payload = reference_cache.get("resume_context", cache_key)
+                if payload is MISSING:
+                    payload = self._get_shared_resume_context(cache_key)
+                    if payload is not None:
+                        reference_cache.set("resume_context", cache_key, payload)
+
+                if payload is None or payload is MISSING:
+                    row = await conn.fetchrow(RESUME_CONTEXT_QUERY, user_id)
+                    payload = orjson.dumps({
+                        "default_resume": row["default_resume"],
+                        "standard_job_roles": row["standard_job_roles"],
+                        "strategic_narratives": row["strategic_narratives"],
+                    })
+                    # Stored under the version read with the data, which may be newer
+                    cache_key = _resume_context_key(str(user_id), row["version"])
+                    reference_cache.set("resume_context", cache_key, payload)
+                    self._set_shared_resume_context(cache_key, payload)
+
+            # Decoded per call so callers never share (and mutate) cached lists
+            return orjson.loads(payload)
         except Exception as e:
             logger.error(f"Failed to fetch resume context: {str(e)}")
             return {
@@ -448,6 +1016,21 @@ class DatabaseService:
                 "strategic_narratives": [],
             }
 
+    def _get_shared_resume_context(self, cache_key: str) -> Optional[bytes]:
+        try:
+            return _get_resume_cache_redis().get(cache_key)
+        except redis.RedisError as e:
+            logger.debug(f"Resume context cache unavailable: {str(e)}")
+            return None
+
+    def _set_shared_resume_context(self, cache_key: str, payload: bytes) -> None:
+        try:
+            _get_resume_cache_redis().set(
+                cache_key, payload, ex=self.settings.resume_context_cache_ttl_seconds
+            )
+        except redis.RedisError as e:
+            logger.debug(f"Resume context cache unavailable: {str(e)}")
+
     # Job Review Methods
     async def get_pending_review_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get jobs that are pending review (status = 'pending_review')."""
@@ -455,11 +1038,13 @@ class DatabaseService:
             await self.initialize()
 
         query = """
-        SELECT id, site, job_url, title, company, location, description, 
-               date_posted, ingested_at, status, updated_at
-        FROM public.jobs 
-        WHERE status = 'pending_review'
-        ORDER BY ingested_at ASC
+        SELECT j.id, j.site, j.job_url, j.title, j.company, j.location, j.description, 
+               j.date_posted, j.ingested_at, j.status, j.updated_at,
+               COALESCE(jr.retry_count, 0) AS retry_count
+        FROM public.jobs j
+        LEFT JOIN public.job_reviews jr ON jr.job_id = j.id
+        WHERE j.status = 'pending_review'
+        ORDER BY j.ingested_at ASC
         LIMIT $1
         """
 
@@ -471,6 +1056,35 @@ class DatabaseService:
             logger.error(f"Failed to get pending review jobs: {str(e)}")
             return []
 
+    async def reset_job_review_retries(self, job_id: str) -> bool:
+        """Clear a job's review retry count and return it to pending_review (dead-letter replay)."""
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        UPDATE public.job_reviews
+                        SET retry_count = 0, updated_at = NOW()
+                        WHERE job_id = $1
+                        """,
+                        job_id
+                    )
+                    result = await conn.execute(
+                        """
+                        UPDATE public.jobs
+                        SET status = 'pending_review', updated_at = NOW()
+                        WHERE id = $1
+                        """,
+                        job_id
+                    )
+                return result == "UPDATE 1"
+        except Exception as e:
+            logger.error(f"Failed to reset review retries for job {job_id}: {str(e)}")
+            return False
+
     async def update_job_status(self, job_id: str, status: str) -> bool:
         """Update job status and updated_at timestamp."""
         if not self.initialized:
@@ -525,30 +1139,6 @@ class DatabaseService:
             logger.error(f"Invalid UUID format for job_id: {job_id}")
             return False
 
-        query = """
-        INSERT INTO public.job_reviews (
-            job_id, recommend, confidence, rationale, personas, tradeoffs,
-            actions, sources, overall_alignment_score, crew_output, processing_time_seconds,
-            crew_version, model_used, error_message, retry_count
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
-        ON CONFLICT (job_id) DO UPDATE SET
-            recommend = EXCLUDED.recommend,
-            confidence = EXCLUDED.confidence,
-            rationale = EXCLUDED.rationale,
-            personas = EXCLUDED.personas,
-            tradeoffs = EXCLUDED.tradeoffs,
-            actions = EXCLUDED.actions,
-            sources = EXCLUDED.sources,
-            overall_alignment_score = EXCLUDED.overall_alignment_score,
-            crew_output = EXCLUDED.crew_output,
-            processing_time_seconds = EXCLUDED.processing_time_seconds,
-            crew_version = EXCLUDED.crew_version,
-            model_used = EXCLUDED.model_used,
-            error_message = EXCLUDED.error_message,
-            retry_count = EXCLUDED.retry_count,
-            updated_at = NOW()
-        """
-
         try:
             # Add detailed logging for debugging
             logger.info(f"Attempting to insert job review for job_id: {job_id}")
@@ -557,26 +1147,8 @@ class DatabaseService:
 
             async with self.pool.acquire() as conn:
                 result = await conn.execute(
-                    query,
-                    job_id,
-                    review_data.get("recommend"),
-                    review_data.get("confidence"),
-                    review_data.get("rationale"),
-                    json.dumps(review_data.get("personas")) if review_data.get("personas") else None,
-                    json.dumps(review_data.get("tradeoffs")) if review_data.get("tradeoffs") else None,
-                    json.dumps(review_data.get("actions")) if review_data.get("actions") else None,
-                    json.dumps(review_data.get("sources")) if review_data.get("sources") else None,
-                    review_data.get("overall_alignment_score"),  # Separate column for alignment score
-                    # crew_output includes tldr_summary (but not overall_alignment_score since it's separate)
-                    json.dumps({
-                        **(review_data.get("crew_output") or {}),
-                        "tldr_summary": review_data.get("tldr_summary")
-                    }) if review_data.get("crew_output") or review_data.get("tldr_summary") else None,
-                    review_data.get("processing_time_seconds"),
-                    review_data.get("crew_version"),
-                    review_data.get("model_used"),
-                    review_data.get("error_message"),
-                    review_data.get("retry_count", 0)
+                    JOB_REVIEW_UPSERT_QUERY,
+                    *self._job_review_params(job_id, review_data)
                 )
                 
                 logger.info(f"Job review insert result: {result}")
@@ -587,6 +1159,7 @@ class DatabaseService:
                 
                 if verify_result:
                     logger.info(f"Job review successfully inserted and verified for job_id: {job_id}")
+                    invalidate_reviewed_jobs_count_cache()
                     return True
                 else:
                     logger.error(f"Job review insert succeeded but verification failed for job_id: {job_id}")
@@ -599,6 +1172,110 @@ class DatabaseService:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return False
 
+    def _job_review_params(self, job_id: str, review_data: Dict[str, Any]) -> tuple:
+        """Positional parameters for JOB_REVIEW_UPSERT_QUERY."""
+        return (
+            job_id,
+            review_data.get("recommend"),
+            review_data.get("confidence"),
+            review_data.get("rationale"),
+            review_data.get("personas") or None,
+            review_data.get("tradeoffs") or None,
+            review_data.get("actions") or None,
+            review_data.get("sources") or None,
+            review_data.get("overall_alignment_score"),  # Separate column for alignment score
+            # crew_output includes tldr_summary (but not overall_alignment_score since it's separate)
+            {
+                **(review_data.get("crew_output") or {}),
+                "tldr_summary": review_data.get("tldr_summary")
+            } if review_data.get("crew_output") or review_data.get("tldr_summary") else None,
+            review_data.get("processing_time_seconds"),
+            review_data.get("crew_version"),
+            review_data.get("model_used"),
+            review_data.get("error_message"),
+            review_data.get("retry_count", 0)
+        )
+
+    async def claim_pending_review_jobs(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Atomically move up to ``limit`` pending_review jobs to in_review and return them.
+
+        ``FOR UPDATE SKIP LOCKED`` lets concurrent batch workers claim disjoint sets.
+        Each row carries the job details plus its current review ``retry_count``.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        query = """
+        WITH claimed AS (
+            SELECT id
+            FROM public.jobs
+            WHERE status = 'pending_review'
+            ORDER BY ingested_at ASC
+            LIMIT $1
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE public.jobs j
+        SET status = 'in_review', updated_at = NOW()
+        FROM claimed
+        WHERE j.id = claimed.id
+        RETURNING j.id, j.site, j.job_url, j.title, j.company, j.company_url, j.location_country,
+                  j.location_state, j.location_city, j.is_remote, j.job_type, j.compensation,
+                  j.interval, j.min_amount, j.max_amount, j.currency, j.salary_source,
+                  j.description, j.date_posted, j.ingested_at, j.status, j.updated_at, j.source_raw,
+                  COALESCE((SELECT jr.retry_count FROM public.job_reviews jr WHERE jr.job_id = j.id), 0)
+                      AS retry_count
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, limit)
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to claim pending review jobs: {str(e)}")
+            return []
+
+    async def save_job_review_batch(self, outcomes: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Store several review results and job statuses in one transaction.
+
+        Each outcome is ``{"job_id", "review_data", "status"}``. Every job is
+        written inside its own savepoint, so one bad row is rolled back on its
+        own and reported as False without discarding the rest of the batch.
+
+        Returns:
+            Mapping of job_id to whether its review was stored
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        saved: Dict[str, bool] = {}
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    for outcome in outcomes:
+                        job_id = outcome["job_id"]
+                        try:
+                            async with conn.transaction():
+                                await conn.execute(
+                                    JOB_REVIEW_UPSERT_QUERY,
+                                    *self._job_review_params(job_id, outcome["review_data"])
+                                )
+                                await conn.execute(
+                                    "UPDATE public.jobs SET status = $2, updated_at = NOW() WHERE id = $1",
+                                    job_id,
+                                    outcome["status"]
+                                )
+                            saved[job_id] = True
+                        except Exception as e:
+                            logger.error(f"Failed to store batched review for job_id {job_id}: {str(e)}")
+                            saved[job_id] = False
+            invalidate_reviewed_jobs_count_cache()
+            return saved
+        except Exception as e:
+            logger.error(f"Failed to store job review batch: {str(e)}")
+            return {outcome["job_id"]: False for outcome in outcomes}
+
     async def get_job_review(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job review by job ID."""
         if not self.initialized:
@@ -614,7 +1291,7 @@ class DatabaseService:
         """
 
         try:
-            async with self.pool.acquire() as conn:
+            async with self.read_connection(stale_ok=False) as conn:
                 row = await conn.fetchrow(query, job_id)
                 return dict(row) if row else None
         except Exception as e:
@@ -675,6 +1352,8 @@ class DatabaseService:
                 
                 if row:
                     logger.info(f"Job review override updated for job_id: {job_id}")
+                    # Overridden reviews drop out of /jobs/reviews, so cached totals are stale
+                    invalidate_reviewed_jobs_count_cache()
                     return dict(row)
                 else:
                     # This is the legitimate "not found" case - job_id doesn't exist in database
@@ -688,6 +1367,198 @@ class DatabaseService:
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise  # Re-raise the exception to be handled as 500 error
 
+    async def bulk_update_job_review_overrides(
+        self,
+        overrides: List[Dict[str, Any]],
+        override_by: str = "system_admin"
+    ) -> List[Dict[str, Any]]:
+        """Apply many human overrides in one UPDATE ... FROM unnest(...) statement.
+
+        Each override is ``{"job_id", "override_recommend", "override_comment"}``.
+        Returns one result per input, in order, with ``status`` "updated",
+        "not_found" or "invalid" (malformed job_id). When a job_id appears more
+        than once the last entry wins. Statement-level counter triggers and the
+        reviewed-jobs count cache are updated once for the whole batch.
+
+        Raises:
+            Exception: For database connection or query execution errors.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        import uuid
+        latest: Dict[uuid.UUID, Dict[str, Any]] = {}
+        parsed: List[Optional[uuid.UUID]] = []
+        for override in overrides:
+            try:
+                job_uuid = uuid.UUID(str(override["job_id"]))
+            except ValueError:
+                parsed.append(None)
+                continue
+            parsed.append(job_uuid)
+            latest[job_uuid] = override
+
+        rows = []
+        if latest:
+            query = """
+            UPDATE public.job_reviews jr
+            SET override_recommend = o.override_recommend,
+                override_comment = o.override_comment,
+                override_by = $4,
+                override_at = NOW(),
+                updated_at = NOW()
+            FROM unnest($1::uuid[], $2::boolean[], $3::text[]) AS o(job_id, override_recommend, override_comment)
+            WHERE jr.job_id = o.job_id
+            RETURNING jr.id, jr.job_id, jr.override_recommend, jr.override_comment,
+                      jr.override_by, jr.override_at, jr.updated_at
+            """
+            try:
+                async with self.pool.acquire() as conn:
+                    statement_stats.record(conn, "job_reviews.bulk_override", query)
+                    rows = await conn.fetch(
+                        query,
+                        list(latest),
+                        [item["override_recommend"] for item in latest.values()],
+                        [item["override_comment"] for item in latest.values()],
+                        override_by
+                    )
+            except Exception as e:
+                logger.error(f"Database error applying {len(latest)} job review overrides: {str(e)}")
+                raise
+
+            if rows:
+                # Overridden reviews drop out of /jobs/reviews, so cached totals are stale
+                invalidate_reviewed_jobs_count_cache()
+            logger.info(f"Bulk job review override: {len(rows)} of {len(latest)} reviews updated")
+
+        updated = {row["job_id"]: dict(row) for row in rows}
+        results = []
+        for override, job_uuid in zip(overrides, parsed):
+            if job_uuid is None:
+                results.append({"job_id": str(override["job_id"]), "status": "invalid",
+                                "error": f"Invalid job_id format: {override['job_id']}"})
+            elif job_uuid in updated:
+                results.append({"status": "updated", **updated[job_uuid], "job_id": str(job_uuid)})
+            else:
+                results.append({"job_id": str(job_uuid), "status": "not_found",
+                                "error": f"Job review not found for job_id: {job_uuid}"})
+        return results
+
+    async def _reviewed_jobs_where(
+        self,
+        query: QueryBuilder,
+        recommendation: Optional[bool] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        date_posted_after: Optional[datetime] = None,
+        date_posted_before: Optional[datetime] = None,
+        include_overridden: bool = False
+    ) -> str:
+        """WHERE clause (parameters added to ``query``) shared by the reviewed-jobs page and export."""
+        # Every filter is always present (NULL when unused) so the statement text only
+        # varies with the sort and page kind, keeping asyncpg on its cached prepared statements
+        if await self._column_exists('job_reviews', 'overall_alignment_score'):
+            score_expression = "jr.overall_alignment_score"
+        else:
+            score_expression = "CASE WHEN jr.confidence = 'high' THEN 0.8 WHEN jr.confidence = 'medium' THEN 0.6 ELSE 0.4 END"
+
+        where_conditions = [
+            "jd.duplicate_status = 'original'",
+            query.optional("COALESCE(jr.override_recommend, jr.recommend) = {}", recommendation, "boolean"),
+            query.optional(f"{score_expression} >= {{}}", min_score, "float8"),
+            query.optional(f"{score_expression} <= {{}}", max_score, "float8"),
+            query.optional("jd.company ILIKE {}", f"%{company}%" if company else None, "text"),
+            query.optional("jd.site = {}", source or None, "text"),
+            query.optional("jd.is_remote = {}", is_remote, "boolean"),
+            query.optional("jd.date_posted >= {}", date_posted_after, "timestamptz"),
+            query.optional("jd.date_posted <= {}", date_posted_before, "timestamptz"),
+        ]
+        if not include_overridden:
+            where_conditions.insert(0, "jr.override_recommend IS NULL")
+        return "WHERE " + "\n          AND ".join(where_conditions)
+
+    async def _reviewed_jobs_sort(self, sort_by: str, sort_order: str) -> Tuple[str, str, str]:
+        """Validated (sort key, ORDER BY column, direction)."""
+        if sort_by == 'overall_alignment_score' and not await self._column_exists('job_reviews', 'overall_alignment_score'):
+            sort_by = 'review_date'
+
+        if sort_by not in _REVIEW_SORT_COLUMNS:
+            sort_by = "overall_alignment_score"
+        sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
+        return sort_by, _REVIEW_SORT_COLUMNS[sort_by], sort_order
+
+    def _review_item(self, row: Any, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Reviewed-jobs row as the ``{"job": ..., "review": ...}`` item of /jobs/reviews."""
+        # Get alignment score from database column (calculated by orchestrator)
+        # Default to confidence-based calculation if not available
+        confidence_scores = {"high": 0.8, "medium": 0.6, "low": 0.4}
+        fallback_alignment_score = confidence_scores.get(row.get("confidence"), 0.4)
+        alignment_score = row.get("overall_alignment_score", fallback_alignment_score) or fallback_alignment_score
+
+        # Normalize location strings that may be null
+        raw_location = row.get("location")
+        if isinstance(raw_location, str):
+            cleaned_location = raw_location.strip(", ")
+            location_value = cleaned_location if cleaned_location else None
+        else:
+            location_value = None
+
+        # JSONB arrives decoded (pool codec); crew_output is already projected to the keys the UI reads
+        crew_output = row.get("crew_output")
+        tldr_summary = row.get("tldr_summary")
+
+        salary_range_formatted = self._format_salary_range(
+            row.get("salary_min"),
+            row.get("salary_max"),
+            row.get("salary_currency")
+        )
+
+        job_data = {
+            "job": {
+                "job_id": str(row.get("job_id")),
+                "title": row.get("title"),
+                "company": row.get("company"),
+                "location": location_value,
+                "url": row.get("url"),
+                "date_posted": row.get("date_posted"),
+                "source": row.get("source"),
+                "description": row.get("description"),
+                "salary_min": row.get("salary_min"),
+                "salary_max": row.get("salary_max"),
+                "salary_currency": row.get("salary_currency"),
+                "salary_range": salary_range_formatted,
+                "is_remote": row.get("is_remote")
+            },
+            "review": {
+                "overall_alignment_score": alignment_score,
+                "recommendation": row.get("recommend"),
+                "confidence": row.get("confidence"),
+                "reviewer": row.get("reviewer"),
+                "review_date": row.get("review_date"),
+                "rationale": row.get("rationale"),
+                "tldr_summary": tldr_summary,
+                "crew_output": crew_output,  # Include full crew_output for dimension data
+                "personas": row.get("personas"),
+                "tradeoffs": row.get("tradeoffs"),
+                "actions": row.get("actions"),
+                "sources": row.get("sources"),
+                "override_recommend": row.get("override_recommend"),
+                "override_comment": row.get("override_comment"),
+                "override_by": row.get("override_by"),
+                "override_at": row.get("override_at")
+            }
+        }
+        if fields is not None:
+            for section in ("job", "review"):
+                job_data[section] = {
+                    key: value for key, value in job_data[section].items()
+                    if key in fields or key == "job_id"
+                }
+        return job_data
+
     async def get_reviewed_jobs(
         self,
         limit: int = 50,
@@ -701,7 +1572,9 @@ class DatabaseService:
         source: Optional[str] = None,
         is_remote: Optional[bool] = None,
         date_posted_after: Optional[datetime] = None,
-        date_posted_before: Optional[datetime] = None
+        date_posted_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> Dict[str, Any]:
         """
         Get jobs with their reviews, supporting pagination, sorting, and filtering.
@@ -709,82 +1582,34 @@ class DatabaseService:
         Uses jobs_deduplicated view to ensure only best version of each duplicate group is shown.
         Filters out jobs that have been human-reviewed (override_recommend IS NOT NULL).
 
+        Pages are ordered by the sort column with the job id as tie-breaker. When
+        ``cursor`` (the ``next_cursor`` of a previous page) is given, ``offset`` is
+        ignored and the page starts right after the cursor row, so every page
+        costs the same as the first. Totals are cached per filter signature until the
+        reviews version (see REVIEWS_VERSION_QUERY) changes.
+
+        ``fields`` (names from REVIEW_LIST_FIELDS) limits both the selected
+        columns and the returned job/review keys; None returns everything.
+
         Returns:
-            Dict containing 'jobs' list and 'total_count' int
+            Dict containing 'jobs' list, 'total_count' int, 'has_more' bool,
+            'next_cursor' (or None) and the 1-based 'page'
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for other filters/sorting,
+                or ``fields`` names an unknown field
         """
         if not self.initialized:
             await self.initialize()
 
-        # Build WHERE conditions for the deduplicated view
-        where_conditions = ["jr.override_recommend IS NULL", "jd.duplicate_status = 'original'"]
-        params = []
-        param_count = 0
-
-        if recommendation is not None:
-            param_count += 1
-            where_conditions.append(f"COALESCE(jr.override_recommend, jr.recommend) = ${param_count}")
-            params.append(recommendation)
-
-        if min_score is not None:
-            param_count += 1
-            if await self._column_exists('job_reviews', 'overall_alignment_score'):
-                where_conditions.append(f"jr.overall_alignment_score >= ${param_count}")
-                params.append(min_score)
-            else:
-                where_conditions.append(f"CASE WHEN jr.confidence = 'high' THEN 0.8 WHEN jr.confidence = 'medium' THEN 0.6 ELSE 0.4 END >= ${param_count}")
-                params.append(min_score)
-
-        if max_score is not None:
-            param_count += 1
-            if await self._column_exists('job_reviews', 'overall_alignment_score'):
-                where_conditions.append(f"jr.overall_alignment_score <= ${param_count}")
-                params.append(max_score)
-            else:
-                where_conditions.append(f"CASE WHEN jr.confidence = 'high' THEN 0.8 WHEN jr.confidence = 'medium' THEN 0.6 ELSE 0.4 END <= ${param_count}")
-                params.append(max_score)
+        select_list = _review_list_select(fields)
 
-        if company:
-            param_count += 1
-            where_conditions.append(f"jd.company ILIKE ${param_count}")
-            params.append(f"%{company}%")
-
-        if source:
-            param_count += 1
-            where_conditions.append(f"jd.site = ${param_count}")
-            params.append(source)
-
-        if is_remote is not None:
-            param_count += 1
-            where_conditions.append(f"jd.is_remote = ${param_count}")
-            params.append(is_remote)
-
-        if date_posted_after:
-            param_count += 1
-            where_conditions.append(f"jd.date_posted >= ${param_count}")
-            params.append(date_posted_after)
-
-        if date_posted_before:
-            param_count += 1
-            where_conditions.append(f"jd.date_posted <= ${param_count}")
-            params.append(date_posted_before)
-
-        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-
-        # Validate sort parameters
-        valid_sort_columns = {
-            "date_posted": "jd.date_posted",
-            "company": "jd.company",
-            "title": "jd.title",
-            "review_date": "jr.created_at",
-            "recommendation": "jr.recommend",
-            "overall_alignment_score": "jr.overall_alignment_score"
-        }
-
-        if sort_by == 'overall_alignment_score' and not await self._column_exists('job_reviews', 'overall_alignment_score'):
-            sort_by = 'review_date'
-
-        sort_column = valid_sort_columns.get(sort_by, valid_sort_columns["overall_alignment_score"]) if sort_by != 'review_date' else valid_sort_columns['review_date']
-        sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
+        query = QueryBuilder()
+        where_clause = await self._reviewed_jobs_where(
+            query, recommendation, min_score, max_score, company, source,
+            is_remote, date_posted_after, date_posted_before
+        )
+        sort_by, sort_column, sort_order = await self._reviewed_jobs_sort(sort_by, sort_order)
 
         # Query for total count
         count_query = f"""
@@ -793,126 +1618,550 @@ class DatabaseService:
         INNER JOIN public.job_reviews jr ON jd.id = jr.job_id
         {where_clause}
         """
+        count_params = list(query.params)
+        filter_signature = hashlib.sha1(
+            json.dumps(count_params, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+
+        # Keyset condition: rows strictly after the cursor row in (sort_column NULLS LAST, id)
+        # order. One fixed shape each for the first page, cursor pages and cursor pages in
+        # the NULL tail; a plain row comparison keeps the (column, id) index range seek
+        page = (offset // limit) + 1 if limit else 1
+        keyset_clause = ""
+        if cursor:
+            position = _decode_review_cursor(cursor)
+            if position.get("s") != sort_by or position.get("o") != sort_order or position.get("f") != filter_signature:
+                raise ValueError("Cursor does not match the current sort and filters")
+
+            last_value = _review_cursor_value(position.get("v"), _REVIEW_SORT_TYPES[sort_by])
+            page = int(position.get("p", 1)) + 1
+            offset = 0
+
+            op = "<" if sort_order == "DESC" else ">"
+            if last_value is None:
+                id_param = query.param(position["id"], "uuid")
+                keyset_clause = f"AND {sort_column} IS NULL AND jd.id {op} {id_param}"
+            else:
+                value_param = query.param(last_value, _REVIEW_SORT_TYPES[sort_by])
+                id_param = query.param(position["id"], "uuid")
+                keyset_clause = (
+                    f"AND (({sort_column}, jd.id) {op} ({value_param}, {id_param})"
+                    f" OR {sort_column} IS NULL)"
+                )
+        limit_param = query.param(limit + 1)
+        offset_param = query.param(offset)
 
         # Main query with pagination using jobs_deduplicated view
         data_query = f"""
         SELECT
-            jd.id as job_id,
-            jd.title,
-            jd.company,
-            jd.location_city || COALESCE(', ' || jd.location_state, '') || COALESCE(', ' || jd.location_country, '') as location,
-            jd.job_url as url,
-            jd.date_posted,
-            jd.site as source,
-            jd.description,
-            jd.min_amount as salary_min,
-            jd.max_amount as salary_max,
-            jd.currency as salary_currency,
-            jd.is_remote,
-            jr.recommend,
-            jr.confidence,
-            jr.rationale,
-            jr.overall_alignment_score,
-            jr.crew_output,
-            jr.personas,
-            jr.tradeoffs,
-            jr.actions,
-            jr.sources,
-            jr.crew_version as reviewer,
-            jr.created_at as review_date,
-            jr.override_recommend,
-            jr.override_comment,
-            jr.override_by,
-            jr.override_at
+            {select_list},
+            {sort_column} as sort_value
         FROM public.jobs_deduplicated jd
         INNER JOIN public.job_reviews jr ON jd.id = jr.job_id
         {where_clause}
-        ORDER BY {sort_column} {sort_order}
-        LIMIT ${param_count + 1} OFFSET ${param_count + 2}
+        {keyset_clause}
+        ORDER BY {sort_column} {sort_order} NULLS LAST, jd.id {sort_order}
+        LIMIT {limit_param} OFFSET {offset_param}
         """
 
         try:
-            async with self.pool.acquire() as conn:
-                # Get total count
-                total_count = await conn.fetchval(count_query, *params)
+            async with self.read_connection(stale_ok=True) as conn:
+                # Get total count (cached per filter signature while the reviews version holds,
+                # so reviews written by workers show up on the next page load)
+                version = _reviews_version(await conn.fetchrow(REVIEWS_VERSION_QUERY))
+                cached = _reviewed_jobs_count_cache.get(filter_signature)
+                if cached and cached[1] == version and cached[2] > time.monotonic():
+                    total_count = cached[0]
+                else:
+                    statement_stats.record(conn, "reviewed_jobs.count", count_query)
+                    total_count = await conn.fetchval(count_query, *count_params) or 0
+                    _reviewed_jobs_count_cache[filter_signature] = (
+                        total_count,
+                        version,
+                        time.monotonic() + self.settings.reviewed_jobs_count_ttl_seconds
+                    )
                 
-                # Get paginated data
-                params.extend([limit, offset])
-                rows = await conn.fetch(data_query, *params)
+                # Get paginated data; one extra row tells us whether another page exists
+                statement_stats.record(conn, "reviewed_jobs.page", data_query)
+                rows = await conn.fetch(data_query, *query.params)
+                has_more = len(rows) > limit
+                rows = rows[:limit]
+
+                next_cursor = None
+                if has_more and rows:
+                    last_row = rows[-1]
+                    last_value = last_row["sort_value"]
+                    if isinstance(last_value, Decimal):
+                        last_value = float(last_value)
+                    next_cursor = _encode_review_cursor({
+                        "s": sort_by,
+                        "o": sort_order,
+                        "f": filter_signature,
+                        "v": last_value.isoformat() if isinstance(last_value, datetime) else last_value,
+                        "id": str(last_row["job_id"]),
+                        "p": page
+                    })
                 
-                jobs = []
-                for row in rows:
-                    # Get alignment score from database column (calculated by orchestrator)
-                    # Default to confidence-based calculation if not available
-                    confidence_scores = {"high": 0.8, "medium": 0.6, "low": 0.4}
-                    fallback_alignment_score = confidence_scores.get(row["confidence"], 0.4)
-                    alignment_score = row.get("overall_alignment_score", fallback_alignment_score) or fallback_alignment_score
-
-                    # Normalize location strings that may be null
-                    raw_location = row["location"]
-                    if isinstance(raw_location, str):
-                        cleaned_location = raw_location.strip(", ")
-                        location_value = cleaned_location if cleaned_location else None
-                    else:
-                        location_value = None
-
-                    # Extract TLDR summary from crew_output JSON and keep full crew_output for dimension data
-                    crew_output = self._deserialize_json_field(row.get("crew_output"))
-                    tldr_summary = crew_output.get("tldr_summary") if crew_output else None
-
-                    salary_range_formatted = self._format_salary_range(
-                        row["salary_min"],
-                        row["salary_max"],
-                        row["salary_currency"]
-                    )
-
-                    job_data = {
-                        "job": {
-                            "job_id": str(row["job_id"]),
-                            "title": row["title"],
-                            "company": row["company"],
-                            "location": location_value,
-                            "url": row["url"],
-                            "date_posted": row["date_posted"],
-                            "source": row["source"],
-                            "description": row["description"],
-                            "salary_min": row["salary_min"],
-                            "salary_max": row["salary_max"],
-                            "salary_currency": row["salary_currency"],
-                            "salary_range": salary_range_formatted,
-                            "is_remote": row["is_remote"]
-                        },
-                        "review": {
-                            "overall_alignment_score": alignment_score,
-                            "recommendation": row["recommend"],
-                            "confidence": row["confidence"],
-                            "reviewer": row["reviewer"],
-                            "review_date": row["review_date"],
-                            "rationale": row["rationale"],
-                            "tldr_summary": tldr_summary,
-                            "crew_output": crew_output,  # Include full crew_output for dimension data
-                            "personas": self._deserialize_json_field(row["personas"]),
-                            "tradeoffs": self._deserialize_json_field(row["tradeoffs"]),
-                            "actions": self._deserialize_json_field(row["actions"]),
-                            "sources": self._deserialize_json_field(row["sources"]),
-                            "override_recommend": row["override_recommend"],
-                            "override_comment": row["override_comment"],
-                            "override_by": row["override_by"],
-                            "override_at": row["override_at"]
-                        }
-                    }
-                    jobs.append(job_data)
+                jobs = [self._review_item(row, fields) for row in rows]
 
                 return {
                     "jobs": jobs,
-                    "total_count": total_count or 0
+                    "total_count": total_count or 0,
+                    "has_more": has_more,
+                    "next_cursor": next_cursor,
+                    "page": page
                 }
 
         except Exception as e:
             logger.error(f"Failed to get reviewed jobs: {str(e)}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
-            return {"jobs": [], "total_count": 0}
+            return {"jobs": [], "total_count": 0, "has_more": False, "next_cursor": None, "page": page}
+
+    async def iter_reviewed_jobs(
+        self,
+        sort_by: str = "date_posted",
+        sort_order: str = "DESC",
+        recommendation: Optional[bool] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        date_posted_after: Optional[datetime] = None,
+        date_posted_before: Optional[datetime] = None,
+        include_overridden: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream every reviewed job matching the /jobs/reviews filters, in batches.
+
+        Runs one query through a server-side cursor (inside a read-only
+        transaction on a general pool connection), fetching ``batch_size``
+        rows at a time, so memory stays bounded however many rows match.
+        Items have the same shape as ``get_reviewed_jobs`` items.
+
+        Raises:
+            ValueError: If ``fields`` names an unknown field
+            Exception: Database errors are logged and re-raised, since a
+                partially sent export cannot fall back to a default
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        select_list = _review_list_select(fields)
+        query = QueryBuilder()
+        where_clause = await self._reviewed_jobs_where(
+            query, recommendation, min_score, max_score, company, source,
+            is_remote, date_posted_after, date_posted_before, include_overridden
+        )
+        sort_by, sort_column, sort_order = await self._reviewed_jobs_sort(sort_by, sort_order)
+        export_query = f"""
+        SELECT
+            {select_list}
+        FROM public.jobs_deduplicated jd
+        INNER JOIN public.job_reviews jr ON jd.id = jr.job_id
+        {where_clause}
+        ORDER BY {sort_column} {sort_order} NULLS LAST, jd.id {sort_order}
+        """
+
+        exported = 0
+        try:
+            async with self.pool.acquire() as conn:
+                statement_stats.record(conn, "reviewed_jobs.export", export_query)
+                async with conn.transaction(readonly=True):
+                    batch: List[Dict[str, Any]] = []
+                    async for row in conn.cursor(export_query, *query.params, prefetch=batch_size):
+                        batch.append(self._review_item(row, fields))
+                        if len(batch) >= batch_size:
+                            exported += len(batch)
+                            yield batch
+                            batch = []
+                    if batch:
+                        exported += len(batch)
+                        yield batch
+        except Exception as e:
+            logger.error(f"Reviewed jobs export failed after {exported} rows: {str(e)}")
+            raise
+
+    async def search_jobs(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        site: Optional[str] = None,
+        include_duplicates: bool = False,
+        snippets: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Ranked full-text search over jobs.search_vector (GIN indexed).
+
+        ``query`` uses web search syntax (``"exact phrase"``, ``or``, ``-exclude``).
+        Matches are ranked with ts_rank_cd, title hits weighing most. Highlight
+        snippets are only built for the returned page, since ts_headline re-parses
+        the description text. Scraped text is HTML-escaped before highlighting,
+        so the only markup in a highlight is the ``<mark>`` tags.
+
+        Returns:
+            Dict with 'results' (job fields, 'rank' and, with ``snippets``,
+            'title_highlight'/'snippet') and 'has_more'
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        query_text = (query or "").strip()
+        if not query_text:
+            return {"query": query_text, "results": [], "has_more": False}
+
+        builder = QueryBuilder([query_text])
+        site_filter = builder.optional("j.site = lower({})", site or None, "text")
+        duplicates = builder.param(include_duplicates, "boolean")
+        page_limit = builder.param(limit + 1)
+        page_offset = builder.param(offset)
+        with_snippets = builder.param(snippets, "boolean")
+
+        sql = f"""
+            WITH q AS (
+                SELECT websearch_to_tsquery('english', $1) AS query
+            ),
+            ranked AS (
+                SELECT j.id, j.site, j.job_url, j.title, j.company, j.location_city,
+                       j.location_state, j.location_country, j.is_remote, j.date_posted,
+                       j.description, ts_rank_cd(j.search_vector, q.query) AS rank
+                FROM jobs j, q
+                WHERE j.search_vector @@ q.query
+                  AND {site_filter}
+                  AND ({duplicates} OR j.duplicate_status = 'original')
+                ORDER BY rank DESC, j.id
+                LIMIT {page_limit} OFFSET {page_offset}
+            )
+            SELECT r.id, r.site, r.job_url, r.title, r.company, r.is_remote, r.date_posted, r.rank,
+                   NULLIF(concat_ws(', ', r.location_city, r.location_state, r.location_country), '') AS location,
+                   CASE WHEN {with_snippets} THEN
+                       ts_headline('english', {_html_escape_sql("COALESCE(r.title, '')")}, q.query,
+                                   'HighlightAll=true, StartSel=<mark>, StopSel=</mark>')
+                   END AS title_highlight,
+                   CASE WHEN {with_snippets} THEN
+                       ts_headline('english', {_html_escape_sql("COALESCE(r.description, '')")}, q.query,
+                                   'MaxFragments=2, MinWords=8, MaxWords=30, StartSel=<mark>, StopSel=</mark>')
+                   END AS snippet
+            FROM ranked r, q
+            ORDER BY r.rank DESC, r.id
+        """
+
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                statement_stats.record(conn, "jobs.search", sql)
+                rows = await conn.fetch(sql, *builder.params)
+
+            has_more = len(rows) > limit
+            results = []
+            for row in rows[:limit]:
+                result = {
+                    "job_id": str(row["id"]),
+                    "title": row["title"],
+                    "company": row["company"],
+                    "location": row["location"],
+                    "url": row["job_url"],
+                    "source": row["site"],
+                    "is_remote": row["is_remote"],
+                    "date_posted": row["date_posted"],
+                    "rank": float(row["rank"]),
+                }
+                if snippets:
+                    result["title_highlight"] = row["title_highlight"]
+                    result["snippet"] = row["snippet"]
+                results.append(result)
+
+            return {"query": query_text, "results": results, "has_more": has_more}
+        except Exception as e:
+            logger.error(f"Failed to search jobs for '{query_text}': {str(e)}")
+            return {"query": query_text, "results": [], "has_more": False}
+
+    async def get_job_facets(
+        self,
+        top_n: int = 10,
+        query: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        status: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        date_posted_after: Optional[datetime] = None,
+        date_posted_before: Optional[datetime] = None,
+        include_duplicates: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Top-N companies, sites and statuses with counts for a filter context.
+
+        All three facets come from one pass over the filtered rows using
+        GROUPING SETS. ``company`` is a substring match served by the trigram
+        index and ``query`` a full-text match on search_vector.
+
+        Returns:
+            Dict with 'total' and 'facets' mapping facet name to [{value, count}]
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        builder = QueryBuilder()
+        where_conditions = [
+            builder.optional("j.search_vector @@ websearch_to_tsquery('english', {})", (query or "").strip() or None, "text"),
+            builder.optional("j.company ILIKE {}", f"%{_like_escape(company)}%" if company else None, "text"),
+            builder.optional("j.site = lower({})", source or None, "text"),
+            builder.optional("j.status = {}", status or None, "text"),
+            builder.optional("j.is_remote = {}", is_remote, "boolean"),
+            builder.optional("j.date_posted >= {}", date_posted_after, "timestamptz"),
+            builder.optional("j.date_posted <= {}", date_posted_before, "timestamptz"),
+            f"({builder.param(include_duplicates, 'boolean')} OR j.duplicate_status = 'original')",
+        ]
+        where_clause = "\n              AND ".join(where_conditions)
+        top = builder.param(top_n)
+
+        sql = f"""
+            WITH filtered AS MATERIALIZED (
+                SELECT j.company, j.site, j.status
+                FROM jobs j
+                WHERE {where_clause}
+            ),
+            grouped AS (
+                SELECT CASE
+                           WHEN GROUPING(company) = 0 THEN 'companies'
+                           WHEN GROUPING(site) = 0 THEN 'sites'
+                           WHEN GROUPING(status) = 0 THEN 'statuses'
+                           ELSE 'total'
+                       END AS facet,
+                       COALESCE(company, site, status) AS value,
+                       COUNT(*) AS count
+                FROM filtered
+                GROUP BY GROUPING SETS ((company), (site), (status), ())
+            ),
+            ranked AS (
+                SELECT facet, value, count,
+                       row_number() OVER (PARTITION BY facet ORDER BY count DESC, value) AS position
+                FROM grouped
+                WHERE value IS NOT NULL OR facet = 'total'
+            )
+            SELECT facet, value, count
+            FROM ranked
+            WHERE position <= {top} OR facet = 'total'
+            ORDER BY facet, position
+        """
+
+        facets: Dict[str, List[Dict[str, Any]]] = {"companies": [], "sites": [], "statuses": []}
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                statement_stats.record(conn, "jobs.facets", sql)
+                rows = await conn.fetch(sql, *builder.params)
+
+            total = 0
+            for row in rows:
+                if row["facet"] == "total":
+                    total = int(row["count"])
+                else:
+                    facets[row["facet"]].append({"value": row["value"], "count": int(row["count"])})
+            return {"total": total, "facets": facets}
+        except Exception as e:
+            logger.error(f"Failed to get job facets: {str(e)}")
+            return {"total": 0, "facets": facets}
+
+    async def typeahead(self, field: str, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Distinct company or title values starting with ``prefix``.
+
+        The prefix ILIKE is answered from the trigram index and reads at most
+        TYPEAHEAD_SCAN_LIMIT rows, so counts are exact for selective prefixes
+        and a lower bound for very common ones.
+
+        Raises:
+            ValueError: If ``field`` is not one of TYPEAHEAD_COLUMNS
+        """
+        column = TYPEAHEAD_COLUMNS.get(field)
+        if column is None:
+            raise ValueError(f"Unsupported typeahead field: {field}")
+
+        if not self.initialized:
+            await self.initialize()
+
+        prefix = (prefix or "").strip()
+        if not prefix:
+            return []
+
+        sql = f"""
+            SELECT value, COUNT(*) AS count
+            FROM (
+                SELECT {column} AS value
+                FROM jobs j
+                WHERE {column} ILIKE $1
+                  AND j.duplicate_status = 'original'
+                LIMIT {TYPEAHEAD_SCAN_LIMIT}
+            ) matches
+            GROUP BY value
+            ORDER BY count DESC, value
+            LIMIT $2
+        """
+
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                statement_stats.record(conn, f"jobs.typeahead.{field}", sql)
+                rows = await conn.fetch(sql, f"{_like_escape(prefix)}%", limit)
+            return [{"value": row["value"], "count": int(row["count"])} for row in rows]
+        except Exception as e:
+            logger.error(f"Failed typeahead on {field} for '{prefix}': {str(e)}")
+            return []
+
+    async def check_duplicate_groups(self, repair: bool = False) -> Dict[str, Any]:
+        """Compare job_duplicate_groups (backing jobs_deduplicated) with a full recomputation.
+
+        The table is maintained by triggers on jobs; this catches drift from
+        trigger-less loads or manual edits. With ``repair`` every inconsistent
+        group is recomputed via refresh_job_duplicate_group().
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT group_key, issue FROM public.check_job_duplicate_groups()"
+                )
+                issues = [dict(row) for row in rows]
+
+                repaired = 0
+                if repair:
+                    for issue in issues:
+                        await conn.execute(
+                            "SELECT public.refresh_job_duplicate_group($1)", issue["group_key"]
+                        )
+                        repaired += 1
+
+            if issues:
+                logger.warning(f"Found {len(issues)} inconsistent duplicate groups (repaired {repaired})")
+
+            return {
+                "consistent": not issues,
+                "issue_count": len(issues),
+                "issues": issues[:100],
+                "repaired": repaired,
+            }
+        except Exception as e:
+            logger.error(f"Failed to check duplicate groups: {str(e)}")
+            return {"consistent": False, "issue_count": 0, "issues": [], "repaired": 0, "error": str(e)}
+
+    async def get_job_status_counts(self, site: Optional[str] = None) -> Dict[str, int]:
+        """Job counts per status from the trigger-maintained job_stat_counters table."""
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT status, SUM(job_count)::bigint AS count
+                    FROM job_stat_counters
+                    WHERE ($1::text IS NULL OR site = lower($1::text))
+                    GROUP BY status
+                    """,
+                    site,
+                )
+            return {row["status"]: int(row["count"]) for row in rows if row["count"]}
+        except Exception as e:
+            logger.error(f"Failed to get job status counts: {str(e)}")
+            return {}
+
+    async def get_site_job_counts(self, site: str) -> Dict[str, int]:
+        """Total and described job counts for one site from job_stat_counters."""
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                row = await conn.fetchrow(
+                    """
+                    SELECT COALESCE(SUM(job_count), 0)::bigint AS total,
+                           COALESCE(SUM(described_count), 0)::bigint AS described
+                    FROM job_stat_counters
+                    WHERE site = lower($1)
+                    """,
+                    site,
+                )
+            return {"total": int(row["total"]), "described": int(row["described"])}
+        except Exception as e:
+            logger.error(f"Failed to get job counts for site {site}: {str(e)}")
+            return {"total": 0, "described": 0}
+
+    async def get_review_counter_totals(self) -> Dict[str, Any]:
+        """Review totals and averages from the trigger-maintained job_review_stat_counters table."""
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                row = await conn.fetchrow(
+                    """
+                    SELECT COALESCE(SUM(review_count), 0)::bigint AS total_reviews,
+                           COALESCE(SUM(recommended_count), 0)::bigint AS recommended_count,
+                           COALESCE(SUM(not_recommended_count), 0)::bigint AS not_recommended_count,
+                           COALESCE(SUM(error_count), 0)::bigint AS error_count,
+                           COALESCE(SUM(processing_time_total), 0) AS processing_time_total,
+                           COALESCE(SUM(processing_time_count), 0)::bigint AS processing_time_count,
+                           COALESCE(SUM(retry_total), 0)::bigint AS retry_total
+                    FROM job_review_stat_counters
+                    """
+                )
+            total = int(row["total_reviews"])
+            timed = int(row["processing_time_count"])
+            return {
+                "total_reviews": total,
+                "recommended_count": int(row["recommended_count"]),
+                "not_recommended_count": int(row["not_recommended_count"]),
+                "error_count": int(row["error_count"]),
+                "avg_processing_time_seconds": float(row["processing_time_total"]) / timed if timed else 0.0,
+                "avg_retry_count": int(row["retry_total"]) / total if total else 0.0,
+            }
+        except Exception as e:
+            logger.error(f"Failed to get review counter totals: {str(e)}")
+            return {}
+
+    async def get_reviews_version(self) -> Optional[Tuple[Any, ...]]:
+        """Cheap change stamp for the reviewed-jobs listing, used as its ETag.
+
+        See REVIEWS_VERSION_QUERY. Read with the same routing as
+        get_reviewed_jobs so the stamp never runs ahead of the body.
+        Returns None when it cannot be read, which disables revalidation.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.read_connection(stale_ok=True) as conn:
+                row = await conn.fetchrow(REVIEWS_VERSION_QUERY)
+            return _reviews_version(row)
+        except Exception as e:
+            logger.error(f"Failed to get reviews version: {str(e)}")
+            return None
+
+    async def reconcile_stat_counters(self) -> Dict[str, int]:
+        """Recount job_stat_counters/job_review_stat_counters from their base tables.
+
+        Returns the number of corrected rows per counter table; non-zero values
+        mean the triggers drifted (bulk loads with triggers disabled, manual edits).
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT counter, corrected_rows FROM public.reconcile_stat_counters()"
+                )
+            corrected = {row["counter"]: int(row["corrected_rows"]) for row in rows}
+            if any(corrected.values()):
+                logger.warning(f"Stat counters drifted, corrected rows: {corrected}")
+            return corrected
+        except Exception as e:
+            logger.error(f"Failed to reconcile stat counters: {str(e)}")
+            return {}
 
     async def get_job_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Get job by URL for duplicate detection."""
@@ -927,7 +2176,8 @@ class DatabaseService:
         """
 
         try:
-            async with self.pool.acquire() as conn:
+            # Duplicate detection right before an insert must see the latest rows
+            async with self.read_connection(stale_ok=False) as conn:
                 row = await conn.fetchrow(query, url)
                 return dict(row) if row else None
         except Exception as e:
@@ -966,6 +2216,11 @@ class DatabaseService:
         if not await self._column_exists('companies', 'normalized_name'):
             return None
 
+        cache_key = (normalized_name, user_id)
+        cached = reference_cache.get("companies", cache_key)
+        if cached is not MISSING:
+            return dict(cached)
+
         include_user = await self._column_exists('companies', 'user_id')
 
         query = """
@@ -996,7 +2251,12 @@ class DatabaseService:
                         """,
                         normalized_name
                     )
-                return dict(row) if row else None
+            if not row:
+                # Misses are not cached: the caller usually creates the company next
+                return None
+            company = dict(row)
+            reference_cache.set("companies", cache_key, company)
+            return dict(company)
         except Exception as e:
             logger.error(f"Failed to get company by normalized name: {str(e)}")
             return None
@@ -1073,6 +2333,7 @@ class DatabaseService:
         try:
             async with self.pool.acquire() as conn:
                 row = await conn.fetchrow(query, *values)
+                reference_cache.invalidate("companies")
                 result = dict(row) if row else {}
                 if include_normalized and 'normalized_name' not in result and company_data.get('normalized_name'):
                     result['normalized_name'] = company_data.get('normalized_name')
@@ -1097,7 +2358,7 @@ class DatabaseService:
             if key in ['mission', 'values']:
                 # JSONB fields
                 set_clauses.append(f"{key} = ${param_count}::jsonb")
-                params.append(json.dumps(value) if not isinstance(value, str) else value)
+                params.append(orjson.loads(value) if isinstance(value, str) else value)
             else:
                 set_clauses.append(f"{key} = ${param_count}")
                 params.append(value)
@@ -1117,11 +2378,42 @@ class DatabaseService:
         try:
             async with self.pool.acquire() as conn:
                 await conn.execute(query, *params)
+            reference_cache.invalidate("companies")
             return True
         except Exception as e:
             logger.error(f"Failed to update company: {str(e)}")
             return False
 
+    async def get_or_create_status_id(self, status_name: str) -> Optional[str]:
+        """Application status id for ``status_name``, creating the status if missing."""
+        cached = reference_cache.get("statuses", status_name)
+        if cached is not MISSING:
+            return cached
+
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            async with self.pool.acquire() as conn:
+                status_id = await conn.fetchval(
+                    "SELECT status_id FROM statuses WHERE status_name = $1 LIMIT 1",
+                    status_name
+                )
+                if status_id is None:
+                    status_id = await conn.fetchval(
+                        """
+                        INSERT INTO statuses (status_name, created_at)
+                        VALUES ($1, NOW())
+                        RETURNING status_id
+                        """,
+                        status_name
+                    )
+            reference_cache.set("statuses", status_name, status_id)
+            return status_id
+        except Exception as e:
+            logger.error(f"Failed to get status id for {status_name}: {str(e)}")
+            return None
+
     async def insert_job(self, job_data: Dict[str, Any]) -> str:
         """Insert a new job and return job ID."""
         if not self.initialized:
@@ -1173,7 +2465,7 @@ class DatabaseService:
         """
 
         try:
-            async with self.pool.acquire() as conn:
+            async with self.read_connection(stale_ok=False) as conn:
                 row = await conn.fetchrow(query, job_id)
                 return dict(row) if row else None
         except Exception as e:
@@ -1217,6 +2509,41 @@ class DatabaseService:
             return False
 
 
+# One DatabaseService per event loop (asyncpg pools are bound to their loop), so every
+# caller in a process shares the same pools and stays within the pool budget
+_services: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DatabaseService]" = weakref.WeakKeyDictionary()
+_services_pid = os.getpid()
+_services_lock = threading.Lock()
+
+
+def _service_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The loop the caller's database work will run on, if it can be known yet."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    # Sync callers (RQ jobs, scripts) drive the main thread's loop with run_until_complete
+    if threading.current_thread() is threading.main_thread():
+        try:
+            return asyncio.get_event_loop_policy().get_event_loop()
+        except RuntimeError:
+            return None
+    return None
+
+
 def get_database_service() -> DatabaseService:
-    """Create a new database service instance."""
-    return DatabaseService()
+    """Shared database service for the caller's event loop (a new one when the loop is unknown)."""
+    global _services_pid
+    loop = _service_loop()
+    if loop is None or loop.is_closed():
+        return DatabaseService()
+
+    with _services_lock:
+        if _services_pid != os.getpid():
+            # Forked child (e.g. an RQ work horse): the parent's pools are not ours to use
+            _services.clear()
+            _services_pid = os.getpid()
+        service = _services.get(loop)
+        if service is None:
+            service = _services[loop] = DatabaseService()
+        return service
@@ -0,0 +1,77 @@
+"""
+Dead-letter queue for job reviews that can no longer be retried.
+
+Entries are kept in a Redis hash keyed by job id, so a job appears at most
+once no matter how many times it failed, and each entry carries the last
+exception seen. Reviews land here either when the worker exhausts
+``max_retries`` or when the RQ job itself fails (timeout, crash).
+"""
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import redis
+from loguru import logger
+
+
+DEAD_LETTER_KEY = "job_review:dead_letter"
+
+
+def review_rq_job_id(job_id: str, attempt: int) -> str:
+    """Deterministic RQ job id for one review attempt of a job."""
+    return f"review-{job_id}-{attempt}"
+
+
+def record_dead_letter(conn: redis.Redis,
+                       job_id: str,
+                       last_error: str,
+                       reason: str,
+                       attempts: Optional[int] = None,
+                       max_retries: Optional[int] = None,
+                       rq_job_id: Optional[str] = None) -> None:
+    """Add (or overwrite) the dead-letter entry for a job."""
+    entry = {
+        "job_id": job_id,
+        "rq_job_id": rq_job_id,
+        "reason": reason,
+        "last_error": last_error,
+        "attempts": attempts,
+        "max_retries": max_retries,
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+    }
+    conn.hset(DEAD_LETTER_KEY, job_id, json.dumps(entry))
+    logger.warning(f"Job review {job_id} moved to dead-letter queue ({reason}): {last_error}")
+
+
+def list_dead_letters(conn: redis.Redis, limit: int = 100) -> List[Dict[str, Any]]:
+    """Return dead-letter entries, most recent failure first."""
+    entries = [json.loads(raw) for raw in conn.hvals(DEAD_LETTER_KEY)]
+    entries.sort(key=lambda entry: entry.get("failed_at") or "", reverse=True)
+    return entries[:limit]
+
+
+def get_dead_letter(conn: redis.Redis, job_id: str) -> Optional[Dict[str, Any]]:
+    raw = conn.hget(DEAD_LETTER_KEY, job_id)
+    return json.loads(raw) if raw else None
+
+
+def remove_dead_letter(conn: redis.Redis, job_id: str) -> bool:
+    return conn.hdel(DEAD_LETTER_KEY, job_id) == 1
+
+
+def dead_letter_count(conn: redis.Redis) -> int:
+    return conn.hlen(DEAD_LETTER_KEY)
+
+
+def review_job_failed(job, connection, exc_type, exc_value, tb) -> None:
+    """RQ ``on_failure`` callback: reviews that fail outside the worker's own handling."""
+    job_id = job.args[0] if job.args else job.kwargs.get("job_id")
+    max_retries = job.args[1] if len(job.args) > 1 else job.kwargs.get("max_retries")
+    record_dead_letter(
+        connection,
+        str(job_id),
+        last_error=f"{exc_type.__name__}: {exc_value}",
+        reason="worker_failure",
+        max_retries=max_retries,
+        rq_job_id=job.id,
+    )
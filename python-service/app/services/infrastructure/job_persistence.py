@@ -5,16 +5,140 @@ Handles idempotent upserts and batch processing with error handling.
 import asyncio
 import hashlib
 import re
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timezone
 import asyncpg
-import json
 from loguru import logger
 
 from ...core.config import get_settings
 from ...schemas.jobspy import ScrapedJob
 from .database import get_database_service
 from .company_normalization import normalize_company_name
+from .cpu_pool import cpu_pool
+
+
+def generate_canonical_key(title: str, company: str) -> str:
+    """
+    Generate normalized canonical key for cross-site deduplication.
+
+    Uses company normalization to handle large companies (Amazon/AWS, Microsoft/Azure, etc.)
+    and title normalization to handle variations (Sr./Senior, PM/Product Manager).
+
+    Args:
+        title: Job title
+        company: Company name
+
+    Returns:
+        Canonical key for deduplication (e.g., "amazon_senior_product_manager")
+    """
+    # Normalize company using alias mapping
+    company_clean = normalize_company_name(company)
+
+    # Normalize title
+    title_clean = title.lower()
+
+    # Expand common abbreviations
+    title_clean = title_clean.replace('sr.', 'senior')
+    title_clean = title_clean.replace('sr ', 'senior ')
+    title_clean = title_clean.replace('jr.', 'junior')
+    title_clean = title_clean.replace('jr ', 'junior ')
+    title_clean = title_clean.replace(' mgr', ' manager')
+    title_clean = title_clean.replace('mgr ', 'manager ')
+    title_clean = title_clean.replace(' pm ', ' product manager ')
+    title_clean = title_clean.replace(' eng ', ' engineer ')
+
+    # Remove Roman numerals (I, II, III, IV, V)
+    title_clean = re.sub(r'\b(i{1,3}|iv|v|vi{1,3})\b', '', title_clean)
+
+    # Remove level numbers (1, 2, 3, etc.)
+    title_clean = re.sub(r'\b\d+\b', '', title_clean)
+
+    # Remove special characters and normalize whitespace
+    title_clean = re.sub(r'[^a-z0-9\s]+', ' ', title_clean)
+    title_clean = re.sub(r'\s+', '_', title_clean).strip('_')
+
+    canonical = f"{company_clean}_{title_clean}"
+
+    logger.debug(f"Canonical key: {company} + {title} → {canonical}")
+    return canonical
+
+
+def generate_fingerprint(description: str, title: str, company: str) -> str:
+    """
+    Generate content-based fingerprint for semantic duplicate detection.
+
+    Uses shingling and hashing to detect jobs with similar descriptions
+    even if posted on different sites with minor formatting differences.
+
+    Args:
+        description: Job description text
+        title: Job title (for additional context)
+        company: Company name (for additional context)
+
+    Returns:
+        MD5 hash fingerprint for content matching
+    """
+    # Normalize description text
+    text = description.lower()
+
+    # Remove HTML/markdown formatting
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[#*`_\[\]()]', '', text)
+
+    # Remove common boilerplate phrases that vary between sites
+    boilerplate_phrases = [
+        'equal opportunity employer',
+        'we are an equal',
+        'apply now',
+        'click here',
+        'eeo statement',
+        'apply today',
+        'learn more',
+        'submit resume',
+        'send resume',
+        'visit our website',
+    ]
+    for phrase in boilerplate_phrases:
+        text = text.replace(phrase, '')
+
+    # Remove excessive whitespace
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    # Create word shingles (3-word sequences) for fuzzy matching
+    words = text.split()
+    if len(words) < 3:
+        # Too short for shingling, just hash the whole thing
+        combined = f"{company.lower()}_{title.lower()}_{text}"
+        return hashlib.md5(combined.encode()).hexdigest()
+
+    # Generate shingles
+    shingles = []
+    for i in range(len(words) - 2):
+        shingle = ' '.join(words[i:i+3])
+        shingles.append(shingle)
+
+    # Sort and join shingles for consistent hashing
+    shingle_text = '|'.join(sorted(set(shingles)))
+
+    # Create final fingerprint with company and title context
+    combined = f"{company.lower()}_{title.lower()}_{hashlib.sha256(shingle_text.encode()).hexdigest()[:16]}"
+    fingerprint = hashlib.md5(combined.encode()).hexdigest()
+
+    logger.debug(f"Fingerprint: {company} + {title} → {fingerprint}")
+    return fingerprint
+
+
+def generate_dedup_keys(title: Optional[str], company: Optional[str],
+                        description: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """(canonical_key, fingerprint) for a job; either is None when its inputs are missing."""
+    canonical_key = None
+    if company and title:
+        canonical_key = generate_canonical_key(title, company)
+
+    fingerprint = None
+    if description and len(description) > 100:
+        fingerprint = generate_fingerprint(description, title or '', company or '')
+    return canonical_key, fingerprint
 
 
 class JobPersistenceService:
@@ -68,8 +192,12 @@ class JobPersistenceService:
                             errors.append(f"Record {i}: missing title")
                             continue
 
-                        # Map ScrapedJob to database fields
-                        job_data = self._map_job_to_db(job, site_name)
+                        # Map ScrapedJob to database fields; shingling a long description runs in the CPU pool
+                        dedup_keys = await cpu_pool.run(
+                            generate_dedup_keys, job.title, job.company, job.description,
+                            size=len(job.description or "")
+                        )
+                        job_data = self._map_job_to_db(job, site_name, dedup_keys)
 
                         # Attempt upsert
                         result = await self._upsert_job(conn, job_data)
@@ -96,13 +224,15 @@ class JobPersistenceService:
         logger.info(f"Persistence complete: {summary}")
         return summary
     
-    def _map_job_to_db(self, job: ScrapedJob, site_name: str) -> Dict[str, Any]:
+    def _map_job_to_db(self, job: ScrapedJob, site_name: str,
+                       dedup_keys: Optional[Tuple[Optional[str], Optional[str]]] = None) -> Dict[str, Any]:
         """
         Map a ScrapedJob object to database fields.
 
         Args:
             job: ScrapedJob object
             site_name: Job site name
+            dedup_keys: Precomputed (canonical_key, fingerprint); computed inline when omitted
 
         Returns:
             Dictionary of database field values
@@ -144,19 +274,10 @@ class JobPersistenceService:
             "scraped_at": datetime.now(timezone.utc).isoformat()
         }
 
-        # Generate canonical key for cross-site deduplication
-        canonical_key = None
-        if job.company and job.title:
-            canonical_key = self._generate_canonical_key(job.title, job.company)
-
-        # Generate content fingerprint for semantic deduplication
-        fingerprint = None
-        if job.description and len(job.description) > 100:
-            fingerprint = self._generate_fingerprint(
-                job.description,
-                job.title or '',
-                job.company or ''
-            )
+        # Canonical key for cross-site deduplication, content fingerprint for semantic deduplication
+        if dedup_keys is None:
+            dedup_keys = generate_dedup_keys(job.title, job.company, job.description)
+        canonical_key, fingerprint = dedup_keys
 
         return {
             "site": site_name,
@@ -239,7 +360,7 @@ class JobPersistenceService:
                     job_data["description"],
                     job_data["date_posted"],
                     job_data["ingested_at"],
-                    json.dumps(job_data["source_raw"]),
+                    job_data["source_raw"],
                     job_data["canonical_key"],
                     job_data["fingerprint"],
                     job_data["duplicate_group_id"],
@@ -287,7 +408,7 @@ class JobPersistenceService:
                 job_data["description"],
                 job_data["date_posted"],
                 job_data["ingested_at"],
-                json.dumps(job_data["source_raw"]),
+                job_data["source_raw"],
                 job_data["canonical_key"],
                 job_data["fingerprint"],
                 job_data["duplicate_group_id"],
@@ -307,113 +428,13 @@ class JobPersistenceService:
             raise
 
     def _generate_canonical_key(self, title: str, company: str) -> str:
-        """
-        Generate normalized canonical key for cross-site deduplication.
-
-        Uses company normalization to handle large companies (Amazon/AWS, Microsoft/Azure, etc.)
-        and title normalization to handle variations (Sr./Senior, PM/Product Manager).
-
-        Args:
-            title: Job title
-            company: Company name
-
-        Returns:
-            Canonical key for deduplication (e.g., "amazon_senior_product_manager")
-        """
-        # Normalize company using alias mapping
-        company_clean = normalize_company_name(company)
-
-        # Normalize title
-        title_clean = title.lower()
-
-        # Expand common abbreviations
-        title_clean = title_clean.replace('sr.', 'senior')
-        title_clean = title_clean.replace('sr ', 'senior ')
-        title_clean = title_clean.replace('jr.', 'junior')
-        title_clean = title_clean.replace('jr ', 'junior ')
-        title_clean = title_clean.replace(' mgr', ' manager')
-        title_clean = title_clean.replace('mgr ', 'manager ')
-        title_clean = title_clean.replace(' pm ', ' product manager ')
-        title_clean = title_clean.replace(' eng ', ' engineer ')
-
-        # Remove Roman numerals (I, II, III, IV, V)
-        title_clean = re.sub(r'\b(i{1,3}|iv|v|vi{1,3})\b', '', title_clean)
-
-        # Remove level numbers (1, 2, 3, etc.)
-        title_clean = re.sub(r'\b\d+\b', '', title_clean)
-
-        # Remove special characters and normalize whitespace
-        title_clean = re.sub(r'[^a-z0-9\s]+', ' ', title_clean)
-        title_clean = re.sub(r'\s+', '_', title_clean).strip('_')
-
-        canonical = f"{company_clean}_{title_clean}"
-
-        logger.debug(f"Canonical key: {company} + {title} → {canonical}")
-        return canonical
+        """Canonical key for cross-site deduplication (see ``generate_canonical_key``)."""
+        return generate_canonical_key(title, company)
 
     def _generate_fingerprint(self, description: str, title: str, company: str) -> str:
-        """
-        Generate content-based fingerprint for semantic duplicate detection.
+        """Content fingerprint for semantic duplicate detection (see ``generate_fingerprint``)."""
+        return generate_fingerprint(description, title, company)
 
-        Uses shingling and hashing to detect jobs with similar descriptions
-        even if posted on different sites with minor formatting differences.
-
-        Args:
-            description: Job description text
-            title: Job title (for additional context)
-            company: Company name (for additional context)
-
-        Returns:
-            MD5 hash fingerprint for content matching
-        """
-        # Normalize description text
-        text = description.lower()
-
-        # Remove HTML/markdown formatting
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'[#*`_\[\]()]', '', text)
-
-        # Remove common boilerplate phrases that vary between sites
-        boilerplate_phrases = [
-            'equal opportunity employer',
-            'we are an equal',
-            'apply now',
-            'click here',
-            'eeo statement',
-            'apply today',
-            'learn more',
-            'submit resume',
-            'send resume',
-            'visit our website',
-        ]
-        for phrase in boilerplate_phrases:
-            text = text.replace(phrase, '')
-
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        # Create word shingles (3-word sequences) for fuzzy matching
-        words = text.split()
-        if len(words) < 3:
-            # Too short for shingling, just hash the whole thing
-            combined = f"{company.lower()}_{title.lower()}_{text}"
-            return hashlib.md5(combined.encode()).hexdigest()
-
-        # Generate shingles
-        shingles = []
-        for i in range(len(words) - 2):
-            shingle = ' '.join(words[i:i+3])
-            shingles.append(shingle)
-
-        # Sort and join shingles for consistent hashing
-        shingle_text = '|'.join(sorted(set(shingles)))
-
-        # Create final fingerprint with company and title context
-        combined = f"{company.lower()}_{title.lower()}_{hashlib.sha256(shingle_text.encode()).hexdigest()[:16]}"
-        fingerprint = hashlib.md5(combined.encode()).hexdigest()
-
-        logger.debug(f"Fingerprint: {company} + {title} → {fingerprint}")
-        return fingerprint
 
 def get_job_persistence_service() -> JobPersistenceService:
     """Create a new job persistence service instance."""
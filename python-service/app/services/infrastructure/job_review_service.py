@@ -74,9 +74,10 @@ class JobReviewService:
             
             # Extract job IDs
             job_ids = [str(job["id"]) for job in pending_jobs]
+            attempts = {str(job["id"]): job.get("retry_count") or 0 for job in pending_jobs}
             
             # Queue jobs for review
-            results = self.queue_service.enqueue_multiple_job_reviews(job_ids, max_retries)
+            results = self.queue_service.enqueue_multiple_job_reviews(job_ids, max_retries, attempts)
             
             # Count successes and failures
             queued_count = sum(1 for task_id in results.values() if task_id is not None)
@@ -105,6 +106,39 @@ class JobReviewService:
                 "message": error_msg
             }
     
+    async def queue_review_batches(self, batches: int = 1, batch_size: Optional[int] = None,
+                                   max_retries: int = 3) -> Dict[str, Any]:
+        """
+        Queue batch review tasks, each of which claims up to ``batch_size`` pending jobs.
+
+        Args:
+            batches: Number of batch tasks to enqueue
+            batch_size: Jobs per batch (defaults to settings.job_review_batch_size)
+            max_retries: Maximum retry attempts per job
+
+        Returns:
+            Summary with the enqueued task IDs
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        batch_size = batch_size or self.settings.job_review_batch_size
+        task_ids = [
+            task_id for task_id in (
+                self.queue_service.enqueue_job_review_batch(batch_size, max_retries)
+                for _ in range(batches)
+            )
+            if task_id
+        ]
+
+        return {
+            "status": "success" if task_ids else "error",
+            "queued_batches": len(task_ids),
+            "batch_size": batch_size,
+            "task_ids": task_ids,
+            "message": f"Queued {len(task_ids)}/{batches} review batches of up to {batch_size} jobs"
+        }
+
     async def get_review_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the review status for a specific job.
@@ -154,46 +188,17 @@ class JobReviewService:
             await self.initialize()
         
         try:
-            # Query job counts by status  
-            stats_query = """
-            SELECT status, COUNT(*) as count
-            FROM public.jobs
-            GROUP BY status
-            """
-            
-            async with self.db_service.pool.acquire() as conn:
-                status_rows = await conn.fetch(stats_query)
-            
-            status_counts = {row["status"]: row["count"] for row in status_rows}
-            
-            # Query review performance
-            review_stats_query = """
-            SELECT 
-                COUNT(*) as total_reviews,
-                COUNT(*) FILTER (WHERE recommend = true) as recommended_count,
-                COUNT(*) FILTER (WHERE recommend = false) as not_recommended_count,
-                COUNT(*) FILTER (WHERE error_message IS NOT NULL) as error_count,
-                AVG(processing_time_seconds) as avg_processing_time,
-                AVG(retry_count) as avg_retry_count
-            FROM public.job_reviews
-            """
-            
-            async with self.db_service.pool.acquire() as conn:
-                review_row = await conn.fetchrow(review_stats_query)
+            # Both come from trigger-maintained counter tables rather than scans of
+            # jobs/job_reviews; see DatabaseService.reconcile_stat_counters()
+            status_counts = await self.db_service.get_job_status_counts()
+            review_stats = await self.db_service.get_review_counter_totals()
             
             # Get queue info
             queue_info = self.queue_service.get_queue_info()
             
             return {
                 "job_status_counts": status_counts,
-                "review_stats": {
-                    "total_reviews": review_row["total_reviews"] or 0,
-                    "recommended_count": review_row["recommended_count"] or 0,
-                    "not_recommended_count": review_row["not_recommended_count"] or 0,
-                    "error_count": review_row["error_count"] or 0,
-                    "avg_processing_time_seconds": float(review_row["avg_processing_time"]) if review_row["avg_processing_time"] else 0.0,
-                    "avg_retry_count": float(review_row["avg_retry_count"]) if review_row["avg_retry_count"] else 0.0,
-                },
+                "review_stats": review_stats,
                 "queue_info": queue_info
             }
             
@@ -243,7 +248,8 @@ class JobReviewService:
             
             # Re-queue the jobs
             job_ids = [str(job["id"]) for job in failed_jobs]
-            results = self.queue_service.enqueue_multiple_job_reviews(job_ids, max_retries)
+            attempts = {str(job["id"]): job["retry_count"] or 0 for job in failed_jobs}
+            results = self.queue_service.enqueue_multiple_job_reviews(job_ids, max_retries, attempts)
             
             requeued_count = sum(1 for task_id in results.values() if task_id is not None)
             
@@ -290,7 +296,9 @@ class JobReviewService:
             await self.initialize()
 
         try:
-            task_id = self.queue_service.enqueue_job_review(job_id, max_retries)
+            review = await self.db_service.get_job_review(job_id)
+            attempt = (review or {}).get("retry_count") or 0
+            task_id = self.queue_service.enqueue_job_review(job_id, max_retries, attempt)
 
             if task_id:
                 logger.info(f"Queued job {job_id} for review with task ID: {task_id}")
@@ -0,0 +1,137 @@
+"""
+Redis lock helpers backed by a registry of active locks.
+
+Every lock taken through these helpers is also recorded in a sorted set
+scored by its expiry time, so finding (or cleaning up) active locks costs
+O(active locks) instead of a ``KEYS`` walk over the whole keyspace.
+"""
+import fnmatch
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import redis
+from loguru import logger
+
+
+LOCK_REGISTRY_KEY = "locks:registry"
+
+_ACQUIRE_SCRIPT = """
+if redis.call("SET", KEYS[1], ARGV[1], "NX", "EX", ARGV[2]) then
+    redis.call("ZADD", KEYS[2], ARGV[3], KEYS[1])
+    return 1
+end
+return 0
+"""
+
+_EXTEND_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("EXPIRE", KEYS[1], ARGV[2])
+    redis.call("ZADD", KEYS[2], ARGV[3], KEYS[1])
+    return 1
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("ZREM", KEYS[2], KEYS[1])
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def acquire_lock(conn: redis.Redis, key: str, value: str, timeout: int) -> bool:
+    """Set ``key`` to ``value`` if absent, with a TTL, and register it."""
+    expires_at = time.time() + timeout
+    return conn.eval(_ACQUIRE_SCRIPT, 2, key, LOCK_REGISTRY_KEY, value, timeout, expires_at) == 1
+
+
+def extend_lock(conn: redis.Redis, key: str, value: str, timeout: int) -> bool:
+    """Reset the TTL of a lock we still own and update its registry score."""
+    expires_at = time.time() + timeout
+    return conn.eval(_EXTEND_SCRIPT, 2, key, LOCK_REGISTRY_KEY, value, timeout, expires_at) == 1
+
+
+def release_lock(conn: redis.Redis, key: str, value: str) -> bool:
+    """Delete a lock we own and drop it from the registry."""
+    return conn.eval(_RELEASE_SCRIPT, 2, key, LOCK_REGISTRY_KEY, value) == 1
+
+
+def unregister_lock(conn: redis.Redis, key: str) -> None:
+    """Remove a key from the registry without touching the key itself."""
+    conn.zrem(LOCK_REGISTRY_KEY, key)
+
+
+def prune_expired_locks(conn: redis.Redis) -> int:
+    """Drop registry entries whose lease has already expired."""
+    return conn.zremrangebyscore(LOCK_REGISTRY_KEY, "-inf", time.time())
+
+
+def registered_locks(conn: redis.Redis, pattern: str = "*") -> List[Tuple[str, float]]:
+    """Return (key, expires_at) for registered locks matching a glob pattern."""
+    entries = conn.zrange(LOCK_REGISTRY_KEY, 0, -1, withscores=True)
+    locks = []
+    for member, score in entries:
+        key = _decode(member)
+        if fnmatch.fnmatchcase(key, pattern):
+            locks.append((key, score))
+    return locks
+
+
+def scan_lock_keys(conn: redis.Redis, pattern: str, count: int = 500) -> Iterator[str]:
+    """Iterate keys matching ``pattern`` with a cursor-based SCAN (legacy locks)."""
+    for key in conn.scan_iter(match=pattern, count=count):
+        yield _decode(key)
+
+
+class LockHeartbeat:
+    """
+    Keep extending a lock lease from a background thread.
+
+    Long-running work holds a short lease that is renewed every third of its
+    length; if the process dies the lock expires within one lease instead of
+    blocking the site for a worst-case TTL. The lock is released on exit.
+    """
+
+    def __init__(self, conn: redis.Redis, key: str, value: str, lease_seconds: int):
+        self.conn = conn
+        self.key = key
+        self.value = value
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _beat(self) -> None:
+        interval = max(1.0, self.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            try:
+                if not extend_lock(self.conn, self.key, self.value, self.lease_seconds):
+                    logger.warning(f"Lost lock {self.key} during heartbeat")
+                    return
+            except Exception as e:
+                logger.error(f"Failed to extend lock {self.key}: {str(e)}")
+
+    def __enter__(self) -> "LockHeartbeat":
+        try:
+            # Shrink the enqueue-time TTL to the lease window now that work has started
+            extend_lock(self.conn, self.key, self.value, self.lease_seconds)
+        except Exception as e:
+            logger.error(f"Failed to start lease for lock {self.key}: {str(e)}")
+        self._thread = threading.Thread(target=self._beat, name=f"lock-heartbeat:{self.key}", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        try:
+            release_lock(self.conn, self.key, self.value)
+        except Exception as e:
+            logger.error(f"Failed to release lock {self.key}: {str(e)}")
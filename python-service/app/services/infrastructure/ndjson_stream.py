@@ -0,0 +1,70 @@
+"""
+Incremental reader for newline-delimited JSON request bodies.
+
+``iter_ndjson_lines`` consumes an upload chunk by chunk (optionally gzip
+compressed) and yields one line at a time, so memory stays bounded by the
+longest line rather than the size of the upload.
+"""
+import zlib
+from typing import AsyncIterator, Tuple
+
+# Cap on decompressed bytes produced per step, so a small compressed chunk cannot expand unboundedly
+DECOMPRESS_STEP_BYTES = 256 * 1024
+
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes], gzipped: bool = False,
+                            max_line_bytes: int = 1024 * 1024) -> AsyncIterator[Tuple[int, bytes]]:
+    """
+    Yield ``(line_number, line)`` for each non-blank line of an NDJSON stream.
+
+    Args:
+        chunks: Raw body chunks, e.g. ``request.stream()``
+        gzipped: Whether the body is gzip compressed
+        max_line_bytes: Longest line accepted
+
+    Raises:
+        ValueError: If a line exceeds ``max_line_bytes`` or the gzip data is corrupt or truncated
+    """
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16) if gzipped else None
+    buffer = bytearray()
+    line_number = 0
+
+    def drain():
+        nonlocal line_number
+        while True:
+            newline = buffer.find(b"\n")
+            if newline < 0:
+                break
+            line = bytes(buffer[:newline]).strip()
+            del buffer[:newline + 1]
+            line_number += 1
+            if len(line) > max_line_bytes:
+                raise ValueError(f"line {line_number} exceeds {max_line_bytes} bytes")
+            if line:
+                yield line_number, line
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"line {line_number + 1} exceeds {max_line_bytes} bytes")
+
+    async for chunk in chunks:
+        if decompressor is None:
+            buffer.extend(chunk)
+            for item in drain():
+                yield item
+            continue
+
+        data = chunk
+        while data:
+            try:
+                buffer.extend(decompressor.decompress(data, DECOMPRESS_STEP_BYTES))
+            except zlib.error as e:
+                raise ValueError(f"invalid gzip body: {e}") from e
+            data = decompressor.unconsumed_tail
+            for item in drain():
+                yield item
+
+    if decompressor is not None and not decompressor.eof:
+        raise ValueError("truncated gzip body")
+
+    line = bytes(buffer).strip()
+    if line:
+        yield line_number + 1, line
@@ -3,41 +3,33 @@
 from typing import List, Dict, Any
 from loguru import logger
 
-from .postgrest import get_postgrest_service
+from .database import get_database_service
 
 
 class PGSearchTool:
-    """Simple search tool using PostgREST service."""
+    """Ranked job search backed by the jobs full-text index."""
 
     def __init__(self):
-        self.service = get_postgrest_service()
+        self.db_service = get_database_service()
 
     async def search_jobs(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        """Search jobs table for titles matching query.
+        """Search jobs by title, company, location and description.
 
         Args:
-            query: Text to search in job titles.
+            query: Search text (web search syntax: "phrase", or, -exclude).
             limit: Maximum number of results to return.
+
+        Returns:
+            Matches ordered by relevance, each with a highlighted snippet.
         """
         try:
-            if not self.service.client:
-                await self.service.initialize()
-
-            params = {
-                "title": f"ilike.%{query}%",
-                "limit": str(limit),
-            }
-            response = await self.service.client.get("/jobs", params=params)
-            if response.status_code == 200:
-                return response.json()
-            logger.error(f"PostgREST search failed: HTTP {response.status_code}")
+            result = await self.db_service.search_jobs(query, limit=limit)
+            return result["results"]
         except Exception as e:
-            logger.error(f"PostgREST search error: {e}")
+            logger.error(f"Job search error: {e}")
         return []
 
 
 def get_pg_search_tool() -> PGSearchTool:
     """Create a new PGSearchTool instance."""
     return PGSearchTool()
-
-
@@ -44,10 +44,12 @@ class PollerService:
             await self.initialize()
 
         query = """
-        SELECT id, title, company, site, job_url, ingested_at, canonical_key
-        FROM public.jobs
-        WHERE status = 'pending_review'
-        ORDER BY ingested_at ASC
+        SELECT j.id, j.title, j.company, j.site, j.job_url, j.ingested_at, j.canonical_key,
+               COALESCE(jr.retry_count, 0) AS retry_count
+        FROM public.jobs j
+        LEFT JOIN public.job_reviews jr ON jr.job_id = j.id
+        WHERE j.status = 'pending_review'
+        ORDER BY j.ingested_at ASC
         LIMIT 100
         """
         
@@ -100,8 +102,11 @@ class PollerService:
                 site=job_data.get("site"),
             )
 
-            # Use the queue service's job review method with the job ID
-            task_id = self.queue_service.enqueue_job_review(job_id)
+            # Use the queue service's job review method; the attempt number keeps
+            # the RQ job id stable so racing enqueuers don't duplicate the review
+            task_id = self.queue_service.enqueue_job_review(
+                job_id, attempt=job_data.get("retry_count", 0)
+            )
 
             if task_id:
                 logger.info(f"Enqueued job {job_id} for review - task_id: {task_id}")
@@ -0,0 +1,187 @@
+"""
+Connection pool instrumentation for the asyncpg pools owned by DatabaseService.
+
+``InstrumentedPool`` wraps an ``asyncpg.Pool`` and records, per pool name:
+
+* how long ``acquire()`` waited for a connection (histogram in milliseconds),
+* how many connections are currently checked out,
+* how long each call site held its connection (a close proxy for query time,
+  since every DatabaseService method acquires around its statements).
+
+Call sites are taken from the caller of ``acquire()`` so existing
+``async with self.pool.acquire() as conn`` blocks are covered unchanged.
+"""
+import sys
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+ACQUIRE_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def call_site(depth: int = 1) -> str:
+    """``module.function`` of the frame ``depth`` levels above the caller."""
+    try:
+        frame = sys._getframe(depth + 1)
+    except ValueError:
+        return "unknown"
+    module = frame.f_globals.get("__name__", "unknown")
+    if module.startswith("app."):
+        module = module[4:]
+    return f"{module}.{frame.f_code.co_name}"
+
+
+class PoolTelemetry:
+    """Process-wide counters shared by every DatabaseService instance."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._pools: Dict[str, Dict[str, Any]] = {}
+        self._call_sites: Dict[str, Dict[str, Any]] = {}
+
+    def _pool(self, pool_name: str) -> Dict[str, Any]:
+        return self._pools.setdefault(pool_name, {
+            "instances": 0,
+            "max_size": 0,
+            "acquires": 0,
+            "acquire_failures": 0,
+            "wait_total_ms": 0.0,
+            "wait_max_ms": 0.0,
+            "wait_histogram": [0] * (len(ACQUIRE_WAIT_BUCKETS_MS) + 1),
+            "in_use": 0,
+            "in_use_peak": 0,
+        })
+
+    def pool_opened(self, pool_name: str, max_size: int) -> None:
+        with self._lock:
+            stats = self._pool(pool_name)
+            stats["instances"] += 1
+            stats["max_size"] = max_size
+
+    def pool_closed(self, pool_name: str) -> None:
+        with self._lock:
+            stats = self._pool(pool_name)
+            stats["instances"] = max(0, stats["instances"] - 1)
+
+    def acquired(self, pool_name: str, wait_seconds: float) -> None:
+        wait_ms = wait_seconds * 1000
+        bucket = next(
+            (i for i, bound in enumerate(ACQUIRE_WAIT_BUCKETS_MS) if wait_ms <= bound),
+            len(ACQUIRE_WAIT_BUCKETS_MS),
+        )
+        with self._lock:
+            stats = self._pool(pool_name)
+            stats["acquires"] += 1
+            stats["wait_total_ms"] += wait_ms
+            stats["wait_max_ms"] = max(stats["wait_max_ms"], wait_ms)
+            stats["wait_histogram"][bucket] += 1
+            stats["in_use"] += 1
+            stats["in_use_peak"] = max(stats["in_use_peak"], stats["in_use"])
+
+    def acquire_failed(self, pool_name: str) -> None:
+        with self._lock:
+            self._pool(pool_name)["acquire_failures"] += 1
+
+    def released(self, pool_name: str, site: str, held_seconds: float, failed: bool) -> None:
+        held_ms = held_seconds * 1000
+        with self._lock:
+            stats = self._pool(pool_name)
+            stats["in_use"] = max(0, stats["in_use"] - 1)
+            site_stats = self._call_sites.setdefault(site, {
+                "calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+            })
+            site_stats["calls"] += 1
+            site_stats["errors"] += int(failed)
+            site_stats["total_ms"] += held_ms
+            site_stats["max_ms"] = max(site_stats["max_ms"], held_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            pools = {}
+            for name, stats in self._pools.items():
+                labels = [f"<={bound}ms" for bound in ACQUIRE_WAIT_BUCKETS_MS] + [f">{ACQUIRE_WAIT_BUCKETS_MS[-1]}ms"]
+                pools[name] = {
+                    "instances": stats["instances"],
+                    "max_size": stats["max_size"],
+                    "in_use": stats["in_use"],
+                    "in_use_peak": stats["in_use_peak"],
+                    "acquires": stats["acquires"],
+                    "acquire_failures": stats["acquire_failures"],
+                    "wait_avg_ms": round(stats["wait_total_ms"] / stats["acquires"], 3) if stats["acquires"] else 0.0,
+                    "wait_max_ms": round(stats["wait_max_ms"], 3),
+                    "wait_histogram": dict(zip(labels, stats["wait_histogram"])),
+                }
+            call_sites = {
+                site: {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "avg_ms": round(stats["total_ms"] / stats["calls"], 3) if stats["calls"] else 0.0,
+                    "max_ms": round(stats["max_ms"], 3),
+                }
+                for site, stats in sorted(self._call_sites.items(), key=lambda item: -item[1]["total_ms"])
+            }
+            return {"pools": pools, "call_sites": call_sites}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pools.clear()
+            self._call_sites.clear()
+
+
+pool_telemetry = PoolTelemetry()
+
+
+class _InstrumentedAcquire:
+    """``async with pool.acquire()`` that reports wait and hold times."""
+
+    def __init__(self, pool: "InstrumentedPool", site: str, timeout: Optional[float]):
+        self._pool = pool
+        self._site = site
+        self._timeout = timeout
+        self._conn = None
+        self._acquired_at = 0.0
+
+    async def __aenter__(self):
+        started = time.perf_counter()
+        try:
+            self._conn = await self._pool.raw.acquire(timeout=self._timeout)
+        except Exception:
+            pool_telemetry.acquire_failed(self._pool.name)
+            raise
+        self._acquired_at = time.perf_counter()
+        pool_telemetry.acquired(self._pool.name, self._acquired_at - started)
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        held = time.perf_counter() - self._acquired_at
+        try:
+            await self._pool.raw.release(self._conn)
+        finally:
+            pool_telemetry.released(self._pool.name, self._site, held, exc_type is not None)
+        return False
+
+
+class InstrumentedPool:
+    """Thin ``asyncpg.Pool`` proxy; everything except ``acquire``/``close`` is delegated."""
+
+    def __init__(self, pool, name: str, max_size: int):
+        self.raw = pool
+        self.name = name
+        self.max_size = max_size
+        pool_telemetry.pool_opened(name, max_size)
+
+    def acquire(self, *, timeout: Optional[float] = None, site: Optional[str] = None) -> _InstrumentedAcquire:
+        return _InstrumentedAcquire(self, site or call_site(1), timeout)
+
+    async def close(self) -> None:
+        try:
+            await self.raw.close()
+        finally:
+            pool_telemetry.pool_closed(self.name)
+            logger.debug(f"Closed {self.name} database pool")
+
+    def __getattr__(self, item):
+        return getattr(self.raw, item)
@@ -0,0 +1,229 @@
+"""
+Progress events for scrape runs and job reviews.
+
+Workers append events to a capped Redis stream with ``publish_progress_event``.
+Each API process runs one ``ProgressEventHub`` that blocks on the stream and
+fans new entries out to its connected SSE clients, so any number of watchers
+costs a single Redis read loop. The loop runs only while someone is
+subscribed and reads from the stream's last entry as of its start, so nothing
+published after a subscribe returns is missed. Stream entry IDs double as SSE event IDs: a
+client reconnecting with ``Last-Event-ID`` is replayed what it missed from
+the stream before live delivery resumes.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import orjson
+import redis
+from loguru import logger
+
+from ...core.config import get_settings
+
+
+# Stream holding recent progress events; capped at settings.progress_events_max_length
+STREAM_KEY = "progress:events"
+
+# Event types
+SCRAPE_RUN_EVENT = "scrape_run"
+JOB_REVIEW_EVENT = "job_review"
+
+# Marker queued to a subscriber that fell behind; its stream ends so the client
+# reconnects and catches up from Last-Event-ID
+OVERFLOW = object()
+
+Event = Tuple[str, str, Dict[str, Any]]
+
+_publisher_redis: Optional[redis.Redis] = None
+
+
+def _redis_client(**options) -> redis.Redis:
+    settings = get_settings()
+    return redis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        **options,
+    )
+
+
+def publish_progress_event(event_type: str, data: Dict[str, Any],
+                           connection: Optional[redis.Redis] = None) -> Optional[str]:
+    """
+    Append an event to the progress stream; returns its ID, or None on failure.
+
+    Progress reporting is best effort: a Redis error is logged and never
+    interrupts the caller.
+    """
+    global _publisher_redis
+    if connection is None:
+        if _publisher_redis is None:
+            _publisher_redis = _redis_client(socket_timeout=1, socket_connect_timeout=1)
+        connection = _publisher_redis
+
+    try:
+        event_id = connection.xadd(
+            STREAM_KEY,
+            {"type": event_type, "data": orjson.dumps(data, default=str)},
+            maxlen=get_settings().progress_events_max_length,
+            approximate=True,
+        )
+        return event_id.decode("utf-8") if isinstance(event_id, bytes) else event_id
+    except Exception as e:
+        logger.warning(f"Failed to publish {event_type} progress event: {str(e)}")
+        return None
+
+
+def _decode_entry(entry_id, fields) -> Event:
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode("utf-8")
+    event_type = fields.get(b"type", b"").decode("utf-8")
+    return entry_id, event_type, orjson.loads(fields.get(b"data", b"{}"))
+
+
+def stream_id_key(event_id: str) -> Tuple[int, int]:
+    """Sortable form of a stream ID (``<ms>-<seq>``)."""
+    millis, _, sequence = event_id.partition("-")
+    return int(millis), int(sequence or 0)
+
+
+def event_matches(event: Event, types: Optional[Set[str]] = None,
+                  run_id: Optional[str] = None, job_id: Optional[str] = None) -> bool:
+    """Whether an event passes a subscriber's filters (unset filters match everything)."""
+    _, event_type, data = event
+    if types and event_type not in types:
+        return False
+    if run_id is not None and data.get("run_id") != run_id:
+        return False
+    if job_id is not None and data.get("job_id") != job_id:
+        return False
+    return True
+
+
+class ProgressEventHub:
+    """One blocking stream reader per process, fanned out to in-memory subscriber queues."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.redis_conn: Optional[redis.Redis] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        # Set once the reader has pinned the ID it reads after
+        self._ready: Optional[asyncio.Event] = None
+        self.stats = {"delivered": 0, "overflows": 0, "replayed": 0}
+
+    def _connection(self) -> redis.Redis:
+        if self.redis_conn is None:
+            # Reads block for up to progress_events_block_ms, so allow for that in the timeout
+            block_seconds = self.settings.progress_events_block_ms / 1000
+            self.redis_conn = _redis_client(socket_timeout=block_seconds + 5, socket_connect_timeout=2)
+        return self.redis_conn
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.settings.progress_events_subscriber_buffer)
+        self._subscribers.add(queue)
+        self.start()
+        if self._ready is not None:
+            await self._ready.wait()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            # Nobody is watching; the next subscriber starts a fresh reader
+            self._task.cancel()
+            self._task = None
+            self._ready = None
+
+    def dispatch(self, event: Event) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+                self.stats["delivered"] += 1
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                self.stats["overflows"] += 1
+                # Make room for the marker so the stream ends promptly
+                queue.get_nowait()
+                queue.put_nowait(OVERFLOW)
+
+    async def replay(self, after_id: str) -> List[Event]:
+        """Events recorded after ``after_id`` (oldest first), bounded by the stream cap."""
+        entries = await asyncio.to_thread(
+            self._connection().xrange, STREAM_KEY, f"({after_id}", "+",
+            self.settings.progress_events_max_length,
+        )
+        self.stats["replayed"] += len(entries)
+        return [_decode_entry(entry_id, fields) for entry_id, fields in entries]
+
+    def _stream_tail(self) -> str:
+        """ID of the newest entry in the stream ("0-0" when it is empty)."""
+        entries = self._connection().xrevrange(STREAM_KEY, "+", "-", count=1)
+        if not entries:
+            return "0-0"
+        entry_id = entries[0][0]
+        return entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id
+
+    async def _read_loop(self, ready: asyncio.Event) -> None:
+        # Start from a concrete ID rather than "$": entries added between a
+        # subscribe and the first XREAD would otherwise be skipped
+        last_id = None
+        while True:
+            if last_id is None:
+                try:
+                    last_id = await asyncio.to_thread(self._stream_tail)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Progress event stream lookup failed, retrying: {str(e)}")
+                    # Don't hold subscribers while Redis is unreachable
+                    ready.set()
+                    await asyncio.sleep(self.settings.progress_events_retry_seconds)
+                    continue
+                ready.set()
+
+            try:
+                response = await asyncio.to_thread(
+                    self._connection().xread, {STREAM_KEY: last_id},
+                    count=100, block=self.settings.progress_events_block_ms,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress event stream read failed, retrying: {str(e)}")
+                await asyncio.sleep(self.settings.progress_events_retry_seconds)
+                continue
+
+            for _stream, entries in response or []:
+                for entry_id, fields in entries:
+                    event = _decode_entry(entry_id, fields)
+                    last_id = event[0]
+                    self.dispatch(event)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._read_loop(self._ready))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._ready = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "subscribers": self.subscriber_count,
+            **self.stats,
+        }
+
+
+progress_event_hub = ProgressEventHub()
@@ -0,0 +1,119 @@
+"""
+Canonical SQL statement shapes for asyncpg's prepared-statement cache.
+
+asyncpg prepares and caches statements per connection keyed by their text, so
+SQL assembled from whichever filters happen to be set produces a new statement
+(and a new plan) for every combination. ``QueryBuilder`` instead always emits
+every optional filter, written as ``($n::type IS NULL OR <predicate>)``, and
+binds ``None`` for the ones that are unused; the statement text then depends
+only on structural choices such as sort column and direction.
+
+``statement_stats`` mirrors asyncpg's per-connection LRU to report how often a
+named statement ran on a connection that already had it prepared.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+
+class QueryBuilder:
+    """Collects positional parameters while rendering fixed-shape SQL fragments."""
+
+    def __init__(self, params: Optional[List[Any]] = None):
+        self.params: List[Any] = list(params or [])
+
+    def param(self, value: Any, cast: Optional[str] = None) -> str:
+        """Bind ``value`` and return its placeholder (``$n`` or ``$n::cast``)."""
+        self.params.append(value)
+        placeholder = f"${len(self.params)}"
+        return f"{placeholder}::{cast}" if cast else placeholder
+
+    def optional(self, predicate: str, value: Any, cast: str) -> str:
+        """
+        Filter that is a no-op when ``value`` is None.
+
+        ``predicate`` uses ``{}`` where the placeholder goes, e.g. ``"jd.site = {}"``.
+        The cast is required so Postgres can type the parameter in ``IS NULL``.
+        """
+        placeholder = self.param(value, cast)
+        return f"({placeholder} IS NULL OR {predicate.format(placeholder)})"
+
+    def assign_if_set(self, column: str, value: Any, cast: str) -> str:
+        """``SET`` item that keeps the current value when ``value`` is None."""
+        placeholder = self.param(value, cast)
+        return f"{column} = COALESCE({placeholder}, {column})"
+
+
+class StatementStats:
+    """Approximate asyncpg statement-cache hits per named statement."""
+
+    def __init__(self, cache_size: int = 100):
+        self.cache_size = cache_size
+        self._lock = Lock()
+        self._connections: Dict[Any, "OrderedDict[str, None]"] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, conn: Any, name: str, query: str) -> None:
+        """Note that ``query`` is about to run on ``conn`` under ``name``."""
+        try:
+            connection_key = conn.get_server_pid()
+        except Exception:
+            connection_key = id(conn)
+
+        with self._lock:
+            cache = self._connections.get(connection_key)
+            if cache is None:
+                cache = self._connections[connection_key] = OrderedDict()
+                self._forget_on_close(conn, connection_key)
+            hit = query in cache
+            if hit:
+                cache.move_to_end(query)
+            else:
+                cache[query] = None
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+
+            stats = self._stats.setdefault(name, {"executions": 0, "hits": 0, "shapes": set()})
+            stats["executions"] += 1
+            stats["hits"] += int(hit)
+            stats["shapes"].add(hash(query))
+
+    def _forget_on_close(self, conn: Any, connection_key: Any) -> None:
+        # Pools recycle idle connections; drop a closed connection's mirror with it
+        try:
+            conn.add_termination_listener(lambda _conn: self.forget(connection_key))
+        except Exception:
+            pass
+
+    def forget(self, connection_key: Any) -> None:
+        with self._lock:
+            self._connections.pop(connection_key, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            statements = {
+                name: {
+                    "executions": stats["executions"],
+                    "cache_hits": stats["hits"],
+                    "hit_rate": round(stats["hits"] / stats["executions"], 4) if stats["executions"] else 0.0,
+                    "distinct_shapes": len(stats["shapes"]),
+                }
+                for name, stats in self._stats.items()
+            }
+            executions = sum(s["executions"] for s in statements.values())
+            hits = sum(s["cache_hits"] for s in statements.values())
+            return {
+                "executions": executions,
+                "cache_hits": hits,
+                "hit_rate": round(hits / executions, 4) if executions else 0.0,
+                "connections_tracked": len(self._connections),
+                "statements": statements,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._connections.clear()
+            self._stats.clear()
+
+
+statement_stats = StatementStats()
@@ -1,16 +1,29 @@
 """
 Queue service for managing RQ job queuing and execution.
 """
+import math
+import time
 import uuid
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 import redis
 from rq import Queue, Worker, Connection
 from loguru import logger
 
 from ...core.config import get_settings
 from .database import get_database_service
-from .worker import scrape_jobs_worker, process_job_review, run_linkedin_job_search
+from .worker import (
+    scrape_jobs_worker, process_job_review, process_job_review_batch, run_linkedin_job_search, run_analysis_task
+)
+from .analysis_jobs import analysis_task_id, get_cached_result, register_webhook
+from . import locks
+from . import dead_letter
+from .dead_letter import review_rq_job_id, review_job_failed
+
+
+# Statuses in which an RQ job still counts as pending work for enqueue-if-absent
+ACTIVE_JOB_STATUSES = {"queued", "started", "deferred", "scheduled"}
+ENQUEUE_CLAIM_SECONDS = 30
 
 
 class QueueService:
@@ -21,6 +34,7 @@ class QueueService:
         self.redis_conn: Optional[redis.Redis] = None
         self.queue: Optional[Queue] = None  # Main scraping queue
         self.review_queue: Optional[Queue] = None  # Job review queue
+        self.analysis_queue: Optional[Queue] = None  # Submit-and-poll LLM analysis
         self.initialized = False
 
     async def initialize(self) -> bool:
@@ -48,6 +62,12 @@ class QueueService:
                 default_timeout=self.settings.rq_job_timeout
             )
             
+            self.analysis_queue = Queue(
+                name=self.settings.analysis_queue_name,
+                connection=self.redis_conn,
+                default_timeout=self.settings.rq_job_timeout
+            )
+            
             self.initialized = True
             logger.info(f"Queue service initialized - Scraping queue: {self.settings.rq_queue_name}, Review queue: {self.settings.job_review_queue_name}")
             return True
@@ -60,7 +80,8 @@ class QueueService:
                            payload: Dict[str, Any],
                            site_schedule_id: Optional[str] = None,
                            trigger: str = "manual",
-                           run_id: Optional[str] = None) -> Optional[Dict[str, str]]:
+                           run_id: Optional[str] = None,
+                           site_lock: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
         """
         Enqueue a job scraping task.
         
@@ -69,6 +90,8 @@ class QueueService:
             site_schedule_id: Site schedule ID for scheduled jobs
             trigger: 'manual' or 'schedule'  
             run_id: Optional custom run ID
+            site_lock: Optional {"key", "value"} of a site lock the worker should
+                keep alive with a heartbeat and release when it finishes
             
         Returns:
             Dictionary with task_id and run_id, or None if failed
@@ -93,22 +116,24 @@ class QueueService:
                 pass
             
             # Enqueue the job
-            job = self.queue.enqueue(
+            task_id = self._enqueue_if_absent(
+                self.queue,
                 scrape_jobs_worker,
+                run_id,  # Use run_id as job_id for consistency
                 site_schedule_id=site_schedule_id,
                 payload=payload,
                 run_id=run_id,
                 min_pause=min_pause,
                 max_pause=max_pause,
                 max_retries=max_retries,
-                job_id=run_id,  # Use run_id as job_id for consistency
+                site_lock=site_lock,
                 result_ttl=self.settings.rq_result_ttl
             )
             
-            logger.info(f"Enqueued job - run_id: {run_id}, task_id: {job.id}, trigger: {trigger}")
+            logger.info(f"Enqueued job - run_id: {run_id}, task_id: {task_id}, trigger: {trigger}")
             
             return {
-                "task_id": job.id,
+                "task_id": task_id,
                 "run_id": run_id
             }
             
@@ -116,13 +141,45 @@ class QueueService:
             logger.error(f"Failed to enqueue scraping job: {str(e)}")
             return None
 
-    def enqueue_job_review(self, job_id: str, max_retries: int = 3) -> Optional[str]:
+    def _enqueue_if_absent(self, queue: Queue, func, rq_job_id: str, *args, **kwargs) -> str:
+        """
+        Enqueue ``func`` under a deterministic RQ job id unless that job is still pending.
+
+        A short Redis claim serializes concurrent callers for the same id; the
+        winner checks the existing job's status, so a job that is already
+        queued or running is never enqueued twice. Finished or failed jobs with
+        the same id are replaced.
+
+        Returns:
+            The RQ job id (new or already pending)
+        """
+        claim_key = f"enqueue_claim:{rq_job_id}"
+        if not self.redis_conn.set(claim_key, "1", nx=True, ex=ENQUEUE_CLAIM_SECONDS):
+            logger.info(f"Job {rq_job_id} is being enqueued by another caller, skipping duplicate")
+            return rq_job_id
+
+        try:
+            existing = queue.fetch_job(rq_job_id)
+            if existing is not None and existing.get_status() in ACTIVE_JOB_STATUSES:
+                logger.info(f"Job {rq_job_id} already {existing.get_status()}, skipping duplicate enqueue")
+                return rq_job_id
+
+            job = queue.enqueue(func, *args, job_id=rq_job_id, **kwargs)
+            return job.id
+        finally:
+            self.redis_conn.delete(claim_key)
+
+    def enqueue_job_review(self, job_id: str, max_retries: int = 3, attempt: int = 0) -> Optional[str]:
         """
         Enqueue a job for review processing.
+
+        The RQ job id is derived from (job_id, attempt), so the poller, the API
+        and requeues racing on the same job produce a single review.
         
         Args:
             job_id: UUID of the job to review
             max_retries: Maximum number of retry attempts
+            attempt: Review attempt number (the job's current retry_count)
             
         Returns:
             Task ID if successful, None if failed
@@ -132,28 +189,35 @@ class QueueService:
             return None
             
         try:
-            job = self.review_queue.enqueue(
+            task_id = self._enqueue_if_absent(
+                self.review_queue,
                 process_job_review,
+                review_rq_job_id(job_id, attempt),
                 job_id,
                 max_retries,
                 job_timeout=self.settings.rq_job_timeout,
-                result_ttl=self.settings.rq_result_ttl
+                result_ttl=self.settings.rq_result_ttl,
+                on_failure=review_job_failed
             )
             
-            logger.info(f"Enqueued job review - job_id: {job_id}, task_id: {job.id}")
-            return job.id
+            logger.info(f"Enqueued job review - job_id: {job_id}, task_id: {task_id}")
+            return task_id
             
         except Exception as e:
             logger.error(f"Failed to enqueue job review for {job_id}: {str(e)}")
             return None
 
-    def enqueue_multiple_job_reviews(self, job_ids: List[str], max_retries: int = 3) -> Dict[str, Optional[str]]:
+    def enqueue_multiple_job_reviews(self,
+                                     job_ids: List[str],
+                                     max_retries: int = 3,
+                                     attempts: Optional[Dict[str, int]] = None) -> Dict[str, Optional[str]]:
         """
         Enqueue multiple jobs for review processing.
         
         Args:
             job_ids: List of job UUIDs to review
             max_retries: Maximum number of retry attempts per job
+            attempts: Optional mapping of job_id to its current attempt number
             
         Returns:
             Dictionary mapping job_id to task_id (or None if failed)
@@ -162,15 +226,182 @@ class QueueService:
             logger.error("Queue service not initialized")
             return {}
         
+        attempts = attempts or {}
         results = {}
         for job_id in job_ids:
-            task_id = self.enqueue_job_review(job_id, max_retries)
+            task_id = self.enqueue_job_review(job_id, max_retries, attempts.get(job_id, 0))
             results[job_id] = task_id
             
         successful = sum(1 for task_id in results.values() if task_id is not None)
         logger.info(f"Enqueued {successful}/{len(job_ids)} job reviews successfully")
         return results
 
+    def enqueue_job_review_batch(self, batch_size: Optional[int] = None, max_retries: int = 3) -> Optional[str]:
+        """
+        Enqueue a batch review task that claims pending jobs itself when it runs.
+
+        Concurrent batch tasks claim disjoint jobs, so enqueueing more than
+        needed only produces empty batches.
+
+        Args:
+            batch_size: Jobs per batch (defaults to settings.job_review_batch_size)
+            max_retries: Maximum number of retry attempts per job
+
+        Returns:
+            Task ID if successful, None if failed
+        """
+        if not self.initialized:
+            logger.error("Queue service not initialized")
+            return None
+
+        batch_size = batch_size or self.settings.job_review_batch_size
+        # Evaluations run batch_concurrency at a time, so allow one job timeout per wave
+        waves = math.ceil(batch_size / max(1, self.settings.job_review_batch_concurrency))
+
+        try:
+            job = self.review_queue.enqueue(
+                process_job_review_batch,
+                batch_size,
+                max_retries,
+                job_id=f"review-batch-{uuid.uuid4().hex[:8]}",
+                job_timeout=self.settings.rq_job_timeout * waves,
+                result_ttl=self.settings.rq_result_ttl
+            )
+
+            logger.info(f"Enqueued job review batch - batch_size: {batch_size}, task_id: {job.id}")
+            return job.id
+
+        except Exception as e:
+            logger.error(f"Failed to enqueue job review batch: {str(e)}")
+            return None
+
+    def enqueue_analysis(self, kind: str, payload: Dict[str, Any],
+                         webhook_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Submit an analysis to run on a worker, or answer it from the result cache.
+
+        The task id is a hash of ``kind`` and ``payload``: a cached result is
+        returned immediately, and an identical submission that is still queued
+        or running is joined rather than enqueued again.
+
+        Args:
+            kind: Analysis kind ("parse" or "analyze")
+            payload: Analysis input
+            webhook_url: Optional callback (already validated) notified on completion
+
+        Returns:
+            Dictionary with task_id, status and cached flag (plus result when
+            cached), or None if enqueueing failed
+        """
+        if not self.initialized:
+            logger.error("Queue service not initialized")
+            return None
+
+        task_id = analysis_task_id(kind, payload)
+        cached = get_cached_result(self.redis_conn, task_id)
+        if cached is not None:
+            logger.info(f"Analysis {task_id} answered from result cache")
+            return {"task_id": task_id, "status": "finished", "cached": True, "result": cached}
+
+        try:
+            if webhook_url:
+                register_webhook(self.redis_conn, task_id, webhook_url)
+            self._enqueue_if_absent(
+                self.analysis_queue,
+                run_analysis_task,
+                task_id,
+                kind,
+                payload,
+                job_timeout=self.settings.rq_job_timeout,
+                result_ttl=self.settings.rq_result_ttl
+            )
+            logger.info(f"Enqueued {kind} analysis - task_id: {task_id}")
+            return {"task_id": task_id, "status": "queued", "cached": False}
+        except Exception as e:
+            logger.error(f"Failed to enqueue {kind} analysis: {str(e)}")
+            return None
+
+    def get_analysis_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Status of an analysis task, falling back to the result cache once the
+        RQ job has expired. Returns None for unknown task ids.
+        """
+        if not self.initialized or not task_id.startswith("analysis-"):
+            return None
+
+        job = self.analysis_queue.fetch_job(task_id)
+        if job is None:
+            cached = get_cached_result(self.redis_conn, task_id)
+            if cached is None:
+                return None
+            return {"task_id": task_id, "status": "finished", "cached": True, "result": cached}
+
+        status = job.get_status()
+        info = {
+            "task_id": task_id,
+            "status": status,
+            "cached": False,
+            "enqueued_at": job.enqueued_at.isoformat() if job.enqueued_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "ended_at": job.ended_at.isoformat() if job.ended_at else None,
+        }
+        if job.is_finished:
+            info["result"] = job.result
+        elif job.is_failed:
+            exc_info = job.exc_info or ""
+            info["error"] = exc_info.strip().splitlines()[-1] if exc_info.strip() else "Analysis failed"
+        return info
+
+    def get_dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """List job reviews in the dead-letter queue, most recent first."""
+        if not self.initialized:
+            return []
+
+        try:
+            return dead_letter.list_dead_letters(self.redis_conn, limit)
+        except Exception as e:
+            logger.error(f"Failed to read dead-letter queue: {str(e)}")
+            return []
+
+    def get_dead_letter(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the dead-letter entry for a job, if any."""
+        if not self.initialized:
+            return None
+
+        try:
+            return dead_letter.get_dead_letter(self.redis_conn, job_id)
+        except Exception as e:
+            logger.error(f"Failed to read dead-letter entry for {job_id}: {str(e)}")
+            return None
+
+    def replay_dead_letter(self, job_id: str, max_retries: Optional[int] = None) -> Optional[str]:
+        """
+        Re-enqueue a dead-lettered review as a fresh first attempt.
+
+        Callers must reset the job's stored retry count first, otherwise the
+        worker will immediately dead-letter it again.
+
+        Returns:
+            The new task id, or None if the job is not in the dead-letter queue
+        """
+        if not self.initialized:
+            return None
+
+        try:
+            entry = self.get_dead_letter(job_id)
+            if not entry:
+                return None
+
+            retries = max_retries or entry.get("max_retries") or 3
+            task_id = self.enqueue_job_review(job_id, retries, attempt=0)
+            if task_id:
+                dead_letter.remove_dead_letter(self.redis_conn, job_id)
+                logger.info(f"Replayed dead-lettered review for {job_id} - task_id: {task_id}")
+            return task_id
+        except Exception as e:
+            logger.error(f"Failed to replay dead-lettered review for {job_id}: {str(e)}")
+            return None
+
     def enqueue_linkedin_job_search(self, 
                                    payload: Dict[str, Any],
                                    site_schedule_id: Optional[str] = None,
@@ -206,20 +437,21 @@ class QueueService:
                 pass
             
             # Enqueue the LinkedIn job search
-            job = self.queue.enqueue(
+            task_id = self._enqueue_if_absent(
+                self.queue,
                 run_linkedin_job_search,
+                run_id,  # Use run_id as job_id for consistency
                 site_schedule_id=site_schedule_id,
                 payload=payload,
                 run_id=run_id,
                 max_retries=max_retries,
-                job_id=run_id,  # Use run_id as job_id for consistency
                 result_ttl=self.settings.rq_result_ttl
             )
             
-            logger.info(f"Enqueued LinkedIn job search - run_id: {run_id}, task_id: {job.id}, trigger: {trigger}")
+            logger.info(f"Enqueued LinkedIn job search - run_id: {run_id}, task_id: {task_id}, trigger: {trigger}")
             
             return {
-                "task_id": job.id,
+                "task_id": task_id,
                 "run_id": run_id
             }
             
@@ -249,6 +481,45 @@ class QueueService:
             logger.error(f"Failed to get job status for {task_id}: {str(e)}")
             return None
 
+    def _queue_stats(self, queue: Queue) -> Dict[str, Any]:
+        """Collect depth, registry counts, worker count and recent throughput for a queue."""
+        return {
+            "name": queue.name,
+            "length": len(queue),
+            "started_jobs": queue.started_job_registry.count,
+            "finished_jobs": queue.finished_job_registry.count,
+            "failed_jobs": queue.failed_job_registry.count,
+            "deferred_jobs": queue.deferred_job_registry.count,
+            "workers": Worker.count(connection=self.redis_conn, queue=queue),
+            "finished_per_hour": self._finished_per_hour(queue),
+        }
+
+    def _review_queue_stats(self) -> Dict[str, Any]:
+        stats = self._queue_stats(self.review_queue)
+        stats["dead_letter_count"] = dead_letter.dead_letter_count(self.redis_conn)
+        return stats
+
+    def _finished_per_hour(self, queue: Queue) -> float:
+        """
+        Estimate jobs finished per hour from the finished registry.
+
+        RQ scores finished jobs by expiry (finish time + result TTL), and every
+        enqueue here uses ``rq_result_ttl``, so jobs that finished within the
+        window sit in the top ``window`` seconds of the score range.
+        """
+        result_ttl = self.settings.rq_result_ttl
+        if result_ttl <= 0:
+            return 0.0
+
+        window = min(3600, result_ttl)
+        now = time.time()
+        finished = self.redis_conn.zcount(
+            queue.finished_job_registry.key,
+            now + result_ttl - window,
+            "+inf"
+        )
+        return finished * 3600 / window
+
     def get_queue_info(self, queue_name: Optional[str] = None) -> Dict[str, Any]:
         """Get information about the queue(s)."""
         if not self.initialized:
@@ -257,43 +528,15 @@ class QueueService:
         try:
             if queue_name == "review" or queue_name == self.settings.job_review_queue_name:
                 # Return review queue info
-                return {
-                    "name": self.review_queue.name,
-                    "length": len(self.review_queue),
-                    "started_jobs": self.review_queue.started_job_registry.count,
-                    "finished_jobs": self.review_queue.finished_job_registry.count,
-                    "failed_jobs": self.review_queue.failed_job_registry.count,
-                    "deferred_jobs": self.review_queue.deferred_job_registry.count
-                }
+                return self._review_queue_stats()
             elif queue_name == "scraping" or queue_name == self.settings.rq_queue_name:
                 # Return scraping queue info
-                return {
-                    "name": self.queue.name,
-                    "length": len(self.queue),
-                    "started_jobs": self.queue.started_job_registry.count,
-                    "finished_jobs": self.queue.finished_job_registry.count,
-                    "failed_jobs": self.queue.failed_job_registry.count,
-                    "deferred_jobs": self.queue.deferred_job_registry.count
-                }
+                return self._queue_stats(self.queue)
             else:
                 # Return info for both queues
                 return {
-                    "scraping_queue": {
-                        "name": self.queue.name,
-                        "length": len(self.queue),
-                        "started_jobs": self.queue.started_job_registry.count,
-                        "finished_jobs": self.queue.finished_job_registry.count,
-                        "failed_jobs": self.queue.failed_job_registry.count,
-                        "deferred_jobs": self.queue.deferred_job_registry.count
-                    },
-                    "review_queue": {
-                        "name": self.review_queue.name,
-                        "length": len(self.review_queue),
-                        "started_jobs": self.review_queue.started_job_registry.count,
-                        "finished_jobs": self.review_queue.finished_job_registry.count,
-                        "failed_jobs": self.review_queue.failed_job_registry.count,
-                        "deferred_jobs": self.review_queue.deferred_job_registry.count
-                    }
+                    "scraping_queue": self._queue_stats(self.queue),
+                    "review_queue": self._review_queue_stats()
                 }
         except Exception as e:
             logger.error(f"Failed to get queue info: {str(e)}")
@@ -316,9 +559,8 @@ class QueueService:
             return False
 
         try:
-            # Use SET with NX (only if not exists) and EX (expiry)
-            result = self.redis_conn.set(key, value, nx=True, ex=timeout)
-            return result is True
+            # SET NX EX and record the lock in the registry atomically
+            return locks.acquire_lock(self.redis_conn, key, value, timeout)
         except Exception as e:
             logger.error(f"Failed to acquire Redis lock for {key}: {str(e)}")
             return False
@@ -371,7 +613,8 @@ class QueueService:
                 payload=payload,
                 site_schedule_id=site_schedule_id,
                 trigger=trigger,
-                run_id=run_id
+                run_id=run_id,
+                site_lock={"key": lock_key, "value": lock_value}
             )
 
             if not job_info:
@@ -418,28 +661,153 @@ class QueueService:
             return False
 
         try:
-            # Lua script to atomically check and delete
-            lua_script = """
-            if redis.call("GET", KEYS[1]) == ARGV[1] then
-                return redis.call("DEL", KEYS[1])
-            else
-                return 0
-            end
-            """
-            result = self.redis_conn.eval(lua_script, 1, key, value)
-            return result == 1
+            # Atomically check ownership, delete and unregister
+            return locks.release_lock(self.redis_conn, key, value)
         except Exception as e:
             logger.error(f"Failed to release Redis lock for {key}: {str(e)}")
             return False
 
+    def extend_redis_lock(self, key: str, value: str, timeout: int = 300) -> bool:
+        """Reset the expiry of a Redis lock if we still own it."""
+        if not self.initialized:
+            return False
+
+        try:
+            return locks.extend_lock(self.redis_conn, key, value, timeout)
+        except Exception as e:
+            logger.error(f"Failed to extend Redis lock for {key}: {str(e)}")
+            return False
+
+    def publish_schedule_change(self, schedule_id: Optional[str] = None) -> bool:
+        """Notify the scheduler leader that site schedules were created, updated or deleted."""
+        if not self.initialized:
+            return False
+
+        try:
+            self.redis_conn.publish(self.settings.scheduler_channel, schedule_id or "*")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to publish schedule change: {str(e)}")
+            return False
+
+    def subscribe_schedule_changes(self):
+        """Return a pub/sub handle subscribed to schedule change notifications."""
+        if not self.initialized:
+            return None
+
+        try:
+            pubsub = self.redis_conn.pubsub()
+            pubsub.subscribe(self.settings.scheduler_channel)
+            return pubsub
+        except Exception as e:
+            logger.error(f"Failed to subscribe to schedule changes: {str(e)}")
+            return None
+
+    def list_locks(self, pattern: str = "*", scan_legacy: bool = False) -> List[Dict[str, Any]]:
+        """
+        List active locks from the lock registry.
+
+        Args:
+            pattern: Glob pattern for lock keys
+            scan_legacy: Also SCAN the keyspace for locks created before the registry
+
+        Returns:
+            List of lock descriptions with key, value, ttl and registry status
+        """
+        if not self.initialized:
+            return []
+
+        try:
+            locks.prune_expired_locks(self.redis_conn)
+            keys = [key for key, _ in locks.registered_locks(self.redis_conn, pattern)]
+            registered = set(keys)
+            if scan_legacy:
+                keys.extend(key for key in locks.scan_lock_keys(self.redis_conn, pattern) if key not in registered)
+
+            result = []
+            for key in keys:
+                value = self.redis_conn.get(key)
+                if value is None:
+                    continue
+                result.append({
+                    "key": key,
+                    "value": value.decode("utf-8"),
+                    "ttl": self.redis_conn.ttl(key),
+                    "registered": key in registered
+                })
+            return result
+        except Exception as e:
+            logger.error(f"Failed to list locks for pattern {pattern}: {str(e)}")
+            return []
+
+    def _check_lock(self, lock_key: str, max_age_hours: int) -> Dict[str, Any]:
+        """Decide whether a single lock is orphaned, clearing it if so."""
+        from rq.job import Job
+
+        lock_value = self.redis_conn.get(lock_key)
+        if not lock_value:
+            # Lock already expired or has no value - drop it and its registry entry
+            self.redis_conn.delete(lock_key)
+            locks.unregister_lock(self.redis_conn, lock_key)
+            return {"action": "cleared", "key": lock_key, "reason": "empty_value"}
+
+        lock_value_str = lock_value.decode('utf-8')
+        logger.debug(f"Checking lock {lock_key} with value {lock_value_str}")
+
+        # Parse lock value format: "run_id:timestamp"
+        if ":" not in lock_value_str:
+            logger.warning(f"Invalid lock value format for {lock_key}: {lock_value_str}")
+            return {"action": "ignored", "key": lock_key}
 
-    def clear_orphaned_locks(self, pattern: str = "scrape_lock:*", max_age_hours: int = 24) -> Dict[str, Any]:
+        run_id, timestamp_str = lock_value_str.split(":", 1)
+
+        # Check if it's an old lock (older than max_age_hours)
+        try:
+            lock_time = datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
+            age_hours = (datetime.now(timezone.utc) - lock_time).total_seconds() / 3600
+
+            if age_hours > max_age_hours:
+                logger.info(f"Clearing old lock {lock_key} (age: {age_hours:.1f} hours)")
+                self._delete_lock(lock_key)
+                return {"action": "cleared", "key": lock_key, "reason": f"too_old_{age_hours:.1f}h", "run_id": run_id}
+        except (ValueError, AttributeError):
+            logger.warning(f"Could not parse timestamp for lock {lock_key}: {timestamp_str}")
+            # Continue with job checking...
+
+        # Check if there's an active job for this run_id
+        try:
+            job = Job.fetch(run_id, connection=self.redis_conn)
+            if job and (job.is_started or job.is_queued):
+                logger.debug(f"Skipping lock {lock_key} - active job {run_id}")
+                return {"action": "skipped", "key": lock_key, "reason": "active_job", "run_id": run_id}
+        except Exception:
+            # Job doesn't exist or fetch failed - lock is orphaned
+            pass
+
+        # Lock has no active job - orphan
+        logger.info(f"Clearing orphaned lock {lock_key} (run_id: {run_id})")
+        self._delete_lock(lock_key)
+        return {"action": "cleared", "key": lock_key, "reason": "orphaned", "run_id": run_id}
+
+    def _delete_lock(self, lock_key: str) -> None:
+        self.redis_conn.delete(lock_key)
+        locks.unregister_lock(self.redis_conn, lock_key)
+
+    def clear_orphaned_locks(self,
+                             pattern: str = "scrape_lock:*",
+                             max_age_hours: int = 24,
+                             scan_legacy: bool = False) -> Dict[str, Any]:
         """
         Clear orphaned Redis locks that don't have corresponding active jobs.
 
+        Candidates come from the lock registry, so the check is proportional to
+        the number of active locks. Locks written before the registry existed
+        are only found when ``scan_legacy`` is set, via a cursor-based SCAN.
+
         Args:
             pattern: Redis key pattern for locks to check (default: scrape locks)
             max_age_hours: Maximum age for locks to consider (older = orphaned)
+            scan_legacy: Also SCAN the keyspace for unregistered locks
 
         Returns:
             Dictionary with cleanup results
@@ -449,71 +817,28 @@ class QueueService:
             return {"error": "Queue service not initialized"}
 
         try:
-            import time
-            from rq.job import Job
-
             cleared = []
             skipped = []
             errors = []
-            current_time = time.time()
-
-            # Get all keys matching the pattern
-            lock_keys = self.redis_conn.keys(pattern)
-            logger.info(f"Found {len(lock_keys)} lock keys matching pattern '{pattern}'")
-
-            for lock_key_bytes in lock_keys:
-                lock_key = lock_key_bytes.decode('utf-8')
 
+            expired = locks.prune_expired_locks(self.redis_conn)
+            lock_keys = [key for key, _ in locks.registered_locks(self.redis_conn, pattern)]
+            legacy_count = 0
+            if scan_legacy:
+                registered = set(lock_keys)
+                legacy_keys = [key for key in locks.scan_lock_keys(self.redis_conn, pattern) if key not in registered]
+                legacy_count = len(legacy_keys)
+                lock_keys.extend(legacy_keys)
+            logger.info(f"Found {len(lock_keys)} lock keys matching pattern '{pattern}' ({legacy_count} legacy)")
+
+            for lock_key in lock_keys:
                 try:
-                    lock_value = self.redis_conn.get(lock_key)
-                    if not lock_value:
-                        # Key exists but no value - should be cleared
-                        self.redis_conn.delete(lock_key)
-                        cleared.append({"key": lock_key, "reason": "empty_value"})
-                        continue
-
-                    lock_value_str = lock_value.decode('utf-8')
-                    logger.debug(f"Checking lock {lock_key} with value {lock_value_str}")
-
-                    # Parse lock value format: "run_id:timestamp"
-                    if ":" not in lock_value_str:
-                        logger.warning(f"Invalid lock value format for {lock_key}: {lock_value_str}")
-                        continue
-
-                    run_id, timestamp_str = lock_value_str.split(":", 1)
-
-                    # Check if it's an old lock (older than max_age_hours)
-                    try:
-                        import datetime
-                        from datetime import timezone
-                        lock_time = datetime.datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
-                        age_hours = (datetime.datetime.now(timezone.utc) - lock_time).total_seconds() / 3600
-
-                        if age_hours > max_age_hours:
-                            logger.info(f"Clearing old lock {lock_key} (age: {age_hours:.1f} hours)")
-                            self.redis_conn.delete(lock_key)
-                            cleared.append({"key": lock_key, "reason": f"too_old_{age_hours:.1f}h", "run_id": run_id})
-                            continue
-                    except (ValueError, AttributeError) as e:
-                        logger.warning(f"Could not parse timestamp for lock {lock_key}: {timestamp_str}")
-                        # Continue with job checking...
-
-                    # Check if there's an active job for this run_id
-                    try:
-                        job = Job.fetch(run_id, connection=self.redis_conn)
-                        if job and (job.is_started or job.is_queued):
-                            skipped.append({"key": lock_key, "reason": "active_job", "run_id": run_id})
-                            logger.debug(f"Skipping lock {lock_key} - active job {run_id}")
-                            continue
-                    except Exception:
-                        # Job doesn't exist or fetch failed - lock is orphaned
-                        pass
-
-                    # Lock has no active job - orphan
-                    logger.info(f"Clearing orphaned lock {lock_key} (run_id: {run_id})")
-                    self.redis_conn.delete(lock_key)
-                    cleared.append({"key": lock_key, "reason": "orphaned", "run_id": run_id})
-
+                    outcome = self._check_lock(lock_key, max_age_hours)
+                    action = outcome.pop("action")
+                    if action == "cleared":
+                        cleared.append(outcome)
+                    elif action == "skipped":
+                        skipped.append(outcome)
                 except Exception as e:
                     error_msg = f"Error processing lock {lock_key}: {str(e)}"
                     logger.error(error_msg)
@@ -523,6 +848,8 @@ class QueueService:
                 "pattern_checked": pattern,
                 "locks_cleared": len(cleared),
                 "locks_skipped": len(skipped),
+                "expired_registry_entries": expired,
+                "legacy_locks_scanned": legacy_count,
                 "errors_count": len(errors),
                 "cleared_details": cleared,
                 "skipped_details": skipped[:10],  # Limit for readability
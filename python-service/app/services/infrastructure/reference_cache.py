@@ -0,0 +1,196 @@
+"""
+Process-wide cache for small, hot, rarely changing reference data.
+
+Entries live in named namespaces (``companies``, ``site_schedules``,
+``statuses``, ``columns``) and expire after a TTL. Writers in this process
+invalidate the namespace directly. Writes from other processes arrive through
+Postgres ``NOTIFY``: the ``reference_cache_notify`` migration adds statement
+triggers that publish the table name on the invalidation channel, and
+``ReferenceCacheListener`` drops the matching namespace. Processes that do not
+run a listener (RQ workers, daemons) fall back to the TTL.
+"""
+import asyncio
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import asyncpg
+from loguru import logger
+
+from ...core.config import get_settings
+
+
+# Channel the reference_cache_notify triggers publish on
+INVALIDATION_CHANNEL = "reference_cache_invalidate"
+
+# How often the idle listener connection is checked
+LISTENER_PING_SECONDS = 30
+
+# Returned by get() on a miss so None can still be cached as a value
+MISSING = object()
+
+# Table name in a NOTIFY payload -> namespace it invalidates
+TABLE_NAMESPACES = {
+    "companies": "companies",
+    "site_schedules": "site_schedules",
+    "statuses": "statuses",
+}
+
+
+class ReferenceCache:
+    """TTL cache with per-namespace invalidation and hit-rate counters."""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 1000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: Dict[str, Dict[Hashable, Tuple[Any, float]]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.listening = False
+
+    def _namespace_stats(self, namespace: str) -> Dict[str, int]:
+        return self._stats.setdefault(namespace, {
+            "hits": 0, "misses": 0, "expired": 0, "invalidations": 0, "evictions": 0,
+        })
+
+    def get(self, namespace: str, key: Hashable) -> Any:
+        """Cached value, or ``MISSING`` when absent or expired."""
+        now = self._clock()
+        with self._lock:
+            stats = self._namespace_stats(namespace)
+            entry = self._entries.get(namespace, {}).get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    stats["hits"] += 1
+                    return value
+                del self._entries[namespace][key]
+                stats["expired"] += 1
+            stats["misses"] += 1
+            return MISSING
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            entries = self._entries.setdefault(namespace, {})
+            if key not in entries and len(entries) >= self.max_entries:
+                # Dicts keep insertion order, so this drops the oldest entry
+                entries.pop(next(iter(entries)))
+                self._namespace_stats(namespace)["evictions"] += 1
+            entries[key] = (value, self._clock() + ttl)
+
+    def invalidate(self, namespace: str, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or the whole namespace when ``key`` is None."""
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries is None:
+                return
+            if key is None:
+                entries.clear()
+            else:
+                entries.pop(key, None)
+            self._namespace_stats(namespace)["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for namespace, entries in self._entries.items():
+                if entries:
+                    entries.clear()
+                    self._namespace_stats(namespace)["invalidations"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {}
+            for namespace, stats in self._stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                namespaces[namespace] = {
+                    **stats,
+                    "entries": len(self._entries.get(namespace, {})),
+                    "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+                }
+            hits = sum(s["hits"] for s in self._stats.values())
+            lookups = hits + sum(s["misses"] for s in self._stats.values())
+            return {
+                "listening": self.listening,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "namespaces": namespaces,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+_settings = get_settings()
+reference_cache = ReferenceCache(
+    ttl_seconds=_settings.reference_cache_ttl_seconds,
+    max_entries=_settings.reference_cache_max_entries,
+)
+
+
+class ReferenceCacheListener:
+    """Keeps a dedicated connection LISTENing for invalidations, reconnecting on loss."""
+
+    def __init__(self, cache: ReferenceCache = reference_cache):
+        self.cache = cache
+        self.settings = get_settings()
+        self._task: Optional[asyncio.Task] = None
+
+    def handle_notification(self, payload: str) -> None:
+        namespace = TABLE_NAMESPACES.get(payload)
+        if namespace is None:
+            logger.debug(f"Ignoring reference cache notification for {payload!r}")
+            return
+        self.cache.invalidate(namespace)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.handle_notification(payload)
+
+    async def _listen_once(self) -> None:
+        conn = await asyncpg.connect(self.settings.database_url, timeout=10)
+        closed = asyncio.Event()
+        try:
+            conn.add_termination_listener(lambda _conn: closed.set())
+            await conn.add_listener(INVALIDATION_CHANNEL, self._on_notify)
+            # Changes made while nobody was listening would otherwise survive until TTL
+            self.cache.clear()
+            self.cache.listening = True
+            logger.info(f"Listening for reference cache invalidations on {INVALIDATION_CHANNEL}")
+            while not closed.is_set():
+                try:
+                    await asyncio.wait_for(closed.wait(), timeout=LISTENER_PING_SECONDS)
+                except asyncio.TimeoutError:
+                    # A silently dropped connection would otherwise never report closing
+                    await conn.fetchval("SELECT 1", timeout=10)
+        finally:
+            self.cache.listening = False
+            if not conn.is_closed():
+                await conn.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+                logger.warning("Reference cache listener connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Reference cache listener unavailable, relying on TTL: {str(e)}")
+            await asyncio.sleep(self.settings.reference_cache_reconnect_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
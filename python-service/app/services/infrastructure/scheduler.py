@@ -1,25 +1,48 @@
 """
 Scheduler service for managing periodic job scraping tasks.
 """
+import asyncio
+import heapq
 import uuid
 import random
 import json
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from loguru import logger
 
+from ...core.config import get_settings
 from .database import get_database_service
 from .queue import get_queue_service
+from .reference_cache import reference_cache
+
+
+SCHEDULER_LEADER_KEY = "scheduler:leader"
+
+# Smallest fraction of results_wanted a thinned run still requests
+MIN_THIN_SCALE = 0.25
+# Matches the scraper's default when a payload omits results_wanted
+DEFAULT_RESULTS_WANTED = 15
 
 
 class SchedulerService:
     """Service for scheduling periodic job scraping tasks."""
 
     def __init__(self):
+        self.settings = get_settings()
         self.db_service = get_database_service()
         self.queue_service = get_queue_service()
         self.initialized = False
 
+        # Leader election and heap-driven scheduling state
+        self.instance_id = f"scheduler_{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._schedule_heap: List[Tuple[float, str]] = []
+        self._schedules: Dict[str, Dict[str, Any]] = {}
+        self._heap_loaded_at: Optional[float] = None
+        self._pubsub = None
+        self._counters_reconciled_at: Optional[float] = None
+
     async def initialize(self) -> bool:
         """Initialize scheduler dependencies."""
         try:
@@ -42,6 +65,10 @@ class SchedulerService:
         """
         Process all enabled site schedules that are due for execution.
 
+        This is the full-scan path used by manual ``/scheduler/run`` calls.
+        The daemon uses :meth:`run_due_schedules`, which only touches the
+        schedules at the top of the next-run heap.
+
         Returns:
             Number of jobs enqueued
         """
@@ -57,190 +84,393 @@ class SchedulerService:
             logger.info(f"Found {len(schedules)} site schedules to process")
 
             for schedule in schedules:
-                lock_key: Optional[str] = None
-                lock_value: Optional[str] = None
-                run_id: Optional[str] = None
-                lock_acquired = False
+                enqueued, _ = await self._process_schedule(schedule)
+                if enqueued:
+                    jobs_enqueued += 1
 
-                try:
-                    site_name = schedule["site_name"]
-                    schedule_id = str(schedule["id"])
+            if jobs_enqueued > 0:
+                logger.info(f"Scheduler enqueued {jobs_enqueued} jobs")
 
-                    # Check for existing running jobs for this site (per-site lock)
-                    lock_key = f"scrape_lock:{site_name}"
-                    existing_lock = self.queue_service.check_redis_lock(lock_key)
+            return jobs_enqueued
 
-                    if existing_lock:
-                        logger.info(f"Site {site_name} is already being scraped, skipping")
-                        continue
+        except Exception as e:
+            logger.error(f"Error in process_scheduled_sites: {str(e)}")
+            return 0
 
-                    # Check database for running jobs as backup
-                    if await self.db_service.check_site_lock(site_name):
-                        logger.info(f"Site {site_name} has running jobs in database, skipping")
-                        continue
+    async def _process_schedule(self, schedule: Dict[str, Any]) -> Tuple[bool, Optional[datetime]]:
+        """
+        Lock, record and enqueue a single due site schedule.
 
-                    # Generate unique run ID
-                    run_id = f"sched_{uuid.uuid4().hex[:8]}"
+        Returns:
+            Tuple of (enqueued, next_run_at). next_run_at is set when the schedule
+            was moved forward, either because a job was enqueued or because the
+            run was deferred by backpressure; otherwise it is None.
+        """
+        enqueued = False
+        next_run: Optional[datetime] = None
+        lock_key: Optional[str] = None
+        lock_value: Optional[str] = None
+        run_id: Optional[str] = None
+        lock_acquired = False
 
-                    # Acquire Redis lock for this site
-                    lock_value = f"{run_id}:{datetime.now(timezone.utc).isoformat()}"
-                    if not self.queue_service.acquire_redis_lock(lock_key, lock_value, timeout=1800):  # 30 min timeout
-                        logger.warning(f"Failed to acquire lock for site {site_name}")
-                        continue
+        try:
+            site_name = schedule["site_name"]
+            schedule_id = str(schedule["id"])
+
+            # Check for existing running jobs for this site (per-site lock)
+            lock_key = f"scrape_lock:{site_name}"
+            existing_lock = self.queue_service.check_redis_lock(lock_key)
+
+            if existing_lock:
+                logger.info(f"Site {site_name} is already being scraped, skipping")
+                return False, None
+
+            # Check database for running jobs as backup
+            if await self.db_service.check_site_lock(site_name):
+                logger.info(f"Site {site_name} has running jobs in database, skipping")
+                return False, None
+
+            # Hold the run back when the scraping or review queues are saturated
+            pressure = self.evaluate_backpressure()
+            if pressure["action"] == "defer":
+                return False, await self._defer_schedule(schedule_id, site_name, pressure["reason"])
+
+            # Generate unique run ID
+            run_id = f"sched_{uuid.uuid4().hex[:8]}"
+
+            # Acquire Redis lock for this site
+            lock_value = f"{run_id}:{datetime.now(timezone.utc).isoformat()}"
+            if not self.queue_service.acquire_redis_lock(lock_key, lock_value, timeout=1800):  # 30 min timeout
+                logger.warning(f"Failed to acquire lock for site {site_name}")
+                return False, None
+
+            lock_acquired = True
+
+            # Create scrape run record
+            scrape_run_id = await self.db_service.create_scrape_run(
+                run_id=run_id,
+                site_schedule_id=schedule_id,
+                task_id="",  # Will be updated after enqueueing
+                trigger="schedule"
+            )
+
+            if not scrape_run_id:
+                logger.error(f"Failed to create scrape run record for {site_name}")
+                return False, None
+
+            # Enqueue the job with site name included in payload
+            payload_dict = schedule["payload"]
+            if isinstance(payload_dict, str):
+                try:
+                    payload_dict = json.loads(payload_dict)
+                except json.JSONDecodeError as json_err:
+                    logger.error(f"Failed to parse payload JSON for {site_name}: {json_err}")
+                    if run_id:
+                        await self.db_service.update_scrape_run_status(
+                            run_id=run_id,
+                            status="failed",
+                            message=f"Failed to parse payload JSON: {json_err}"
+                        )
+                    if lock_acquired and lock_key and lock_value:
+                        self.queue_service.release_redis_lock(lock_key, lock_value)
+                        lock_acquired = False
+                        lock_value = None
+                    return False, None
 
-                    lock_acquired = True
+            # Ensure payload_dict is a dictionary
+            if not isinstance(payload_dict, dict):
+                logger.error(f"Payload is not a dictionary for {site_name}: {type(payload_dict)}")
+                if run_id:
+                    await self.db_service.update_scrape_run_status(
+                        run_id=run_id,
+                        status="failed",
+                        message=f"Payload must be a dictionary, got {type(payload_dict).__name__}"
+                    )
+                if lock_acquired and lock_key and lock_value:
+                    self.queue_service.release_redis_lock(lock_key, lock_value)
+                    lock_acquired = False
+                    lock_value = None
+                return False, None
+
+            payload = {**payload_dict, "site_name": schedule["site_name"]}
+
+            run_message = f"Scheduled scrape for {site_name}"
+            if pressure["action"] == "thin":
+                payload = self._thin_payload(payload, pressure["scale"])
+                run_message += (
+                    f" (thinned to {payload['results_wanted']} results: {pressure['reason']})"
+                )
+
+            # Use site-locked enqueueing to prevent overlapping execution per site
+            if site_name.lower() == "linkedin":
+                # Use LinkedIn job search for LinkedIn sites with site locking
+                job_info = self.queue_service.enqueue_linkedin_with_site_lock(
+                    payload=payload,
+                    site_schedule_id=schedule_id,
+                    trigger="schedule",
+                    run_id=run_id
+                )
+            else:
+                # Use regular scraping for other sites with site locking
+                job_info = self.queue_service.enqueue_with_site_lock(
+                    payload=payload,
+                    site_name=site_name,
+                    site_schedule_id=schedule_id,
+                    trigger="schedule",
+                    run_id=run_id
+                )
+
+            if job_info:
+                task_id = job_info["task_id"]
+
+                # Update scrape run with task_id
+                await self.db_service.update_scrape_run_status(
+                    run_id=run_id,
+                    status="queued",
+                    task_id=task_id,
+                    message=run_message
+                )
+
+                # Calculate next run time with jitter
+                interval_minutes = schedule["interval_minutes"]
+                jitter_percent = random.uniform(-0.1, 0.1)  # ±10% jitter
+                jittered_minutes = interval_minutes * (1 + jitter_percent)
+                next_run_at = datetime.now(timezone.utc) + timedelta(minutes=jittered_minutes)
+
+                # Update schedule next run time
+                await self.db_service.update_site_schedule_next_run(schedule_id, next_run_at)
+
+                logger.info(
+                    f"Enqueued scheduled job for {site_name} - "
+                    f"run_id: {run_id}, task_id: {task_id}, "
+                    f"next_run: {next_run_at.isoformat()}"
+                )
+
+                enqueued = True
+                next_run = next_run_at
+
+                # Release the lock - the worker will manage its own execution
+                # The lock was just to prevent duplicate scheduling
+                if lock_acquired and lock_key and lock_value:
+                    self.queue_service.release_redis_lock(lock_key, lock_value)
+                    lock_acquired = False
+                    lock_value = None
+            else:
+                logger.error(f"Failed to enqueue job for {site_name}")
 
-                    # Create scrape run record
-                    scrape_run_id = await self.db_service.create_scrape_run(
+                # Update scrape run to failed
+                if run_id:
+                    await self.db_service.update_scrape_run_status(
                         run_id=run_id,
-                        site_schedule_id=schedule_id,
-                        task_id="",  # Will be updated after enqueueing
-                        trigger="schedule"
+                        status="failed",
+                        message="Failed to enqueue job"
                     )
 
-                    if not scrape_run_id:
-                        logger.error(f"Failed to create scrape run record for {site_name}")
-                        continue
-
-                    # Enqueue the job with site name included in payload
-                    payload_dict = schedule["payload"]
-                    if isinstance(payload_dict, str):
-                        try:
-                            payload_dict = json.loads(payload_dict)
-                        except json.JSONDecodeError as json_err:
-                            logger.error(f"Failed to parse payload JSON for {site_name}: {json_err}")
-                            if run_id:
-                                await self.db_service.update_scrape_run_status(
-                                    run_id=run_id,
-                                    status="failed",
-                                    message=f"Failed to parse payload JSON: {json_err}"
-                                )
-                            if lock_acquired and lock_key and lock_value:
-                                self.queue_service.release_redis_lock(lock_key, lock_value)
-                                lock_acquired = False
-                                lock_value = None
-                            continue
-
-                    # Ensure payload_dict is a dictionary
-                    if not isinstance(payload_dict, dict):
-                        logger.error(f"Payload is not a dictionary for {site_name}: {type(payload_dict)}")
-                        if run_id:
-                            await self.db_service.update_scrape_run_status(
-                                run_id=run_id,
-                                status="failed",
-                                message=f"Payload must be a dictionary, got {type(payload_dict).__name__}"
-                            )
-                        if lock_acquired and lock_key and lock_value:
-                            self.queue_service.release_redis_lock(lock_key, lock_value)
-                            lock_acquired = False
-                            lock_value = None
-                        continue
-
-                    payload = {**payload_dict, "site_name": schedule["site_name"]}
-
-                    # Use site-locked enqueueing to prevent overlapping execution per site
-                    if site_name.lower() == "linkedin":
-                        # Use LinkedIn job search for LinkedIn sites with site locking
-                        job_info = self.queue_service.enqueue_linkedin_with_site_lock(
-                            payload=payload,
-                            site_schedule_id=schedule_id,
-                            trigger="schedule",
-                            run_id=run_id
-                        )
-                    else:
-                        # Use regular scraping for other sites with site locking
-                        job_info = self.queue_service.enqueue_with_site_lock(
-                            payload=payload,
-                            site_name=site_name,
-                            site_schedule_id=schedule_id,
-                            trigger="schedule",
-                            run_id=run_id
-                        )
+                if lock_acquired and lock_key and lock_value:
+                    self.queue_service.release_redis_lock(lock_key, lock_value)
+                    lock_acquired = False
+                    lock_value = None
 
-                    if job_info:
-                        task_id = job_info["task_id"]
+        except Exception as e:
+            site_name = "unknown"
+            try:
+                if isinstance(schedule, dict):
+                    site_name = schedule.get('site_name', 'unknown')
+                else:
+                    site_name = f"invalid_schedule_type_{type(schedule).__name__}"
+            except Exception:
+                pass  # Keep default site_name if we can't extract it
+
+            logger.error(f"Error processing schedule for {site_name}: {str(e)}")
+
+            if run_id:
+                try:
+                    await self.db_service.update_scrape_run_status(
+                        run_id=run_id,
+                        status="failed",
+                        message=f"Scheduler error for {site_name}: {str(e)}"
+                    )
+                except Exception as update_err:
+                    logger.error(f"Failed to mark scrape run {run_id} as failed: {update_err}")
 
-                        # Update scrape run with task_id
-                        await self.db_service.update_scrape_run_status(
-                            run_id=run_id,
-                            status="queued",
-                            task_id=task_id,
-                            message=f"Scheduled scrape for {site_name}"
-                        )
+            if lock_acquired and lock_key and lock_value:
+                self.queue_service.release_redis_lock(lock_key, lock_value)
+                lock_acquired = False
+                lock_value = None
 
-                        # Calculate next run time with jitter
-                        interval_minutes = schedule["interval_minutes"]
-                        jitter_percent = random.uniform(-0.1, 0.1)  # ±10% jitter
-                        jittered_minutes = interval_minutes * (1 + jitter_percent)
-                        next_run_at = datetime.now(timezone.utc) + timedelta(minutes=jittered_minutes)
+            return False, None
 
-                        # Update schedule next run time
-                        await self.db_service.update_site_schedule_next_run(schedule_id, next_run_at)
+        finally:
+            if lock_acquired and lock_key and lock_value:
+                self.queue_service.release_redis_lock(lock_key, lock_value)
+                lock_acquired = False
+                lock_value = None
 
-                        logger.info(
-                            f"Enqueued scheduled job for {site_name} - "
-                            f"run_id: {run_id}, task_id: {task_id}, "
-                            f"next_run: {next_run_at.isoformat()}"
-                        )
+        return enqueued, next_run
 
-                        jobs_enqueued += 1
-
-                        # Release the lock - the worker will manage its own execution
-                        # The lock was just to prevent duplicate scheduling
-                        if lock_acquired and lock_key and lock_value:
-                            self.queue_service.release_redis_lock(lock_key, lock_value)
-                            lock_acquired = False
-                            lock_value = None
-                    else:
-                        logger.error(f"Failed to enqueue job for {site_name}")
-
-                        # Update scrape run to failed
-                        if run_id:
-                            await self.db_service.update_scrape_run_status(
-                                run_id=run_id,
-                                status="failed",
-                                message="Failed to enqueue job"
-                            )
-
-                        if lock_acquired and lock_key and lock_value:
-                            self.queue_service.release_redis_lock(lock_key, lock_value)
-                            lock_acquired = False
-                            lock_value = None
-
-                except Exception as e:
-                    site_name = "unknown"
-                    try:
-                        if isinstance(schedule, dict):
-                            site_name = schedule.get('site_name', 'unknown')
-                        else:
-                            site_name = f"invalid_schedule_type_{type(schedule).__name__}"
-                    except Exception:
-                        pass  # Keep default site_name if we can't extract it
-
-                    logger.error(f"Error processing schedule for {site_name}: {str(e)}")
+    def evaluate_backpressure(self) -> Dict[str, Any]:
+        """
+        Decide whether a scheduled scrape should run, run thinned, or be deferred.
 
-                    if run_id:
-                        try:
-                            await self.db_service.update_scrape_run_status(
-                                run_id=run_id,
-                                status="failed",
-                                message=f"Scheduler error for {site_name}: {str(e)}"
-                            )
-                        except Exception as update_err:
-                            logger.error(f"Failed to mark scrape run {run_id} as failed: {update_err}")
+        A scrape is deferred when the scraping queue already has
+        ``scheduler_max_scrape_queue_depth`` jobs waiting, or when the review
+        backlog would take longer than ``scheduler_max_review_drain_minutes``
+        to drain at the recent review throughput. Past half that drain time
+        the scrape still runs but requests proportionally fewer results.
 
-                    if lock_acquired and lock_key and lock_value:
-                        self.queue_service.release_redis_lock(lock_key, lock_value)
-                        lock_acquired = False
-                        lock_value = None
+        Returns:
+            Dict with ``action`` ('proceed', 'thin' or 'defer'), ``reason`` and ``scale``
+        """
+        decision: Dict[str, Any] = {"action": "proceed", "reason": None, "scale": 1.0}
+
+        queue_info = self.queue_service.get_queue_info()
+        scraping_info = queue_info.get("scraping_queue") or {}
+        review_info = queue_info.get("review_queue") or {}
+
+        scrape_depth = scraping_info.get("length", 0)
+        max_scrape_depth = self.settings.scheduler_max_scrape_queue_depth
+        if scrape_depth >= max_scrape_depth:
+            decision.update(
+                action="defer",
+                reason=f"scraping queue has {scrape_depth} waiting jobs (limit {max_scrape_depth})"
+            )
+            return decision
+
+        review_backlog = review_info.get("length", 0) + review_info.get("started_jobs", 0)
+        if review_backlog == 0:
+            return decision
+
+        throughput = review_info.get("finished_per_hour", 0.0)
+        if not review_info.get("workers"):
+            throughput = 0.0
+
+        if throughput <= 0:
+            max_backlog = self.settings.scheduler_max_review_backlog
+            if review_backlog >= max_backlog:
+                decision.update(
+                    action="defer",
+                    reason=(
+                        f"review backlog of {review_backlog} jobs with no recent review "
+                        f"throughput (limit {max_backlog})"
+                    )
+                )
+            return decision
+
+        drain_minutes = review_backlog / throughput * 60
+        max_drain = self.settings.scheduler_max_review_drain_minutes
+        reason = (
+            f"review backlog of {review_backlog} jobs needs ~{drain_minutes:.0f} min "
+            f"to drain at {throughput:.0f}/h (limit {max_drain} min)"
+        )
+
+        if drain_minutes >= max_drain:
+            decision.update(action="defer", reason=reason)
+        elif drain_minutes >= max_drain / 2:
+            half = max_drain / 2
+            scale = max(MIN_THIN_SCALE, 1 - (drain_minutes - half) / half)
+            decision.update(action="thin", reason=reason, scale=scale)
+
+        return decision
+
+    @staticmethod
+    def _thin_payload(payload: Dict[str, Any], scale: float) -> Dict[str, Any]:
+        """Scale down the number of requested results for a thinned run."""
+        results_wanted = payload.get("results_wanted", DEFAULT_RESULTS_WANTED)
+        return {**payload, "results_wanted": max(1, int(results_wanted * scale))}
+
+    async def _defer_schedule(self, schedule_id: str, site_name: str, reason: str) -> datetime:
+        """Record a deferred scrape run and push the schedule's next run forward."""
+        run_id = f"sched_{uuid.uuid4().hex[:8]}"
+        next_run_at = datetime.now(timezone.utc) + timedelta(
+            minutes=self.settings.scheduler_backpressure_defer_minutes
+        )
+
+        await self.db_service.create_scrape_run(
+            run_id=run_id,
+            site_schedule_id=schedule_id,
+            task_id="",
+            trigger="schedule",
+            status="deferred",
+            message=f"Deferred until {next_run_at.isoformat()}: {reason}"
+        )
+        await self.db_service.update_site_schedule_next_run(schedule_id, next_run_at, record_run=False)
+
+        logger.warning(f"Deferred scheduled scrape for {site_name} - run_id: {run_id}, reason: {reason}")
+        return next_run_at
+
+    async def refresh_schedule_heap(self) -> int:
+        """
+        Reload enabled site schedules into the in-memory next-run heap.
+
+        Returns:
+            Number of schedules loaded
+        """
+        schedules = await self.db_service.get_enabled_site_schedules(due_only=False)
+        now = time.time()
+
+        heap: List[Tuple[float, str]] = []
+        self._schedules = {}
+        for schedule in schedules:
+            schedule_id = str(schedule["id"])
+            next_run_at = schedule.get("next_run_at")
+            due_at = next_run_at.timestamp() if next_run_at else now
+            self._schedules[schedule_id] = schedule
+            heap.append((due_at, schedule_id))
+
+        heapq.heapify(heap)
+        self._schedule_heap = heap
+        self._heap_loaded_at = now
+
+        logger.info(f"Loaded {len(heap)} enabled site schedules into scheduler heap")
+        return len(heap)
+
+    def _heap_is_stale(self) -> bool:
+        """Check whether the heap must be reloaded from the database."""
+        if self._heap_loaded_at is None:
+            return True
+        return time.time() - self._heap_loaded_at >= self.settings.scheduler_refresh_seconds
+
+    async def run_due_schedules(self) -> int:
+        """
+        Process only the schedules whose next run time has passed.
+
+        Due entries are popped from the heap, processed, and pushed back with
+        their new next run time. Schedules skipped because the site is busy are
+        retried after ``scheduler_retry_seconds``.
+
+        Returns:
+            Number of jobs enqueued
+        """
+        if not self.initialized:
+            logger.warning("Scheduler not initialized")
+            return 0
+
+        try:
+            if self._heap_is_stale():
+                await self.refresh_schedule_heap()
+
+            now = time.time()
+            due_ids: List[str] = []
+            while self._schedule_heap and self._schedule_heap[0][0] <= now:
+                _, schedule_id = heapq.heappop(self._schedule_heap)
+                due_ids.append(schedule_id)
 
+            jobs_enqueued = 0
+            for schedule_id in due_ids:
+                schedule = self._schedules.get(schedule_id)
+                if schedule is None:
                     continue
 
-                finally:
-                    if lock_acquired and lock_key and lock_value:
-                        self.queue_service.release_redis_lock(lock_key, lock_value)
-                        lock_acquired = False
-                        lock_value = None
+                enqueued, next_run_at = await self._process_schedule(schedule)
+                if enqueued:
+                    jobs_enqueued += 1
+
+                if next_run_at is not None:
+                    schedule["next_run_at"] = next_run_at
+                    heapq.heappush(self._schedule_heap, (next_run_at.timestamp(), schedule_id))
+                else:
+                    retry_at = time.time() + self.settings.scheduler_retry_seconds
+                    heapq.heappush(self._schedule_heap, (retry_at, schedule_id))
 
             if jobs_enqueued > 0:
                 logger.info(f"Scheduler enqueued {jobs_enqueued} jobs")
@@ -248,9 +478,121 @@ class SchedulerService:
             return jobs_enqueued
 
         except Exception as e:
-            logger.error(f"Error in process_scheduled_sites: {str(e)}")
+            logger.error(f"Error in run_due_schedules: {str(e)}")
+            # Force a reload on the next pass in case the heap is inconsistent
+            self._heap_loaded_at = None
             return 0
 
+    async def reconcile_counters_if_due(self) -> Optional[Dict[str, int]]:
+        """
+        Recount the trigger-maintained stat counters every
+        ``scheduler_counter_reconcile_seconds`` (and on the first leader pass).
+
+        Returns:
+            Corrected rows per counter table, or None when not yet due
+        """
+        interval = self.settings.scheduler_counter_reconcile_seconds
+        if interval <= 0:
+            return None
+        if self._counters_reconciled_at is not None and time.time() - self._counters_reconciled_at < interval:
+            return None
+
+        self._counters_reconciled_at = time.time()
+        return await self.db_service.reconcile_stat_counters()
+
+    def seconds_until_next_run(self) -> float:
+        """
+        Seconds until the earliest schedule is due.
+
+        Capped at a third of the leader lease so the leader renews in time, and
+        at the heap refresh interval so an empty heap is re-read periodically.
+        """
+        max_sleep = min(
+            self.settings.scheduler_leader_ttl_seconds / 3,
+            self.settings.scheduler_refresh_seconds
+        )
+        if not self._schedule_heap:
+            return max_sleep
+        return max(0.0, min(self._schedule_heap[0][0] - time.time(), max_sleep))
+
+    def ensure_leadership(self) -> bool:
+        """
+        Acquire or renew the scheduler leader lease in Redis.
+
+        Only the leader processes schedules; standby replicas keep retrying
+        until the current leader's lease expires.
+        """
+        ttl = self.settings.scheduler_leader_ttl_seconds
+
+        if self.is_leader:
+            if self.queue_service.extend_redis_lock(SCHEDULER_LEADER_KEY, self.instance_id, timeout=ttl):
+                return True
+            logger.warning(f"Scheduler {self.instance_id} lost leadership")
+            self.is_leader = False
+
+        if self.queue_service.acquire_redis_lock(SCHEDULER_LEADER_KEY, self.instance_id, timeout=ttl):
+            logger.info(f"Scheduler {self.instance_id} acquired leadership")
+            self.is_leader = True
+            # Another replica may have moved next_run_at while we were standby
+            self._mark_schedules_stale()
+
+        return self.is_leader
+
+    def release_leadership(self) -> None:
+        """Give up the leader lease so a standby replica can take over."""
+        if self.is_leader:
+            self.queue_service.release_redis_lock(SCHEDULER_LEADER_KEY, self.instance_id)
+            self.is_leader = False
+            logger.info(f"Scheduler {self.instance_id} released leadership")
+
+    async def wait_for_schedule_change(self, timeout: float) -> bool:
+        """
+        Sleep until ``timeout`` elapses or a schedule change is published.
+
+        Returns:
+            True if a change notification arrived (the heap is marked stale)
+        """
+        if self._pubsub is None:
+            self._pubsub = self.queue_service.subscribe_schedule_changes()
+
+        if self._pubsub is None:
+            await asyncio.sleep(timeout)
+            return False
+
+        try:
+            message = await asyncio.to_thread(
+                self._pubsub.get_message,
+                ignore_subscribe_messages=True,
+                timeout=timeout
+            )
+        except Exception as e:
+            logger.warning(f"Schedule change subscription failed, falling back to sleep: {str(e)}")
+            self._pubsub = None
+            await asyncio.sleep(timeout)
+            return False
+
+        if not message:
+            return False
+
+        logger.info(f"Schedule change notification received: {message.get('data')}")
+        self._mark_schedules_stale()
+        return True
+
+    def _mark_schedules_stale(self) -> None:
+        """
+        Force the next pass to reload the heap from the database.
+
+        The change came from another process, and daemons do not run the
+        reference cache's NOTIFY listener, so the cached schedule rows are
+        dropped too rather than served until their TTL expires.
+        """
+        reference_cache.invalidate("site_schedules")
+        self._heap_loaded_at = None
+
+    def notify_schedules_changed(self, schedule_id: Optional[str] = None) -> bool:
+        """Publish a schedule change so the leader reloads its heap immediately."""
+        return self.queue_service.publish_schedule_change(schedule_id)
+
     async def get_scheduler_status(self) -> Dict[str, Any]:
         """Get status information about the scheduler."""
         try:
@@ -263,10 +605,19 @@ class SchedulerService:
             # Get enabled schedules count
             schedules = await self.db_service.get_enabled_site_schedules()
 
+            next_due_at = None
+            if self._schedule_heap:
+                next_due_at = datetime.fromtimestamp(self._schedule_heap[0][0], tz=timezone.utc).isoformat()
+
             return {
                 "status": "running",
                 "enabled_sites": len(schedules),
                 "queue_info": queue_info,
+                "backpressure": self.evaluate_backpressure(),
+                "instance_id": self.instance_id,
+                "is_leader": self.is_leader,
+                "heap_size": len(self._schedule_heap),
+                "next_due_at": next_due_at,
                 "last_check": datetime.now(timezone.utc).isoformat()
             }
 
@@ -0,0 +1,198 @@
+"""
+Incremental CSV and Parquet writers for reviewed-job exports.
+
+Both writers consume the batches produced by
+``DatabaseService.iter_reviewed_jobs`` and yield encoded bytes per batch, so
+an export of any size is written with one batch in memory. Parquet needs the
+optional ``pyarrow`` package; each batch becomes one row group.
+"""
+import csv
+import io
+from contextlib import aclosing
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import orjson
+
+from .database import REVIEW_LIST_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+
+# Value kind of each exported column (REVIEW_LIST_FIELDS names); unlisted columns are text
+_COLUMN_KINDS = {
+    "salary_min": "float",
+    "salary_max": "float",
+    "overall_alignment_score": "float",
+    "is_remote": "bool",
+    "recommendation": "bool",
+    "override_recommend": "bool",
+    "date_posted": "timestamp",
+    "review_date": "timestamp",
+    "override_at": "timestamp",
+    "crew_output": "json",
+    "personas": "json",
+    "tradeoffs": "json",
+    "actions": "json",
+    "sources": "json",
+}
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+def export_columns(fields: Optional[Sequence[str]]) -> List[str]:
+    """Exported columns in REVIEW_LIST_FIELDS order (all of them when ``fields`` is None)."""
+    if fields is None:
+        return list(REVIEW_LIST_FIELDS)
+    return [field for field in REVIEW_LIST_FIELDS if field in fields or field == "job_id"]
+
+
+def flatten_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """``{"job": ..., "review": ...}`` item as one flat row."""
+    return {**item["job"], **item["review"]}
+
+
+def _plain_value(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "json":
+        return orjson.dumps(value).decode("utf-8")
+    if kind == "float":
+        return float(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _csv_value(value: Any, kind: str) -> Any:
+    value = _plain_value(value, kind)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def first_batch_primed(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Fetch the first batch now, then continue lazily.
+
+    Lets the caller surface query errors as a normal error response before any
+    byte of the export has been sent.
+    """
+    try:
+        first = await batches.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def resumed():
+        async with aclosing(batches):
+            if first is not None:
+                yield first
+            async for batch in batches:
+                yield batch
+
+    return resumed()
+
+
+async def csv_chunks(batches: AsyncIterator[List[Dict[str, Any]]], columns: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    kinds = [_COLUMN_KINDS.get(column, "text") for column in columns]
+
+    writer.writerow(columns)
+    async with aclosing(batches):
+        async for batch in batches:
+            for item in batch:
+                row = flatten_item(item)
+                writer.writerow([_csv_value(row.get(column), kind) for column, kind in zip(columns, kinds)])
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    # Header only, when nothing matched
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _parquet_schema(columns: List[str]) -> "pa.Schema":
+    types = {
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(column, types.get(_COLUMN_KINDS.get(column), pa.string())) for column in columns])
+
+
+class _DrainableSink:
+    """Write-only file object whose contents are handed out after each row group."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+async def parquet_chunks(batches: AsyncIterator[List[Dict[str, Any]]], columns: List[str]) -> AsyncIterator[bytes]:
+    if pq is None:
+        raise RuntimeError("Parquet export requires the pyarrow package")
+
+    schema = _parquet_schema(columns)
+    kinds = [_COLUMN_KINDS.get(column, "text") for column in columns]
+    sink = _DrainableSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        async with aclosing(batches):
+            async for batch in batches:
+                rows = [flatten_item(item) for item in batch]
+                table = pa.Table.from_pydict(
+                    {
+                        column: [_plain_value(row.get(column), kind) for row in rows]
+                        for column, kind in zip(columns, kinds)
+                    },
+                    schema=schema,
+                )
+                writer.write_table(table)
+                yield sink.drain()
+    finally:
+        # Writes the footer; on an aborted export it only releases the writer
+        writer.close()
+    yield sink.drain()
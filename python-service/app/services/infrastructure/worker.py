@@ -2,14 +2,23 @@
 RQ worker functions for processing job scraping tasks.
 """
 import uuid
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from loguru import logger
+from rq import get_current_job
 
+from ...core.config import get_settings
 from ..jobspy.scraping import scrape_jobs_sync, normalize_job_to_scraped_job
 from .database import get_database_service
 from .job_persistence import persist_jobs
+from .locks import LockHeartbeat
+from .dead_letter import record_dead_letter
+from .progress_events import publish_progress_event, SCRAPE_RUN_EVENT, JOB_REVIEW_EVENT
+from .analysis_jobs import (
+    analysis_task_id, execute_analysis, is_cacheable, store_result, pop_webhooks, deliver_webhooks
+)
 from ..jobspy.glassdoor_scraper import scrape_glassdoor_job_description, PLAYWRIGHT_AVAILABLE
 
 
@@ -24,12 +33,58 @@ def _coerce_decimals(value: Any) -> Any:
     return value
 
 
+def _site_lock_lease(site_lock: Optional[Dict[str, str]]):
+    """Keep the enqueue-time site lock alive while this job runs, then release it."""
+    if not site_lock:
+        return nullcontext()
+
+    job = get_current_job()
+    if job is None:
+        # Running outside an RQ worker (e.g. called inline) - nothing to heartbeat
+        return nullcontext()
+
+    settings = get_settings()
+    return LockHeartbeat(
+        job.connection,
+        site_lock["key"],
+        site_lock["value"],
+        settings.site_lock_lease_seconds
+    )
+
+
+def _dead_letter_review(job_id: str, last_error: str, attempts: int, max_retries: int) -> None:
+    """Record a review that has exhausted its retries in the dead-letter queue."""
+    job = get_current_job()
+    if job is None:
+        return
+
+    try:
+        record_dead_letter(
+            job.connection,
+            job_id,
+            last_error=last_error,
+            reason="retries_exhausted",
+            attempts=attempts,
+            max_retries=max_retries,
+            rq_job_id=job.id
+        )
+    except Exception as e:
+        logger.error(f"Failed to dead-letter review for {job_id}: {str(e)}")
+
+
+def _publish_progress(event_type: str, data: Dict[str, Any]) -> None:
+    """Report progress to SSE watchers over the worker's own Redis connection when it has one."""
+    job = get_current_job()
+    publish_progress_event(event_type, data, connection=job.connection if job else None)
+
+
 def scrape_jobs_worker(site_schedule_id: Optional[str] = None, 
                       payload: Optional[Dict[str, Any]] = None,
                       run_id: Optional[str] = None,
                       min_pause: int = 2, 
                       max_pause: int = 8,
-                      max_retries: int = 3) -> Dict[str, Any]:
+                      max_retries: int = 3,
+                      site_lock: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """
     Worker function that processes job scraping tasks.
     
@@ -40,11 +95,22 @@ def scrape_jobs_worker(site_schedule_id: Optional[str] = None,
         min_pause: Minimum pause between requests
         max_pause: Maximum pause between requests  
         max_retries: Maximum retry attempts
+        site_lock: Site lock {"key", "value"} held for this run; its lease is
+            extended by a heartbeat while scraping and released afterwards
         
     Returns:
         Dictionary with scraping results and metadata
     """
-    
+    with _site_lock_lease(site_lock):
+        return _run_scrape_job(site_schedule_id, payload, run_id, min_pause, max_pause)
+
+
+def _run_scrape_job(site_schedule_id: Optional[str],
+                    payload: Optional[Dict[str, Any]],
+                    run_id: Optional[str],
+                    min_pause: int,
+                    max_pause: int) -> Dict[str, Any]:
+    """Scrape, persist and record the status of a single run."""
     # Generate run_id if not provided
     if not run_id:
         run_id = f"run_{uuid.uuid4().hex[:8]}"
@@ -79,6 +145,12 @@ def scrape_jobs_worker(site_schedule_id: Optional[str] = None,
         )
         
         logger.info(f"Run {run_id}: Status updated to 'running'")
+        _publish_progress(SCRAPE_RUN_EVENT, {
+            "run_id": run_id,
+            "site_schedule_id": site_schedule_id,
+            "status": "running",
+            "started_at": started_at.isoformat()
+        })
         
         # Execute the scraping
         result = scrape_jobs_sync(payload, min_pause, max_pause)
@@ -132,6 +204,18 @@ def scrape_jobs_worker(site_schedule_id: Optional[str] = None,
         )
         
         logger.info(f"Run {run_id}: Completed with status '{final_status}', found {result.get('total_found', 0)} jobs")
+        _publish_progress(SCRAPE_RUN_EVENT, {
+            "run_id": run_id,
+            "site_schedule_id": site_schedule_id,
+            "status": final_status,
+            "finished_at": finished_at.isoformat(),
+            "total_found": result.get("total_found", 0),
+            "requested_pages": result.get("requested_pages", 0),
+            "completed_pages": result.get("completed_pages", 0),
+            "errors_count": result.get("errors_count", 0),
+            "inserted": (persistence_summary or {}).get("inserted", 0),
+            "message": result.get("message", "")
+        })
         
         # Add worker metadata to result
         result["run_id"] = run_id
@@ -158,6 +242,14 @@ def scrape_jobs_worker(site_schedule_id: Optional[str] = None,
             )
         except:
             logger.error(f"Failed to update run status for failed job {run_id}")
+
+        _publish_progress(SCRAPE_RUN_EVENT, {
+            "run_id": run_id,
+            "site_schedule_id": site_schedule_id,
+            "status": "failed",
+            "errors_count": 1,
+            "message": error_msg[:500]
+        })
         
         return {
             "status": "failed",
@@ -171,6 +263,65 @@ def scrape_jobs_worker(site_schedule_id: Optional[str] = None,
         }
 
 
+def _build_crew_input(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Structured job data for the review crew (skips job_intake_agent - already structured)."""
+    crew_input = {
+        "title": job_data.get("title", ""),
+        "company": job_data.get("company", ""),
+        "location": job_data.get("location_city") or job_data.get("location_state") or "Remote",
+        "description": job_data.get("description", ""),
+        "job_type": job_data.get("job_type", ""),
+        "seniority": "Senior",  # Default as this field may not exist in jobs table
+        "salary": {
+            "min_amount": job_data.get("min_amount"),
+            "max_amount": job_data.get("max_amount"),
+            "currency": job_data.get("currency", "USD"),
+            "interval": job_data.get("interval", "yearly")
+        }
+    }
+    return _coerce_decimals(crew_input)
+
+
+def _build_review_data(crew_result: Dict[str, Any], retry_count: int, processing_time: float) -> Dict[str, Any]:
+    """Map a successful crew result onto job_reviews columns."""
+    if isinstance(crew_result, dict):
+        final_result = crew_result.get("final", {})
+        prefilter = crew_result.get("pre_filter", {})
+    else:
+        final_result = {}
+        prefilter = {}
+
+    if not isinstance(final_result, dict):
+        final_result = {}
+    if not isinstance(prefilter, dict):
+        prefilter = {}
+
+    rationale = (
+        final_result.get("rationale")
+        or prefilter.get("reason")
+        or "No rationale provided"
+    )
+
+    return {
+        "recommend": final_result.get(
+            "recommend", prefilter.get("recommend", False)
+        ),
+        "confidence": final_result.get("confidence", "low"),
+        "rationale": rationale,
+        "personas": crew_result.get("personas", []),
+        "tradeoffs": crew_result.get("tradeoffs", []),
+        "actions": crew_result.get("actions", []),
+        "sources": crew_result.get("sources", []),
+        "overall_alignment_score": crew_result.get("overall_alignment_score"),  # Extract for database column
+        "tldr_summary": crew_result.get("tldr_summary"),  # Include for crew_output JSON (no separate column)
+        "crew_output": crew_result,
+        "processing_time_seconds": processing_time,
+        "crew_version": "job_posting_review_v1",
+        "model_used": "CrewAI",
+        "retry_count": retry_count
+    }
+
+
 def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
     """
     Worker function for processing job review tasks using CrewAI.
@@ -218,6 +369,7 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
             raise RuntimeError(f"Job not found: {job_id}")
         
         logger.info(f"Job review started - ID: {job_id}, Title: '{job_data.get('title')}', Company: {job_data.get('company')}")
+        _publish_progress(JOB_REVIEW_EVENT, {"job_id": job_id, "status": "in_review"})
         
         # Check if review already exists (for retry scenarios)
         existing_review = loop.run_until_complete(db_service.get_job_review(job_id))
@@ -229,6 +381,8 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
             
             # Update job status to error and store error in job_reviews
             loop.run_until_complete(db_service.update_job_status(job_id, "error"))
+            last_error = existing_review.get("error_message") if existing_review else None
+            _dead_letter_review(job_id, last_error or error_msg, retry_count, max_retries)
             loop.run_until_complete(db_service.insert_job_review(job_id, {
                 "recommend": False,
                 "confidence": "low",
@@ -238,6 +392,9 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
                 "processing_time_seconds": time.time() - start_time
             }))
             
+            _publish_progress(JOB_REVIEW_EVENT, {
+                "job_id": job_id, "status": "failed", "message": error_msg, "retry_count": retry_count
+            })
             return {
                 "status": "failed",
                 "job_id": job_id,
@@ -247,22 +404,8 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
             }
         
         # Prepare structured job data for CrewAI (skip job_intake_agent - already structured)
-        crew_input = {
-            "title": job_data.get("title", ""),
-            "company": job_data.get("company", ""),
-            "location": job_data.get("location_city") or job_data.get("location_state") or "Remote",
-            "description": job_data.get("description", ""),
-            "job_type": job_data.get("job_type", ""),
-            "seniority": "Senior",  # Default as this field may not exist in jobs table
-            "salary": {
-                "min_amount": job_data.get("min_amount"),
-                "max_amount": job_data.get("max_amount"),
-                "currency": job_data.get("currency", "USD"),
-                "interval": job_data.get("interval", "yearly")
-            }
-        }
-
-        crew_input = _coerce_decimals(crew_input)
+        crew_input = _build_crew_input(job_data)
+        
         
         # Run CrewAI job posting review
         logger.info(f"Running CrewAI review for job {job_id}")
@@ -291,6 +434,9 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
             # If under retry limit, keep status as pending_review for retry
             if retry_count + 1 < max_retries:
                 loop.run_until_complete(db_service.update_job_status(job_id, "pending_review"))
+                _publish_progress(JOB_REVIEW_EVENT, {
+                    "job_id": job_id, "status": "retry", "message": error_msg, "retry_count": retry_count + 1
+                })
                 return {
                     "status": "retry",
                     "job_id": job_id,
@@ -301,6 +447,10 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
             else:
                 # Max retries reached
                 loop.run_until_complete(db_service.update_job_status(job_id, "error"))
+                _dead_letter_review(job_id, error_msg, retry_count + 1, max_retries)
+                _publish_progress(JOB_REVIEW_EVENT, {
+                    "job_id": job_id, "status": "failed", "message": error_msg, "retry_count": retry_count + 1
+                })
                 return {
                     "status": "failed",
                     "job_id": job_id,
@@ -310,42 +460,7 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
                 }
         
         # Parse successful crew result
-        if isinstance(crew_result, dict):
-            final_result = crew_result.get("final", {})
-            prefilter = crew_result.get("pre_filter", {})
-        else:
-            final_result = {}
-            prefilter = {}
-
-        if not isinstance(final_result, dict):
-            final_result = {}
-        if not isinstance(prefilter, dict):
-            prefilter = {}
-
-        rationale = (
-            final_result.get("rationale")
-            or prefilter.get("reason")
-            or "No rationale provided"
-        )
-
-        review_data = {
-            "recommend": final_result.get(
-                "recommend", prefilter.get("recommend", False)
-            ),
-            "confidence": final_result.get("confidence", "low"),
-            "rationale": rationale,
-            "personas": crew_result.get("personas", []),
-            "tradeoffs": crew_result.get("tradeoffs", []),
-            "actions": crew_result.get("actions", []),
-            "sources": crew_result.get("sources", []),
-            "overall_alignment_score": crew_result.get("overall_alignment_score"),  # Extract for database column
-            "tldr_summary": crew_result.get("tldr_summary"),  # Include for crew_output JSON (no separate column)
-            "crew_output": crew_result,
-            "processing_time_seconds": processing_time,
-            "crew_version": "job_posting_review_v1",
-            "model_used": "CrewAI",
-            "retry_count": retry_count
-        }
+        review_data = _build_review_data(crew_result, retry_count, processing_time)
         
         logger.info(f"Prepared review data for job_id {job_id}: recommend={review_data['recommend']}, confidence={review_data['confidence']}")
         
@@ -374,6 +489,14 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
         }
         
         logger.info(f"Job review completed successfully for job_id: {job_id} (recommend: {review_data['recommend']}, confidence: {review_data['confidence']})")
+        _publish_progress(JOB_REVIEW_EVENT, {
+            "job_id": job_id,
+            "status": "completed",
+            "recommend": review_data["recommend"],
+            "confidence": review_data["confidence"],
+            "overall_alignment_score": review_data.get("overall_alignment_score"),
+            "processing_time_seconds": processing_time
+        })
         return result
         
     except Exception as e:
@@ -404,8 +527,11 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
                     loop.run_until_complete(db_service.update_job_status(job_id, "pending_review"))
                 else:
                     loop.run_until_complete(db_service.update_job_status(job_id, "error"))
+                    _dead_letter_review(job_id, error_msg, retry_count + 1, max_retries)
         except Exception as store_error:
             logger.error(f"Failed to store error information: {store_error}")
+
+        _publish_progress(JOB_REVIEW_EVENT, {"job_id": job_id, "status": "failed", "message": error_msg})
         
         return {
             "status": "failed", 
@@ -417,6 +543,231 @@ def process_job_review(job_id: str, max_retries: int = 3) -> Dict[str, Any]:
         }
 
 
+def _batch_review_outcome(job_id: str,
+                          crew_result: Dict[str, Any],
+                          retry_count: int,
+                          max_retries: int,
+                          processing_time: float) -> Dict[str, Any]:
+    """Turn one evaluation in a batch into the review row and job status to store."""
+    if "error" not in crew_result:
+        return {
+            "job_id": job_id,
+            "status": "reviewed",
+            "result": "completed",
+            "review_data": _build_review_data(crew_result, retry_count, processing_time)
+        }
+
+    error_msg = f"CrewAI error: {crew_result['error']}"
+    exhausted = retry_count + 1 >= max_retries
+    return {
+        "job_id": job_id,
+        "status": "error" if exhausted else "pending_review",
+        "result": "failed" if exhausted else "retry",
+        "error": error_msg,
+        "review_data": {
+            "recommend": False,
+            "confidence": "low",
+            "rationale": error_msg,
+            "error_message": error_msg,
+            "retry_count": retry_count + 1,
+            "processing_time_seconds": processing_time,
+            "crew_output": crew_result
+        }
+    }
+
+
+def _get_review_orchestrator():
+    """Shared job posting orchestrator (imported lazily - CrewAI is heavy to load)."""
+    from ..crewai.job_posting_review.orchestrator import get_job_posting_orchestrator
+    return get_job_posting_orchestrator()
+
+
+async def _review_batch(db_service, batch_size: int, max_retries: int, concurrency: int) -> Dict[str, Any]:
+    """Claim a batch of pending jobs, evaluate them concurrently and store the results together."""
+    if not db_service.initialized:
+        await db_service.initialize()
+
+    jobs = await db_service.claim_pending_review_jobs(batch_size)
+    if not jobs:
+        return {"status": "completed", "claimed": 0, "completed": 0, "retry": 0, "failed": 0, "jobs": {}}
+
+    # Claimed jobs sit in in_review, which the poller never picks up again; any that are
+    # neither stored nor released when the batch fails (or is cancelled) go back to pending_review
+    settled: set = set()
+    try:
+        return await _review_claimed_jobs(db_service, jobs, settled, max_retries, concurrency)
+    except BaseException as e:
+        stranded = [str(job["id"]) for job in jobs if str(job["id"]) not in settled]
+        logger.error(f"Review batch failed, returning {len(stranded)} claimed jobs to pending_review: {e!r}")
+        for job_id in stranded:
+            await db_service.update_job_status(job_id, "pending_review")
+        raise
+
+
+async def _review_claimed_jobs(db_service, jobs: List[Dict[str, Any]], settled: set,
+                               max_retries: int, concurrency: int) -> Dict[str, Any]:
+    """Evaluate claimed jobs and store the results, adding each job id to ``settled`` once it leaves in_review."""
+    import time
+    import asyncio
+
+    # One orchestrator (crew, single-agent evaluator and cached brand payload) serves the whole batch
+    orchestrator = _get_review_orchestrator()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def review_one(job_data: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = str(job_data["id"])
+        retry_count = job_data.get("retry_count") or 0
+        start_time = time.time()
+
+        if retry_count >= max_retries:
+            error_msg = f"Maximum retry attempts ({max_retries}) reached for job {job_id}"
+            return {
+                "job_id": job_id,
+                "status": "error",
+                "result": "failed",
+                "error": error_msg,
+                "review_data": {
+                    "recommend": False,
+                    "confidence": "low",
+                    "rationale": error_msg,
+                    "error_message": error_msg,
+                    "retry_count": retry_count,
+                    "processing_time_seconds": 0.0
+                }
+            }
+
+        try:
+            async with semaphore:
+                crew_result = await orchestrator.evaluate_job_posting_async(
+                    _build_crew_input(job_data), correlation_id=job_id
+                )
+        except Exception as e:
+            # Isolate the failure to this posting; the rest of the batch carries on
+            crew_result = {"error": str(e)}
+
+        return _batch_review_outcome(job_id, crew_result, retry_count, max_retries, time.time() - start_time)
+
+    outcomes = await asyncio.gather(*(review_one(job) for job in jobs))
+    saved = await db_service.save_job_review_batch(outcomes)
+    settled.update(job_id for job_id, stored in saved.items() if stored)
+
+    summary = {"status": "completed", "claimed": len(jobs), "completed": 0, "retry": 0, "failed": 0, "jobs": {}}
+    for outcome in outcomes:
+        job_id = outcome["job_id"]
+        result = outcome["result"] if saved.get(job_id) else "failed"
+        summary[result] += 1
+        summary["jobs"][job_id] = result
+
+        if not saved.get(job_id):
+            # Storing failed - put the job back so the next poll picks it up
+            await db_service.update_job_status(job_id, "pending_review")
+            settled.add(job_id)
+        elif outcome["result"] == "failed":
+            _dead_letter_review(job_id, outcome["error"], outcome["review_data"]["retry_count"], max_retries)
+
+        event = {"job_id": job_id, "status": result}
+        if result == "completed":
+            event["recommend"] = outcome["review_data"]["recommend"]
+            event["confidence"] = outcome["review_data"]["confidence"]
+            event["overall_alignment_score"] = outcome["review_data"].get("overall_alignment_score")
+        _publish_progress(JOB_REVIEW_EVENT, event)
+
+    return summary
+
+
+def process_job_review_batch(batch_size: Optional[int] = None, max_retries: int = 3) -> Dict[str, Any]:
+    """
+    Worker function that reviews several pending jobs in one task.
+
+    Claims up to ``batch_size`` pending_review jobs (default
+    ``settings.job_review_batch_size``), evaluates them concurrently with a
+    shared orchestrator and writes all reviews in a single transaction. A
+    posting that fails only affects its own review and retry count.
+
+    Args:
+        batch_size: Number of jobs to claim
+        max_retries: Maximum number of retry attempts per job
+
+    Returns:
+        Dictionary with per-outcome counts and the result for each job
+    """
+    import time
+    import asyncio
+
+    settings = get_settings()
+    batch_size = batch_size or settings.job_review_batch_size
+    start_time = time.time()
+    db_service = get_database_service()
+
+    logger.info(f"Processing job review batch of up to {batch_size} jobs")
+
+    try:
+        loop = None
+        try:
+            loop = asyncio.get_event_loop()
+        except:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+
+        summary = loop.run_until_complete(
+            _review_batch(db_service, batch_size, max_retries, settings.job_review_batch_concurrency)
+        )
+        summary["processing_time_seconds"] = time.time() - start_time
+        summary["processed_at"] = datetime.now(timezone.utc).isoformat()
+
+        logger.info(
+            f"Job review batch finished - claimed: {summary['claimed']}, completed: {summary['completed']}, "
+            f"retry: {summary['retry']}, failed: {summary['failed']}"
+        )
+        return summary
+
+    except Exception as e:
+        error_msg = f"Job review batch error: {str(e)}"
+        logger.error(error_msg)
+        return {
+            "status": "failed",
+            "message": error_msg,
+            "processed_at": datetime.now(timezone.utc).isoformat(),
+            "processing_time_seconds": time.time() - start_time
+        }
+
+
+def run_analysis_task(kind: str, payload: Dict[str, Any]) -> Any:
+    """
+    Worker function for submit-and-poll analysis requests.
+
+    Runs the analysis, caches a successful result under the task id and
+    notifies every webhook registered for the task. Exceptions are re-raised
+    after notifying, so RQ records the task as failed.
+
+    Args:
+        kind: Analysis kind ("parse" or "analyze")
+        payload: Analysis input, as hashed into the task id
+
+    Returns:
+        The analysis result
+    """
+    job = get_current_job()
+    task_id = job.id if job else analysis_task_id(kind, payload)
+    logger.info(f"Running {kind} analysis task {task_id}")
+
+    try:
+        result = execute_analysis(kind, payload)
+    except Exception as e:
+        logger.error(f"Analysis task {task_id} failed: {str(e)}")
+        if job is not None:
+            deliver_webhooks(pop_webhooks(job.connection, task_id),
+                             {"task_id": task_id, "kind": kind, "status": "failed", "error": str(e)})
+        raise
+
+    if job is not None:
+        if is_cacheable(kind, result):
+            store_result(job.connection, task_id, result)
+        deliver_webhooks(pop_webhooks(job.connection, task_id),
+                         {"task_id": task_id, "kind": kind, "status": "finished", "result": result})
+    return result
+
+
 def run_linkedin_job_search(
     site_schedule_id: Optional[str] = None,
     payload: Optional[Dict[str, Any]] = None,
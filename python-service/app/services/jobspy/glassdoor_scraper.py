@@ -9,6 +9,8 @@ import re
 from typing import Optional, Dict, Any
 from loguru import logger
 
+from ..infrastructure.cpu_pool import cpu_pool
+
 try:
     from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
@@ -112,8 +114,10 @@ async def scrape_glassdoor_job_description(job_url: str, timeout: int = 30000) -
                 return None
 
             # Extract text content
-            # Convert to markdown format
-            description_md = format_glassdoor_description_as_markdown(description_text)
+            # Convert to markdown format (in the CPU pool for long descriptions)
+            description_md = await cpu_pool.run(
+                format_glassdoor_description_as_markdown, description_text, size=len(description_text)
+            )
 
             await browser.close()
 
@@ -12,13 +12,17 @@ import traceback
 import json
 
 from app.core.config import configure_logging, get_settings
+from app.core.compression import CompressionMiddleware
 from app.api.router import api_router
 from app.services.ai.gemini import GeminiService
 from app.services.infrastructure.postgrest import PostgRESTService
 from app.services.jobspy.ingestion import JobSpyIngestionService
-from app.services.infrastructure.database import DatabaseService
+from app.services.infrastructure.database import close_shared_pools, get_database_service
 from app.services.infrastructure.queue import QueueService
 from app.services.infrastructure.scheduler import SchedulerService
+from app.services.infrastructure.reference_cache import ReferenceCacheListener
+from app.services.infrastructure.progress_events import progress_event_hub
+from app.services.infrastructure.cpu_pool import cpu_pool
 from app.services.crewai.research_company.crew import ResearchCompanyCrew
 from app.schemas.responses import create_error_response
 from app.services.startup import startup_tasks
@@ -37,15 +41,22 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
+
+    # Fork the CPU pool's workers before any service starts threads
+    try:
+        cpu_pool.start()
+    except Exception as e:
+        logger.error(f"Failed to start CPU pool, text helpers will run inline: {str(e)}")
     
     # Initialize services and store on application state
     app.state.gemini_service = GeminiService()
     app.state.postgrest_service = PostgRESTService()
     app.state.jobspy_service = JobSpyIngestionService()
-    app.state.database_service = DatabaseService()
+    app.state.database_service = get_database_service()
     app.state.queue_service = QueueService()
     app.state.scheduler_service = SchedulerService()
     app.state.company_crew = ResearchCompanyCrew()
+    app.state.reference_cache_listener = ReferenceCacheListener()
     
     try:
         # Initialize existing services
@@ -58,6 +69,9 @@ async def lifespan(app: FastAPI):
         await app.state.queue_service.initialize()
         await app.state.scheduler_service.initialize()
         
+        # Drop cached companies/schedules/statuses when another process changes them
+        app.state.reference_cache_listener.start()
+        
         # Initialize ChromaDB collections
         await startup_tasks()
         
@@ -71,8 +85,12 @@ async def lifespan(app: FastAPI):
     
     # Cleanup on shutdown
     logger.info("Shutting down services...")
+    await app.state.reference_cache_listener.stop()
+    await progress_event_hub.stop()
+    await cpu_pool.stop()
     await app.state.postgrest_service.close()
     await app.state.database_service.close()
+    await close_shared_pools()
     logger.info("Application shutdown complete")
 
 
@@ -109,6 +127,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (brotli when available, otherwise gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.response_compression_minimum_bytes,
+    gzip_level=settings.response_compression_gzip_level,
+    brotli_quality=settings.response_compression_brotli_quality,
+)
+
 
 # Global exception handler
 @app.exception_handler(HTTPException)
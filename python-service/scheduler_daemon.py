@@ -6,7 +6,6 @@ Runs the job scheduling logic in a loop to enqueue periodic scraping tasks.
 import sys
 import os
 import asyncio
-import time
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -33,24 +32,36 @@ async def scheduler_loop():
         await scheduler_service.initialize()
         logger.info("Scheduler initialized successfully")
         
-        # Run scheduler loop
-        check_interval = 60  # Check every minute
+        # Run scheduler loop: only the elected leader processes schedules, and it
+        # sleeps until the next schedule is due or a change is published
+        standby_interval = settings.scheduler_leader_ttl_seconds / 3
         
-        while True:
-            try:
-                logger.debug("Checking for due scheduled tasks...")
-                jobs_enqueued = await scheduler_service.process_scheduled_sites()
-                
-                if jobs_enqueued > 0:
-                    logger.info(f"Scheduler enqueued {jobs_enqueued} tasks")
-                
-                # Wait for next check
-                await asyncio.sleep(check_interval)
-                
-            except Exception as e:
-                logger.error(f"Error in scheduler loop: {str(e)}")
-                # Wait a bit longer before retrying
-                await asyncio.sleep(check_interval * 2)
+        try:
+            while True:
+                try:
+                    if not scheduler_service.ensure_leadership():
+                        logger.debug("Another scheduler replica is leader, standing by...")
+                        await asyncio.sleep(standby_interval)
+                        continue
+                    
+                    jobs_enqueued = await scheduler_service.run_due_schedules()
+                    
+                    if jobs_enqueued > 0:
+                        logger.info(f"Scheduler enqueued {jobs_enqueued} tasks")
+                    
+                    await scheduler_service.reconcile_counters_if_due()
+                    
+                    # Wait for the next due schedule or a schedule change notification
+                    wait_seconds = scheduler_service.seconds_until_next_run()
+                    logger.debug(f"Next scheduler wakeup in {wait_seconds:.1f}s")
+                    await scheduler_service.wait_for_schedule_change(wait_seconds)
+                    
+                except Exception as e:
+                    logger.error(f"Error in scheduler loop: {str(e)}")
+                    # Wait a bit longer before retrying
+                    await asyncio.sleep(standby_interval * 2)
+        finally:
+            scheduler_service.release_leadership()
                 
     except KeyboardInterrupt:
         logger.info("Scheduler interrupted by user")
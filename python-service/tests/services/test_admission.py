@@ -0,0 +1,90 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.api import admission as admission_module
+from app.api.admission import AdmissionController, ConcurrencyLimiter, admission
+
+
+def _limiter(limit=1, queue_size=1, queue_timeout=5.0):
+    return ConcurrencyLimiter("analysis", limit=limit, queue_size=queue_size, queue_timeout=queue_timeout,
+                              default_retry_after=10, max_retry_after=300)
+
+
+def test_full_queue_is_shed_with_429_and_retry_after():
+    async def run_test():
+        limiter = _limiter()
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        assert limiter.active == 1 and limiter.waiting == 1
+
+        with pytest.raises(HTTPException) as rejected:
+            await limiter.acquire()
+        assert rejected.value.status_code == 429
+        assert rejected.value.headers["Retry-After"] == "10"
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+        snapshot = limiter.snapshot()
+        assert snapshot["admitted"] == 2
+        assert snapshot["shed_queue_full"] == 1
+        assert snapshot["max_queue_depth"] == 1
+        assert snapshot["active"] == 0 and snapshot["queue_depth"] == 0
+
+    asyncio.run(run_test())
+
+
+def test_queue_wait_timeout_is_shed_with_503():
+    async def run_test():
+        limiter = _limiter(queue_timeout=0.01)
+        limiter.avg_service_seconds = 4.2
+        await limiter.acquire()
+
+        with pytest.raises(HTTPException) as rejected:
+            await limiter.acquire()
+
+        assert rejected.value.status_code == 503
+        assert rejected.value.headers["Retry-After"] == "5"
+        assert limiter.stats["shed_timeout"] == 1
+        assert limiter.waiting == 0
+
+        limiter.release(1.0)
+        await limiter.acquire()
+
+    asyncio.run(run_test())
+
+
+def test_dependency_sheds_saturated_class_but_admits_async_submissions():
+    controller = AdmissionController()
+    limiter = _limiter(queue_size=0)
+    controller._limiters["analysis"] = limiter
+    asyncio.run(limiter.acquire())
+
+    app = FastAPI()
+
+    @app.post("/parse", dependencies=[Depends(admission("analysis"))])
+    async def parse():
+        return {"ok": True}
+
+    with patch.object(admission_module, "admission_controller", controller):
+        client = TestClient(app)
+        shed = client.post("/parse")
+        submitted = client.post("/parse?mode=async")
+
+    assert shed.status_code == 429
+    assert "Retry-After" in shed.headers
+    assert submitted.status_code == 200
+    assert controller.snapshot()["analysis"]["shed_queue_full"] == 1
@@ -0,0 +1,91 @@
+import os
+from unittest.mock import MagicMock, Mock, patch
+
+import orjson
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure import worker
+from app.services.infrastructure.analysis_jobs import (
+    RESULT_KEY_PREFIX,
+    analysis_task_id,
+    is_cacheable,
+    validate_webhook_url,
+)
+from app.services.infrastructure.queue import QueueService
+
+
+def _queue_service(cached=None):
+    service = QueueService()
+    service.redis_conn = MagicMock()
+    service.redis_conn.get.return_value = orjson.dumps(cached) if cached is not None else None
+    service.redis_conn.set.return_value = True
+    service.analysis_queue = Mock()
+    service.analysis_queue.fetch_job.return_value = None
+    service.analysis_queue.enqueue.side_effect = lambda *args, **kwargs: Mock(id=kwargs["job_id"])
+    service.initialized = True
+    return service
+
+
+def test_task_id_is_stable_across_key_order():
+    first = analysis_task_id("analyze", {"job_posting": {"title": "Eng", "company": "Acme"}})
+    second = analysis_task_id("analyze", {"job_posting": {"company": "Acme", "title": "Eng"}})
+
+    assert first == second
+    assert first.startswith("analysis-analyze-")
+    assert analysis_task_id("parse", {"description": "x"}) != analysis_task_id("parse", {"description": "y"})
+
+
+def test_enqueue_answers_repeat_submission_from_cache():
+    service = _queue_service(cached={"title": "Engineer"})
+
+    submitted = service.enqueue_analysis("parse", {"description": "text"}, "http://localhost/hook")
+
+    assert submitted["cached"] is True
+    assert submitted["result"] == {"title": "Engineer"}
+    service.analysis_queue.enqueue.assert_not_called()
+    service.redis_conn.sadd.assert_not_called()
+
+
+def test_enqueue_registers_webhook_under_deterministic_id():
+    service = _queue_service()
+    payload = {"description": "text"}
+
+    submitted = service.enqueue_analysis("parse", payload, "http://localhost/hook")
+
+    task_id = analysis_task_id("parse", payload)
+    assert submitted == {"task_id": task_id, "status": "queued", "cached": False}
+    assert service.analysis_queue.enqueue.call_args.kwargs["job_id"] == task_id
+    service.redis_conn.sadd.assert_called_once_with(f"analysis_webhooks:{task_id}", "http://localhost/hook")
+
+
+def test_webhook_host_must_be_allow_listed():
+    assert validate_webhook_url("http://localhost:3000/callback")
+    with pytest.raises(ValueError):
+        validate_webhook_url("https://example.com/callback")
+    with pytest.raises(ValueError):
+        validate_webhook_url("ftp://localhost/callback")
+
+
+def test_worker_caches_result_and_notifies_webhooks():
+    connection = MagicMock()
+    connection.smembers.return_value = {b"http://localhost/hook"}
+    job = Mock(id="analysis-parse-abc", connection=connection)
+
+    with patch.object(worker, "get_current_job", return_value=job), \
+         patch.object(worker, "execute_analysis", return_value={"title": "Engineer"}), \
+         patch.object(worker, "deliver_webhooks") as deliver:
+        result = worker.run_analysis_task("parse", {"description": "text"})
+
+    assert result == {"title": "Engineer"}
+    assert connection.set.call_args.args[0] == RESULT_KEY_PREFIX + "analysis-parse-abc"
+    urls, body = deliver.call_args.args
+    assert urls == ["http://localhost/hook"]
+    assert body["status"] == "finished"
+
+
+def test_failed_results_are_not_cacheable():
+    assert not is_cacheable("parse", {"description": "text", "title": None})
+    assert not is_cacheable("analyze", {"error": "crew failed"})
+    assert is_cacheable("analyze", {"final": {"recommend": True}})
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.database import DatabaseService
+
+
+def _service(conn):
+    service = DatabaseService()
+    service.initialized = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    return service
+
+
+def test_bulk_override_runs_one_statement_and_reports_each_item():
+    async def run_test():
+        found = uuid.UUID("00000000-0000-0000-0000-000000000001")
+        missing = uuid.UUID("00000000-0000-0000-0000-000000000002")
+        now = datetime(2025, 10, 6, tzinfo=timezone.utc)
+
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[{
+            "id": 7, "job_id": found, "override_recommend": True, "override_comment": "second",
+            "override_by": "system_admin", "override_at": now, "updated_at": now,
+        }])
+        service = _service(conn)
+
+        with patch("app.services.infrastructure.database.invalidate_reviewed_jobs_count_cache") as invalidate:
+            results = await service.bulk_update_job_review_overrides([
+                {"job_id": str(found), "override_recommend": False, "override_comment": "first"},
+                {"job_id": "not-a-uuid", "override_recommend": True, "override_comment": "x"},
+                {"job_id": str(missing), "override_recommend": True, "override_comment": "y"},
+                {"job_id": str(found), "override_recommend": True, "override_comment": "second"},
+            ])
+
+        conn.fetch.assert_awaited_once()
+        sql, job_ids, recommends, comments, override_by = conn.fetch.await_args.args
+        assert "FROM unnest($1::uuid[], $2::boolean[], $3::text[])" in sql
+        # Duplicate job_id collapses to its last entry
+        assert job_ids == [found, missing]
+        assert recommends == [True, True]
+        assert comments == ["second", "y"]
+        assert override_by == "system_admin"
+        invalidate.assert_called_once()
+
+        assert [result["status"] for result in results] == ["updated", "invalid", "not_found", "updated"]
+        assert results[0]["job_id"] == str(found)
+        assert results[0]["override_comment"] == "second"
+
+    asyncio.run(run_test())
+
+
+def test_bulk_override_with_only_invalid_ids_skips_the_database():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock()
+        service = _service(conn)
+
+        results = await service.bulk_update_job_review_overrides([
+            {"job_id": "bad", "override_recommend": True, "override_comment": "x"},
+        ])
+
+        conn.fetch.assert_not_awaited()
+        assert results[0]["status"] == "invalid"
+
+    asyncio.run(run_test())
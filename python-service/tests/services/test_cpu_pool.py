@@ -0,0 +1,95 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.chroma_manager import chunk_text
+from app.services.infrastructure.cpu_pool import CPUPool
+from app.services.infrastructure.job_persistence import generate_dedup_keys, generate_fingerprint
+
+DESCRIPTION = "Own the product roadmap and partner with engineering on delivery. " * 200
+FINGERPRINT_NAME = "app.services.infrastructure.job_persistence.generate_fingerprint"
+PARENT_PID = os.getpid()
+
+
+def _die_in_worker(text):
+    # Simulates a worker killed mid-call (OOM, segfault); harmless when run inline
+    if os.getpid() != PARENT_PID:
+        os._exit(1)
+    return len(text)
+
+
+def _pool(workers=1, offload_min_chars=1000):
+    pool = CPUPool()
+    pool.settings = SimpleNamespace(cpu_pool_workers=workers, cpu_pool_offload_min_chars=offload_min_chars)
+    return pool
+
+
+def test_calls_run_inline_below_threshold_or_when_not_started():
+    async def run_test():
+        pool = _pool()
+
+        # Not started: even a large input runs in-process
+        result = await pool.run(generate_fingerprint, DESCRIPTION, "PM", "Acme", size=len(DESCRIPTION))
+        assert result == generate_fingerprint(DESCRIPTION, "PM", "Acme")
+
+        pool.start()
+        try:
+            short = "Own the product roadmap"
+            assert await pool.run(chunk_text, short, 2, 1, size=len(short)) == chunk_text(short, 2, 1)
+        finally:
+            await pool.stop()
+
+        stats = pool.snapshot()["functions"]
+        assert stats[FINGERPRINT_NAME]["inline"] == 1
+        assert stats[FINGERPRINT_NAME]["offloaded"] == 0
+        assert stats["app.services.chroma_manager.chunk_text"]["inline"] == 1
+
+    asyncio.run(run_test())
+
+
+def test_large_inputs_are_offloaded_with_queue_and_exec_timings():
+    async def run_test():
+        pool = _pool()
+        pool.start()
+        try:
+            assert pool.snapshot()["started"] is True
+            results = await asyncio.gather(*[
+                pool.run(generate_dedup_keys, "Senior PM", "Acme", DESCRIPTION, size=len(DESCRIPTION))
+                for _ in range(3)
+            ])
+        finally:
+            await pool.stop()
+
+        assert results == [generate_dedup_keys("Senior PM", "Acme", DESCRIPTION)] * 3
+        snapshot = pool.snapshot()
+        assert snapshot["started"] is False
+        stats = snapshot["functions"]["app.services.infrastructure.job_persistence.generate_dedup_keys"]
+        assert stats["offloaded"] == 3
+        assert stats["inline"] == 0
+        assert stats["max_exec_ms"] > 0
+        assert stats["max_queue_ms"] >= stats["avg_queue_ms"] >= 0
+
+    asyncio.run(run_test())
+
+
+def test_broken_pool_is_disabled_and_calls_run_inline():
+    async def run_test():
+        pool = _pool()
+        pool.start()
+        try:
+            assert await pool.run(_die_in_worker, DESCRIPTION, size=len(DESCRIPTION)) == len(DESCRIPTION)
+            snapshot = pool.snapshot()
+            assert snapshot["started"] is False
+            assert snapshot["broken"] is True
+
+            # No replacement is forked; later large inputs run in-process
+            assert await pool.run(_die_in_worker, DESCRIPTION, size=len(DESCRIPTION)) == len(DESCRIPTION)
+            stats = pool.snapshot()["functions"][f"{__name__}._die_in_worker"]
+            assert stats["inline"] == 2
+            assert stats["offloaded"] == 0
+        finally:
+            await pool.stop()
+
+    asyncio.run(run_test())
@@ -0,0 +1,45 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import orjson
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure import database
+from app.services.infrastructure.database import DatabaseService
+
+
+def test_pool_connections_register_orjson_codecs_for_json_types():
+    async def run_test():
+        conn = AsyncMock()
+        await database._init_connection(conn)
+
+        registered = {call.args[0]: call.kwargs for call in conn.set_type_codec.await_args_list}
+        assert set(registered) == {"json", "jsonb"}
+        assert registered["jsonb"]["decoder"] is orjson.loads
+        assert registered["jsonb"]["schema"] == "pg_catalog"
+
+        encoded = registered["jsonb"]["encoder"]({"posted": datetime(2025, 1, 1, tzinfo=timezone.utc), 1: "x"})
+        assert orjson.loads(encoded) == {"posted": "2025-01-01T00:00:00+00:00", "1": "x"}
+
+    asyncio.run(run_test())
+
+
+def test_review_params_bind_native_objects():
+    review = {
+        "recommend": True,
+        "confidence": "high",
+        "rationale": "fit",
+        "personas": [{"id": "north_star"}],
+        "tradeoffs": [],
+        "crew_output": {"final": {"recommend": True}},
+        "tldr_summary": "Short",
+    }
+
+    params = DatabaseService()._job_review_params("job-1", review)
+
+    assert params[4] == [{"id": "north_star"}]
+    assert params[5] is None
+    assert params[9] == {"final": {"recommend": True}, "tldr_summary": "Short"}
@@ -0,0 +1,42 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.database import DatabaseService
+
+
+def _service(conn):
+    service = DatabaseService()
+    service.initialized = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    return service
+
+
+def test_check_duplicate_groups_reports_and_repairs_drift():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            {"group_key": "acme|engineer|austin", "issue": "duplicate_count"},
+            {"group_key": "00000000-0000-0000-0000-000000000001", "issue": "missing"},
+        ])
+        conn.execute = AsyncMock(return_value="SELECT 1")
+        service = _service(conn)
+
+        report = await service.check_duplicate_groups()
+        assert report["consistent"] is False
+        assert report["issue_count"] == 2
+        assert report["repaired"] == 0
+        conn.execute.assert_not_awaited()
+
+        repaired = await service.check_duplicate_groups(repair=True)
+        assert repaired["repaired"] == 2
+        assert [call.args[1] for call in conn.execute.await_args_list] == [
+            "acme|engineer|austin",
+            "00000000-0000-0000-0000-000000000001",
+        ]
+
+    asyncio.run(run_test())
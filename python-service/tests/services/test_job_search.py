@@ -0,0 +1,156 @@
+import asyncio
+import html
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure import database
+from app.services.infrastructure.database import DatabaseService
+from app.services.infrastructure.pg_search import PGSearchTool
+
+
+def _service(conn):
+    service = DatabaseService()
+    service.initialized = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    service.read_pool = service.pool
+    return service
+
+
+def _row(job_id, rank):
+    return {
+        "id": job_id,
+        "site": "indeed",
+        "job_url": f"https://example.com/{job_id}",
+        "title": "Staff Engineer",
+        "company": "Acme",
+        "is_remote": True,
+        "date_posted": None,
+        "rank": rank,
+        "location": "Austin, TX",
+        "title_highlight": "Staff <mark>Engineer</mark>",
+        "snippet": "Build <mark>engineering</mark> platforms",
+    }
+
+
+def test_search_jobs_ranks_with_tsquery_and_detects_next_page():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[_row("a", 0.9), _row("b", 0.5), _row("c", 0.1)])
+        service = _service(conn)
+
+        result = await service.search_jobs("  staff engineer ", limit=2, site="Indeed")
+
+        sql, *params = conn.fetch.await_args.args
+        assert "websearch_to_tsquery('english', $1)" in sql
+        assert "search_vector @@" in sql
+        assert params == ["staff engineer", "Indeed", False, 3, 0, True]
+        assert [r["job_id"] for r in result["results"]] == ["a", "b"]
+        assert result["has_more"] is True
+        assert result["results"][0]["snippet"] == "Build <mark>engineering</mark> platforms"
+
+        # Statement text is identical with and without the optional filter
+        await service.search_jobs("staff engineer", limit=2)
+        assert conn.fetch.await_args.args[0] == sql
+
+    asyncio.run(run_test())
+
+
+def test_search_jobs_skips_database_for_blank_query():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock()
+        service = _service(conn)
+
+        result = await service.search_jobs("   ")
+
+        assert result == {"query": "", "results": [], "has_more": False}
+        conn.fetch.assert_not_awaited()
+
+    asyncio.run(run_test())
+
+
+def test_pg_search_tool_uses_ranked_search():
+    async def run_test():
+        db_service = MagicMock()
+        db_service.search_jobs = AsyncMock(return_value={"query": "python", "results": [{"job_id": "a"}], "has_more": False})
+
+        with patch("app.services.infrastructure.pg_search.get_database_service", return_value=db_service):
+            tool = PGSearchTool()
+            results = await tool.search_jobs("python", limit=3)
+
+        assert results == [{"job_id": "a"}]
+        db_service.search_jobs.assert_awaited_once_with("python", limit=3)
+
+    asyncio.run(run_test())
+
+
+def test_job_facets_group_rows_by_facet():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            {"facet": "companies", "value": "Acme", "count": 7},
+            {"facet": "companies", "value": "Globex", "count": 3},
+            {"facet": "sites", "value": "indeed", "count": 10},
+            {"facet": "statuses", "value": "pending_review", "count": 10},
+            {"facet": "total", "value": None, "count": 10},
+        ])
+        service = _service(conn)
+
+        result = await service.get_job_facets(top_n=2, company="ac_me")
+
+        sql, *params = conn.fetch.await_args.args
+        assert "GROUPING SETS" in sql
+        assert params[1] == "%ac\\_me%"
+        assert params[-1] == 2
+        assert result["total"] == 10
+        assert result["facets"]["companies"] == [{"value": "Acme", "count": 7}, {"value": "Globex", "count": 3}]
+        assert result["facets"]["sites"] == [{"value": "indeed", "count": 10}]
+
+    asyncio.run(run_test())
+
+
+def test_typeahead_uses_escaped_prefix_and_rejects_unknown_fields():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[{"value": "Acme 100%", "count": 2}])
+        service = _service(conn)
+
+        suggestions = await service.typeahead("company", "Acme 100%", limit=5)
+
+        sql, prefix, limit = conn.fetch.await_args.args
+        assert "j.company ILIKE $1" in sql
+        assert prefix == "Acme 100\\%%"
+        assert limit == 5
+        assert suggestions == [{"value": "Acme 100%", "count": 2}]
+
+        with pytest.raises(ValueError):
+            await service.typeahead("description", "x")
+
+    asyncio.run(run_test())
+
+
+def test_search_highlights_are_built_over_html_escaped_text():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[])
+        await _service(conn).search_jobs("engineer")
+
+        sql = conn.fetch.await_args.args[0]
+        for column in ("r.title", "r.description"):
+            escaped = database._html_escape_sql(f"COALESCE({column}, '')")
+            assert f"ts_headline('english', {escaped}, q.query," in sql
+
+    asyncio.run(run_test())
+
+    # The SQL replace chain produces exactly what html.escape would
+    scraped = """<script>alert('x')</script> R&D "lead" &amp;"""
+    escaped = scraped
+    for char, entity in database._HTML_ESCAPES:
+        escaped = escaped.replace(char, entity)
+    assert escaped == html.escape(scraped)
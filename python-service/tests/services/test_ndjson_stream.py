@@ -0,0 +1,44 @@
+import asyncio
+import gzip
+import os
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.ndjson_stream import iter_ndjson_lines
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _read(data: bytes, size: int = 7, **kwargs):
+    async def run_test():
+        return [item async for item in iter_ndjson_lines(_chunks(data, size), **kwargs)]
+    return asyncio.run(run_test())
+
+
+def test_lines_split_across_chunks_are_reassembled():
+    body = b'{"title": "a"}\n\n{"title": "b"}\r\n{"title": "c"}'
+
+    assert _read(body) == [(1, b'{"title": "a"}'), (3, b'{"title": "b"}'), (4, b'{"title": "c"}')]
+
+
+def test_gzip_body_is_decompressed_incrementally():
+    lines = [f'{{"job_url": "https://example.com/{n}"}}'.encode() for n in range(500)]
+    body = gzip.compress(b"\n".join(lines) + b"\n")
+
+    result = _read(body, size=64, gzipped=True)
+
+    assert [line for _, line in result] == lines
+    assert result[-1][0] == 500
+
+
+def test_oversized_line_and_truncated_gzip_are_rejected():
+    with pytest.raises(ValueError, match="line 2 exceeds"):
+        _read(b'{"a": 1}\n' + b"x" * 100, max_line_bytes=50)
+
+    with pytest.raises(ValueError, match="truncated gzip"):
+        _read(gzip.compress(b'{"a": 1}\n')[:-8], gzipped=True)
@@ -0,0 +1,121 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure import database
+from app.services.infrastructure.database import DatabaseService
+from app.services.infrastructure.pool_telemetry import InstrumentedPool, pool_telemetry
+
+
+def test_instrumented_pool_records_wait_in_use_and_call_site():
+    async def lookup(pool):
+        async with pool.acquire() as conn:
+            snapshot = pool_telemetry.snapshot()
+            assert snapshot["pools"]["test"]["in_use"] == 1
+            return conn
+
+    async def run_test():
+        pool_telemetry.reset()
+        raw = Mock(acquire=AsyncMock(return_value="conn"), release=AsyncMock(), close=AsyncMock())
+        pool = InstrumentedPool(raw, "test", max_size=3)
+
+        assert await lookup(pool) == "conn"
+        raw.release.assert_awaited_once_with("conn")
+
+        snapshot = pool_telemetry.snapshot()
+        stats = snapshot["pools"]["test"]
+        assert stats["acquires"] == 1
+        assert stats["in_use"] == 0
+        assert stats["max_size"] == 3
+        assert sum(stats["wait_histogram"].values()) == 1
+        site = f"{__name__}.lookup"
+        assert snapshot["call_sites"][site]["calls"] == 1
+
+        await pool.close()
+        assert pool_telemetry.snapshot()["pools"]["test"]["instances"] == 0
+
+    asyncio.run(run_test())
+
+
+def test_pool_max_size_is_capped_by_server_max_connections():
+    async def run_test():
+        service = DatabaseService()
+        service.settings = Mock(
+            database_url="postgresql://db/test",
+            database_pool_min_size=1,
+            database_pool_max_size=20,
+            database_pool_max_share=0.25,
+            database_read_pool_size=2,
+        )
+        # The read pool's connections come out of the same share as the main pool's
+        with patch.object(database, "_probe_server_max_connections", AsyncMock(return_value=40)):
+            assert await service._pool_max_size() == 8
+            assert await service._pool_budget() == (8, 2)
+        with patch.object(database, "_probe_server_max_connections", AsyncMock(return_value=8)):
+            assert await service._pool_budget() == (1, 1)
+        with patch.object(database, "_probe_server_max_connections", AsyncMock(side_effect=OSError("down"))):
+            assert await service._pool_max_size() == 20
+
+    asyncio.run(run_test())
+
+
+def test_read_pool_is_shared_across_services_and_closed_once():
+    async def run_test():
+        await database.close_shared_pools()
+        created = []
+
+        async def create_pool(name, min_size, max_size, dsn=None):
+            pool = Mock(close=AsyncMock())
+            created.append((name, max_size, pool))
+            return pool
+
+        services = [DatabaseService(), DatabaseService()]
+        for service in services:
+            service.pool = Mock(close=AsyncMock())
+            service._create_pool = create_pool
+            service._pool_budget = AsyncMock(return_value=(3, 2))
+
+        pools = [await service._get_primary_read_pool() for service in services]
+        assert pools[0] is pools[1] is created[0][2]
+        assert [(name, size) for name, size, _ in created] == [("read", 2)]
+
+        # A short-lived service closing does not take the shared pool with it
+        await services[0].close()
+        pools[0].close.assert_not_awaited()
+        assert await services[1]._get_primary_read_pool() is pools[0]
+
+        await database.close_shared_pools()
+        pools[0].close.assert_awaited_once()
+
+    asyncio.run(run_test())
+
+
+def test_database_service_is_shared_per_event_loop():
+    async def current():
+        return database.get_database_service()
+
+    async def run_test():
+        service = database.get_database_service()
+        assert await current() is service
+
+        # Loop-bound pools: an instance initialized on another loop reports not ready
+        service.initialized = True
+        service._loop = asyncio.get_running_loop()
+        assert service.initialized is True
+        return service
+
+    first = asyncio.run(run_test())
+    second = asyncio.run(run_test())
+    assert second is not first
+    assert first.initialized is False
+
+    with patch.object(database, "_services_pid", -1):
+        loop = asyncio.new_event_loop()
+        try:
+            service = loop.run_until_complete(current())
+            assert loop.run_until_complete(current()) is service
+            assert database._services_pid == os.getpid()
+        finally:
+            loop.close()
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import orjson
+
+from app.api.v1.endpoints.events import progress_stream
+from app.services.infrastructure import progress_events
+from app.services.infrastructure.progress_events import (
+    OVERFLOW,
+    ProgressEventHub,
+    publish_progress_event,
+)
+
+
+def test_publish_appends_capped_stream_entry():
+    connection = MagicMock()
+    connection.xadd.return_value = b"1700000000000-0"
+
+    event_id = publish_progress_event("scrape_run", {"run_id": "run_1", "status": "running"}, connection)
+
+    assert event_id == "1700000000000-0"
+    args, kwargs = connection.xadd.call_args
+    assert args[0] == progress_events.STREAM_KEY
+    assert orjson.loads(args[1]["data"]) == {"run_id": "run_1", "status": "running"}
+    assert kwargs["approximate"] is True
+
+
+def test_publish_failure_is_swallowed():
+    connection = MagicMock()
+    connection.xadd.side_effect = ConnectionError("redis down")
+
+    assert publish_progress_event("job_review", {"job_id": "j1"}, connection) is None
+
+
+def test_slow_subscriber_is_dropped_with_overflow_marker():
+    async def run_test():
+        hub = ProgressEventHub()
+        hub.settings.progress_events_subscriber_buffer = 2
+        with patch.object(hub, "start"):
+            fast = await hub.subscribe()
+            slow = await hub.subscribe()
+
+        for n in range(2):
+            hub.dispatch((f"1-{n}", "job_review", {"job_id": "j1"}))
+            fast.get_nowait()
+        hub.dispatch(("1-2", "job_review", {"job_id": "j1"}))
+
+        assert hub.subscriber_count == 1
+        assert hub.stats["overflows"] == 1
+        assert slow.get_nowait()[0] == "1-1"
+        assert slow.get_nowait() is OVERFLOW
+
+    asyncio.run(run_test())
+
+
+def test_stream_replays_missed_events_then_skips_duplicates():
+    async def run_test():
+        hub = ProgressEventHub()
+        hub.replay = AsyncMock(return_value=[
+            ("5-0", "scrape_run", {"run_id": "run_1", "status": "running"}),
+            ("6-0", "scrape_run", {"run_id": "run_2", "status": "running"}),
+        ])
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(side_effect=[False, False, True])
+
+        with patch.object(progress_events, "progress_event_hub", hub), \
+             patch("app.api.v1.endpoints.events.progress_event_hub", hub), \
+             patch.object(hub, "start"):
+            stream = progress_stream(request, "4-0", None, "run_1", None)
+            chunks = [await stream.__anext__(), await stream.__anext__()]
+
+            # Already replayed, then a new live event for the watched run
+            hub.dispatch(("6-0", "scrape_run", {"run_id": "run_2", "status": "running"}))
+            hub.dispatch(("7-0", "scrape_run", {"run_id": "run_1", "status": "succeeded"}))
+            chunks += [chunk async for chunk in stream]
+
+        assert chunks[0].startswith("retry:")
+        assert chunks[1].startswith("id: 5-0\nevent: scrape_run\n")
+        assert len(chunks) == 3
+        assert chunks[2].startswith("id: 7-0\n")
+        assert '"status":"succeeded"' in chunks[2]
+        hub.replay.assert_awaited_once_with("4-0")
+        assert hub.subscriber_count == 0
+
+    asyncio.run(run_test())
+
+
+def test_reader_starts_from_stream_tail_and_stops_with_last_subscriber():
+    async def run_test():
+        hub = ProgressEventHub()
+        hub.redis_conn = MagicMock()
+        hub.redis_conn.xrevrange.return_value = [(b"3-0", {b"type": b"scrape_run", b"data": b"{}"})]
+        reads = []
+
+        def xread(streams, count, block):
+            reads.append(dict(streams))
+            if len(reads) == 1:
+                # Published after subscribe returned, before the reader's first XREAD
+                fields = {b"type": b"scrape_run", b"data": b'{"run_id": "run_1", "status": "started"}'}
+                return [[progress_events.STREAM_KEY.encode(), [(b"4-0", fields)]]]
+            time.sleep(0.01)
+            return []
+
+        hub.redis_conn.xread.side_effect = xread
+        queue = await hub.subscribe()
+
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        assert event == ("4-0", "scrape_run", {"run_id": "run_1", "status": "started"})
+        assert reads[0] == {progress_events.STREAM_KEY: "3-0"}
+
+        task = hub._task
+        hub.unsubscribe(queue)
+        await asyncio.sleep(0)
+        assert task.cancelled() or task.done()
+        assert hub.snapshot()["running"] is False
+
+    asyncio.run(run_test())
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+from app.services.infrastructure.query_builder import QueryBuilder, StatementStats
+
+
+def test_optional_filters_keep_a_single_statement_shape():
+    def render(site, remote):
+        query = QueryBuilder()
+        where = " AND ".join([
+            query.optional("jd.site = {}", site, "text"),
+            query.optional("jd.is_remote = {}", remote, "boolean"),
+        ])
+        return where, query.params
+
+    unfiltered, unfiltered_params = render(None, None)
+    filtered, filtered_params = render("indeed", True)
+
+    assert unfiltered == filtered == (
+        "($1::text IS NULL OR jd.site = $1::text) AND ($2::boolean IS NULL OR jd.is_remote = $2::boolean)"
+    )
+    assert unfiltered_params == [None, None]
+    assert filtered_params == ["indeed", True]
+
+
+def test_statement_stats_track_hits_per_connection_lru():
+    stats = StatementStats(cache_size=1)
+    conn_a = Mock(get_server_pid=Mock(return_value=101))
+    conn_b = Mock(get_server_pid=Mock(return_value=202))
+
+    stats.record(conn_a, "page", "SELECT 1")
+    stats.record(conn_a, "page", "SELECT 1")
+    stats.record(conn_b, "page", "SELECT 1")
+    stats.record(conn_a, "count", "SELECT 2")  # evicts SELECT 1 on conn_a
+    stats.record(conn_a, "page", "SELECT 1")
+
+    snapshot = stats.snapshot()
+    assert snapshot["statements"]["page"] == {
+        "executions": 4,
+        "cache_hits": 1,
+        "hit_rate": 0.25,
+        "distinct_shapes": 1,
+    }
+    assert snapshot["connections_tracked"] == 2
+
+
+def test_statement_stats_forget_closed_connections():
+    stats = StatementStats()
+    listeners = []
+    conn = Mock(get_server_pid=Mock(return_value=303), add_termination_listener=listeners.append)
+
+    stats.record(conn, "page", "SELECT 1")
+    stats.record(conn, "page", "SELECT 1")
+    assert len(listeners) == 1
+    assert stats.snapshot()["connections_tracked"] == 1
+
+    # asyncpg calls termination listeners when the pool closes an idle connection
+    listeners[0](conn)
+    assert stats.snapshot()["connections_tracked"] == 0
+    assert stats.snapshot()["statements"]["page"]["executions"] == 2
@@ -0,0 +1,83 @@
+import os
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.locks import LOCK_REGISTRY_KEY, LockHeartbeat
+from app.services.infrastructure.queue import QueueService
+
+
+def _queue_service(redis_conn):
+    service = QueueService()
+    service.redis_conn = redis_conn
+    service.initialized = True
+    return service
+
+
+def test_clear_orphaned_locks_reads_registry_instead_of_keys():
+    recent = datetime.now().isoformat()
+    values = {
+        "scrape_lock:indeed": f"run_orphan:{recent}".encode(),
+        "scrape_lock:linkedin": f"run_active:{recent}".encode(),
+    }
+
+    redis_conn = Mock()
+    redis_conn.keys.side_effect = AssertionError("KEYS must not be used")
+    redis_conn.zremrangebyscore.return_value = 2
+    redis_conn.zrange.return_value = [
+        (b"scrape_lock:indeed", 1.0),
+        (b"scrape_lock:linkedin", 2.0),
+        (b"site_active_job:glassdoor", 3.0),
+    ]
+    redis_conn.get.side_effect = lambda key: values.get(key)
+
+    active_job = Mock(is_started=True, is_queued=False)
+
+    def fetch(run_id, connection):
+        if run_id == "run_active":
+            return active_job
+        raise LookupError(run_id)
+
+    with patch("rq.job.Job.fetch", side_effect=fetch):
+        result = _queue_service(redis_conn).clear_orphaned_locks(pattern="scrape_lock:*")
+
+    assert result["locks_cleared"] == 1
+    assert result["locks_skipped"] == 1
+    assert result["expired_registry_entries"] == 2
+    assert result["cleared_details"][0]["key"] == "scrape_lock:indeed"
+    redis_conn.delete.assert_called_once_with("scrape_lock:indeed")
+    redis_conn.zrem.assert_called_once_with(LOCK_REGISTRY_KEY, "scrape_lock:indeed")
+    redis_conn.scan_iter.assert_not_called()
+
+
+def test_clear_orphaned_locks_scans_for_legacy_locks_when_requested():
+    stale = (datetime.now() - timedelta(hours=48)).isoformat()
+
+    redis_conn = Mock()
+    redis_conn.zremrangebyscore.return_value = 0
+    redis_conn.zrange.return_value = []
+    redis_conn.scan_iter.return_value = iter([b"scrape_lock:legacy"])
+    redis_conn.get.return_value = f"run_old:{stale}".encode()
+
+    result = _queue_service(redis_conn).clear_orphaned_locks(pattern="scrape_lock:*", scan_legacy=True)
+
+    redis_conn.scan_iter.assert_called_once_with(match="scrape_lock:*", count=500)
+    assert result["legacy_locks_scanned"] == 1
+    assert result["locks_cleared"] == 1
+    assert result["cleared_details"][0]["reason"].startswith("too_old_")
+    redis_conn.delete.assert_called_once_with("scrape_lock:legacy")
+
+
+def test_lock_heartbeat_shrinks_lease_and_releases_on_exit():
+    redis_conn = Mock()
+    redis_conn.eval.return_value = 1
+
+    with LockHeartbeat(redis_conn, "site_active_job:indeed", "run_1:ts", lease_seconds=90):
+        pass
+
+    calls = redis_conn.eval.call_args_list
+    # First call extends the lease to 90s, last call releases the lock
+    assert calls[0].args[2:6] == ("site_active_job:indeed", LOCK_REGISTRY_KEY, "run_1:ts", 90)
+    assert "DEL" in calls[-1].args[0]
+    assert calls[-1].args[2:] == ("site_active_job:indeed", LOCK_REGISTRY_KEY, "run_1:ts")
@@ -0,0 +1,58 @@
+import json
+import os
+from unittest.mock import Mock
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.dead_letter import DEAD_LETTER_KEY
+from app.services.infrastructure.queue import QueueService
+
+
+def _queue_service(existing_status=None, claim_acquired=True):
+    service = QueueService()
+    service.redis_conn = Mock()
+    service.redis_conn.set.return_value = claim_acquired
+    service.review_queue = Mock()
+    if existing_status is None:
+        service.review_queue.fetch_job.return_value = None
+    else:
+        service.review_queue.fetch_job.return_value = Mock(get_status=Mock(return_value=existing_status))
+    service.review_queue.enqueue.side_effect = lambda *args, **kwargs: Mock(id=kwargs["job_id"])
+    service.initialized = True
+    return service
+
+
+def test_review_enqueue_uses_deterministic_id_per_attempt():
+    service = _queue_service()
+
+    task_id = service.enqueue_job_review("job-1", max_retries=3, attempt=2)
+
+    assert task_id == "review-job-1-2"
+    assert service.review_queue.enqueue.call_args.kwargs["job_id"] == "review-job-1-2"
+    service.redis_conn.delete.assert_called_once_with("enqueue_claim:review-job-1-2")
+
+
+def test_review_enqueue_skips_job_that_is_already_pending():
+    queued = _queue_service(existing_status="queued")
+    assert queued.enqueue_job_review("job-1") == "review-job-1-0"
+    queued.review_queue.enqueue.assert_not_called()
+
+    racing = _queue_service(claim_acquired=False)
+    assert racing.enqueue_job_review("job-1") == "review-job-1-0"
+    racing.review_queue.fetch_job.assert_not_called()
+    racing.review_queue.enqueue.assert_not_called()
+
+    finished = _queue_service(existing_status="finished")
+    assert finished.enqueue_job_review("job-1") == "review-job-1-0"
+    finished.review_queue.enqueue.assert_called_once()
+
+
+def test_replay_dead_letter_enqueues_first_attempt_and_removes_entry():
+    service = _queue_service()
+    service.redis_conn.hget.return_value = json.dumps({"job_id": "job-1", "max_retries": 5})
+
+    task_id = service.replay_dead_letter("job-1")
+
+    assert task_id == "review-job-1-0"
+    assert service.review_queue.enqueue.call_args.args[1:] == ("job-1", 5)
+    service.redis_conn.hdel.assert_called_once_with(DEAD_LETTER_KEY, "job-1")
@@ -0,0 +1,104 @@
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.database import DatabaseService
+from app.services.infrastructure.reference_cache import (
+    MISSING,
+    ReferenceCache,
+    ReferenceCacheListener,
+    reference_cache,
+)
+
+
+def _service(conn):
+    service = DatabaseService()
+    service.initialized = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    return service
+
+
+def test_entries_expire_and_count_hits():
+    now = [100.0]
+    cache = ReferenceCache(ttl_seconds=10, clock=lambda: now[0])
+
+    assert cache.get("statuses", "Draft") is MISSING
+    cache.set("statuses", "Draft", "status-1")
+    assert cache.get("statuses", "Draft") == "status-1"
+
+    now[0] += 11
+    assert cache.get("statuses", "Draft") is MISSING
+
+    stats = cache.snapshot()["namespaces"]["statuses"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expired"] == 1
+    assert stats["hit_rate"] == round(1 / 3, 4)
+
+
+def test_notification_invalidates_only_the_changed_table():
+    cache = ReferenceCache()
+    cache.set("companies", ("acme", None), {"company_id": "c1"})
+    cache.set("statuses", "Draft", "status-1")
+
+    listener = ReferenceCacheListener(cache)
+    listener.handle_notification("companies")
+    listener.handle_notification("unrelated_table")
+
+    assert cache.get("companies", ("acme", None)) is MISSING
+    assert cache.get("statuses", "Draft") == "status-1"
+
+
+def test_company_lookup_is_cached_until_a_company_write():
+    async def run_test():
+        reference_cache.reset()
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(side_effect=[
+            {"company_id": "c1", "company_name": "Acme", "normalized_name": "acme", "company_url": ""},
+            {"company_id": "c1", "company_name": "Acme Corp", "normalized_name": "acme", "company_url": ""},
+        ])
+        conn.fetchval = AsyncMock(return_value=True)
+        conn.execute = AsyncMock(return_value="UPDATE 1")
+        service = _service(conn)
+
+        first = await service.get_company_by_normalized_name("acme", "user-1")
+        second = await service.get_company_by_normalized_name("acme", "user-1")
+        assert first == second
+        assert conn.fetchrow.await_count == 1
+
+        assert await service.update_company("c1", {"company_name": "Acme Corp"})
+        refreshed = await service.get_company_by_normalized_name("acme", "user-1")
+        assert refreshed["company_name"] == "Acme Corp"
+        assert conn.fetchrow.await_count == 2
+
+    asyncio.run(run_test())
+
+
+def test_site_schedules_share_one_cached_read_for_due_and_all():
+    async def run_test():
+        reference_cache.reset()
+        now = datetime.now(timezone.utc)
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            {"id": "due", "site_name": "indeed", "next_run_at": now - timedelta(minutes=1)},
+            {"id": "later", "site_name": "linkedin", "next_run_at": now + timedelta(hours=1)},
+        ])
+        service = _service(conn)
+
+        all_schedules = await service.get_enabled_site_schedules(due_only=False)
+        due = await service.get_enabled_site_schedules()
+
+        assert [s["id"] for s in all_schedules] == ["due", "later"]
+        assert [s["id"] for s in due] == ["due"]
+        conn.fetch.assert_awaited_once()
+
+        # Callers get copies, not the cached rows
+        due[0]["next_run_at"] = None
+        assert (await service.get_enabled_site_schedules())[0]["next_run_at"] is not None
+
+    asyncio.run(run_test())
@@ -0,0 +1,103 @@
+import asyncio
+import copy
+import os
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure import database
+from app.services.infrastructure.database import DatabaseService
+
+
+def _pool(conn, fail=False):
+    pool = MagicMock()
+    if fail:
+        pool.acquire.return_value.__aenter__ = AsyncMock(side_effect=OSError("connection refused"))
+    else:
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pool
+
+
+def _service(replica_lag=0.0, replica_down=False):
+    database._replica_status.update(
+        available=True, lag_seconds=None, checked_at=0.0, error=None,
+        replica_reads=0, primary_reads=0, lagging_reads=0,
+    )
+    service = DatabaseService()
+    service.initialized = True
+    service.settings = Mock(
+        database_replica_url="postgresql://replica/test",
+        database_replica_max_lag_seconds=10,
+        database_replica_check_seconds=5,
+    )
+    service.primary_conn = Mock(name="primary")
+    service.replica_conn = Mock(name="replica", fetchval=AsyncMock(return_value=replica_lag))
+    service.pool = _pool(service.primary_conn)
+    service.read_pool = service.pool
+    service.replica_pool = _pool(service.replica_conn)
+    if replica_down:
+        # Lag check succeeds on the existing connection, the next acquire fails
+        service.replica_pool.acquire.return_value.__aenter__ = AsyncMock(
+            side_effect=[service.replica_conn, OSError("connection refused")]
+        )
+    return service
+
+
+async def _route(service, stale_ok):
+    async with service.read_connection(stale_ok=stale_ok) as conn:
+        return conn
+
+
+def test_stale_tolerant_reads_use_a_caught_up_replica():
+    service = _service(replica_lag=0.5)
+
+    assert asyncio.run(_route(service, stale_ok=True)) is service.replica_conn
+    assert asyncio.run(_route(service, stale_ok=False)) is service.primary_conn
+    assert DatabaseService.replica_status()["replica_reads"] == 1
+
+
+def test_lagging_replica_falls_back_to_primary():
+    service = _service(replica_lag=60)
+
+    assert asyncio.run(_route(service, stale_ok=True)) is service.primary_conn
+    assert DatabaseService.replica_status()["lagging_reads"] == 1
+
+
+def test_unreachable_replica_falls_back_and_is_skipped_until_next_check():
+    service = _service(replica_down=True)
+
+    assert asyncio.run(_route(service, stale_ok=True)) is service.primary_conn
+    status = DatabaseService.replica_status()
+    assert status["available"] is False
+    assert "connection refused" in status["error"]
+
+    service.replica_pool.acquire.reset_mock()
+    assert asyncio.run(_route(service, stale_ok=True)) is service.primary_conn
+    service.replica_pool.acquire.assert_not_called()
+
+
+@pytest.mark.skipif(
+    not (os.getenv("TEST_PRIMARY_DATABASE_URL") and os.getenv("TEST_REPLICA_DATABASE_URL")),
+    reason="set TEST_PRIMARY_DATABASE_URL and TEST_REPLICA_DATABASE_URL to two local Postgres instances",
+)
+def test_routing_against_two_local_postgres_instances():
+    async def run_test():
+        database._replica_status.update(available=True, lag_seconds=None, checked_at=0.0, error=None)
+        service = DatabaseService()
+        service.settings = copy.copy(service.settings)
+        service.settings.database_url = os.environ["TEST_PRIMARY_DATABASE_URL"]
+        service.settings.database_replica_url = os.environ["TEST_REPLICA_DATABASE_URL"]
+        assert await service.initialize()
+        try:
+            async with service.read_connection(stale_ok=False) as conn:
+                primary_port = await conn.fetchval("SELECT inet_server_port()")
+            async with service.read_connection(stale_ok=True) as conn:
+                replica_port = await conn.fetchval("SELECT inet_server_port()")
+            assert primary_port != replica_port
+        finally:
+            await service.close()
+
+    asyncio.run(run_test())
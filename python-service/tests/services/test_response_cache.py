@@ -0,0 +1,136 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.response_cache import MemoryBackend, ResponseCache
+from app.core.compression import CompressionMiddleware
+
+
+def _client(cache, state):
+    app = FastAPI()
+
+    async def build():
+        state["builds"] += 1
+        if state.get("fail"):
+            raise HTTPException(status_code=500, detail="boom")
+        return {"value": state["value"]}
+
+    @app.get("/versioned")
+    async def versioned(request: Request):
+        return await cache.respond(request, "versioned", build, ttl=60, version=state["version"])
+
+    @app.get("/ttl")
+    async def ttl(request: Request):
+        return await cache.respond(request, "ttl", build, ttl=60)
+
+    return TestClient(app)
+
+
+def test_versioned_etag_answers_304_without_building():
+    cache = ResponseCache(MemoryBackend(10))
+    state = {"builds": 0, "value": 1, "version": ("2025-10-06", 3)}
+    client = _client(cache, state)
+
+    first = client.get("/versioned")
+    assert first.status_code == 200
+    assert first.json() == {"value": 1}
+    etag = first.headers["etag"]
+
+    revalidated = client.get("/versioned", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert client.get("/versioned").headers["x-cache"] == "HIT"
+    assert state["builds"] == 1
+
+    state["version"] = ("2025-10-06", 4)
+    state["value"] = 2
+    changed = client.get("/versioned", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json() == {"value": 2}
+    assert changed.headers["etag"] != etag
+    assert state["builds"] == 2
+
+
+def test_query_string_variants_are_cached_separately():
+    cache = ResponseCache(MemoryBackend(10))
+    state = {"builds": 0, "value": 1, "version": 1}
+    client = _client(cache, state)
+
+    a = client.get("/versioned?limit=10&offset=0")
+    b = client.get("/versioned?offset=0&limit=10")
+    c = client.get("/versioned?limit=20")
+
+    assert a.headers["etag"] == b.headers["etag"] != c.headers["etag"]
+    assert state["builds"] == 2
+
+
+def test_ttl_mode_serves_cached_body_until_invalidated():
+    cache = ResponseCache(MemoryBackend(10))
+    state = {"builds": 0, "value": 1}
+    client = _client(cache, state)
+
+    etag = client.get("/ttl").headers["etag"]
+    state["value"] = 2
+    assert client.get("/ttl", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/ttl").json() == {"value": 1}
+    assert state["builds"] == 1
+
+    cache.invalidate("ttl")
+    refreshed = client.get("/ttl", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json() == {"value": 2}
+
+    stats = cache.snapshot()["endpoints"]["ttl"]
+    assert stats == {"not_modified": 1, "hits": 1, "misses": 2, "requests": 4, "served_from_cache_rate": 0.5}
+
+
+def test_errors_are_not_cached():
+    cache = ResponseCache(MemoryBackend(10))
+    state = {"builds": 0, "value": 1, "fail": True}
+    client = _client(cache, state)
+
+    assert client.get("/ttl").status_code == 500
+    state["fail"] = False
+    assert client.get("/ttl").status_code == 200
+    assert state["builds"] == 2
+
+
+def test_compression_applies_above_threshold_only():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/text")
+    async def text(size: int):
+        return PlainTextResponse("x" * size)
+
+    client = TestClient(app)
+
+    large = client.get("/text?size=5000", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.text == "x" * 5000
+
+    small = client.get("/text?size=10", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    refused = client.get("/text?size=5000", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+
+
+def test_ndjson_streams_are_not_compressed():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/progress")
+    async def progress():
+        async def lines():
+            for n in range(50):
+                yield f'{{"chunk": {n}, "padding": "{"x" * 100}"}}\n'
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    response = TestClient(app).get("/progress", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert len(response.text.splitlines()) == 50
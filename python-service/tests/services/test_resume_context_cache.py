@@ -0,0 +1,125 @@
+import asyncio
+import os
+import re
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.database import RESUME_CONTEXT_QUERY, DatabaseService
+from app.services.infrastructure.reference_cache import reference_cache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+def _service(conn):
+    service = DatabaseService()
+    service.initialized = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    service.read_pool = service.pool
+    return service
+
+
+def _context_row(version, roles):
+    return {
+        "version": version,
+        "default_resume": {"resume_id": "r1", "resume_name": "Main"},
+        "standard_job_roles": roles,
+        "strategic_narratives": ["Builder of platforms"],
+    }
+
+
+def test_resume_context_is_reused_until_the_version_changes():
+    async def run_test():
+        reference_cache.reset()
+        fake_redis = FakeRedis()
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(side_effect=[3, 3, 4])
+        conn.fetchrow = AsyncMock(side_effect=[
+            _context_row(3, ["Staff Engineer"]),
+            _context_row(4, ["Staff Engineer", "Architect"]),
+        ])
+        service = _service(conn)
+
+        with patch("app.services.infrastructure.database._get_resume_cache_redis", return_value=fake_redis):
+            first = await service.get_user_resume_context("user-1")
+            first["standard_job_roles"].append("mutated by caller")
+            second = await service.get_user_resume_context("user-1")
+            third = await service.get_user_resume_context("user-1")
+
+        assert second["standard_job_roles"] == ["Staff Engineer"]
+        assert third["standard_job_roles"] == ["Staff Engineer", "Architect"]
+        assert conn.fetchrow.await_count == 2
+        assert set(fake_redis.store) == {"resume_context:user-1:3", "resume_context:user-1:4"}
+
+    asyncio.run(run_test())
+
+
+def test_resume_context_is_shared_through_redis_across_processes():
+    async def run_test():
+        reference_cache.reset()
+        fake_redis = FakeRedis()
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value=7)
+        conn.fetchrow = AsyncMock(return_value=_context_row(7, ["Staff Engineer"]))
+        service = _service(conn)
+
+        with patch("app.services.infrastructure.database._get_resume_cache_redis", return_value=fake_redis):
+            await service.get_user_resume_context("user-1")
+            # A forked worker starts with an empty in-process cache
+            reference_cache.reset()
+            context = await service.get_user_resume_context("user-1")
+
+        assert context["default_resume"] == {"resume_id": "r1", "resume_name": "Main"}
+        conn.fetchrow.assert_awaited_once()
+
+    asyncio.run(run_test())
+
+
+SQITCH_DIR = Path(__file__).resolve().parents[3] / "DB Scripts" / "sqitch"
+
+
+def _schema_columns():
+    """Table -> columns, from the deploy scripts in sqitch.plan order."""
+    tables = {}
+    plan = (SQITCH_DIR / "sqitch.plan").read_text().splitlines()
+    changes = [line.split()[0] for line in plan if line and not line.startswith(("%", "#", "@"))]
+    for change in changes:
+        script = (SQITCH_DIR / "deploy" / f"{change}.sql").read_text()
+        for table, body in re.findall(
+            r"CREATE TABLE (?:IF NOT EXISTS )?(?:public\.)?(\w+) \((.*?)\n\);", script, re.S
+        ):
+            tables[table] = {
+                line.split()[0] for line in body.splitlines()
+                if line.strip() and not line.split()[0].upper() in ("CONSTRAINT", "PRIMARY", "UNIQUE", "FOREIGN", "CHECK")
+            }
+        for table, clauses in re.findall(r"ALTER TABLE (?:public\.)?(\w+)(.*?);", script, re.S):
+            tables.setdefault(table, set()).update(
+                re.findall(r"ADD COLUMN (?:IF NOT EXISTS )?(\w+)", clauses)
+            )
+    return tables
+
+
+def test_resume_context_query_matches_the_schema():
+    tables = _schema_columns()
+    aliases = dict(
+        (alias, table) for table, alias in re.findall(r"(?:FROM|JOIN) (\w+) (\w+)", RESUME_CONTEXT_QUERY)
+    )
+    references = re.findall(r"\b(\w+)\.(\w+)\b", RESUME_CONTEXT_QUERY)
+
+    assert set(aliases.values()) == {"resume_context_versions", "strategic_narratives", "resumes", "standard_job_roles"}
+    assert references
+    for alias, column in references:
+        assert alias in aliases, f"unqualified or unknown alias {alias}.{column}"
+        assert column in tables[aliases[alias]], f"{aliases[alias]} has no column {column}"
@@ -0,0 +1,199 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure import database
+from app.services.infrastructure.database import DatabaseService
+
+
+def _row(job_id, date_posted):
+    return {
+        "job_id": job_id, "title": "Engineer", "company": "Acme", "location": "Austin, TX",
+        "url": "https://example.com", "date_posted": date_posted, "source": "indeed",
+        "description": "", "salary_min": None, "salary_max": None, "salary_currency": None,
+        "is_remote": True, "recommend": True, "confidence": "high", "rationale": "fit",
+        "overall_alignment_score": 0.9, "crew_output": None, "personas": None, "tradeoffs": None,
+        "actions": None, "sources": None, "reviewer": "v1", "review_date": date_posted,
+        "override_recommend": None, "override_comment": None, "override_by": None,
+        "override_at": None, "sort_value": date_posted,
+    }
+
+
+def _version(review_count=3, reviews_updated_at=datetime(2025, 1, 3, tzinfo=timezone.utc)):
+    return {"reviews_updated_at": reviews_updated_at, "jobs_updated_at": reviews_updated_at,
+            "review_count": review_count, "job_count": 10}
+
+
+def _service(conn):
+    if not isinstance(conn.fetchrow, AsyncMock):
+        conn.fetchrow = AsyncMock(return_value=_version())
+    service = DatabaseService()
+    service.initialized = True
+    service._column_cache[("job_reviews", "overall_alignment_score")] = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    service.read_pool = service.pool
+    return service
+
+
+def test_cursor_pages_use_keyset_and_cached_total():
+    async def run_test():
+        database.invalidate_reviewed_jobs_count_cache()
+        first = datetime(2025, 1, 3, tzinfo=timezone.utc)
+        second = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        third = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        id_1 = "00000000-0000-0000-0000-000000000001"
+        id_2 = "00000000-0000-0000-0000-000000000002"
+        id_3 = "00000000-0000-0000-0000-000000000003"
+
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value=3)
+        conn.fetch = AsyncMock(side_effect=[
+            [_row(id_1, first), _row(id_2, second), _row(id_3, third)],
+            [_row(id_3, third)],
+        ])
+        service = _service(conn)
+
+        page_one = await service.get_reviewed_jobs(limit=2, source="indeed")
+        assert page_one["has_more"] is True
+        assert page_one["page"] == 1
+        assert [job["job"]["job_id"] for job in page_one["jobs"]] == [id_1, id_2]
+
+        page_two = await service.get_reviewed_jobs(limit=2, source="indeed", cursor=page_one["next_cursor"])
+        assert page_two["has_more"] is False
+        assert page_two["next_cursor"] is None
+        assert page_two["page"] == 2
+        assert page_two["total_count"] == 3
+
+        # The total was counted once and reused for the second page
+        conn.fetchval.assert_awaited_once()
+
+        first_query, *first_params = conn.fetch.await_args_list[0].args
+        query, *params = conn.fetch.await_args_list[1].args
+        # The first page has no keyset predicate; cursor pages seek with a plain row comparison
+        assert "jd.id <" not in first_query
+        assert first_params == [None, None, None, None, "indeed", None, None, None, 3, 0]
+        assert "(jd.date_posted, jd.id) < ($9::timestamptz, $10::uuid) OR jd.date_posted IS NULL" in query
+        assert "$10::uuid IS NULL" not in query
+        assert params == [None, None, None, None, "indeed", None, None, None, second, id_2, 3, 0]
+
+    asyncio.run(run_test())
+
+
+def test_cached_total_is_recounted_when_another_process_writes_a_review():
+    async def run_test():
+        database.invalidate_reviewed_jobs_count_cache()
+        day = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(side_effect=[3, 4])
+        conn.fetch = AsyncMock(return_value=[_row("00000000-0000-0000-0000-000000000001", day)])
+        # An RQ worker inserts a review between the second and third request
+        conn.fetchrow = AsyncMock(side_effect=[_version(3), _version(3), _version(4)])
+        service = _service(conn)
+
+        totals = [(await service.get_reviewed_jobs(limit=10))["total_count"] for _ in range(3)]
+
+        assert totals == [3, 3, 4]
+        assert conn.fetchval.await_count == 2
+
+    asyncio.run(run_test())
+
+
+def test_cursor_rejected_when_filters_change():
+    async def run_test():
+        database.invalidate_reviewed_jobs_count_cache()
+        day = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value=5)
+        conn.fetch = AsyncMock(return_value=[
+            _row("00000000-0000-0000-0000-000000000001", day),
+            _row("00000000-0000-0000-0000-000000000002", day),
+        ])
+        service = _service(conn)
+
+        page_one = await service.get_reviewed_jobs(limit=1, source="indeed")
+        with pytest.raises(ValueError):
+            await service.get_reviewed_jobs(limit=1, source="linkedin", cursor=page_one["next_cursor"])
+
+    asyncio.run(run_test())
+
+
+def test_field_projection_trims_select_list_and_rows():
+    async def run_test():
+        database.invalidate_reviewed_jobs_count_cache()
+        posted = datetime(2025, 1, 3, tzinfo=timezone.utc)
+        job_id = "00000000-0000-0000-0000-000000000001"
+        row = {"job_id": job_id, "title": "Engineer", "salary_min": 100000, "salary_max": 120000,
+               "salary_currency": "USD", "tldr_summary": "Strong fit", "sort_value": posted}
+
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value=1)
+        conn.fetch = AsyncMock(return_value=[row])
+        service = _service(conn)
+
+        result = await service.get_reviewed_jobs(fields=["title", "salary_range", "tldr_summary"])
+
+        sql = conn.fetch.await_args.args[0]
+        assert "jd.description" not in sql
+        assert "jsonb_each(jr.crew_output)" not in sql
+        assert "jd.min_amount as salary_min" in sql
+        assert result["jobs"][0]["job"] == {
+            "job_id": job_id, "title": "Engineer", "salary_range": "$100k - $120k",
+        }
+        assert result["jobs"][0]["review"] == {"tldr_summary": "Strong fit"}
+
+    asyncio.run(run_test())
+
+
+def test_unknown_projection_field_is_rejected():
+    async def run_test():
+        service = _service(MagicMock())
+        with pytest.raises(ValueError, match="Unknown fields: salary"):
+            await service.get_reviewed_jobs(fields=["title", "salary"])
+
+    asyncio.run(run_test())
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+def test_export_streams_rows_in_batches_through_one_cursor():
+    async def run_test():
+        posted = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        rows = [_row(f"00000000-0000-0000-0000-00000000000{n}", posted) for n in range(1, 6)]
+
+        conn = MagicMock()
+        conn.cursor = MagicMock(return_value=_Cursor(rows))
+        conn.transaction.return_value.__aenter__ = AsyncMock()
+        conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+        service = _service(conn)
+
+        batches = [batch async for batch in service.iter_reviewed_jobs(
+            source="indeed", include_overridden=True, fields=["title"], batch_size=2
+        )]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[0][0] == {"job": {"job_id": rows[0]["job_id"], "title": "Engineer"}, "review": {}}
+        conn.transaction.assert_called_once_with(readonly=True)
+        sql, *params = conn.cursor.call_args.args
+        assert conn.cursor.call_args.kwargs["prefetch"] == 2
+        assert "override_recommend IS NULL" not in sql
+        assert "LIMIT" not in sql
+        assert "indeed" in params
+
+    asyncio.run(run_test())
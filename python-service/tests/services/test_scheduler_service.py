@@ -1,9 +1,12 @@
 import asyncio
 import os
-from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 
+from app.services.infrastructure.database import DatabaseService
+from app.services.infrastructure.reference_cache import reference_cache
 from app.services.infrastructure.scheduler import SchedulerService
 
 
@@ -61,3 +64,226 @@ def test_malformed_payload_marks_run_failed_and_releases_lock():
         mock_queue_service.enqueue_linkedin_job_search.assert_not_called()
 
     asyncio.run(run_test())
+
+
+def _heap_mocks(schedules):
+    mock_db_service = Mock()
+    mock_db_service.initialize = AsyncMock(return_value=True)
+    mock_db_service.get_enabled_site_schedules = AsyncMock(return_value=schedules)
+    mock_db_service.check_site_lock = AsyncMock(return_value=False)
+    mock_db_service.create_scrape_run = AsyncMock(return_value="scrape-run-db-id")
+    mock_db_service.update_scrape_run_status = AsyncMock(return_value=True)
+    mock_db_service.update_site_schedule_next_run = AsyncMock(return_value=True)
+
+    mock_queue_service = Mock()
+    mock_queue_service.initialize = AsyncMock(return_value=True)
+    mock_queue_service.get_queue_info = Mock(return_value={})
+    mock_queue_service.check_redis_lock = Mock(return_value=None)
+    mock_queue_service.acquire_redis_lock = Mock(return_value=True)
+    mock_queue_service.release_redis_lock = Mock(return_value=True)
+    mock_queue_service.enqueue_with_site_lock = Mock(return_value={"task_id": "task-1", "run_id": "run-1"})
+    return mock_db_service, mock_queue_service
+
+
+def test_run_due_schedules_only_processes_heap_top():
+    async def run_test():
+        now = datetime.now(timezone.utc)
+        schedules = [
+            {
+                "site_name": "indeed",
+                "id": "schedule-due",
+                "payload": {"search_term": "engineer"},
+                "interval_minutes": 60,
+                "next_run_at": now - timedelta(minutes=1),
+            },
+            {
+                "site_name": "glassdoor",
+                "id": "schedule-later",
+                "payload": {"search_term": "engineer"},
+                "interval_minutes": 60,
+                "next_run_at": now + timedelta(minutes=30),
+            },
+        ]
+        mock_db_service, mock_queue_service = _heap_mocks(schedules)
+
+        with patch("app.services.infrastructure.scheduler.get_database_service", return_value=mock_db_service), \
+             patch("app.services.infrastructure.scheduler.get_queue_service", return_value=mock_queue_service):
+
+            scheduler = SchedulerService()
+            scheduler.initialized = True
+
+            jobs_enqueued = await scheduler.run_due_schedules()
+
+            assert jobs_enqueued == 1
+            mock_db_service.get_enabled_site_schedules.assert_awaited_once_with(due_only=False)
+            mock_queue_service.enqueue_with_site_lock.assert_called_once()
+            assert mock_queue_service.enqueue_with_site_lock.call_args.kwargs["site_name"] == "indeed"
+
+            # Both schedules stay in the heap; the next wakeup is in the future
+            assert len(scheduler._schedule_heap) == 2
+            assert scheduler.seconds_until_next_run() > 0
+
+            # A second pass before anything is due does no work
+            assert await scheduler.run_due_schedules() == 0
+            mock_queue_service.enqueue_with_site_lock.assert_called_once()
+
+    asyncio.run(run_test())
+
+
+def test_only_one_replica_holds_leadership():
+    leases = {}
+
+    def acquire(key, value, timeout=300):
+        if key in leases:
+            return False
+        leases[key] = value
+        return True
+
+    def extend(key, value, timeout=300):
+        return leases.get(key) == value
+
+    mock_db_service, mock_queue_service = _heap_mocks([])
+    mock_queue_service.acquire_redis_lock = Mock(side_effect=acquire)
+    mock_queue_service.extend_redis_lock = Mock(side_effect=extend)
+
+    with patch("app.services.infrastructure.scheduler.get_database_service", return_value=mock_db_service), \
+         patch("app.services.infrastructure.scheduler.get_queue_service", return_value=mock_queue_service):
+        first = SchedulerService()
+        second = SchedulerService()
+
+    assert first.ensure_leadership() is True
+    assert second.ensure_leadership() is False
+    # Renewal goes through the lease extension rather than re-acquiring
+    assert first.ensure_leadership() is True
+    mock_queue_service.extend_redis_lock.assert_called_once()
+
+    # Lease lost (e.g. expired while paused): the next check demotes the old leader
+    leases.clear()
+    assert second.ensure_leadership() is True
+    assert first.ensure_leadership() is False
+
+
+def test_out_of_process_schedule_edit_is_picked_up_on_change_message():
+    async def run_test():
+        reference_cache.reset()
+        now = datetime.now(timezone.utc)
+        row = {
+            "site_name": "indeed",
+            "id": "schedule-1",
+            "payload": {"search_term": "engineer"},
+            "interval_minutes": 60,
+            "next_run_at": now + timedelta(hours=1),
+        }
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[dict(row)])
+
+        # Real cached schedule read; the writes _process_schedule makes are mocked
+        db_service = DatabaseService()
+        db_service.initialized = True
+        db_service.pool = MagicMock()
+        db_service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        db_service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_db_service, mock_queue_service = _heap_mocks([])
+        for name in ("check_site_lock", "create_scrape_run", "update_scrape_run_status",
+                     "update_site_schedule_next_run"):
+            setattr(db_service, name, getattr(mock_db_service, name))
+
+        pubsub = Mock()
+        pubsub.get_message = Mock(return_value={"type": "message", "data": "schedule-1"})
+        mock_queue_service.subscribe_schedule_changes = Mock(return_value=pubsub)
+
+        with patch("app.services.infrastructure.scheduler.get_database_service", return_value=db_service), \
+             patch("app.services.infrastructure.scheduler.get_queue_service", return_value=mock_queue_service):
+            scheduler = SchedulerService()
+            scheduler.initialized = True
+
+            assert await scheduler.run_due_schedules() == 0
+            assert scheduler.seconds_until_next_run() > 0
+
+            # The schedule is made due by another process (API or a direct DB write)
+            conn.fetch.return_value = [dict(row, next_run_at=now - timedelta(minutes=1))]
+            assert await scheduler.wait_for_schedule_change(timeout=1) is True
+
+            assert await scheduler.run_due_schedules() == 1
+
+        assert conn.fetch.await_count == 2
+        mock_queue_service.enqueue_with_site_lock.assert_called_once()
+        reference_cache.reset()
+
+    asyncio.run(run_test())
+
+
+def _saturation_queue_info(review_length, finished_per_hour, scrape_length=0):
+    return {
+        "scraping_queue": {"length": scrape_length, "started_jobs": 0, "workers": 1, "finished_per_hour": 4.0},
+        "review_queue": {
+            "length": review_length,
+            "started_jobs": 0,
+            "workers": 2,
+            "finished_per_hour": finished_per_hour,
+        },
+    }
+
+
+def test_saturated_review_queue_defers_and_records_reason():
+    async def run_test():
+        schedules = [{
+            "site_name": "indeed",
+            "id": "schedule-1",
+            "payload": {"search_term": "engineer", "results_wanted": 40},
+            "interval_minutes": 60,
+        }]
+        mock_db_service, mock_queue_service = _heap_mocks(schedules)
+        # 600 jobs at 60/h is ten hours of review backlog
+        mock_queue_service.get_queue_info = Mock(return_value=_saturation_queue_info(600, 60.0))
+
+        with patch("app.services.infrastructure.scheduler.get_database_service", return_value=mock_db_service), \
+             patch("app.services.infrastructure.scheduler.get_queue_service", return_value=mock_queue_service):
+            scheduler = SchedulerService()
+            scheduler.initialized = True
+
+            jobs_enqueued = await scheduler.process_scheduled_sites()
+
+        assert jobs_enqueued == 0
+        mock_queue_service.enqueue_with_site_lock.assert_not_called()
+        mock_queue_service.acquire_redis_lock.assert_not_called()
+
+        run_kwargs = mock_db_service.create_scrape_run.await_args.kwargs
+        assert run_kwargs["status"] == "deferred"
+        assert "review backlog of 600 jobs" in run_kwargs["message"]
+
+        next_run_call = mock_db_service.update_site_schedule_next_run.await_args
+        assert next_run_call.kwargs["record_run"] is False
+        assert next_run_call.args[1] > datetime.now(timezone.utc)
+
+    asyncio.run(run_test())
+
+
+def test_partially_saturated_review_queue_thins_requested_results():
+    async def run_test():
+        schedules = [{
+            "site_name": "indeed",
+            "id": "schedule-1",
+            "payload": {"search_term": "engineer", "results_wanted": 40},
+            "interval_minutes": 60,
+        }]
+        mock_db_service, mock_queue_service = _heap_mocks(schedules)
+        # 90 jobs at 60/h drains in 90 min: past half of the 120 min limit
+        mock_queue_service.get_queue_info = Mock(return_value=_saturation_queue_info(90, 60.0))
+
+        with patch("app.services.infrastructure.scheduler.get_database_service", return_value=mock_db_service), \
+             patch("app.services.infrastructure.scheduler.get_queue_service", return_value=mock_queue_service):
+            scheduler = SchedulerService()
+            scheduler.initialized = True
+
+            jobs_enqueued = await scheduler.process_scheduled_sites()
+
+        assert jobs_enqueued == 1
+        payload = mock_queue_service.enqueue_with_site_lock.call_args.kwargs["payload"]
+        assert payload["results_wanted"] == 20
+
+        queued_call = mock_db_service.update_scrape_run_status.await_args
+        assert queued_call.kwargs["status"] == "queued"
+        assert "thinned to 20 results" in queued_call.kwargs["message"]
+
+    asyncio.run(run_test())
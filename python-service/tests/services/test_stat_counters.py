@@ -0,0 +1,79 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.database import DatabaseService
+from app.services.infrastructure.scheduler import SchedulerService
+
+
+def _service(conn):
+    service = DatabaseService()
+    service.initialized = True
+    service.pool = MagicMock()
+    service.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    service.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    service.read_pool = service.pool
+    return service
+
+
+def test_review_counter_totals_derive_averages_from_sums():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value={
+            "total_reviews": 4,
+            "recommended_count": 3,
+            "not_recommended_count": 1,
+            "error_count": 0,
+            "processing_time_total": 30.0,
+            "processing_time_count": 3,
+            "retry_total": 2,
+        })
+        service = _service(conn)
+
+        totals = await service.get_review_counter_totals()
+
+        assert totals["total_reviews"] == 4
+        assert totals["avg_processing_time_seconds"] == 10.0
+        assert totals["avg_retry_count"] == 0.5
+        assert "job_review_stat_counters" in conn.fetchrow.await_args.args[0]
+
+    asyncio.run(run_test())
+
+
+def test_job_status_counts_filter_by_site_and_drop_zero_rows():
+    async def run_test():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            {"status": "pending_review", "count": 5},
+            {"status": "archived", "count": 0},
+        ])
+        service = _service(conn)
+
+        counts = await service.get_job_status_counts(site="Glassdoor")
+
+        assert counts == {"pending_review": 5}
+        assert conn.fetch.await_args.args[1] == "Glassdoor"
+
+    asyncio.run(run_test())
+
+
+def test_reconcile_counters_runs_once_per_interval():
+    async def run_test():
+        mock_db_service = MagicMock()
+        mock_db_service.reconcile_stat_counters = AsyncMock(return_value={"jobs": 2, "job_reviews": 0})
+
+        with patch("app.services.infrastructure.scheduler.get_database_service", return_value=mock_db_service), \
+             patch("app.services.infrastructure.scheduler.get_queue_service", return_value=MagicMock()):
+            scheduler = SchedulerService()
+
+            assert await scheduler.reconcile_counters_if_due() == {"jobs": 2, "job_reviews": 0}
+            assert await scheduler.reconcile_counters_if_due() is None
+            mock_db_service.reconcile_stat_counters.assert_awaited_once()
+
+            scheduler._counters_reconciled_at -= scheduler.settings.scheduler_counter_reconcile_seconds
+            await scheduler.reconcile_counters_if_due()
+            assert mock_db_service.reconcile_stat_counters.await_count == 2
+
+    asyncio.run(run_test())
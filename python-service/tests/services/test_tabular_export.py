@@ -0,0 +1,79 @@
+import asyncio
+import csv
+import io
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.services.infrastructure.tabular_export import (
+    csv_chunks,
+    export_columns,
+    first_batch_primed,
+    parquet_chunks,
+)
+
+
+def _item(job_id, salary_min=None):
+    return {
+        "job": {"job_id": job_id, "title": "Engineer", "salary_min": salary_min,
+                "date_posted": datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        "review": {"recommendation": True, "personas": [{"id": "coach"}]},
+    }
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+def _collect(chunks):
+    async def run_test():
+        return [chunk async for chunk in chunks]
+    return asyncio.run(run_test())
+
+
+def test_csv_is_written_batch_by_batch():
+    columns = export_columns(["title", "salary_min", "date_posted", "recommendation", "personas"])
+    chunks = _collect(csv_chunks(_batches([_item("a", Decimal("100000.50")), _item("b")], [_item("c")]), columns))
+
+    assert len(chunks) == 2
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == ["job_id", "title", "date_posted", "salary_min", "recommendation", "personas"]
+    assert rows[1] == ["a", "Engineer", "2025-01-01T00:00:00+00:00", "100000.5", "true", '[{"id":"coach"}]']
+    assert rows[2][3] == ""
+    assert len(rows) == 4
+
+
+def test_empty_export_still_has_a_header():
+    async def run_test():
+        batches = await first_batch_primed(_batches())
+        return [chunk async for chunk in csv_chunks(batches, ["job_id", "title"])]
+
+    assert asyncio.run(run_test()) == [b"job_id,title\r\n"]
+
+
+def test_query_errors_surface_before_streaming():
+    async def failing():
+        raise RuntimeError("connection lost")
+        yield []
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(first_batch_primed(failing()))
+
+
+def test_parquet_writes_one_row_group_per_batch():
+    pq = pytest.importorskip("pyarrow.parquet")
+    columns = export_columns(["title", "salary_min", "date_posted", "recommendation", "personas"])
+
+    data = b"".join(_collect(parquet_chunks(_batches([_item("a", 1), _item("b")], [_item("c")]), columns)))
+
+    parquet_file = pq.ParquetFile(io.BytesIO(data))
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column_names == columns
+    assert table.column("job_id").to_pylist() == ["a", "b", "c"]
+    assert table.column("salary_min").to_pylist() == [1.0, None, None]
@@ -353,4 +353,71 @@ def test_job_review_max_retries_reached():
 def test_simple_worker_import():
     """Test that worker module can be imported without errors."""
     from app.services.infrastructure.worker import process_job_review
-    assert callable(process_job_review)
\ No newline at end of file
+    assert callable(process_job_review)
+
+def test_process_job_review_batch_isolates_failures_and_saves_once():
+    """One failing posting should not fail the rest of the batch."""
+    from app.services.infrastructure.worker import process_job_review_batch
+
+    good_id, bad_id = str(uuid4()), str(uuid4())
+    claimed = [
+        {"id": good_id, "title": "Python Developer", "company": "TechCorp", "min_amount": Decimal("100000"), "retry_count": 0},
+        {"id": bad_id, "title": "Broken Posting", "company": "FlakyCorp", "retry_count": 2},
+    ]
+
+    async def evaluate(job_posting, correlation_id=None):
+        if correlation_id == bad_id:
+            raise RuntimeError("LLM timeout")
+        return {"final": {"recommend": True, "confidence": "high", "rationale": "Strong match"}}
+
+    mock_db_service = Mock()
+    mock_db_service.initialized = True
+    mock_db_service.claim_pending_review_jobs = AsyncMock(return_value=claimed)
+    mock_db_service.save_job_review_batch = AsyncMock(return_value={good_id: True, bad_id: True})
+    mock_db_service.update_job_status = AsyncMock(return_value=True)
+
+    mock_orchestrator = Mock()
+    mock_orchestrator.evaluate_job_posting_async = AsyncMock(side_effect=evaluate)
+
+    with patch('app.services.infrastructure.worker.get_database_service', return_value=mock_db_service), \
+         patch('app.services.infrastructure.worker._get_review_orchestrator', return_value=mock_orchestrator), \
+         patch('app.services.infrastructure.worker._dead_letter_review') as mock_dead_letter:
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        result = process_job_review_batch(batch_size=2, max_retries=3)
+
+    assert result["claimed"] == 2
+    assert result["jobs"] == {good_id: "completed", bad_id: "failed"}
+    mock_db_service.claim_pending_review_jobs.assert_awaited_once_with(2)
+    mock_db_service.save_job_review_batch.assert_awaited_once()
+
+    outcomes = {o["job_id"]: o for o in mock_db_service.save_job_review_batch.await_args.args[0]}
+    assert outcomes[good_id]["status"] == "reviewed"
+    assert outcomes[good_id]["review_data"]["recommend"] is True
+    assert outcomes[bad_id]["status"] == "error"
+    assert outcomes[bad_id]["review_data"]["retry_count"] == 3
+    mock_dead_letter.assert_called_once()
+
+
+def test_process_job_review_batch_releases_claim_when_orchestrator_fails():
+    """Jobs claimed into in_review must go back to pending_review if the batch cannot run."""
+    from app.services.infrastructure.worker import process_job_review_batch
+
+    job_ids = [str(uuid4()), str(uuid4())]
+    mock_db_service = Mock()
+    mock_db_service.initialized = True
+    mock_db_service.claim_pending_review_jobs = AsyncMock(
+        return_value=[{"id": job_id, "title": "Python Developer", "retry_count": 0} for job_id in job_ids]
+    )
+    mock_db_service.save_job_review_batch = AsyncMock()
+    mock_db_service.update_job_status = AsyncMock(return_value=True)
+
+    with patch('app.services.infrastructure.worker.get_database_service', return_value=mock_db_service), \
+         patch('app.services.infrastructure.worker._get_review_orchestrator',
+               side_effect=ImportError("crewai not installed")):
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        result = process_job_review_batch(batch_size=2, max_retries=3)
+
+    assert result["status"] == "failed"
+    mock_db_service.save_job_review_batch.assert_not_awaited()
+    released = [call.args for call in mock_db_service.update_job_status.await_args_list]
+    assert released == [(job_id, "pending_review") for job_id in job_ids]
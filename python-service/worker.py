@@ -42,8 +42,11 @@ def main():
         
         # Create and start worker for both queues
         with Connection(redis_conn):
-            worker = Worker([settings.rq_queue_name, settings.job_review_queue_name])
-            logger.info(f"Worker started for queues: {settings.rq_queue_name}, {settings.job_review_queue_name}")
+            worker = Worker([settings.rq_queue_name, settings.job_review_queue_name, settings.analysis_queue_name])
+            logger.info(
+                f"Worker started for queues: {settings.rq_queue_name}, {settings.job_review_queue_name}, "
+                f"{settings.analysis_queue_name}"
+            )
             worker.work()
             
     except KeyboardInterrupt:
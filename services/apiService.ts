@@ -1609,6 +1609,17 @@ export const getJobSites = async (): Promise<SiteDetails[]> => {
     return [];
 };
 
+// Wake the scheduler leader so it reloads schedules now instead of at its next refresh.
+// Best-effort: the scheduler still picks up changes on its periodic reload.
+const notifyScheduleChanged = async (scheduleId?: string): Promise<void> => {
+    const query = scheduleId ? `?schedule_id=${encodeURIComponent(scheduleId)}` : '';
+    try {
+        await fetch(buildFastApiUrl(`scheduler/schedules/changed${query}`), { method: 'POST' });
+    } catch (err) {
+        console.warn('Failed to notify scheduler of schedule change:', err);
+    }
+};
+
 export const createSiteSchedule = async (payload: SiteSchedulePayload): Promise<SiteSchedule> => {
     const response = await fetch(`${API_BASE_URL}/site_schedules`, {
         method: 'POST',
@@ -1616,6 +1627,7 @@ export const createSiteSchedule = async (payload: SiteSchedulePayload): Promise<
         body: JSON.stringify(payload),
     });
     const data = await handleResponse(response);
+    await notifyScheduleChanged(data[0]?.id);
     return data[0];
 };
 
@@ -1626,6 +1638,7 @@ export const updateSiteSchedule = async (scheduleId: string, payload: SiteSchedu
         body: JSON.stringify(payload),
     });
     const data = await handleResponse(response);
+    await notifyScheduleChanged(scheduleId);
     return data[0];
 };
 
@@ -1635,6 +1648,7 @@ export const deleteSiteSchedule = async (scheduleId: string): Promise<void> => {
         headers,
     });
     await handleResponse(response);
+    await notifyScheduleChanged(scheduleId);
 };
 
 // --- Document Management via FastAPI ---
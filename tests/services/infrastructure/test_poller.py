@@ -118,7 +118,7 @@ class TestPollerService:
 
         # Assertions
         assert result == mock_task_id
-        poller_service.queue_service.enqueue_job_review.assert_called_once_with(job_id)
+        poller_service.queue_service.enqueue_job_review.assert_called_once_with(job_id, attempt=0)
 
     @pytest.mark.asyncio
     async def test_poll_and_enqueue_jobs_empty(self, poller_service):